@@ -27,6 +27,7 @@ from tools import (
     get_all_opportunities, get_single_opportunity, search_opportunities,
     get_all_notes, get_specific_note
 )
+from tools.base import init_http_clients, close_http_clients
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -1384,13 +1385,15 @@ def main(
 
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
-        """Context manager for session manager."""
+        """Context manager for session manager and shared HTTP client."""
+        await init_http_clients()
         async with session_manager.run():
             logger.info("Application started with dual transports!")
             try:
                 yield
             finally:
                 logger.info("Application shutting down...")
+                await close_http_clients()
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
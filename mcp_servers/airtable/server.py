@@ -32,6 +32,7 @@ from tools import (
     update_records,
     update_table,
 )
+from tools.base import init_http_clients, close_http_clients
 
 load_dotenv()
 
@@ -284,7 +285,7 @@ def main(
                         },
                         "max_records": {
                             "type": "integer",
-                            "description": "Maximum number of records to return (default: all records, max: 100)",
+                            "description": "Maximum number of records to return in total across all pages (default: all records)",
                         },
                         "page_size": {
                             "type": "integer",
@@ -308,6 +309,14 @@ def main(
                             "type": "boolean",
                             "description": "Return fields keyed by field ID instead of name",
                         },
+                        "offset": {
+                            "type": "string",
+                            "description": "Offset returned by a previous call, to continue listing from there",
+                        },
+                        "fetch_all_pages": {
+                            "type": "boolean",
+                            "description": "Follow pagination and return all matching records, up to max_records (default: 10000). Default false returns a single page",
+                        },
                     },
                     "required": ["base_id", "table_id"],
                 },
@@ -342,7 +351,7 @@ def main(
             ),
             types.Tool(
                 name="airtable_create_records",
-                description="Create multiple records in a table",
+                description="Create multiple records in a table. Any number of records can be passed; they are sent in chunks of 10",
                 inputSchema={
                     "type": "object",
                     "properties": {
@@ -376,7 +385,7 @@ def main(
             ),
             types.Tool(
                 name="airtable_update_records",
-                description="Update multiple records in a table with optional upsert functionality",
+                description="Update multiple records in a table with optional upsert functionality. Any number of records can be passed; they are sent in chunks of 10",
                 inputSchema={
                     "type": "object",
                     "properties": {
@@ -421,7 +430,7 @@ def main(
             ),
             types.Tool(
                 name="airtable_delete_records",
-                description="Delete multiple records from a table",
+                description="Delete multiple records from a table. Any number of record IDs can be passed; they are sent in chunks of 10",
                 inputSchema={
                     "type": "object",
                     "properties": {
@@ -589,6 +598,8 @@ def main(
                     return_fields_by_field_id=arguments.get(
                         "return_fields_by_field_id"
                     ),
+                    offset=arguments.get("offset"),
+                    fetch_all_pages=arguments.get("fetch_all_pages", False),
                 )
                 return [
                     types.TextContent(
@@ -753,13 +764,15 @@ def main(
 
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
-        """Context manager for session manager."""
+        """Context manager for session manager and shared HTTP client."""
+        await init_http_clients()
         async with session_manager.run():
             logger.info("Application started with dual transports!")
             try:
                 yield
             finally:
                 logger.info("Application shutting down...")
+                await close_http_clients()
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
@@ -1,6 +1,10 @@
+import asyncio
 import logging
 import os
-from typing import Optional
+import re
+import time
+from collections import deque
+from typing import Any, Optional
 from contextvars import ContextVar
 
 import aiohttp
@@ -48,73 +52,187 @@ def _get_airtable_headers() -> dict:
     }
 
 
+# Shared HTTP session, reused across tool calls so connections stay pooled
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Return the process-wide HTTP session, creating it on first use."""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            keepalive_timeout=30,
+        )
+        # No cookie jar: the session is shared across tenants
+        _http_session = aiohttp.ClientSession(
+            connector=connector, cookie_jar=aiohttp.DummyCookieJar()
+        )
+    return _http_session
+
+
+async def init_http_clients() -> None:
+    """Create the shared HTTP session (called from the server lifespan)."""
+    get_http_session()
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP session on server shutdown."""
+    global _http_session
+    if _http_session is not None:
+        try:
+            await _http_session.close()
+        finally:
+            _http_session = None
+
+
+# Airtable allows 5 requests per second per base and asks clients to wait
+# 30 seconds after a 429 response
+AIRTABLE_REQUESTS_PER_SECOND = 5
+AIRTABLE_RATE_LIMIT_BACKOFF_SECONDS = 30
+MAX_RATE_LIMIT_RETRIES = 2
+
+_BASE_ID_PATTERN = re.compile(r"(?:^|/)(app[A-Za-z0-9]{14})(?:[/?]|$)")
+
+
+class BaseRateLimiter:
+    """Paces requests to one base to at most `rate` per second.
+
+    Callers queue on a FIFO lock, so concurrent requests are released in order.
+    """
+
+    def __init__(self, rate: int = AIRTABLE_REQUESTS_PER_SECOND):
+        self.rate = rate
+        self._sent: deque[float] = deque()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._sent and self._sent[0] <= now - 1.0:
+                    self._sent.popleft()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                elif len(self._sent) < self.rate:
+                    self._sent.append(now)
+                    return
+                else:
+                    await asyncio.sleep(self._sent[0] + 1.0 - now)
+
+    def pause(self, seconds: float) -> None:
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+_base_rate_limiters: dict[str, BaseRateLimiter] = {}
+
+
+def get_base_rate_limiter(endpoint: str) -> Optional[BaseRateLimiter]:
+    """Return the rate limiter for the base an endpoint belongs to, if any."""
+    match = _BASE_ID_PATTERN.search(endpoint)
+    if not match:
+        return None
+    base_id = match.group(1)
+    limiter = _base_rate_limiters.get(base_id)
+    if limiter is None:
+        limiter = _base_rate_limiters[base_id] = BaseRateLimiter()
+    return limiter
+
+
+async def _parse_airtable_response(
+    response: aiohttp.ClientResponse,
+    method: str,
+    endpoint: str,
+    expect_empty_response: bool,
+) -> Any:
+    """Check an Airtable response for errors and parse its body."""
+    # Handle 422 validation errors specially
+    if response.status == 422:
+        error_text = await response.text()
+        logger.error(f"Airtable API 422 Error: {error_text}")
+        raise AirtableValidationError(
+            "Invalid Request body: You may have missed a required field or provided an invalid field. Please check the Airtable Field model for the correct field types and options."
+        )
+    response.raise_for_status()  # Raise exception for non-2xx status codes
+    if expect_empty_response:
+        # For requests like DELETE or PUT roles/reactions where success is 204 No Content
+        if response.status == 204:
+            return None
+        else:
+            # If we expected empty but got something else (and it wasn't an error raised above)
+            logger.warning(
+                f"Expected empty response for {method} {endpoint}, but got status {response.status}"
+            )
+            # Try to parse JSON anyway, might be useful error info
+            try:
+                return await response.json()
+            except aiohttp.ContentTypeError:
+                return await response.text()  # Return text if not json
+    else:
+        # Check if response is JSON before parsing
+        if "application/json" in response.headers.get("Content-Type", ""):
+            return await response.json()
+        else:
+            # Handle non-JSON responses if necessary, e.g., log or return text
+            text_content = await response.text()
+            logger.warning(
+                f"Received non-JSON response for {method} {endpoint}: {text_content[:100]}..."
+            )
+            return {"raw_content": text_content}
+
+
 async def make_airtable_request(
     method: str,
     endpoint: str,
     json_data: Optional[dict] = None,
     expect_empty_response: bool = False,
+    params: Optional[list[tuple[str, Any]]] = None,
 ) -> dict | None:
-    """Make a request to the Airtable API."""
+    """Make a request to the Airtable API.
+
+    Requests to a base are paced by its rate limiter and retried after a
+    backoff when Airtable still answers 429.
+    """
     url = f"{AIRTABLE_API_BASE}/{endpoint}"
     headers = _get_airtable_headers()
-    async with aiohttp.ClientSession(headers=headers) as session:
-        try:
-            async with session.request(method, url, json=json_data) as response:
-                # Handle 422 validation errors specially
-                if response.status == 422:
-                    error_text = await response.text()
-                    logger.error(f"Airtable API 422 Error: {error_text}")
-                    raise AirtableValidationError(
-                        "Invalid Request body: You may have missed a required field or provided an invalid field. Please check the Airtable Field model for the correct field types and options."
-                    )
-                response.raise_for_status()  # Raise exception for non-2xx status codes
-                if expect_empty_response:
-                    # For requests like DELETE or PUT roles/reactions where success is 204 No Content
-                    if response.status == 204:
-                        return None
-                    else:
-                        # If we expected empty but got something else (and it wasn't an error raised above)
-                        logger.warning(
-                            f"Expected empty response for {method} {endpoint}, but got status {response.status}"
-                        )
-                        # Try to parse JSON anyway, might be useful error info
-                        try:
-                            return await response.json()
-                        except aiohttp.ContentTypeError:
-                            return await response.text()  # Return text if not json
-                else:
-                    # Check if response is JSON before parsing
-                    if "application/json" in response.headers.get("Content-Type", ""):
-                        return await response.json()
+    session = get_http_session()
+    rate_limiter = get_base_rate_limiter(endpoint)
+    try:
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
+            async with session.request(method, url, json=json_data, params=params, headers=headers) as response:
+                if response.status == 429 and attempt < MAX_RATE_LIMIT_RETRIES:
+                    logger.warning(f"Airtable rate limit hit for {method} {endpoint}, backing off")
+                    if rate_limiter is not None:
+                        rate_limiter.pause(AIRTABLE_RATE_LIMIT_BACKOFF_SECONDS)
                     else:
-                        # Handle non-JSON responses if necessary, e.g., log or return text
-                        text_content = await response.text()
-                        logger.warning(
-                            f"Received non-JSON response for {method} {endpoint}: {text_content[:100]}..."
-                        )
-                        return {"raw_content": text_content}
-        except AirtableValidationError as e:
-            # Re-raise 422 validation errors with their specific message
-            raise e
-        except aiohttp.ClientResponseError as e:
-            logger.error(
-                f"Airtable API request failed: {e.status} {e.message} for {method} {url}"
-            )
-            error_details = e.message
-            try:
-                # Airtable often returns JSON errors
-                error_body = await e.response.json()
-                error_details = f"{e.message} - {error_body}"
-            except Exception:
-                # If response body isn't JSON or can't be read
-                pass
-            raise RuntimeError(
-                f"Airtable API Error ({e.status}): {error_details}"
-            ) from e
-        except Exception as e:
-            logger.error(
-                f"An unexpected error occurred during Airtable API request: {e}"
-            )
-            raise RuntimeError(
-                f"Unexpected error during API call to {method} {url}"
-            ) from e
+                        await asyncio.sleep(AIRTABLE_RATE_LIMIT_BACKOFF_SECONDS)
+                    continue
+                return await _parse_airtable_response(response, method, endpoint, expect_empty_response)
+    except AirtableValidationError as e:
+        # Re-raise 422 validation errors with their specific message
+        raise e
+    except aiohttp.ClientResponseError as e:
+        logger.error(
+            f"Airtable API request failed: {e.status} {e.message} for {method} {url}"
+        )
+        error_details = e.message
+        try:
+            # Airtable often returns JSON errors
+            error_body = await e.response.json()
+            error_details = f"{e.message} - {error_body}"
+        except Exception:
+            # If response body isn't JSON or can't be read
+            pass
+        raise RuntimeError(
+            f"Airtable API Error ({e.status}): {error_details}"
+        ) from e
+    except Exception as e:
+        logger.error(
+            f"An unexpected error occurred during Airtable API request: {e}"
+        )
+        raise RuntimeError(
+            f"Unexpected error during API call to {method} {url}"
+        ) from e
@@ -1,11 +1,84 @@
+import asyncio
 import logging
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict
 
 from .base import make_airtable_request
 
 # Configure logging
 logger = logging.getLogger("airtable_tools")
 
+# Airtable accepts at most 10 records per create, update or delete request
+MAX_RECORDS_PER_REQUEST = 10
+# Chunk requests in flight per bulk operation; the per-base rate limiter
+# still paces them to Airtable's limit
+BULK_PIPELINE_DEPTH = 5
+# Upper bound on records accumulated by list_records(fetch_all_pages=True)
+# when no max_records is given
+MAX_ACCUMULATED_RECORDS = 10000
+
+
+async def _run_in_chunks(
+    items: list[Any],
+    send_chunk: Callable[[list[Any]], Awaitable[Dict[str, Any]]],
+) -> Dict[str, Any]:
+    """Send items in API-sized chunks, pipelined, and merge the responses.
+
+    List values of the chunk responses (records, createdRecords, ...) are
+    concatenated in input order. Failed chunks are reported under "errors"
+    with the index range of the items they contained.
+    """
+    if len(items) <= MAX_RECORDS_PER_REQUEST:
+        return await send_chunk(items)
+
+    chunks = [
+        items[i:i + MAX_RECORDS_PER_REQUEST]
+        for i in range(0, len(items), MAX_RECORDS_PER_REQUEST)
+    ]
+    semaphore = asyncio.Semaphore(BULK_PIPELINE_DEPTH)
+
+    async def send(chunk: list[Any]) -> Dict[str, Any] | Exception:
+        async with semaphore:
+            try:
+                return await send_chunk(chunk)
+            except Exception as e:
+                return e
+
+    responses = await asyncio.gather(*(send(chunk) for chunk in chunks))
+
+    merged: Dict[str, Any] = {}
+    errors = []
+    for index, response in enumerate(responses):
+        if isinstance(response, Exception):
+            start = index * MAX_RECORDS_PER_REQUEST
+            errors.append({
+                "start_index": start,
+                "end_index": start + len(chunks[index]) - 1,
+                "error": str(response),
+            })
+            continue
+        for key, value in (response or {}).items():
+            if isinstance(value, list):
+                merged.setdefault(key, []).extend(value)
+    if errors:
+        logger.warning(f"{len(errors)} of {len(chunks)} record chunks failed")
+        merged["errors"] = errors
+    return merged
+
+
+async def iter_record_pages(
+    endpoint: str, params: list[tuple[str, Any]]
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yield pages of a record listing, following `offset` until the last page."""
+    params = list(params)
+    while True:
+        page = await make_airtable_request("GET", endpoint, params=params)
+        yield page
+        offset = page.get("offset")
+        if not offset:
+            return
+        params = [(key, value) for key, value in params if key != "offset"]
+        params.append(("offset", offset))
+
 
 async def list_records(
     base_id: str,
@@ -16,56 +89,64 @@ async def list_records(
     page_size: int | None = None,
     sort: list[Dict[str, str]] | None = None,
     return_fields_by_field_id: bool | None = None,
+    offset: str | None = None,
+    fetch_all_pages: bool = False,
 ) -> Dict[str, Any]:
-    """Get all records from a table with optional filtering and formatting."""
+    """Get records from a table with optional filtering and formatting.
+
+    Returns a single page (with an `offset` to continue from) unless
+    fetch_all_pages is set, in which case pages are followed until max_records
+    (or MAX_ACCUMULATED_RECORDS) records have been collected.
+    """
     endpoint = f"{base_id}/{table_id}"
 
-    # Build query parameters
-    params = {}
+    # Build query parameters; fields[] and sort may repeat
+    params: list[tuple[str, Any]] = []
 
     if fields:
         for field in fields:
-            params["fields[]"] = field
+            params.append(("fields[]", field))
 
     if filter_by_formula:
-        params["filterByFormula"] = filter_by_formula
+        params.append(("filterByFormula", filter_by_formula))
 
     if max_records is not None:
-        params["maxRecords"] = max_records
+        params.append(("maxRecords", max_records))
 
     if page_size is not None:
-        params["pageSize"] = page_size
+        params.append(("pageSize", page_size))
 
     if sort:
         for i, sort_item in enumerate(sort):
             if "field" in sort_item:
-                params[f"sort[{i}][field]"] = sort_item["field"]
+                params.append((f"sort[{i}][field]", sort_item["field"]))
             if "direction" in sort_item:
-                params[f"sort[{i}][direction]"] = sort_item["direction"]
+                params.append((f"sort[{i}][direction]", sort_item["direction"]))
 
     if return_fields_by_field_id is not None:
-        params["returnFieldsByFieldId"] = str(return_fields_by_field_id).lower()
-
-    # Add query parameters to endpoint if any exist
-    if params:
-        # Convert params to query string
-        query_parts = []
-        for key, value in params.items():
-            if key == "fields[]":
-                # Handle multiple fields specially
-                continue
-            query_parts.append(f"{key}={value}")
-
-        # Handle fields separately to allow multiple values
-        if fields:
-            for field in fields:
-                query_parts.append(f"fields[]={field}")
-
-        if query_parts:
-            endpoint = f"{endpoint}?{'&'.join(query_parts)}"
+        params.append(("returnFieldsByFieldId", str(return_fields_by_field_id).lower()))
+
+    if offset:
+        params.append(("offset", offset))
 
     logger.info(f"Executing tool: list_records for table {table_id} in base {base_id}")
-    return await make_airtable_request("GET", endpoint)
+    if not fetch_all_pages:
+        return await make_airtable_request("GET", endpoint, params=params)
+
+    limit = max_records or MAX_ACCUMULATED_RECORDS
+    records: list[Dict[str, Any]] = []
+    next_offset = None
+    async for page in iter_record_pages(endpoint, params):
+        records.extend(page.get("records", []))
+        next_offset = page.get("offset")
+        if len(records) >= limit:
+            break
+
+    result: Dict[str, Any] = {"records": records}
+    if next_offset:
+        # More records remain; pass this offset back to continue
+        result["offset"] = next_offset
+    return result
 
 
 async def get_record(base_id: str, table_id: str, record_id: str) -> Dict[str, Any]:
@@ -84,19 +165,24 @@ async def create_records(
     typecast: bool | None = None,
     return_fields_by_field_id: bool | None = None,
 ) -> Dict[str, Any]:
-    """Create one or multiple records in a table."""
+    """Create one or multiple records in a table.
+
+    Lists longer than Airtable's 10-record limit are split into chunks.
+    """
     endpoint = f"{base_id}/{table_id}"
 
-    payload = {
-        "typecast": typecast,
-        "returnFieldsByFieldId": return_fields_by_field_id,
-        "records": records,
-    }
+    async def send_chunk(chunk: list[Dict[str, Any]]) -> Dict[str, Any]:
+        payload = {
+            "typecast": typecast,
+            "returnFieldsByFieldId": return_fields_by_field_id,
+            "records": chunk,
+        }
+        return await make_airtable_request("POST", endpoint, json_data=payload)
 
     logger.info(
         f"Executing tool: create_records for table {table_id} in base {base_id}"
     )
-    return await make_airtable_request("POST", endpoint, json_data=payload)
+    return await _run_in_chunks(records, send_chunk)
 
 
 async def update_records(
@@ -107,26 +193,32 @@ async def update_records(
     return_fields_by_field_id: bool | None = None,
     perform_upsert: Dict[str, Any] | None = None,
 ) -> Dict[str, Any]:
-    """Update one or multiple records in a table, with optional upsert functionality."""
+    """Update one or multiple records in a table, with optional upsert functionality.
+
+    Lists longer than Airtable's 10-record limit are split into chunks.
+    """
     endpoint = f"{base_id}/{table_id}"
 
-    payload = {
-        "records": records,
-    }
+    async def send_chunk(chunk: list[Dict[str, Any]]) -> Dict[str, Any]:
+        payload = {
+            "records": chunk,
+        }
 
-    if typecast is not None:
-        payload["typecast"] = typecast
+        if typecast is not None:
+            payload["typecast"] = typecast
 
-    if return_fields_by_field_id is not None:
-        payload["returnFieldsByFieldId"] = return_fields_by_field_id
+        if return_fields_by_field_id is not None:
+            payload["returnFieldsByFieldId"] = return_fields_by_field_id
+
+        if perform_upsert is not None:
+            payload["performUpsert"] = perform_upsert
 
-    if perform_upsert is not None:
-        payload["performUpsert"] = perform_upsert
+        return await make_airtable_request("PATCH", endpoint, json_data=payload)
 
     logger.info(
         f"Executing tool: update_records for table {table_id} in base {base_id}"
     )
-    return await make_airtable_request("PATCH", endpoint, json_data=payload)
+    return await _run_in_chunks(records, send_chunk)
 
 
 async def delete_records(
@@ -134,14 +226,17 @@ async def delete_records(
     table_id: str,
     record_ids: list[str],
 ) -> Dict[str, Any]:
-    """Delete multiple records from a table."""
+    """Delete multiple records from a table.
+
+    Lists longer than Airtable's 10-record limit are split into chunks.
+    """
     endpoint = f"{base_id}/{table_id}"
 
-    # Build query params string with multiple record IDs
-    records_params = "&".join([f"records[]={record_id}" for record_id in record_ids])
-    endpoint = f"{endpoint}?{records_params}"
+    async def send_chunk(chunk: list[str]) -> Dict[str, Any]:
+        params = [("records[]", record_id) for record_id in chunk]
+        return await make_airtable_request("DELETE", endpoint, params=params)
 
     logger.info(
         f"Executing tool: delete_records for table {table_id} in base {base_id}"
     )
-    return await make_airtable_request("DELETE", endpoint)
+    return await _run_in_chunks(record_ids, send_chunk)
@@ -32,6 +32,7 @@ from tools import users as user_tools
 from tools import teams as team_tools
 from tools import tags as tag_tools
 from tools.base import auth_token_context
+from tools.base import init_http_clients, close_http_clients
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -135,7 +136,7 @@ def main(
                         },
                         "assignee_id": {
                             "type": "string",
-                            "description": "The ID of the assignee (defaults to 'me')",
+                            "description": "The ID, email or name of the assignee (defaults to 'me')",
                         },
                         "tags": {
                             "type": "array",
@@ -188,7 +189,7 @@ def main(
                         },
                         "assignee_id": {
                             "type": "string",
-                            "description": "Filter by assignee ID",
+                            "description": "Filter by assignee ID, email or name",
                         },
                         "project": {
                             "type": "string",
@@ -196,7 +197,7 @@ def main(
                         },
                         "team_id": {
                             "type": "string",
-                            "description": "Team ID to filter by",
+                            "description": "Team ID or name to filter by",
                         },
                         "tags": {
                             "type": "array",
@@ -286,7 +287,7 @@ def main(
                         },
                         "assignee_id": {
                             "type": "string",
-                            "description": "New assignee ID",
+                            "description": "New assignee ID, email or name",
                         },
                     },
                     "required": ["task_id"],
@@ -866,13 +867,15 @@ def main(
 
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
-        """Context manager for session manager."""
+        """Context manager for session manager and shared HTTP client."""
+        await init_http_clients()
         async with session_manager.run():
             logger.info("Application started with dual transports!")
             try:
                 yield
             finally:
                 logger.info("Application shutting down...")
+                await close_http_clients()
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
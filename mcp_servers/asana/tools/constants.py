@@ -14,8 +14,14 @@ try:
 except ValueError:
     ASANA_MAX_TIMEOUT_SECONDS = 20
 
+try:
+    ASANA_ENTITY_CACHE_TTL_SECONDS = int(os.getenv("ASANA_ENTITY_CACHE_TTL_SECONDS", 300))
+except ValueError:
+    ASANA_ENTITY_CACHE_TTL_SECONDS = 300
+
 MAX_PROJECTS_TO_SCAN_BY_NAME = 1000
 MAX_TAGS_TO_SCAN_BY_NAME = 1000
+MAX_ENTITIES_TO_CACHE_PER_WORKSPACE = 5000
 
 PROJECT_OPT_FIELDS = [
     "gid",
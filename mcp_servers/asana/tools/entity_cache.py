@@ -0,0 +1,175 @@
+import asyncio
+import difflib
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+from .constants import ASANA_ENTITY_CACHE_TTL_SECONDS, MAX_ENTITIES_TO_CACHE_PER_WORKSPACE
+from .base import get_asana_client, get_auth_token
+
+logger = logging.getLogger(__name__)
+
+# Workspace-scoped entities that can be looked up by name
+ENTITY_KINDS = ("projects", "tags", "teams", "users")
+ENTITY_OPT_FIELDS = {
+    "workspaces": "name",
+    "projects": "name,team",
+    "tags": "name",
+    "teams": "name",
+    "users": "name,email",
+}
+
+
+class AsanaEntityCache:
+    """TTL cache of entity lists, keyed by (token hash, kind, workspace id).
+
+    Concurrent loads of the same key share one set of API requests.
+    """
+
+    def __init__(self, ttl_seconds: float = ASANA_ENTITY_CACHE_TTL_SECONDS, max_keys: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_keys = max_keys
+        self._entries: OrderedDict[tuple, tuple[float, list[dict[str, Any]]]] = OrderedDict()
+        self._loading: dict[tuple, asyncio.Future] = {}
+
+    async def get(
+        self, key: tuple, loader: Callable[[], Awaitable[list[dict[str, Any]]]]
+    ) -> list[dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        load = self._loading.get(key)
+        if load is None:
+            load = asyncio.ensure_future(loader())
+            self._loading[key] = load
+            load.add_done_callback(lambda _: self._loading.pop(key, None))
+        value = await asyncio.shield(load)
+
+        if self.ttl_seconds > 0:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_keys:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, token_hash: str, kind: str | None = None, workspace_id: str | None = None) -> None:
+        for key in list(self._entries):
+            if key[0] == token_hash and kind in (None, key[1]) and workspace_id in (None, key[2]):
+                del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+entity_cache = AsanaEntityCache()
+
+
+def _token_hash() -> str:
+    return hashlib.sha256(get_auth_token().encode("utf-8")).hexdigest()
+
+
+async def _list_all(endpoint: str, params: dict[str, Any], max_items: int) -> list[dict[str, Any]]:
+    """Page through an Asana list endpoint up to max_items."""
+    client = get_asana_client()
+    items: list[dict[str, Any]] = []
+    params = {**params, "limit": 100}
+    while len(items) < max_items:
+        response = await client.get(endpoint, params=params)
+        items.extend(response["data"])
+        next_page = response.get("next_page") or {}
+        if not next_page.get("offset"):
+            break
+        params["offset"] = next_page["offset"]
+    return items[:max_items]
+
+
+async def get_workspaces() -> list[dict[str, Any]]:
+    """Get the workspaces visible to the current token (cached)."""
+
+    async def load() -> list[dict[str, Any]]:
+        return await _list_all(
+            "/workspaces", {"opt_fields": ENTITY_OPT_FIELDS["workspaces"]}, MAX_ENTITIES_TO_CACHE_PER_WORKSPACE
+        )
+
+    return await entity_cache.get((_token_hash(), "workspaces", None), load)
+
+
+async def get_workspace_entities(kind: str, workspace_id: str) -> list[dict[str, Any]]:
+    """Get all projects, tags, teams or users of a workspace (cached).
+
+    Each entity carries its workspace as {"workspace": {"id": ...}}. Teams only
+    exist in organizations; for other workspaces the team list is empty.
+    """
+    if kind not in ENTITY_KINDS:
+        raise ValueError(f"Unknown Asana entity kind: {kind}")
+
+    async def load() -> list[dict[str, Any]]:
+        try:
+            entities = await _list_all(
+                f"/workspaces/{workspace_id}/{kind}",
+                {"opt_fields": ENTITY_OPT_FIELDS[kind]},
+                MAX_ENTITIES_TO_CACHE_PER_WORKSPACE,
+            )
+        except Exception as e:
+            if kind != "teams":
+                raise
+            logger.info(f"No teams for workspace {workspace_id}: {e}")
+            entities = []
+        for entity in entities:
+            entity.setdefault("workspace", {"id": workspace_id})
+        return entities
+
+    return await entity_cache.get((_token_hash(), kind, workspace_id), load)
+
+
+async def get_entities(
+    kind: str,
+    workspace_ids: list[str] | None = None,
+    max_items: int | None = None,
+) -> list[dict[str, Any]]:
+    """Get entities of a kind across workspaces, fetching workspaces concurrently.
+
+    Without workspace_ids, every workspace visible to the token is included.
+    """
+    if not workspace_ids:
+        workspace_ids = [workspace["id"] for workspace in await get_workspaces()]
+    per_workspace = await asyncio.gather(
+        *(get_workspace_entities(kind, workspace_id) for workspace_id in workspace_ids)
+    )
+    entities = [entity for entities in per_workspace for entity in entities]
+    return entities[:max_items] if max_items is not None else entities
+
+
+def normalize_name(name: str) -> str:
+    return " ".join(name.casefold().split())
+
+
+def match_by_name(
+    entities: list[dict[str, Any]],
+    name: str,
+    fuzzy: bool = False,
+    max_fuzzy_matches: int = 5,
+    cutoff: float = 0.75,
+) -> list[dict[str, Any]]:
+    """Find entities by name, ignoring case and repeated whitespace.
+
+    With fuzzy=True and no exact match, the closest names are returned instead,
+    best match first.
+    """
+    wanted = normalize_name(name)
+    matches = [entity for entity in entities if normalize_name(entity.get("name") or "") == wanted]
+    if matches or not fuzzy:
+        return matches
+
+    names = {normalize_name(entity.get("name") or ""): entity for entity in entities}
+    close = difflib.get_close_matches(wanted, list(names), n=max_fuzzy_matches, cutoff=cutoff)
+    return [names[candidate] for candidate in close]
+
+
+def invalidate_entities(kind: str | None = None, workspace_id: str | None = None) -> None:
+    """Drop cached entities of the current token, e.g. after creating one."""
+    entity_cache.invalidate(_token_hash(), kind, workspace_id)
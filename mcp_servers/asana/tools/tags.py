@@ -9,6 +9,7 @@ from .base import (
     remove_none_values,
     AsanaToolExecutionError,
 )
+from .entity_cache import invalidate_entities
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +53,7 @@ async def create_tag(
 
         client = get_asana_client()
         response = await client.post("/tags", json_data={"data": data})
+        invalidate_entities("tags", workspace_id)
         return {"tag": response["data"]}
 
     except AsanaToolExecutionError as e:
@@ -13,6 +13,7 @@ from .base import (
     AsanaToolExecutionError,
     RetryableToolError,
 )
+from .entity_cache import get_entities, invalidate_entities, match_by_name
 
 logger = logging.getLogger(__name__)
 
@@ -161,7 +162,12 @@ async def get_project_by_name_or_raise_error(
     )
 
     if not response["matches"]["projects"]:
-        projects = response["not_matched"]["projects"]
+        # Suggest from every cached project, not only the truncated list above
+        all_projects = await get_entities("projects", max_items=max_items_to_scan)
+        projects = (
+            match_by_name(all_projects, project_name, fuzzy=True)
+            or response["not_matched"]["projects"]
+        )
         projects = [{"name": project["name"], "id": project["id"]} for project in projects]
         message = (
             f"Project with name '{project_name}' was not found. The search scans up to "
@@ -191,6 +197,51 @@ async def get_project_by_name_or_raise_error(
     return cast(dict, response["matches"]["projects"][0])
 
 
+def is_user_name(user: str | None) -> bool:
+    """Whether an assignee value is a name, rather than a user ID, 'me' or an email."""
+    return bool(user) and not user.isnumeric() and user != "me" and "@" not in user
+
+
+async def get_entity_by_name_or_raise_error(
+    kind: str,
+    name: str,
+    workspace_id: str | None = None,
+) -> dict[str, Any]:
+    """Find a team or user by name, using the workspace entity cache."""
+    label = kind.rstrip("s")
+    entities = await get_entities(kind, workspace_ids=[workspace_id] if workspace_id else None)
+
+    # Users belong to several workspaces, so the same ID can appear more than once
+    matches = list({entity["id"]: entity for entity in match_by_name(entities, name)}.values())
+
+    if not matches:
+        suggestions = match_by_name(entities, name, fuzzy=True)
+        suggestions = [{"name": entity["name"], "id": entity["id"]} for entity in suggestions]
+        message = f"{label.capitalize()} with name '{name}' was not found."
+        additional_prompt = (
+            f"Closest {kind} by name: {json.dumps(suggestions)}"
+            if suggestions
+            else f"Provide a {label} ID instead."
+        )
+        raise RetryableToolError(
+            message=message,
+            developer_message=f"{message} {additional_prompt}",
+            additional_prompt_content=additional_prompt,
+        )
+
+    if len(matches) > 1:
+        entities = [{"name": entity["name"], "id": entity["id"]} for entity in matches]
+        message = f"Multiple {kind} found with the same name. Please provide a {label} ID instead."
+        additional_prompt = f"{kind.capitalize()} matching the name '{name}': {json.dumps(entities)}"
+        raise RetryableToolError(
+            message=message,
+            developer_message=message,
+            additional_prompt_content=additional_prompt,
+        )
+
+    return cast(dict, matches[0])
+
+
 async def handle_new_task_tags(
     tags: list[str] | None,
     workspace_id: str | None,
@@ -207,7 +258,9 @@ async def handle_new_task_tags(
             tag_names.append(tag)
 
     if tag_names:
-        response = await find_tags_by_name(tag_names)
+        response = await find_tags_by_name(
+            tag_names, workspace_id=[workspace_id] if workspace_id else None
+        )
         tag_ids.extend([tag["id"] for tag in response["matches"]["tags"]])
 
         if response["not_found"]["tags"]:
@@ -220,6 +273,7 @@ async def handle_new_task_tags(
                 created_tags.append(create_response["data"]["id"])
             
             tag_ids.extend(created_tags)
+            invalidate_entities("tags", workspace_id)
 
     return tag_ids
 
@@ -261,38 +315,24 @@ async def find_projects_by_name(
     max_items_to_scan: int = MAX_PROJECTS_TO_SCAN_BY_NAME,
     return_projects_not_matched: bool = False,
 ) -> dict[str, Any]:
-    """Find projects by name."""
-    client = get_asana_client()
-    
-    # Get all workspaces first
-    workspaces_response = await client.get("/workspaces")
-    workspaces = workspaces_response["data"]
-    
-    all_projects = []
-    
-    # Search through all workspaces
-    for workspace in workspaces:
-        projects_response = await client.get(
-            f"/workspaces/{workspace['id']}/projects",
-            params={"limit": min(response_limit, max_items_to_scan)}
-        )
-        all_projects.extend(projects_response["data"])
-        
-        if len(all_projects) >= max_items_to_scan:
-            break
+    """Find projects by name (case-insensitive), using the workspace entity cache."""
+    all_projects = await get_entities("projects", max_items=max_items_to_scan)
+    if team_id:
+        all_projects = [
+            project for project in all_projects
+            if (project.get("team") or {}).get("id") in team_id
+        ]
     
     # Match projects by name
     matches = []
     not_matched = []
     
     for name in names:
-        found = False
-        for project in all_projects:
-            if project["name"].lower() == name.lower():
-                matches.append(project)
-                found = True
-                break
-        if not found:
+        found = match_by_name(all_projects, name)
+        if found:
+            # Keep every match so that ambiguous names can be reported
+            matches.extend(found)
+        else:
             not_matched.append(name)
     
     result = {
@@ -304,7 +344,7 @@ async def find_projects_by_name(
     
     if return_projects_not_matched:
         result["not_matched"] = {
-            "projects": all_projects,
+            "projects": all_projects[:response_limit],
             "tags": not_matched
         }
     
@@ -318,41 +358,18 @@ async def find_tags_by_name(
     max_items_to_scan: int = MAX_TAGS_TO_SCAN_BY_NAME,
     return_tags_not_matched: bool = False,
 ) -> dict[str, Any]:
-    """Find tags by name."""
-    client = get_asana_client()
-    
-    # Get all workspaces first
-    if not workspace_id:
-        workspaces_response = await client.get("/workspaces")
-        workspaces = workspaces_response["data"]
-    else:
-        workspaces = [{"id": wid} for wid in workspace_id]
-    
-    all_tags = []
-    
-    # Search through all workspaces
-    for workspace in workspaces:
-        tags_response = await client.get(
-            f"/workspaces/{workspace['id']}/tags",
-            params={"limit": min(response_limit, max_items_to_scan)}
-        )
-        all_tags.extend(tags_response["data"])
-        
-        if len(all_tags) >= max_items_to_scan:
-            break
+    """Find tags by name (case-insensitive), using the workspace entity cache."""
+    all_tags = await get_entities("tags", workspace_ids=workspace_id, max_items=max_items_to_scan)
     
     # Match tags by name
     matches = []
     not_found = []
     
     for name in names:
-        found = False
-        for tag in all_tags:
-            if tag["name"].lower() == name.lower():
-                matches.append(tag)
-                found = True
-                break
-        if not found:
+        found = match_by_name(all_tags, name)
+        if found:
+            matches.extend(found[:1])
+        else:
             not_found.append(name)
     
     result = {
@@ -367,7 +384,7 @@ async def find_tags_by_name(
     
     if return_tags_not_matched:
         result["not_matched"] = {
-            "tags": all_tags
+            "tags": all_tags[:response_limit]
         }
     
     return result
@@ -404,6 +421,15 @@ async def search_tasks(
                 if not workspace_id:
                     workspace_id = project_data["workspace"]["id"]
 
+        if team_id and not team_id.isnumeric():
+            team = await get_entity_by_name_or_raise_error("teams", team_id, workspace_id)
+            team_id = team["id"]
+            workspace_id = workspace_id or team["workspace"]["id"]
+
+        if is_user_name(assignee_id):
+            user = await get_entity_by_name_or_raise_error("users", assignee_id, workspace_id)
+            assignee_id = user["id"]
+
         tag_ids = await get_tag_ids(tags)
 
         client = get_asana_client()
@@ -420,7 +446,7 @@ async def search_tasks(
 
         if not workspace_id and team_id:
             from .teams import get_team_by_id
-            team = await get_team_by_id(team_id)
+            team = (await get_team_by_id(team_id))["team"]
             workspace_id = team["organization"]["id"]
 
         response = await client.get(
@@ -530,6 +556,9 @@ async def update_task(
         validate_date_format("start_date", start_date)
         validate_date_format("due_date", due_date)
 
+        if is_user_name(assignee_id):
+            assignee_id = (await get_entity_by_name_or_raise_error("users", assignee_id))["id"]
+
         update_data = remove_none_values({
             "name": name,
             "completed": completed,
@@ -581,6 +610,10 @@ async def create_task(
 
         tag_ids = await handle_new_task_tags(tags, workspace_id)
 
+        if is_user_name(assignee_id):
+            user = await get_entity_by_name_or_raise_error("users", assignee_id, workspace_id)
+            assignee_id = user["id"]
+
         task_data = remove_none_values({
             "name": name,
             "notes": description,
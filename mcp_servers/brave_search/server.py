@@ -24,6 +24,7 @@ brave_video_search,
 brave_news_search,
 brave_image_search
 )
+from tools.base import init_http_clients, close_http_clients
 
 
 
@@ -395,13 +396,15 @@ def main(
 
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
-        """Context manager for session manager."""
+        """Context manager for session manager and shared HTTP client."""
+        await init_http_clients()
         async with session_manager.run():
             logger.info("Application started with dual transports!")
             try:
                 yield
             finally:
                 logger.info("Application shutting down...")
+                await close_http_clients()
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
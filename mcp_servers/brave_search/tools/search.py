@@ -1,5 +1,4 @@
-import httpx
-from .base import get_brave_client
+from .base import get_brave_client, get_http_client
 import logging
 
 # Configure logging
@@ -49,11 +48,11 @@ async def brave_web_search(
 
     logger.info(f"Sending Brave search request: {query}")
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, params=params)
-            response.raise_for_status()  # Good practice to check for HTTP errors
-            logger.info("Received Brave search response")
-            return response.json()
+        client = get_http_client()
+        response = await client.get(url, headers=headers, params=params)
+        response.raise_for_status()  # Good practice to check for HTTP errors
+        logger.info("Received Brave search response")
+        return response.json()
 
     except Exception as e:
         logger.error(f"Brave search failed: {e}")
@@ -110,10 +109,10 @@ async def brave_image_search(
 
     logger.info(f"Sending Brave image search request: {query}")
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, params=params)
-            logger.info("Received Brave image search response")
-            return response.json()
+        client = get_http_client()
+        response = await client.get(url, headers=headers, params=params)
+        logger.info("Received Brave image search response")
+        return response.json()
     except Exception as e:
         logger.error(f"Brave image search failed: {e}")
         return {"error": f"Could not complete Brave image search for query: {query}"}
@@ -168,10 +167,10 @@ async def brave_news_search(
 
     logger.info(f"Sending Brave news search request: {query}")
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, params=params)
-            logger.info("Received Brave news search response")
-            return response.json()
+        client = get_http_client()
+        response = await client.get(url, headers=headers, params=params)
+        logger.info("Received Brave news search response")
+        return response.json()
     except Exception as e:
         logger.error(f"Brave news search failed: {e}")
         return {"error": f"Could not complete Brave news search for query: {query}"}
@@ -229,10 +228,10 @@ async def brave_video_search(
 
     logger.info(f"Sending Brave video search request: {query}")
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, params=params)
-            logger.info("Received Brave video search response")
-            return response.json()
+        client = get_http_client()
+        response = await client.get(url, headers=headers, params=params)
+        logger.info("Received Brave video search response")
+        return response.json()
     except Exception as e:
         logger.error(f"Brave video search failed: {e}")
         return {"error": f"Could not complete Brave video search for query: {query}"}
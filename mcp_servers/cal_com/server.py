@@ -29,6 +29,7 @@ from tools import (
     cal_get_schedule,
     cal_delete_a_schedule
 )
+from tools.base import init_http_clients, close_http_clients
 
 
 
@@ -492,13 +493,15 @@ def main(
 
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
-        """Context manager for session manager."""
+        """Context manager for session manager and shared HTTP client."""
+        await init_http_clients()
         async with session_manager.run():
             logger.info("Application started with dual transports!")
             try:
                 yield
             finally:
                 logger.info("Application shutting down...")
+                await close_http_clients()
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
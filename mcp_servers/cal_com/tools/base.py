@@ -2,6 +2,9 @@ import logging
 import os
 from contextvars import ContextVar
 from typing import Optional
+import http.cookiejar
+import importlib.util
+import httpx
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -9,6 +12,44 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP client, reused across tool calls so connections stay pooled
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            # Reject all cookies: the client is shared across tenants
+            cookies=http.cookiejar.CookieJar(
+                policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+            ),
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _http_client
+
+
+async def init_http_clients() -> None:
+    """Create the shared HTTP client (called from the server lifespan)."""
+    get_http_client()
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP client on server shutdown."""
+    global _http_client
+    if _http_client is not None:
+        try:
+            await _http_client.aclose()
+        finally:
+            _http_client = None
+
+
 auth_token_context: ContextVar[str] = ContextVar('auth_token')
 
 def get_auth_token() -> str:
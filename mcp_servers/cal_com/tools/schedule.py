@@ -1,7 +1,7 @@
 import httpx
 import json
 import logging
-from .base import get_calcom_client
+from .base import get_calcom_client, get_http_client
 
 
 # Configure logging
@@ -40,12 +40,12 @@ async def cal_get_all_schedules() -> dict:
 
     try:
         # Use an async context manager to handle the client's lifecycle
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers)
-            # This checks for HTTP error statuses (e.g., 404, 500)
-            response.raise_for_status()
-            logging.info("Successfully retrieved Cal.com schedules")
-            return response.json()
+        client = get_http_client()
+        response = await client.get(url, headers=headers)
+        # This checks for HTTP error statuses (e.g., 404, 500)
+        response.raise_for_status()
+        logging.info("Successfully retrieved Cal.com schedules")
+        return response.json()
     except httpx.RequestError as e:
         logging.error(f"Could not get Cal.com schedules from {url}: {e}")
         return {"error": f"Could not get Cal.com schedules from {url}"}
@@ -106,13 +106,13 @@ async def cal_create_a_schedule(
 
     try:
         # Use an async context manager for the client
-        async with httpx.AsyncClient() as client:
-            # The 'json' parameter works the same as in requests
-            response = await client.post(url, json=payload, headers=headers)
-            # Check for HTTP errors (e.g., 4xx or 5xx responses)
-            response.raise_for_status()
-            logging.info("Successfully created Cal.com schedule")
-            return response.json()
+        client = get_http_client()
+        # The 'json' parameter works the same as in requests
+        response = await client.post(url, json=payload, headers=headers)
+        # Check for HTTP errors (e.g., 4xx or 5xx responses)
+        response.raise_for_status()
+        logging.info("Successfully created Cal.com schedule")
+        return response.json()
 
     except httpx.RequestError as e:
         logging.error(f"Could not create Cal.com schedule: {e}")
@@ -187,15 +187,15 @@ async def cal_update_a_schedule(
 
     try:
         # Use an async context manager for the client
-        async with httpx.AsyncClient() as client:
-            # Make an async PATCH request
-            response = await client.patch(url_new, json=payload, headers=headers)
+        client = get_http_client()
+        # Make an async PATCH request
+        response = await client.patch(url_new, json=payload, headers=headers)
 
-            # Check for HTTP errors (e.g., 4xx or 5xx responses)
-            response.raise_for_status()
+        # Check for HTTP errors (e.g., 4xx or 5xx responses)
+        response.raise_for_status()
 
-            logging.info("Successfully updated Cal.com schedule")
-            return response.json()
+        logging.info("Successfully updated Cal.com schedule")
+        return response.json()
 
     except httpx.RequestError as e:
         # Catch httpx-specific request errors
@@ -228,15 +228,15 @@ async def cal_get_default_schedule() -> dict:
 
     try:
         # Use an async context manager for the client
-        async with httpx.AsyncClient() as client:
-            # Make an async GET request
-            response = await client.get(url_new, headers=headers)
+        client = get_http_client()
+        # Make an async GET request
+        response = await client.get(url_new, headers=headers)
 
-            # Check for HTTP errors (e.g., 4xx or 5xx responses)
-            response.raise_for_status()
+        # Check for HTTP errors (e.g., 4xx or 5xx responses)
+        response.raise_for_status()
 
-            logging.info("Successfully fetched default schedule")
-            return response.json()
+        logging.info("Successfully fetched default schedule")
+        return response.json()
 
     except httpx.RequestError as e:
         # Catch httpx-specific request errors
@@ -276,15 +276,15 @@ async def cal_get_schedule(schedule_id: int) -> dict:
 
     try:
         # Use an async context manager for the client
-        async with httpx.AsyncClient() as client:
-            # Make an async GET request
-            response = await client.get(url_new, headers=headers)
+        client = get_http_client()
+        # Make an async GET request
+        response = await client.get(url_new, headers=headers)
 
-            # Check for HTTP errors (e.g., 4xx or 5xx responses)
-            response.raise_for_status()
+        # Check for HTTP errors (e.g., 4xx or 5xx responses)
+        response.raise_for_status()
 
-            logging.info("Successfully fetched schedule")
-            return response.json()
+        logging.info("Successfully fetched schedule")
+        return response.json()
 
     except httpx.RequestError as e:
         # Catch httpx-specific request errors
@@ -324,15 +324,15 @@ async def cal_delete_a_schedule(schedule_id: int) -> dict:
 
     try:
         # Use an async context manager for the client
-        async with httpx.AsyncClient() as client:
-            # Make an async DELETE request
-            response = await client.delete(url_new, headers=headers)
+        client = get_http_client()
+        # Make an async DELETE request
+        response = await client.delete(url_new, headers=headers)
 
-            # Check for HTTP errors (e.g., 4xx or 5xx responses)
-            response.raise_for_status()
+        # Check for HTTP errors (e.g., 4xx or 5xx responses)
+        response.raise_for_status()
 
-            logging.info("Successfully deleted schedule")
-            return response.json()
+        logging.info("Successfully deleted schedule")
+        return response.json()
 
     except httpx.RequestError as e:
         # Catch httpx-specific request errors
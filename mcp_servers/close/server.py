@@ -26,6 +26,7 @@ from tools import opportunities as opportunity_tools
 from tools import tasks as task_tools
 from tools import users as user_tools
 from tools.base import auth_token_context
+from tools.base import init_http_clients, close_http_clients
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -903,13 +904,15 @@ def main(
 
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
-        """Context manager for session manager."""
+        """Context manager for session manager and shared HTTP client."""
+        await init_http_clients()
         async with session_manager.run():
             logger.info("Application started with dual transports!")
             try:
                 yield
             finally:
                 logger.info("Application shutting down...")
+                await close_http_clients()
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
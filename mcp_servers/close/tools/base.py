@@ -6,6 +6,8 @@ from typing import Any, Dict, Optional, cast
 from contextvars import ContextVar
 from functools import wraps
 
+import http.cookiejar
+import importlib.util
 import httpx
 
 from .constants import CLOSE_API_VERSION, CLOSE_BASE_URL, CLOSE_MAX_CONCURRENT_REQUESTS, CLOSE_MAX_TIMEOUT_SECONDS
@@ -13,6 +15,44 @@ from .constants import CLOSE_API_VERSION, CLOSE_BASE_URL, CLOSE_MAX_CONCURRENT_R
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Shared HTTP client, reused across tool calls so connections stay pooled
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            # Reject all cookies: the client is shared across tenants
+            cookies=http.cookiejar.CookieJar(
+                policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+            ),
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _http_client
+
+
+async def init_http_clients() -> None:
+    """Create the shared HTTP client (called from the server lifespan)."""
+    get_http_client()
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP client on server shutdown."""
+    global _http_client
+    if _http_client is not None:
+        try:
+            await _http_client.aclose()
+        finally:
+            _http_client = None
+
+
 # Context variable to store the access token for each request
 auth_token_context: ContextVar[str] = ContextVar('auth_token')
 
@@ -221,7 +261,8 @@ class CloseClient:
         if params:
             kwargs["params"] = params
 
-        async with self._semaphore, httpx.AsyncClient() as client:  # type: ignore[union-attr]
+        async with self._semaphore:  # type: ignore[union-attr]
+            client = get_http_client()
             response = await client.get(**kwargs)  # type: ignore[arg-type]
             self._raise_for_status(response)
         return cast(dict, response.json())
@@ -259,7 +300,8 @@ class CloseClient:
         else:
             kwargs = self._set_request_body(kwargs, data, json_data)
 
-        async with self._semaphore, httpx.AsyncClient() as client:  # type: ignore[union-attr]
+        async with self._semaphore:  # type: ignore[union-attr]
+            client = get_http_client()
             response = await client.post(**kwargs)  # type: ignore[arg-type]
             self._raise_for_status(response)
         return cast(dict, response.json())
@@ -286,7 +328,8 @@ class CloseClient:
 
         kwargs = self._set_request_body(kwargs, data, json_data)
 
-        async with self._semaphore, httpx.AsyncClient() as client:  # type: ignore[union-attr]
+        async with self._semaphore:  # type: ignore[union-attr]
+            client = get_http_client()
             response = await client.put(**kwargs)  # type: ignore[arg-type]
             self._raise_for_status(response)
         return cast(dict, response.json())
@@ -308,7 +351,8 @@ class CloseClient:
             "timeout": CLOSE_MAX_TIMEOUT_SECONDS,
         }
 
-        async with self._semaphore, httpx.AsyncClient() as client:  # type: ignore[union-attr]
+        async with self._semaphore:  # type: ignore[union-attr]
+            client = get_http_client()
             response = await client.delete(**kwargs)  # type: ignore[arg-type]
             self._raise_for_status(response)
         
@@ -29,7 +29,9 @@ from tools import (
     coinbase_get_portfolio_value,
     coinbase_get_product_details,
     coinbase_get_historical_prices,
+    coinbase_get_price_history_summary,
 )
+from tools.base import init_http_clients, close_http_clients
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -187,6 +189,46 @@ def main(
                     **{"category": "COINBASE_MARKET", "readOnlyHint": True}
                 ),
             ),
+            types.Tool(
+                name="coinbase_get_price_history_summary",
+                description="""
+                Summarize cryptocurrency price history over a long time range.
+                Rate limited: the range is fetched in windows of 300 candles, concurrently, under the product rate limits.
+
+                Typical use: analyze performance and risk over weeks or months without raw candle dumps.
+                Returns OHLCV bars resampled to a coarser period plus total return, volatility
+                (per candle and annualized), max drawdown and VWAP.
+                """,
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "symbol": {
+                            "type": "string",
+                            "description": "Required. Trading pair symbol (e.g., 'BTC-USD')."
+                        },
+                        "start": {
+                            "type": "string",
+                            "description": "Required. Start time in ISO 8601 format (e.g., '2024-01-01T00:00:00Z')."
+                        },
+                        "end": {
+                            "type": "string",
+                            "description": "Required. End time in ISO 8601 format (e.g., '2024-12-31T23:59:59Z')."
+                        },
+                        "granularity": {
+                            "type": "integer",
+                            "description": "Candle granularity in seconds used for the statistics. Options: 60, 300, 900, 3600, 21600, 86400. Default 3600."
+                        },
+                        "resample_seconds": {
+                            "type": "integer",
+                            "description": "Bar size in seconds for the returned OHLCV bars, a multiple of granularity (e.g., 86400 for daily bars). Defaults to the smallest standard size giving at most 100 bars."
+                        }
+                    },
+                    "required": ["symbol", "start", "end"]
+                },
+                annotations=types.ToolAnnotations(
+                    **{"category": "COINBASE_MARKET", "readOnlyHint": True}
+                ),
+            ),
             # Account & Portfolio Tools (requires API key)
             types.Tool(
                 name="coinbase_get_accounts",
@@ -395,6 +437,45 @@ def main(
             except Exception as e:
                 logger.exception(f"Error executing tool {name}: {e}")
 
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Error: {str(e)}",
+                    )
+                ]
+        elif name == "coinbase_get_price_history_summary":
+            try:
+                symbol = arguments.get("symbol")
+                start = arguments.get("start")
+                end = arguments.get("end")
+                granularity = arguments.get("granularity")
+                resample_seconds = arguments.get("resample_seconds")
+
+                if not all([symbol, start, end]):
+                    return [
+                        types.TextContent(
+                            type="text",
+                            text="Missing required parameters. Required: symbol, start, end.",
+                        )
+                    ]
+
+                result = await coinbase_get_price_history_summary(
+                    symbol,
+                    start,
+                    end,
+                    granularity,
+                    resample_seconds
+                )
+
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=json.dumps(result, indent=2),
+                    )
+                ]
+            except Exception as e:
+                logger.exception(f"Error executing tool {name}: {e}")
+
                 return [
                     types.TextContent(
                         type="text",
@@ -575,13 +656,15 @@ def main(
 
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
-        """Context manager for session manager."""
+        """Context manager for session manager and shared HTTP client."""
+        await init_http_clients()
         async with session_manager.run():
             logger.info("Application started with dual transports!")
             try:
                 yield
             finally:
                 logger.info("Application shutting down...")
+                await close_http_clients()
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
@@ -19,6 +19,10 @@ from .products import (
     coinbase_get_historical_prices,
 )
 
+from .price_history import (
+    coinbase_get_price_history_summary,
+)
+
 __all__ = [
     "auth_token_context",
     "coinbase_get_prices",
@@ -29,4 +33,5 @@ __all__ = [
     "coinbase_get_portfolio_value",
     "coinbase_get_product_details",
     "coinbase_get_historical_prices",
+    "coinbase_get_price_history_summary",
 ]
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 from typing import Any, Dict, Optional
@@ -77,11 +78,11 @@ async def coinbase_get_transactions(
     )
 
 
-@rate_limited(api_type="accounts")
 async def coinbase_get_portfolio_value() -> Dict[str, Any]:
     """
     Get total portfolio value across all accounts.
-    Uses conservative rate limits for authenticated account endpoints.
+    Account balances are requested concurrently; each request takes a token
+    from the accounts rate limiter.
 
     Requires Coinbase API authentication.
     Returns:
@@ -94,21 +95,21 @@ async def coinbase_get_portfolio_value() -> Dict[str, Any]:
             return accounts_response
 
         accounts = accounts_response.get("data", [])
-        account_values = []
+        accounts_with_id = [account for account in accounts if account.get("id")]
 
-        for account in accounts:
-            account_id = account.get("id")
-
-            if account_id:
-                balance_response = await coinbase_get_account_balance(account_id)
+        balance_responses = await asyncio.gather(
+            *(coinbase_get_account_balance(account["id"]) for account in accounts_with_id)
+        )
 
-                if "error" not in balance_response:
-                    balance_data = balance_response.get("data", {})
-                    account_values.append({
-                        "account_id": account_id,
-                        "currency": account.get("currency"),
-                        "balance": balance_data.get("balance"),
-                    })
+        account_values = []
+        for account, balance_response in zip(accounts_with_id, balance_responses):
+            if "error" not in balance_response:
+                balance_data = balance_response.get("data", {})
+                account_values.append({
+                    "account_id": account["id"],
+                    "currency": account.get("currency"),
+                    "balance": balance_data.get("balance"),
+                })
 
         return {
             "data": {
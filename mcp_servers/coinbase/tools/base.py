@@ -1,6 +1,8 @@
 import logging
 import os
+import time
 
+from collections import OrderedDict
 from contextvars import ContextVar
 from typing import Any, Dict, List, Optional
 
@@ -125,6 +127,70 @@ def get_coinbase_config() -> Optional[Dict[str, str]]:
         raise RuntimeError(f"Failed to initialize Coinbase config: {e}")
 
 
+class TTLCache:
+    """Small LRU cache whose entries expire after a per-entry TTL."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Any, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any, ttl: float) -> None:
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Shared HTTP session, reused across tool calls so connections stay pooled
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Return the process-wide HTTP session, creating it on first use."""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            keepalive_timeout=30,
+        )
+        # No cookie jar: the session is shared across tenants
+        _http_session = aiohttp.ClientSession(
+            connector=connector, cookie_jar=aiohttp.DummyCookieJar()
+        )
+    return _http_session
+
+
+async def init_http_clients() -> None:
+    """Create the shared HTTP session (called from the server lifespan)."""
+    get_http_session()
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP session on server shutdown."""
+    global _http_session
+    if _http_session is not None:
+        try:
+            await _http_session.close()
+        finally:
+            _http_session = None
+
+
 async def make_coinbase_request(
     method: str,
     endpoint: str,
@@ -173,21 +239,21 @@ async def make_coinbase_request(
 
         logger.info(f"Request: {method} {url}")
 
-        async with aiohttp.ClientSession(headers=headers) as session:
-            try:
-                async with session.request(method, url, json=json_data) as response:
-                    response.raise_for_status()
-                    return await response.json()
-            except aiohttp.ClientResponseError as e:
-                logger.error(
-                    f"Coinbase API request failed: {e.status} {e.message} for {method} {url}"
-                )
-                return {"error": f"API request failed: {str(e)}"}
-            except Exception as e:
-                logger.error(
-                    f"Unexpected error occurred during Coinbase API request: {e}"
-                )
-                return {"error": f"Unexpected error: {str(e)}"}
+        session = get_http_session()
+        try:
+            async with session.request(method, url, json=json_data, headers=headers) as response:
+                response.raise_for_status()
+                return await response.json()
+        except aiohttp.ClientResponseError as e:
+            logger.error(
+                f"Coinbase API request failed: {e.status} {e.message} for {method} {url}"
+            )
+            return {"error": f"API request failed: {str(e)}"}
+        except Exception as e:
+            logger.error(
+                f"Unexpected error occurred during Coinbase API request: {e}"
+            )
+            return {"error": f"Unexpected error: {str(e)}"}
     except CoinbaseValidationError as e:
         raise e
     except aiohttp.ClientResponseError as e:
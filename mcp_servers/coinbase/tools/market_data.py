@@ -1,92 +1,106 @@
+import asyncio
 import logging
+import os
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from .base import make_coinbase_request
+from .base import TTLCache, make_coinbase_request
 from utils.rate_limiter import rate_limited
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Spot prices and exchange rates are public, so the cache is shared across tenants
+PRICE_CACHE_TTL_SECONDS = float(os.getenv("COINBASE_PRICE_CACHE_TTL", "5"))
+
+_price_cache = TTLCache(1024)
+_price_requests: Dict[tuple, asyncio.Future] = {}
+
 
 @rate_limited(api_type="market_data")
+async def _fetch_public(endpoint: str, query_params: Optional[List[str]] = None) -> Dict[str, Any]:
+    return await make_coinbase_request(
+        method="GET",
+        endpoint=endpoint,
+        query_params=query_params,
+        require_auth=False
+    )
+
+
+async def _get_public_cached(endpoint: str, query_params: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    GET a public market data endpoint through the shared price cache.
+
+    Concurrent requests for the same endpoint share one API call, and cache
+    hits do not take a rate limiter token. Errors are not cached.
+    """
+    key = (endpoint, tuple(query_params or ()))
+    result = _price_cache.get(key)
+    if result is None:
+        lookup = _price_requests.get(key)
+        if lookup is None:
+            lookup = asyncio.ensure_future(_fetch_public(endpoint, query_params))
+            _price_requests[key] = lookup
+            lookup.add_done_callback(lambda _: _price_requests.pop(key, None))
+        result = await asyncio.shield(lookup)
+        if "error" not in result:
+            _price_cache.set(key, result, PRICE_CACHE_TTL_SECONDS)
+    return result
+
+
+async def _get_spot_price(symbol: str) -> Dict[str, Any]:
+    try:
+        result = await _get_public_cached(f"/v2/prices/{symbol}/spot")
+
+        if "error" in result:
+            return {"error": f"Could not get price for {symbol}: {result['error']}"}
+        return result
+    except Exception as e:
+        logger.error(f"Coinbase price request failed for {symbol}: {e}")
+        return {"error": f"Could not get price for {symbol}: {str(e)}"}
+
+
+async def _get_exchange_rate(symbol: str) -> Dict[str, Any]:
+    try:
+        result = await _get_public_cached("/v2/exchange-rates", [f"currency={symbol}"])
+
+        if "error" in result:
+            return {"error": f"Could not get exchange rate for {symbol}: {result['error']}"}
+        return result
+    except Exception as e:
+        logger.error(
+            f"Coinbase exchange rate request failed for {symbol}: {e}"
+        )
+        return {"error": f"Could not get exchange rate for {symbol}: {str(e)}"}
+
+
 async def coinbase_get_prices(symbols: List[str]) -> Dict[str, Any]:
     """
     Get current prices for cryptocurrencies.
-    Uses higher rate limits for market data endpoints.
+    Symbols are requested concurrently; each request takes a token from the
+    market data rate limiter, and recent prices are served from a short-TTL cache.
 
     Args:
-        symbols (List[str]): List of cryptocurrency symbols (e.g., ['BTC-USD', 'ETH-USD']). 
+        symbols (List[str]): List of cryptocurrency symbols (e.g., ['BTC-USD', 'ETH-USD']).
     Returns:
-        dict: JSON response with current prices.
+        dict: JSON response with current prices, in the order of symbols.
     """
-    # Get prices for specific symbols
-    prices_data = []
-
-    for symbol in symbols:
-        try:
-            endpoint = f"/v2/prices/{symbol}/spot"
-
-            result = await make_coinbase_request(
-                method="GET",
-                endpoint=endpoint,
-                require_auth=False
-            )
-
-            if "error" in result:
-                prices_data.append(
-                    {"error": f"Could not get price for {symbol}: {result['error']}"}
-                )
-            else:
-                prices_data.append(result)
-        except Exception as e:
-            logger.error(f"Coinbase price request failed for {symbol}: {e}")
-            prices_data.append(
-                {"error": f"Could not get price for {symbol}: {str(e)}"}
-            )
-
-    return {"data": prices_data}
+    prices_data = await asyncio.gather(*(_get_spot_price(symbol) for symbol in symbols))
+
+    return {"data": list(prices_data)}
 
 
-@rate_limited(api_type="market_data")
 async def coinbase_get_current_exchange_rate(symbols: List[str]) -> Dict[str, Any]:
     """
     Get current exchange rate for a cryptocurrencies.
-    Uses higher rate limits for market data endpoints.
+    Symbols are requested concurrently; each request takes a token from the
+    market data rate limiter, and recent rates are served from a short-TTL cache.
 
     Args:
-        symbols (List[str]): List[str]): List of cryptocurrency symbols (e.g., ['BTC-USD', 'ETH-USD']). 
+        symbols (List[str]): List of cryptocurrency symbols (e.g., ['BTC-USD', 'ETH-USD']).
     Returns:
-        dict: JSON response with current exchange rate.
+        dict: JSON response with current exchange rate, in the order of symbols.
     """
-    # Get exchange rates for specific symbols
-    exchange_rates_data = []
-
-    for symbol in symbols:
-        try:
-            endpoint = "/v2/exchange-rates"
-            query_params = [f"currency={symbol}"]
-
-            result = await make_coinbase_request(
-                method="GET",
-                endpoint=endpoint,
-                query_params=query_params,
-                require_auth=False
-            )
-
-            if "error" in result:
-                exchange_rates_data.append(
-                    {"error": f"Could not get exchange rate for {symbol}: {result['error']}"}
-                )
-            else:
-                exchange_rates_data.append(result)
-
-        except Exception as e:
-            logger.error(
-                f"Coinbase exchange rate request failed for {symbol}: {e}"
-            )
-            exchange_rates_data.append(
-                {"error": f"Could not get exchange rate for {symbol}: {str(e)}"}
-            )
-
-    return {"data": exchange_rates_data}
+    exchange_rates_data = await asyncio.gather(*(_get_exchange_rate(symbol) for symbol in symbols))
+
+    return {"data": list(exchange_rates_data)}
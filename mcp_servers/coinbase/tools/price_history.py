@@ -0,0 +1,234 @@
+import asyncio
+import logging
+import math
+import os
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .base import make_coinbase_request
+from utils.rate_limiter import rate_limited
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+EXCHANGE_URL = os.getenv("COINBASE_EXCHANGE_URL")
+
+# Granularities the candles endpoint accepts, and its per-request candle limit
+CANDLE_GRANULARITIES = (60, 300, 900, 3600, 21600, 86400)
+MAX_CANDLES_PER_REQUEST = 300
+
+# Upper bound on candles loaded for one summary (windows are fetched in parallel)
+MAX_CANDLES_PER_SUMMARY = int(os.getenv("COINBASE_HISTORY_MAX_CANDLES", "10000"))
+
+# Bar sizes tried, smallest first, when no resample period is given
+RESAMPLE_PERIODS = (60, 300, 900, 3600, 21600, 86400, 604800)
+DEFAULT_MAX_BARS = 100
+
+SECONDS_PER_YEAR = 365 * 86400
+
+# Column order of a candle as returned by the API
+TIME, LOW, HIGH, OPEN, CLOSE, VOLUME = range(6)
+
+
+def _parse_time(value: str) -> int:
+    """Parse an ISO 8601 timestamp to epoch seconds (naive times are UTC)."""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+def _format_time(epoch: float) -> str:
+    return datetime.fromtimestamp(int(epoch), tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def split_windows(start: int, end: int, granularity: int) -> List[Tuple[int, int]]:
+    """Split [start, end) into windows of at most MAX_CANDLES_PER_REQUEST candles."""
+    span = granularity * MAX_CANDLES_PER_REQUEST
+    return [(window_start, min(window_start + span, end)) for window_start in range(start, end, span)]
+
+
+@rate_limited(api_type="products")
+async def _fetch_candles(symbol: str, start: int, end: int, granularity: int) -> Any:
+    # The end bound is inclusive on the API side; stop one second short so
+    # adjacent windows do not return the same candle twice
+    return await make_coinbase_request(
+        method="GET",
+        endpoint=f"/products/{symbol}/candles",
+        query_params=[
+            f"start={_format_time(start)}",
+            f"end={_format_time(end - 1)}",
+            f"granularity={granularity}"
+        ],
+        require_auth=False,
+        base_url=EXCHANGE_URL
+    )
+
+
+def candles_to_array(candle_lists: List[List[List[float]]]) -> np.ndarray:
+    """Merge candle lists into one array sorted by time, without duplicate candles."""
+    rows = [candle for candles in candle_lists for candle in candles]
+    if not rows:
+        return np.empty((0, 6))
+    candles = np.asarray(rows, dtype=float)[:, :6]
+    _, unique_index = np.unique(candles[:, TIME], return_index=True)
+    return candles[unique_index]
+
+
+def choose_resample_period(start: int, end: int, granularity: int, max_bars: int = DEFAULT_MAX_BARS) -> int:
+    """Smallest standard bar size, not below granularity, giving at most max_bars bars."""
+    for period in RESAMPLE_PERIODS:
+        if period >= granularity and math.ceil((end - start) / period) <= max_bars:
+            return period
+    return RESAMPLE_PERIODS[-1]
+
+
+def resample_ohlc(candles: np.ndarray, period: int) -> List[Dict[str, Any]]:
+    """Aggregate time-sorted candles into OHLCV bars aligned to multiples of period."""
+    if not len(candles):
+        return []
+    buckets = candles[:, TIME] // period * period
+    bucket_times, starts = np.unique(buckets, return_index=True)
+    ends = np.append(starts[1:], len(candles)) - 1
+
+    opens = candles[starts, OPEN]
+    closes = candles[ends, CLOSE]
+    highs = np.maximum.reduceat(candles[:, HIGH], starts)
+    lows = np.minimum.reduceat(candles[:, LOW], starts)
+    volumes = np.add.reduceat(candles[:, VOLUME], starts)
+
+    return [
+        {
+            "time": _format_time(bucket_time),
+            "open": float(open_), "high": float(high), "low": float(low),
+            "close": float(close), "volume": float(volume),
+        }
+        for bucket_time, open_, high, low, close, volume
+        in zip(bucket_times, opens, highs, lows, closes, volumes)
+    ]
+
+
+def summarize_candles(candles: np.ndarray, granularity: int) -> Dict[str, Any]:
+    """Return, volatility and drawdown statistics of time-sorted candles."""
+    if not len(candles):
+        return {}
+    closes = candles[:, CLOSE]
+    first_open = candles[0, OPEN]
+    summary: Dict[str, Any] = {
+        "open": float(first_open),
+        "close": float(closes[-1]),
+        "high": float(candles[:, HIGH].max()),
+        "low": float(candles[:, LOW].min()),
+        "volume": float(candles[:, VOLUME].sum()),
+        "total_return": float(closes[-1] / first_open - 1) if first_open else None,
+        "max_drawdown": float((closes / np.maximum.accumulate(closes) - 1).min()),
+    }
+    volumes = candles[:, VOLUME]
+    if volumes.sum() > 0:
+        typical = (candles[:, HIGH] + candles[:, LOW] + closes) / 3
+        summary["vwap"] = float(np.average(typical, weights=volumes))
+
+    if len(closes) > 1:
+        # Log returns between consecutive candles; gaps in the data (no
+        # trades) are skipped rather than counted as one long period
+        gaps = np.diff(candles[:, TIME])
+        log_returns = np.diff(np.log(closes))[gaps == granularity]
+        if len(log_returns) > 1:
+            period_volatility = float(np.std(log_returns, ddof=1))
+            summary.update({
+                "mean_log_return": float(log_returns.mean()),
+                "volatility": period_volatility,
+                "annualized_volatility": period_volatility * math.sqrt(SECONDS_PER_YEAR / granularity),
+                "best_return": float(np.expm1(log_returns.max())),
+                "worst_return": float(np.expm1(log_returns.min())),
+            })
+    return summary
+
+
+async def coinbase_get_price_history_summary(
+    symbol: str,
+    start: str,
+    end: str,
+    granularity: Optional[int] = 3600,
+    resample_seconds: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Summarize the price history of a trading pair over a long range.
+
+    The range is split into windows of at most 300 candles, the API limit for
+    one request, which are fetched concurrently (each request takes a token
+    from the products rate limiter). Instead of raw candles, returns OHLCV
+    bars resampled to resample_seconds and return/volatility statistics.
+
+    Args:
+        symbol (str): Trading pair symbol (e.g., 'BTC-USD').
+        start (str): Start time in ISO 8601 format (e.g., '2024-01-01T00:00:00Z').
+        end (str): End time in ISO 8601 format (e.g., '2024-12-31T23:59:59Z').
+        granularity (int): Candle granularity in seconds. Options: 60, 300, 900, 3600, 21600, 86400.
+        resample_seconds (int): Optional. Bar size in seconds, a multiple of granularity.
+            Defaults to the smallest standard size giving at most 100 bars.
+    Returns:
+        dict: JSON response with resampled bars and summary statistics.
+    """
+    try:
+        if not EXCHANGE_URL:
+            return {"error": "Exchange URL not configured"}
+
+        granularity = granularity or 3600
+        if granularity not in CANDLE_GRANULARITIES:
+            return {"error": f"Invalid granularity {granularity}. Options: {', '.join(map(str, CANDLE_GRANULARITIES))}."}
+
+        start_time, end_time = _parse_time(start), _parse_time(end)
+        if end_time <= start_time:
+            return {"error": "end must be after start"}
+
+        candle_count = math.ceil((end_time - start_time) / granularity)
+        if candle_count > MAX_CANDLES_PER_SUMMARY:
+            return {
+                "error": f"Range covers {candle_count} candles at granularity {granularity}; "
+                         f"the limit is {MAX_CANDLES_PER_SUMMARY}. Use a larger granularity or a shorter range."
+            }
+
+        if resample_seconds is None:
+            resample_seconds = choose_resample_period(start_time, end_time, granularity)
+        elif resample_seconds <= 0 or resample_seconds % granularity:
+            return {"error": "resample_seconds must be a positive multiple of granularity"}
+
+        windows = split_windows(start_time, end_time, granularity)
+        responses = await asyncio.gather(
+            *(_fetch_candles(symbol, window_start, window_end, granularity) for window_start, window_end in windows)
+        )
+
+        for response in responses:
+            if isinstance(response, dict) and "error" in response:
+                return {"error": f"Could not get Coinbase historical prices for {symbol}: {response['error']}"}
+
+        candles = candles_to_array(responses)
+        # Windows are fetched by candle start time; drop anything the API
+        # returned outside the requested range
+        candles = candles[(candles[:, TIME] >= start_time) & (candles[:, TIME] < end_time)]
+
+        return {
+            "data": {
+                "symbol": symbol,
+                "start": _format_time(start_time),
+                "end": _format_time(end_time),
+                "granularity": granularity,
+                "candles": len(candles),
+                "requests": len(windows),
+                "resample_seconds": resample_seconds,
+                "summary": summarize_candles(candles, granularity),
+                "bars": resample_ohlc(candles, resample_seconds),
+            }
+        }
+
+    except ValueError as e:
+        return {"error": f"Invalid time range: {str(e)}"}
+    except Exception as e:
+        logger.error(f"Coinbase price history summary request failed: {e}")
+        return {
+            "error": f"Could not summarize Coinbase price history for {symbol}: {str(e)}"
+        }
@@ -126,6 +126,8 @@ class RateLimiter:
         self.token_bucket = TokenBucketRateLimiter(
             self.max_requests_per_second
         )
+        # Serializes waiters so concurrent calls take tokens one at a time
+        self._lock = asyncio.Lock()
 
     def _is_rate_limited(self) -> bool:
         """Check if we're currently rate limited using token bucket."""
@@ -162,6 +164,27 @@ class RateLimiter:
         """Async delay function."""
         await asyncio.sleep(seconds)
 
+    async def acquire(self, context: str = "API request"):
+        """
+        Wait until a token is available and consume it.
+
+        Safe to call from concurrent tasks: waiters queue on a lock, so a
+        burst of calls is spread out at the bucket's refill rate instead of
+        all proceeding after the same wait.
+
+        Args:
+            context: Context string for logging
+        """
+        async with self._lock:
+            while self._is_rate_limited():
+                wait_time = self._calculate_wait_time()
+                logger.warning(
+                    f"Rate limit active for {context}. Waiting {wait_time:.2f}s")
+                await self._delay(wait_time)
+
+            # Record the request
+            self._add_request()
+
     async def with_retry(self, operation: Callable, context: str = "API request") -> Any:
         """
         Execute an operation with retry logic and rate limiting.
@@ -177,15 +200,8 @@ class RateLimiter:
 
         while attempt <= config.max_retry_attempts:
             try:
-                # Check rate limits before making request
-                if self._is_rate_limited():
-                    wait_time = self._calculate_wait_time()
-                    logger.warning(
-                        f"Rate limit active for {context}. Waiting {wait_time:.2f}s")
-                    await self._delay(wait_time)
-
-                # Record the request
-                self._add_request()
+                # Wait for a token before making request
+                await self.acquire(context)
 
                 # Execute the operation
                 return await operation()
@@ -221,15 +237,8 @@ class RateLimiter:
             None
         """
         try:
-            # Check rate limits before starting
-            if self._is_rate_limited():
-                wait_time = self._calculate_wait_time()
-                logger.warning(
-                    f"Rate limit active for {context}. Waiting {wait_time:.2f}s")
-                await self._delay(wait_time)
-
-            # Record the request
-            self._add_request()
+            # Wait for a token before starting
+            await self.acquire(context)
 
             yield
 
@@ -1,9 +1,17 @@
+from collections import OrderedDict
 from enum import Enum
-from typing import Any
+from typing import Any, Optional
 from urllib.parse import parse_qs, urlparse
 from contextvars import ContextVar
+import asyncio
+import copy
+import hashlib
 import logging
+import os
+import time
 
+import http.cookiejar
+import importlib.util
 import httpx
 from errors import ToolExecutionError, AuthenticationError, TokenExpiredError, InvalidTokenError
 
@@ -20,6 +28,110 @@ from utils import (
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Shared HTTP client, reused across tool calls so connections stay pooled
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            # Reject all cookies: the client is shared across tenants
+            cookies=http.cookiejar.CookieJar(
+                policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+            ),
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _http_client
+
+
+async def init_http_clients() -> None:
+    """Create the shared HTTP client (called from the server lifespan)."""
+    get_http_client()
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP client on server shutdown."""
+    global _http_client
+    if _http_client is not None:
+        try:
+            await _http_client.aclose()
+        finally:
+            _http_client = None
+
+
+# Clients are created per tool call, so lookups worth keeping across calls are
+# cached at module level, keyed by a hash of the OAuth token.
+CLOUD_ID_CACHE_TTL_SECONDS = float(os.getenv("CONFLUENCE_CLOUD_ID_CACHE_TTL", "3600"))
+# Space trees are revalidated against the most recently modified page's
+# version.number on every hit; 0 disables the cache
+SPACE_TREE_CACHE_TTL_SECONDS = float(os.getenv("CONFLUENCE_SPACE_TREE_CACHE_TTL", "300"))
+# Maximum concurrent requests when fetching page descendants
+MAX_CONCURRENT_REQUESTS = int(os.getenv("CONFLUENCE_MAX_CONCURRENT_REQUESTS", "8"))
+# The v2 descendants endpoints return at most 5 levels per request
+DESCENDANTS_MAX_DEPTH = 5
+DESCENDANT_PATHS = {
+    "page": "pages",
+    "folder": "folders",
+    "whiteboard": "whiteboards",
+    "database": "databases",
+    "embed": "embeds",
+}
+
+
+class TTLCache:
+    """Small LRU cache whose entries expire after a per-entry TTL."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Any, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any, ttl: float) -> None:
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_cloud_id_cache = TTLCache(1024)
+_cloud_id_requests: dict[str, asyncio.Future] = {}
+_space_tree_cache = TTLCache(64)
+
+
+def token_cache_key(token: str) -> str:
+    """Hash a token so it is never kept in cache keys verbatim."""
+    return hashlib.sha256((token or "").encode("utf-8")).hexdigest()
+
+
+def _next_cursor(response: dict[str, Any]) -> Optional[str]:
+    """Extract the cursor from a v2 response's `_links.next`, if any."""
+    return parse_qs(urlparse(response.get("_links", {}).get("next", "")).query).get(
+        "cursor",
+        [None],  # type: ignore[list-item]
+    )[0]
+
 
 class ConfluenceAPIVersion(str, Enum):
     V1 = "wiki/rest/api"
@@ -56,20 +168,20 @@ class ConfluenceClient:
         logger.info(f"Fetching cloud ID from accessible-resources endpoint")
         
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(self.ACCESSIBLE_RESOURCES_URL, headers=headers)
-                resp.raise_for_status()
-                resp_json = resp.json()
-                
-                if len(resp_json) == 0:
-                    raise ToolExecutionError(
-                        message="No workspaces found for the authenticated user.",
-                        developer_message="The OAuth token is valid but no Confluence workspaces are accessible. Ensure the user has access to at least one Confluence site."
-                    )
+            client = get_http_client()
+            resp = await client.get(self.ACCESSIBLE_RESOURCES_URL, headers=headers)
+            resp.raise_for_status()
+            resp_json = resp.json()
+            
+            if len(resp_json) == 0:
+                raise ToolExecutionError(
+                    message="No workspaces found for the authenticated user.",
+                    developer_message="The OAuth token is valid but no Confluence workspaces are accessible. Ensure the user has access to at least one Confluence site."
+                )
 
-                cloud_id = resp_json[0].get("id")
-                logger.info(f"Successfully retrieved cloud ID: {cloud_id}")
-                return cloud_id
+            cloud_id = resp_json[0].get("id")
+            logger.info(f"Successfully retrieved cloud ID: {cloud_id}")
+            return cloud_id
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
@@ -109,9 +221,23 @@ class ConfluenceClient:
             )
 
     async def _ensure_cloud_id(self) -> str:
-        """Ensure cloud_id is available, fetching it if necessary."""
+        """Ensure cloud_id is available, fetching it if necessary.
+
+        Cloud IDs are cached per token across clients; concurrent lookups for
+        the same token share one request.
+        """
         if self.cloud_id is None:
-            self.cloud_id = await self._get_cloud_id()
+            key = token_cache_key(self.token)
+            cloud_id = _cloud_id_cache.get(key)
+            if cloud_id is None:
+                lookup = _cloud_id_requests.get(key)
+                if lookup is None:
+                    lookup = asyncio.ensure_future(self._get_cloud_id())
+                    _cloud_id_requests[key] = lookup
+                    lookup.add_done_callback(lambda _: _cloud_id_requests.pop(key, None))
+                cloud_id = await asyncio.shield(lookup)
+                _cloud_id_cache.set(key, cloud_id, CLOUD_ID_CACHE_TTL_SECONDS)
+            self.cloud_id = cloud_id
         return self.cloud_id
 
     async def request(self, method: str, path: str, **kwargs: Any) -> Any:
@@ -126,39 +252,39 @@ class ConfluenceClient:
         if 'headers' in kwargs:
             headers.update(kwargs.pop('headers'))
         
-        async with httpx.AsyncClient() as client:
-            url = f"{self.BASE_URL}/{cloud_id}/{self.api_version}/{path.lstrip('/')}"
-            logger.debug(f"Making {method} request to: {url}")
-                
-            try:
-                response = await client.request(
-                    method,
-                    url,
-                    headers=headers,
-                    **kwargs,
+        client = get_http_client()
+        url = f"{self.BASE_URL}/{cloud_id}/{self.api_version}/{path.lstrip('/')}"
+        logger.debug(f"Making {method} request to: {url}")
+            
+        try:
+            response = await client.request(
+                method,
+                url,
+                headers=headers,
+                **kwargs,
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 401:
+                logger.error(f"Authentication failed for API request: {e}")
+                raise TokenExpiredError(
+                    message="OAuth token is expired or invalid",
+                    developer_message=f"Received 401 Unauthorized when calling {url}. " +
+                                    "The OAuth token may have expired. Please re-authenticate."
                 )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 401:
-                    logger.error(f"Authentication failed for API request: {e}")
-                    raise TokenExpiredError(
-                        message="OAuth token is expired or invalid",
-                        developer_message=f"Received 401 Unauthorized when calling {url}. " +
-                                        "The OAuth token may have expired. Please re-authenticate."
-                    )
-                else:
-                    logger.error(f"HTTP error in API request: {e}")
-                    raise ToolExecutionError(
-                        message=f"API request failed: HTTP {e.response.status_code}",
-                        developer_message=f"HTTP {e.response.status_code} error when calling {url}: {e}"
-                    )
-            except Exception as e:
-                logger.error(f"Unexpected error in API request: {e}")
+            else:
+                logger.error(f"HTTP error in API request: {e}")
                 raise ToolExecutionError(
-                    message="Unexpected error in API request",
-                    developer_message=f"Unexpected error when calling {url}: {type(e).__name__}: {e}"
+                    message=f"API request failed: HTTP {e.response.status_code}",
+                    developer_message=f"HTTP {e.response.status_code} error when calling {url}: {e}"
                 )
+        except Exception as e:
+            logger.error(f"Unexpected error in API request: {e}")
+            raise ToolExecutionError(
+                message="Unexpected error in API request",
+                developer_message=f"Unexpected error when calling {url}: {type(e).__name__}: {e}"
+            )
 
     async def get(self, path: str, **kwargs: Any) -> Any:
         return await self.request("GET", path, **kwargs)
@@ -348,10 +474,7 @@ class ConfluenceClientV2(ConfluenceClient):
         Transform the response from the GET /spaces endpoint by converting relative webui paths
         to absolute URLs using the base URL from the response.
         """
-        pagination_token = parse_qs(urlparse(response.get("_links", {}).get("next", "")).query).get(
-            "cursor",
-            [None],  # type: ignore[list-item]
-        )[0]
+        pagination_token = _next_cursor(response)
 
         base_url = response.get("_links", {}).get("base", "")
         results = response.get("results", [])
@@ -370,10 +493,7 @@ class ConfluenceClientV2(ConfluenceClient):
 
     def transform_list_pages_response(self, response: dict[str, Any]) -> dict[str, Any]:
         """Transform the response from the GET /pages endpoint."""
-        pagination_token = parse_qs(urlparse(response.get("_links", {}).get("next", "")).query).get(
-            "cursor",
-            [None],  # type: ignore[list-item]
-        )[0]
+        pagination_token = _next_cursor(response)
 
         base_url = response.get("_links", {}).get("base", "")
         pages = [self._transform_links(page, base_url) for page in response["results"]]
@@ -400,10 +520,7 @@ class ConfluenceClientV2(ConfluenceClient):
 
     def transform_get_attachments_response(self, response: dict[str, Any]) -> dict[str, Any]:
         """Transform the response from the GET /pages/{id}/attachments endpoint."""
-        pagination_token = parse_qs(urlparse(response.get("_links", {}).get("next", "")).query).get(
-            "cursor",
-            [None],  # type: ignore[list-item]
-        )[0]
+        pagination_token = _next_cursor(response)
 
         base_url = response.get("_links", {}).get("base", "")
         attachments = []
@@ -495,6 +612,26 @@ class ConfluenceClientV2(ConfluenceClient):
         )
         return payload
 
+    async def get_all_results(
+        self, path: str, params: dict[str, Any] | None = None
+    ) -> tuple[list[dict[str, Any]], str]:
+        """Get every result of a cursor-paginated v2 endpoint.
+
+        Returns:
+            The results of all pages and the `_links.base` URL
+        """
+        params = dict(params or {})
+        results: list[dict[str, Any]] = []
+        base_url = ""
+        while True:
+            response = await self.get(path, params=params)
+            results.extend(response.get("results", []))
+            base_url = base_url or response.get("_links", {}).get("base", "")
+            cursor = _next_cursor(response)
+            if not cursor:
+                return results, base_url
+            params["cursor"] = cursor
+
     async def get_root_pages_in_space(self, space_id: str) -> dict[str, Any]:
         """
         Get the root pages in a space.
@@ -505,9 +642,8 @@ class ConfluenceClientV2(ConfluenceClient):
             "depth": "root",
             "limit": 250,
         }
-        pages = await self.get(f"spaces/{space_id}/pages", params=params)
-        base_url = pages.get("_links", {}).get("base", "")
-        return {"pages": [self._transform_links(page, base_url) for page in pages["results"]]}
+        pages, base_url = await self.get_all_results(f"spaces/{space_id}/pages", params=params)
+        return {"pages": [self._transform_links(page, base_url) for page in pages]}
 
     async def get_space_homepage(self, space_id: str) -> dict[str, Any]:
         """
@@ -686,45 +822,101 @@ class ConfluenceClientV2(ConfluenceClient):
         
         return tree_nodes
 
+    async def get_space_tree_version(self, space_id: str) -> tuple | None:
+        """Get a cheap fingerprint of a space's page tree.
+
+        Editing, adding or moving a page bumps its version.number, which makes it
+        the space's most recently modified page. Deletions and changes to other
+        content types are not detected and only expire with the cache TTL.
+
+        Requires Confluence scope 'read:page:confluence'
+        """
+        if SPACE_TREE_CACHE_TTL_SECONDS <= 0:
+            return None
+        params = {"sort": "-modified-date", "limit": 1}
+        response = await self.get(f"spaces/{space_id}/pages", params=params)
+        pages = response.get("results", [])
+        if not pages:
+            return None
+        return (pages[0].get("id"), pages[0].get("version", {}).get("number"))
+
+    def get_cached_space_tree(self, space_id: str, version: tuple | None) -> dict | None:
+        """Return a cached space tree if it was built at the given version."""
+        if version is None:
+            return None
+        entry = _space_tree_cache.get((token_cache_key(self.token), space_id))
+        if entry is None or entry[0] != version:
+            return None
+        return copy.deepcopy(entry[1])
+
+    def cache_space_tree(self, space_id: str, version: tuple | None, tree: dict) -> None:
+        """Cache a space tree together with the version it was built at."""
+        if version is None:
+            return
+        _space_tree_cache.set(
+            (token_cache_key(self.token), space_id),
+            (version, copy.deepcopy(tree)),
+            SPACE_TREE_CACHE_TTL_SECONDS,
+        )
+
+    async def get_descendants(
+        self, content_id: str, content_type: str, semaphore: asyncio.Semaphore
+    ) -> list[dict[str, Any]]:
+        """Get all descendants of a content item, following every cursor.
+
+        The descendants endpoint returns at most DESCENDANTS_MAX_DEPTH levels,
+        so items at that depth are expanded with further concurrent requests.
+        """
+        async with semaphore:
+            descendants, _ = await self.get_all_results(
+                f"{DESCENDANT_PATHS[content_type]}/{content_id}/descendants",
+                params={"limit": 250, "depth": DESCENDANTS_MAX_DEPTH},
+            )
+
+        deepest = [
+            desc for desc in descendants
+            if desc.get("depth") == DESCENDANTS_MAX_DEPTH and desc.get("type") in DESCENDANT_PATHS
+        ]
+        if deepest:
+            deeper = await asyncio.gather(
+                *(self.get_descendants(desc["id"], desc["type"], semaphore) for desc in deepest)
+            )
+            for more in deeper:
+                descendants.extend(more)
+        return descendants
+
     async def process_page_descendants(self, root_children: list, base_url: str) -> None:
-        """Process page descendants and build the hierarchy."""
-        # For each root page, get its descendants
-        for root_child in root_children:
-            if root_child["type"] == "page":
-                try:
-                    # Get descendants for this page
-                    params = {
-                        "expand": "ancestors"
-                    }
-                    response = await self.get(f"content/{root_child['id']}/descendant", params=params)
-                    
-                    # Process descendants into hierarchy
-                    descendants = response.get("page", {}).get("results", [])
-                    if descendants:
-                        transformed_children = []
-                        for desc in descendants:
-                            child_node = {
-                                "id": desc.get("id"),
-                                "title": desc.get("title"),
-                                "type": desc.get("type", "page"),
-                                "status": desc.get("status", "current"),
-                                "parent_id": None,
-                                "children": []
-                            }
-                            
-                            # Determine parent ID from ancestors
-                            ancestors = desc.get("ancestors", [])
-                            if ancestors:
-                                child_node["parent_id"] = ancestors[-1].get("id")
-                            
-                            # Build URL
-                            child_node["url"] = build_child_url(base_url, child_node) or ""
-                            
-                            transformed_children.append(child_node)
-                        
-                        # Build hierarchy
-                        build_hierarchy(transformed_children, root_child["id"], root_child)
-                
-                except Exception:
-                    # Log the error but continue processing other pages
-                    continue 
\ No newline at end of file
+        """Process page descendants and build the hierarchy.
+
+        Descendants of all root pages are fetched concurrently, with at most
+        MAX_CONCURRENT_REQUESTS requests in flight.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def process_root(root_child: dict) -> None:
+            try:
+                descendants = await self.get_descendants(root_child["id"], "page", semaphore)
+            except Exception as e:
+                # Log the error but continue processing other pages
+                logger.warning(f"Failed to get descendants of page {root_child['id']}: {e}")
+                return
+
+            transformed_children = []
+            for desc in descendants:
+                child_node = {
+                    "id": desc.get("id"),
+                    "title": desc.get("title"),
+                    "type": desc.get("type", "page"),
+                    "status": desc.get("status", "current"),
+                    "parent_id": desc.get("parentId"),
+                    "children": []
+                }
+                child_node["url"] = build_child_url(base_url, child_node) or ""
+                transformed_children.append(child_node)
+
+            if transformed_children:
+                build_hierarchy(transformed_children, root_child["id"], root_child)
+
+        await asyncio.gather(
+            *(process_root(root_child) for root_child in root_children if root_child["type"] == "page")
+        )
@@ -140,10 +140,18 @@ async def get_space_hierarchy(
     client = ConfluenceClientV2()
 
     space = await client.get_space(space_identifier)
+    space_id = space["space"]["id"]
+
+    # Reuse a recently built tree while the space's pages are unchanged
+    version = await client.get_space_tree_version(space_id)
+    cached_tree = client.get_cached_space_tree(space_id, version)
+    if cached_tree is not None:
+        return cached_tree
+
     tree = client.create_space_tree(space)
 
     # Get root pages
-    root_pages = await client.get_root_pages_in_space(space["space"]["id"])
+    root_pages = await client.get_root_pages_in_space(space_id)
     tree["children"] = client.convert_root_pages_to_tree_nodes(root_pages["pages"])
 
     if not tree["children"]:
@@ -157,6 +165,7 @@ async def get_space_hierarchy(
     # Get descendants for each root page
     await client.process_page_descendants(tree["children"], children_base_url)
 
+    client.cache_space_tree(space_id, version, tree)
     return tree
 
 
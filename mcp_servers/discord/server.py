@@ -39,6 +39,40 @@ def _get_discord_headers() -> Dict[str, str]:
         "Content-Type": "application/json"
     }
 
+# Shared HTTP session, reused across tool calls so connections stay pooled
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Return the process-wide HTTP session, creating it on first use."""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            keepalive_timeout=30,
+        )
+        # No cookie jar: the session is shared across tenants
+        _http_session = aiohttp.ClientSession(
+            connector=connector, cookie_jar=aiohttp.DummyCookieJar()
+        )
+    return _http_session
+
+
+async def init_http_clients() -> None:
+    """Create the shared HTTP session (called from the server lifespan)."""
+    get_http_session()
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP session on server shutdown."""
+    global _http_session
+    if _http_session is not None:
+        try:
+            await _http_session.close()
+        finally:
+            _http_session = None
+
+
 # Helper to make API requests and handle errors
 async def _make_discord_request(method: str, endpoint: str, json_data: Optional[Dict] = None, expect_empty_response: bool = False) -> Any:
     """
@@ -47,45 +81,45 @@ async def _make_discord_request(method: str, endpoint: str, json_data: Optional[
     url = f"{DISCORD_API_BASE}{endpoint}"
     headers = _get_discord_headers()
     
-    async with aiohttp.ClientSession(headers=headers) as session:
-        try:
-            async with session.request(method, url, json=json_data) as response:
-                response.raise_for_status()  # Raise exception for non-2xx status codes
-                if expect_empty_response:
-                    # For requests like DELETE or PUT roles/reactions where success is 204 No Content
-                    if response.status == 204: 
-                        return None
-                    else:
-                         # If we expected empty but got something else (and it wasn't an error raised above)
-                         logger.warning(f"Expected empty response for {method} {endpoint}, but got status {response.status}")
-                         # Try to parse JSON anyway, might be useful error info
-                         try:
-                             return await response.json()
-                         except aiohttp.ContentTypeError:
-                             return await response.text() # Return text if not json
+    session = get_http_session()
+    try:
+        async with session.request(method, url, json=json_data, headers=headers) as response:
+            response.raise_for_status()  # Raise exception for non-2xx status codes
+            if expect_empty_response:
+                # For requests like DELETE or PUT roles/reactions where success is 204 No Content
+                if response.status == 204: 
+                    return None
                 else:
-                    # Check if response is JSON before parsing
-                    if 'application/json' in response.headers.get('Content-Type', ''):
+                     # If we expected empty but got something else (and it wasn't an error raised above)
+                     logger.warning(f"Expected empty response for {method} {endpoint}, but got status {response.status}")
+                     # Try to parse JSON anyway, might be useful error info
+                     try:
                          return await response.json()
-                    else:
-                         # Handle non-JSON responses if necessary, e.g., log or return text
-                         text_content = await response.text()
-                         logger.warning(f"Received non-JSON response for {method} {endpoint}: {text_content[:100]}...")
-                         return {"raw_content": text_content}
-        except aiohttp.ClientResponseError as e:
-            logger.error(f"Discord API request failed: {e.status} {e.message} for {method} {url}")
-            error_details = e.message
-            try:
-                # Discord often returns JSON errors
-                error_body = await e.response.json()
-                error_details = f"{e.message} - {error_body}"
-            except Exception:
-                 # If response body isn't JSON or can't be read
-                 pass
-            raise RuntimeError(f"Discord API Error ({e.status}): {error_details}") from e
-        except Exception as e:
-            logger.error(f"An unexpected error occurred during Discord API request: {e}")
-            raise RuntimeError(f"Unexpected error during API call to {method} {url}") from e
+                     except aiohttp.ContentTypeError:
+                         return await response.text() # Return text if not json
+            else:
+                # Check if response is JSON before parsing
+                if 'application/json' in response.headers.get('Content-Type', ''):
+                     return await response.json()
+                else:
+                     # Handle non-JSON responses if necessary, e.g., log or return text
+                     text_content = await response.text()
+                     logger.warning(f"Received non-JSON response for {method} {endpoint}: {text_content[:100]}...")
+                     return {"raw_content": text_content}
+    except aiohttp.ClientResponseError as e:
+        logger.error(f"Discord API request failed: {e.status} {e.message} for {method} {url}")
+        error_details = e.message
+        try:
+            # Discord often returns JSON errors
+            error_body = await e.response.json()
+            error_details = f"{e.message} - {error_body}"
+        except Exception:
+             # If response body isn't JSON or can't be read
+             pass
+        raise RuntimeError(f"Discord API Error ({e.status}): {error_details}") from e
+    except Exception as e:
+        logger.error(f"An unexpected error occurred during Discord API request: {e}")
+        raise RuntimeError(f"Unexpected error during API call to {method} {url}") from e
 
 async def get_server_info(server_id: str) -> Dict[str, Any]:
     """Get information about a Discord server (guild)."""
@@ -684,13 +718,15 @@ def main(
 
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
-        """Context manager for session manager."""
+        """Context manager for session manager and shared HTTP client."""
+        await init_http_clients()
         async with session_manager.run():
             logger.info("Application started with dual transports!")
             try:
                 yield
             finally:
                 logger.info("Application shutting down...")
+                await close_http_clients()
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
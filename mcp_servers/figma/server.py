@@ -36,6 +36,7 @@ from tools import (
     delete_webhook,
     get_library_analytics,
 )
+from tools.base import init_http_clients, close_http_clients
 
 # Load env early
 load_dotenv()
@@ -557,8 +558,12 @@ async def run_server(log_level: str = "INFO"):
 
     # Run with stdio transport for Claude Desktop
     logger.info("Starting Figma MCP server with stdio transport")
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(read_stream, write_stream, app.create_initialization_options())
+    await init_http_clients()
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(read_stream, write_stream, app.create_initialization_options())
+    finally:
+        await close_http_clients()
 
 
 @click.command()
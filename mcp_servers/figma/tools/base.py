@@ -39,6 +39,41 @@ def _get_ssl_context():
     """Create secure SSL context."""
     return ssl.create_default_context()
 
+# Shared HTTP session, reused across tool calls so connections stay pooled
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Return the process-wide HTTP session, creating it on first use."""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        connector = aiohttp.TCPConnector(
+            ssl=_get_ssl_context(),
+            limit=100,
+            keepalive_timeout=30,
+        )
+        # No cookie jar: the session is shared across tenants
+        _http_session = aiohttp.ClientSession(
+            connector=connector, cookie_jar=aiohttp.DummyCookieJar()
+        )
+    return _http_session
+
+
+async def init_http_clients() -> None:
+    """Create the shared HTTP session (called from the server lifespan)."""
+    get_http_session()
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP session on server shutdown."""
+    global _http_session
+    if _http_session is not None:
+        try:
+            await _http_session.close()
+        finally:
+            _http_session = None
+
+
 async def make_figma_request(
     method: str, 
     endpoint: str, 
@@ -63,43 +98,42 @@ async def make_figma_request(
     url = f"{base_url}{endpoint}"
     headers = _get_figma_headers()
     
-    connector = aiohttp.TCPConnector(ssl=_get_ssl_context())
-    async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
-        try:
-            async with session.request(method, url, json=json_data, params=params) as response:
-                response.raise_for_status()
-                
-                if expect_empty_response:
-                    if response.status in [200, 201, 204]:
-                        return None
-                    else:
-                        logger.warning(f"Expected empty response for {method} {endpoint}, but got status {response.status}")
-                        try:
-                            return await response.json()
-                        except aiohttp.ContentTypeError:
-                            return await response.text()
+    session = get_http_session()
+    try:
+        async with session.request(method, url, json=json_data, params=params, headers=headers) as response:
+            response.raise_for_status()
+            
+            if expect_empty_response:
+                if response.status in [200, 201, 204]:
+                    return None
                 else:
-                    if 'application/json' in response.headers.get('Content-Type', ''):
+                    logger.warning(f"Expected empty response for {method} {endpoint}, but got status {response.status}")
+                    try:
                         return await response.json()
-                    else:
-                        text_content = await response.text()
-                        logger.warning(f"Received non-JSON response for {method} {endpoint}: {text_content[:100]}...")
-                        return {"raw_content": text_content}
-                        
-        except aiohttp.ClientResponseError as e:
-            logger.error(f"Figma API request failed: {e.status} {e.message} for {method} {url}")
-            error_details = e.message
-            try:
-                error_body = await e.response.json()
-                if 'err' in error_body:
-                    error_details = error_body['err']
-                elif 'message' in error_body:
-                    error_details = error_body['message']
+                    except aiohttp.ContentTypeError:
+                        return await response.text()
+            else:
+                if 'application/json' in response.headers.get('Content-Type', ''):
+                    return await response.json()
                 else:
-                    error_details = f"{e.message} - {error_body}"
-            except Exception:
-                pass
-            raise RuntimeError(f"Figma API Error ({e.status}): {error_details}") from e
-        except Exception as e:
-            logger.error(f"An unexpected error occurred during Figma API request: {e}")
-            raise RuntimeError(f"Unexpected error during API call to {method} {url}") from e
\ No newline at end of file
+                    text_content = await response.text()
+                    logger.warning(f"Received non-JSON response for {method} {endpoint}: {text_content[:100]}...")
+                    return {"raw_content": text_content}
+                    
+    except aiohttp.ClientResponseError as e:
+        logger.error(f"Figma API request failed: {e.status} {e.message} for {method} {url}")
+        error_details = e.message
+        try:
+            error_body = await e.response.json()
+            if 'err' in error_body:
+                error_details = error_body['err']
+            elif 'message' in error_body:
+                error_details = error_body['message']
+            else:
+                error_details = f"{e.message} - {error_body}"
+        except Exception:
+            pass
+        raise RuntimeError(f"Figma API Error ({e.status}): {error_details}") from e
+    except Exception as e:
+        logger.error(f"An unexpected error occurred during Figma API request: {e}")
+        raise RuntimeError(f"Unexpected error during API call to {method} {url}") from e
\ No newline at end of file
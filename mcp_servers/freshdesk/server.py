@@ -24,12 +24,15 @@ from tools import (
     # Context variables
     auth_token_context,
     domain_context,
+    init_http_clients,
+    close_http_clients,
 
     # Ticket tools
     create_ticket,
     update_ticket,
     delete_ticket,
     get_ticket_by_id,
+    get_tickets_by_ids,
     list_tickets,
     add_note_to_ticket,
     filter_tickets,
@@ -51,6 +54,7 @@ from tools import (
 
     create_contact,
     get_contact_by_id,
+    get_contacts_by_ids,
     list_contacts,
     update_contact,
     delete_contact,
@@ -296,6 +300,26 @@ def main(port: int, log_level: str, json_response: bool) -> int:
             },
             annotations=types.ToolAnnotations(**{"category": "FRESHDESK_TICKET", "readOnlyHint": True})
         ),
+        types.Tool(
+            name="freshdesk_get_tickets_by_ids",
+            description="Retrieve multiple tickets by their IDs in one call. Tickets are fetched concurrently within the account's rate limit.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "ticket_ids": {
+                        "type": "array",
+                        "items": {"type": "integer"},
+                        "description": "List of ticket IDs to retrieve (required)."
+                    },
+                    "include": {
+                        "type": "string",
+                        "description": "Optional query parameter to include additional data (e.g., 'conversations', 'requester', 'company', 'stats')"
+                    }
+                },
+                "required": ["ticket_ids"]
+            },
+            annotations=types.ToolAnnotations(**{"category": "FRESHDESK_TICKET", "readOnlyHint": True})
+        ),
         types.Tool(
             name="freshdesk_update_ticket",
             description="Update an existing ticket in Freshdesk.",
@@ -860,6 +884,22 @@ def main(port: int, log_level: str, json_response: bool) -> int:
             },
             annotations=types.ToolAnnotations(**{"category": "FRESHDESK_CONTACT", "readOnlyHint": True})
         ),
+        types.Tool(
+            name="freshdesk_get_contacts_by_ids",
+            description="Retrieve multiple contacts by their IDs in one call. Contacts are fetched concurrently within the account's rate limit.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "contact_ids": {
+                        "type": "array",
+                        "items": {"type": "integer"},
+                        "description": "List of contact IDs to retrieve"
+                    }
+                },
+                "required": ["contact_ids"]
+            },
+            annotations=types.ToolAnnotations(**{"category": "FRESHDESK_CONTACT", "readOnlyHint": True})
+        ),
         types.Tool(
             name="freshdesk_list_contacts",
             description="List all contacts, optionally filtered by parameters.",
@@ -1884,6 +1924,8 @@ def main(port: int, log_level: str, json_response: bool) -> int:
                 result = await create_ticket(**arguments)
             elif name == "freshdesk_get_ticket_by_id":
                 result = await get_ticket_by_id(**arguments)
+            elif name == "freshdesk_get_tickets_by_ids":
+                result = await get_tickets_by_ids(**arguments)
             elif name == "freshdesk_list_tickets":
                 result = await list_tickets(**arguments)
             elif name == "freshdesk_filter_tickets":
@@ -1925,6 +1967,8 @@ def main(port: int, log_level: str, json_response: bool) -> int:
                 result = await create_contact(**arguments)
             elif name == "freshdesk_get_contact_by_id":
                 result = await get_contact_by_id(**arguments)
+            elif name == "freshdesk_get_contacts_by_ids":
+                result = await get_contacts_by_ids(**arguments)
             elif name == "freshdesk_list_contacts":
                 result = await list_contacts(**arguments)
             elif name == "freshdesk_update_contact":
@@ -2062,13 +2106,15 @@ def main(port: int, log_level: str, json_response: bool) -> int:
 
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
-        """Context manager for session manager."""
+        """Context manager for session manager and shared HTTP client."""
+        await init_http_clients()
         async with session_manager.run():
             logger.info("Application started with dual transports!")
             try:
                 yield
             finally:
                 logger.info("Application shutting down...")
+                await close_http_clients()
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
@@ -0,0 +1,56 @@
+"""
+Tests for contact avatar uploads, with the Freshdesk API mocked out.
+
+Run from this directory: python -m pytest test_contacts.py
+"""
+
+import asyncio
+
+import pytest
+
+from tools import contacts
+
+
+@pytest.fixture
+def sent_requests(monkeypatch):
+    """Record make_freshdesk_request calls instead of sending them."""
+    requests = []
+
+    async def fake_request(method, endpoint, data=None, options=None, **kwargs):
+        requests.append({"method": method, "endpoint": endpoint, "data": data, "options": options})
+        return {"id": 1, **(data or {})}
+
+    monkeypatch.setattr(contacts, "make_freshdesk_request", fake_request)
+    return requests
+
+
+@pytest.fixture
+def avatar(tmp_path):
+    path = tmp_path / "avatar.png"
+    path.write_bytes(b"\x89PNG\r\n\x1a\nfake image")
+    return path
+
+
+def test_create_contact_with_avatar(sent_requests, avatar):
+    result = asyncio.run(contacts.create_contact(name="Ada", email="ada@example.com", avatar_path=str(avatar)))
+
+    assert "error" not in result
+    [request] = sent_requests
+    assert request["method"] == "POST"
+    assert request["options"]["files"] == [
+        ("avatar", ("avatar.png", b"\x89PNG\r\n\x1a\nfake image", "image/png"))
+    ]
+
+
+def test_update_contact_with_avatar(sent_requests, avatar):
+    result = asyncio.run(contacts.update_contact(7, name="Ada", avatar_path=str(avatar)))
+
+    assert "error" not in result
+    [request] = sent_requests
+    assert (request["method"], request["endpoint"]) == ("PUT", "/contacts/7")
+    assert request["options"]["files"][0][1][0] == "avatar.png"
+
+
+def test_create_contact_without_avatar(sent_requests):
+    asyncio.run(contacts.create_contact(name="Ada", email="ada@example.com"))
+    assert sent_requests[0]["options"] == {}
@@ -2,10 +2,11 @@
 # This package contains all the tool implementations organized by object type
 
 
-from .base import  auth_token_context, domain_context
+from .base import  auth_token_context, domain_context, init_http_clients, close_http_clients
 from .tickets import (
     create_ticket,
     get_ticket_by_id,
+    get_tickets_by_ids,
     update_ticket,
     delete_ticket,
     delete_multiple_tickets,
@@ -29,6 +30,7 @@ from .tickets import (
 from .contacts import (
     create_contact,
     get_contact_by_id,
+    get_contacts_by_ids,
     list_contacts,
     update_contact,
     delete_contact,
@@ -81,10 +83,13 @@ __all__ = [
     # Context variables
     'auth_token_context',
     'domain_context',
+    'init_http_clients',
+    'close_http_clients',
 
     # Tickets
     'create_ticket',
     'get_ticket_by_id',
+    'get_tickets_by_ids',
     'update_ticket',
     'delete_ticket',
     'delete_multiple_tickets',
@@ -109,6 +114,7 @@ __all__ = [
     # Contacts
     'create_contact',
     'get_contact_by_id',
+    'get_contacts_by_ids',
     'list_contacts',
     'update_contact',
     'delete_contact',
@@ -1,19 +1,68 @@
-import requests
+import asyncio
+import http.cookiejar
+import importlib.util
+import logging
+import httpx
 import os
 import random
 import string
-from typing import Any, Dict, Optional, List
+from typing import Any, Awaitable, Callable, Dict, Optional, List
 import base64
 from dotenv import load_dotenv
-from util import rate_limiter
+from util import get_rate_limiter
 from contextvars import ContextVar
 
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 auth_token_context: ContextVar[str] = ContextVar('auth_token')
 domain_context: ContextVar[str] = ContextVar('domain')
 
+# Retries for rate limited (429) requests, and for transient failures of GETs
+MAX_RETRIES = 3
+RETRY_STATUS_CODES = {502, 503, 504}
+# Concurrent requests per bulk fetch; the account's rate limiter still applies
+BULK_FETCH_CONCURRENCY = 10
+
+# Shared HTTP client, reused across tool calls so connections stay pooled
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            # Reject all cookies: the client is shared across tenants
+            cookies=http.cookiejar.CookieJar(
+                policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+            ),
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _http_client
+
+
+async def init_http_clients() -> None:
+    """Create the shared HTTP client (called from the server lifespan)."""
+    get_http_client()
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP client on server shutdown."""
+    global _http_client
+    if _http_client is not None:
+        try:
+            await _http_client.aclose()
+        finally:
+            _http_client = None
+
 def get_config_value(
     context_var: ContextVar[str],
     env_name: str,
@@ -55,13 +104,17 @@ def gen_random_password(length: int = 10) -> str:
 
 
 async def make_freshdesk_request(
-    method: str, 
-    endpoint: str, 
+    method: str,
+    endpoint: str,
     data: Optional[Dict] = None,
     options: Optional[Dict] = {},
 ) -> Any:
     """Make an HTTP request to the Freshdesk API.
-    
+
+    Requests are queued on the account's rate limiter (one per domain and API
+    key). Rate limited requests are retried after Retry-After, and GETs are
+    also retried on connection errors and 502/503/504 responses.
+
     Args:
         method: HTTP method (GET, POST, PUT, DELETE, etc.)
         endpoint: API endpoint (e.g., '/tickets')
@@ -72,28 +125,29 @@ async def make_freshdesk_request(
             query_params: Optional query parameters as a dictionary
             headers: Optional headers as a dictionary
             files: Optional files as a dictionary
-        
+
     Returns:
         Parsed JSON response from the API
-        
+
     Raises:
         ValueError: For invalid input parameters
-        requests.exceptions.RequestException: For HTTP and connection errors
+        httpx.HTTPError: For HTTP and connection errors
         json.JSONDecodeError: If response cannot be parsed as JSON
     """
     if not isinstance(method, str) or not method.strip():
         raise ValueError("HTTP method must be a non-empty string")
-    
+
     if not isinstance(endpoint, str) or not endpoint.strip():
         raise ValueError("Endpoint must be a non-empty string")
-    
+
     if data is not None and not isinstance(data, dict):
         raise ValueError("Data must be a dictionary or None")
 
-    FRESHDESK_API_BASE = f"https://{get_domain()}.freshdesk.com/api/v2"
+    FRESHDESK_DOMAIN = get_domain()
+    FRESHDESK_API_BASE = f"https://{FRESHDESK_DOMAIN}.freshdesk.com/api/v2"
     FRESHDESK_API_KEY = get_auth_token()
-    
-    
+
+
     url = f"{FRESHDESK_API_BASE}{endpoint}"
 
 
@@ -102,7 +156,7 @@ async def make_freshdesk_request(
     query_params = options.get("query_params", {})
     extra_headers = options.get("headers", {})
     files = options.get("files", None)
-    
+
     headers = {
         "Content-Type": "application/json",
         **extra_headers,
@@ -127,50 +181,84 @@ async def make_freshdesk_request(
         request_args["data"] = data
 
     if not use_pwd:
-        api_key = base64.b64encode(f"{FRESHDESK_API_KEY}:{random_password}").decode("utf-8")
-        headers["Authorization"] = f"{api_key}"
+        api_key = base64.b64encode(f"{FRESHDESK_API_KEY}:{random_password}".encode("utf-8")).decode("utf-8")
+        headers["Authorization"] = f"Basic {api_key}"
     else:
         request_args["auth"] = (FRESHDESK_API_KEY, random_password)
 
-    try:
-        
-        response = requests.request(
-            method=method.upper(),
-            url=url,
-            headers=headers,
-            timeout=timeout,
-            **request_args,
-        )
-        
+    method = method.upper()
+    rate_limiter = get_rate_limiter(FRESHDESK_DOMAIN, FRESHDESK_API_KEY)
+    client = get_http_client()
+
+    for attempt in range(MAX_RETRIES + 1):
+        await rate_limiter.acquire()
+        try:
+            response = await client.request(
+                method,
+                url,
+                headers=headers,
+                timeout=timeout,
+                **request_args,
+            )
+        except httpx.TimeoutException as e:
+            if method == "GET" and attempt < MAX_RETRIES:
+                continue
+            raise httpx.TimeoutException(
+                f"Request to Freshdesk API timed out after {timeout} seconds", request=e.request
+            ) from e
+        except httpx.TransportError:
+            if method == "GET" and attempt < MAX_RETRIES:
+                await asyncio.sleep(2 ** attempt)
+                continue
+            raise
+
         rate_limiter.update_from_headers(response.headers)
 
-        if response.status_code == 429:
-            retry_after = int(response.headers.get('Retry-After', 30))
-            await asyncio.sleep(retry_after)
-            return await make_freshdesk_request(method, endpoint, data, options)
-        
         # Log response status for debugging
-        print(f"Freshdesk API {method.upper()} {endpoint} - Status: {response.status_code}")
-        
-        # Raise HTTPError for 4XX/5XX responses
-        response.raise_for_status()
-        
-        # Handle empty responses (e.g., 204 No Content)
-        if not response.content:
-            return {}
-            
+        logger.info(f"Freshdesk API {method} {endpoint} - Status: {response.status_code}")
+
+        if attempt < MAX_RETRIES:
+            if response.status_code == 429:
+                # update_from_headers has already paused the bucket for Retry-After
+                if "Retry-After" not in response.headers:
+                    rate_limiter.block_for(30)
+                continue
+            if method == "GET" and response.status_code in RETRY_STATUS_CODES:
+                await asyncio.sleep(2 ** attempt)
+                continue
+        break
+
+    # Raise HTTPStatusError for 4XX/5XX responses
+    response.raise_for_status()
+
+    # Handle empty responses (e.g., 204 No Content)
+    if not response.content:
+        return {}
+
+    try:
         return response.json()
-        
-    except requests.exceptions.Timeout as e:
-        raise requests.exceptions.Timeout(f"Request to Freshdesk API timed out after {timeout} seconds") from e
-        
-    except requests.exceptions.TooManyRedirects as e:
-        raise requests.exceptions.TooManyRedirects("Too many redirects while connecting to Freshdesk API") from e
-        
     except ValueError as e:
         raise ValueError(f"Failed to parse JSON response from Freshdesk API: {str(e)}") from e
 
 
+async def fetch_concurrently(
+    fetch: Callable[[Any], Awaitable[Any]],
+    ids: List[Any],
+    limit: int = BULK_FETCH_CONCURRENCY,
+) -> List[Any]:
+    """Call fetch(id) for every id concurrently, at most `limit` at a time.
+
+    Results are returned in the order of `ids`.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def fetch_one(item_id: Any) -> Any:
+        async with semaphore:
+            return await fetch(item_id)
+
+    return await asyncio.gather(*(fetch_one(item_id) for item_id in ids))
+
+
 def handle_freshdesk_error(e: Exception, operation: str, object_type: str = "") -> Dict[str, Any]:
     """Handle Freshdesk errors and return a standardized error response.
     
@@ -201,12 +289,12 @@ def handle_freshdesk_error(e: Exception, operation: str, object_type: str = "")
         }
     }
 
-    # Handle requests.exceptions.RequestException and its subclasses
-    if isinstance(e, requests.exceptions.RequestException):
+    # Handle httpx.HTTPError and its subclasses
+    if isinstance(e, httpx.HTTPError):
         error_response['error']['code'] = 'request_error'
 
         # Handle HTTP errors (4XX, 5XX)
-        if hasattr(e, 'response') and e.response is not None:
+        if isinstance(e, httpx.HTTPStatusError):
             status_code = e.response.status_code
 
             # Map status codes to error codes
@@ -256,12 +344,12 @@ def handle_freshdesk_error(e: Exception, operation: str, object_type: str = "")
                 error_response['error']['message'] = f"Freshdesk API error: {e.response.text}"
         else:
             # Handle connection errors, timeouts, etc.
-            if isinstance(e, requests.exceptions.Timeout):
+            if isinstance(e, httpx.TimeoutException):
                 error_response['error'].update({
                     'code': 'request_timeout',
                     'message': 'The request to Freshdesk API timed out'
                 })
-            elif isinstance(e, requests.exceptions.ConnectionError):
+            elif isinstance(e, httpx.ConnectError):
                 error_response['error'].update({
                     'code': 'connection_error',
                     'message': 'Could not connect to Freshdesk API'
@@ -295,9 +383,17 @@ def handle_freshdesk_error(e: Exception, operation: str, object_type: str = "")
     return error_response
 
 
-def handle_freshdesk_attachments(field_name: str, attachments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+async def handle_freshdesk_attachments(field_name: str, attachments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Handle attachments for Freshdesk API requests.
+
+    Local files are read in a worker thread and URLs are fetched with the
+    shared HTTP client, so resolving attachments never blocks the event loop.
     
     Args:
         field_name: Name of the field to which the attachment is being added
@@ -310,7 +406,8 @@ def handle_freshdesk_attachments(field_name: str, attachments: List[Dict[str, An
 
     for attachment in attachments:
         if attachment["type"] == "local":
-            file_content = open(attachment["content"], "rb")
+            # Read eagerly so the request body can be resent on retry
+            file_content = await asyncio.to_thread(_read_file, attachment["content"])
             file_name = attachment.get("name", gen_random_password(15))
 
             resolved_attachments.append((
@@ -334,7 +431,9 @@ def handle_freshdesk_attachments(field_name: str, attachments: List[Dict[str, An
                 (file_name, file_content, attachment.get("media_type", "application/octet-stream")),
             ))
         elif attachment["type"] == "url":
-            file_content = requests.get(attachment["content"]).content
+            response = await get_http_client().get(attachment["content"], follow_redirects=True)
+            response.raise_for_status()
+            file_content = response.content
             file_name = attachment.get("name", gen_random_password(15))
             resolved_attachments.append((
                 f"{field_name}",
@@ -2,7 +2,7 @@ import logging
 from typing import Any, Dict, List, Optional
 import mimetypes
 import os
-from .base import make_freshdesk_request, handle_freshdesk_error, remove_none_values
+from .base import make_freshdesk_request, handle_freshdesk_error, handle_freshdesk_attachments, remove_none_values, fetch_concurrently
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -67,7 +67,7 @@ async def create_contact(
     
     try:
         if avatar_path:
-            options["files"] = handle_freshdesk_attachments("avatar", [{"type": "local", "content": avatar_path, "name": os.path.basename(avatar_path), "media_type": mimetypes.guess_type(avatar_path)[0]}])
+            options["files"] = await handle_freshdesk_attachments("avatar", [{"type": "local", "content": avatar_path, "name": os.path.basename(avatar_path), "media_type": mimetypes.guess_type(avatar_path)[0]}])
     
         return await make_freshdesk_request("POST", "/contacts", data=contact_data, options=options)
     except Exception as e:
@@ -88,6 +88,32 @@ async def get_contact_by_id(contact_id: int) -> Dict[str, Any]:
     except Exception as e:
         return handle_freshdesk_error(e, "retrieve", "contact")
 
+async def get_contacts_by_ids(contact_ids: List[int]) -> Dict[str, Any]:
+    """
+    Retrieve multiple contacts by their IDs concurrently.
+    
+    Requests share the account's rate limit, so large batches are queued
+    rather than rejected.
+    
+    Args:
+        contact_ids: List of IDs of contacts to retrieve
+        
+    Returns:
+        Dict with the retrieved contacts (in the order requested) and per-contact errors
+    """
+    if not contact_ids:
+        return {"success": False, "error": "No contact IDs provided"}
+
+    results = await fetch_concurrently(get_contact_by_id, contact_ids)
+    contacts = []
+    errors = []
+    for contact_id, result in zip(contact_ids, results):
+        if result.get("success") is False:
+            errors.append({"contact_id": contact_id, "error": result.get("error")})
+        else:
+            contacts.append(result)
+    return {"contacts": contacts, "errors": errors}
+
 async def list_contacts(
     email: Optional[str] = None,
     phone: Optional[str] = None,
@@ -189,7 +215,7 @@ async def update_contact(
     
     try:
         if avatar_path:
-            options["files"] = handle_freshdesk_attachments("avatar", [{"type": "local", "content": avatar_path, "name": os.path.basename(avatar_path), "media_type": mimetypes.guess_type(avatar_path)[0]}])
+            options["files"] = await handle_freshdesk_attachments("avatar", [{"type": "local", "content": avatar_path, "name": os.path.basename(avatar_path), "media_type": mimetypes.guess_type(avatar_path)[0]}])
            
         return await make_freshdesk_request("PUT", f"/contacts/{contact_id}", data=contact_data, options=options)
         
@@ -1,7 +1,7 @@
 import logging
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
-from .base import make_freshdesk_request, handle_freshdesk_error, remove_none_values, handle_freshdesk_attachments
+from .base import make_freshdesk_request, handle_freshdesk_error, remove_none_values, handle_freshdesk_attachments, fetch_concurrently
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -95,7 +95,7 @@ async def create_ticket(
 
         # Handle attachments if provided
         if attachments:
-            options["files"] = handle_freshdesk_attachments("attachments[]", attachments)
+            options["files"] = await handle_freshdesk_attachments("attachments[]", attachments)
         
         logger.info(f"Creating ticket with data: {ticket_data}")
         response = await make_freshdesk_request("POST", "/tickets", data=ticket_data, options=options)
@@ -167,6 +167,34 @@ async def get_ticket_by_id(ticket_id: int, include: str = None) -> Dict[str, Any
         return handle_freshdesk_error(e, "retrieve", "ticket")
 
 
+async def get_tickets_by_ids(ticket_ids: List[int], include: str = None) -> Dict[str, Any]:
+    """
+    Retrieve multiple tickets by their IDs concurrently.
+    
+    Requests share the account's rate limit, so large batches are queued
+    rather than rejected.
+    
+    Args:
+        ticket_ids: List of IDs of tickets to retrieve
+        include: Optional query parameter to include additional data (e.g., 'conversations', 'requester', 'company', 'stats')
+        
+    Returns:
+        Dictionary with the retrieved tickets (in the order requested) and per-ticket errors
+    """
+    if not ticket_ids:
+        return {"success": False, "error": "No ticket IDs provided"}
+
+    results = await fetch_concurrently(lambda ticket_id: get_ticket_by_id(ticket_id, include), ticket_ids)
+    tickets = []
+    errors = []
+    for ticket_id, result in zip(ticket_ids, results):
+        if result.get("success") is False:
+            errors.append({"ticket_id": ticket_id, "error": result.get("error")})
+        else:
+            tickets.append(result)
+    return {"tickets": tickets, "errors": errors}
+
+
 async def update_ticket(
     ticket_id: int,
     subject: Optional[str] = None,
@@ -218,7 +246,7 @@ async def update_ticket(
         options = {}
 
         if attachments:
-            options["files"] = handle_freshdesk_attachments("attachments[]", attachments)
+            options["files"] = await handle_freshdesk_attachments("attachments[]", attachments)
 
         response = await make_freshdesk_request("PUT", f"/tickets/{ticket_id}", data=update_data, options=options)
         return response
@@ -428,7 +456,7 @@ async def add_note_to_ticket(
         options = {}
 
         if attachments:
-            options["files"] = handle_freshdesk_attachments("attachments[]", attachments)
+            options["files"] = await handle_freshdesk_attachments("attachments[]", attachments)
 
         response = await make_freshdesk_request(
             "POST",
@@ -480,7 +508,7 @@ async def reply_to_a_ticket(
         options = {}
 
         if attachments:
-            options["files"] = handle_freshdesk_attachments("attachments[]", attachments)
+            options["files"] = await handle_freshdesk_attachments("attachments[]", attachments)
 
         response = await make_freshdesk_request(
             "POST",
@@ -520,7 +548,7 @@ async def update_note(
         options = {}
 
         if attachments:
-            options["files"] = handle_freshdesk_attachments("attachments[]", attachments)
+            options["files"] = await handle_freshdesk_attachments("attachments[]", attachments)
 
         response = await make_freshdesk_request(
             "PUT",
@@ -1,66 +1,98 @@
-import time
-import math
-from typing import Dict
-from datetime import datetime, timedelta
 import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Mapping, Tuple
+
+# Freshdesk's smallest plan allows 50 requests per minute; the real limit is
+# learned from X-RateLimit-Total on the first response
+DEFAULT_RATE_LIMIT_PER_MINUTE = 50
+MAX_TRACKED_ACCOUNTS = 1024
+
 
 class FreshdeskRateLimiter:
-    def __init__(self):
-        self.rate_limit_total = 50 
-        self.rate_limit_remaining = 50
-        self.rate_limit_reset = 60 
-        self.last_request_time = 0
-        self.retry_after = 0
-        self.window_start = time.time()
-        self.requests_in_window = 0
-
-    def update_from_headers(self, headers: Dict[str, str]) -> None:
-        """Update rate limit state from response headers"""
-        now = time.time()
-        
-        # Reset window if we're in a new minute
-        if now - self.window_start >= 60:
-            self.window_start = now
-            self.requests_in_window = 0
-
-        if 'X-RateLimit-Total' in headers:
-            self.rate_limit_total = int(headers['X-RateLimit-Total'])
-        if 'X-RateLimit-Remaining' in headers:
-            self.rate_limit_remaining = int(headers['X-RateLimit-Remaining'])
-        if 'Retry-After' in headers:
-            self.retry_after = int(headers['Retry-After'])
-        
-        self.requests_in_window += 1
-        self.last_request_time = now
-
-    def get_sleep_time(self) -> float:
-        """Calculate how long to sleep before next request"""
-        now = time.time()
-        
-        # If we hit rate limit, use Retry-After
-        if self.retry_after > 0:
-            return self.retry_after
-        
-        # Calculate time since last request to enforce minimum delay
-        time_since_last = now - self.last_request_time
-        min_delay = 0.1 
-        sleep_time = max(0, min_delay - time_since_last)
-        
-        # If we're approaching the rate limit, let's slow down
-        if self.rate_limit_remaining < self.rate_limit_total * 0.1:  
-            time_left_in_window = 60 - (now - self.window_start)
-            if time_left_in_window > 0:
-                # Distribute remaining requests over time left
-                sleep_time = max(sleep_time, time_left_in_window / (self.rate_limit_remaining + 1))
-        
-        return sleep_time
-
-    async def wait_for_capacity(self, required_requests: int = 1) -> None:
-        """Wait until we have capacity to make the requested number of API calls"""
-        if self.rate_limit_remaining < required_requests:
-            sleep_time = self.get_sleep_time()
-            if sleep_time > 0:
-                await asyncio.sleep(sleep_time)
-
-
-rate_limiter = FreshdeskRateLimiter()
\ No newline at end of file
+    """Token bucket for a single Freshdesk account (domain and API key).
+
+    The bucket holds up to one minute's worth of requests and refills
+    continuously. X-RateLimit-Total and X-RateLimit-Remaining response headers
+    correct the local estimate, and Retry-After pauses the bucket. Callers
+    queue on a FIFO lock, so waiting requests are released in arrival order.
+    """
+
+    def __init__(self, rate_limit_total: int = DEFAULT_RATE_LIMIT_PER_MINUTE):
+        self.rate_limit_total = rate_limit_total
+        self.tokens = float(rate_limit_total)
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated_at
+        self.tokens = min(
+            float(self.rate_limit_total),
+            self.tokens + elapsed * self.rate_limit_total / 60.0,
+        )
+        self.updated_at = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent, then consume one token."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self.blocked_until - now
+                if wait <= 0:
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) * 60.0 / self.rate_limit_total
+                await asyncio.sleep(wait)
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Update the bucket from Freshdesk rate limit response headers."""
+        now = time.monotonic()
+        self._refill(now)
+
+        total = _int_header(headers, "X-RateLimit-Total")
+        if total and total > 0:
+            self.rate_limit_total = total
+        remaining = _int_header(headers, "X-RateLimit-Remaining")
+        if remaining is not None:
+            # The server's count also includes requests made by other clients
+            # using the same key, so only ever lower the local estimate
+            self.tokens = min(self.tokens, float(remaining))
+        retry_after = _int_header(headers, "Retry-After")
+        if retry_after is not None:
+            self.block_for(retry_after)
+
+    def block_for(self, seconds: float) -> None:
+        """Hold back all requests for this account for the given time."""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+        self.tokens = min(self.tokens, 0.0)
+
+
+def _int_header(headers: Mapping[str, str], name: str):
+    value = headers.get(name)
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+_rate_limiters: "OrderedDict[Tuple[str, str], FreshdeskRateLimiter]" = OrderedDict()
+
+
+def get_rate_limiter(domain: str, api_key: str) -> FreshdeskRateLimiter:
+    """Return the rate limiter for a Freshdesk account, creating it on first use.
+
+    API keys are hashed so they are never kept in memory as dictionary keys.
+    """
+    key = (domain, hashlib.sha256(api_key.encode("utf-8")).hexdigest())
+    limiter = _rate_limiters.get(key)
+    if limiter is None:
+        limiter = _rate_limiters[key] = FreshdeskRateLimiter()
+        while len(_rate_limiters) > MAX_TRACKED_ACCOUNTS:
+            _rate_limiters.popitem(last=False)
+    else:
+        _rate_limiters.move_to_end(key)
+    return limiter
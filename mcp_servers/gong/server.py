@@ -26,6 +26,7 @@ from tools import (
     list_calls,
     add_new_call,
 )
+from tools.base import init_http_clients, close_http_clients
 
 logger = logging.getLogger(__name__)
 
@@ -266,12 +267,14 @@ def main(port: int, log_level: str, json_response: bool) -> int:
 
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        await init_http_clients()
         async with session_manager.run():
             logger.info("Gong MCP Server started")
             try:
                 yield
             finally:
                 logger.info("Gong MCP Server shutting down")
+                await close_http_clients()
 
     starlette_app = Starlette(
         debug=True,
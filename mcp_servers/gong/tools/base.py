@@ -2,8 +2,10 @@ import logging
 import base64
 import json
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from contextvars import ContextVar
+import http.cookiejar
+import importlib.util
 import httpx
 
 # Configure logging
@@ -11,6 +13,44 @@ logger = logging.getLogger(__name__)
 
 GONG_API_ENDPOINT = "https://api.gong.io"
 
+# Shared HTTP client, reused across tool calls so connections stay pooled
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            # Reject all cookies: the client is shared across tenants
+            cookies=http.cookiejar.CookieJar(
+                policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+            ),
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _http_client
+
+
+async def init_http_clients() -> None:
+    """Create the shared HTTP client (called from the server lifespan)."""
+    get_http_client()
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP client on server shutdown."""
+    global _http_client
+    if _http_client is not None:
+        try:
+            await _http_client.aclose()
+        finally:
+            _http_client = None
+
+
 # Context variable to store the basic auth header for each request
 # We expect the server to set this value from the incoming HTTP header "x-auth-token",
 # where the value is already formatted as "Basic <base64(key:secret)>".
@@ -65,15 +105,15 @@ def build_headers(extra: Dict[str, str] | None = None) -> Dict[str, str]:
 async def get(path: str, params: Dict[str, Any] | None = None) -> Dict[str, Any]:
     """Perform a GET request to the Gong API and return JSON."""
     url = f"{GONG_API_ENDPOINT}{path}"
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(url, params=params, headers=build_headers())
-        resp.raise_for_status()
-        return resp.json()
+    client = get_http_client()
+    resp = await client.get(url, params=params, headers=build_headers())
+    resp.raise_for_status()
+    return resp.json()
 
 async def post(path: str, json_body: Dict[str, Any]) -> Dict[str, Any]:
     """Perform a POST request to the Gong API and return JSON."""
     url = f"{GONG_API_ENDPOINT}{path}"
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(url, json=json_body, headers=build_headers())
-        resp.raise_for_status()
-        return resp.json() 
\ No newline at end of file
+    client = get_http_client()
+    resp = await client.post(url, json=json_body, headers=build_headers())
+    resp.raise_for_status()
+    return resp.json() 
\ No newline at end of file
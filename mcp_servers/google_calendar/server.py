@@ -1,14 +1,22 @@
+import asyncio
+import bisect
+import hashlib
+import heapq
+import threading
+import time
 import contextlib
 import base64
 import logging
 import os
 import json
 import uuid
+from collections import OrderedDict
 from collections.abc import AsyncIterator
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
 from contextvars import ContextVar
 from enum import Enum
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, time as dt_time
 from zoneinfo import ZoneInfo
 
 import click
@@ -22,7 +30,8 @@ from starlette.routing import Mount, Route
 from starlette.types import Receive, Scope, Send
 from dotenv import load_dotenv
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build, build_from_document, fix_method_name
 from googleapiclient.errors import HttpError
 
 # Configure logging
@@ -83,15 +92,109 @@ class RetryableToolError(Exception):
         self.retry_after_ms = retry_after_ms
         self.developer_message = developer_message
 
+# The Google API helpers below are kept identical in every google_* server.
+# Each Docker image copies only its own server, so they cannot live in a
+# shared module.
+
+# Parsed discovery documents, loaded once per process and shared by every
+# per-token service object
+_discovery_documents: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_discovery_lock = threading.Lock()
+
+# Blocking googleapiclient calls run on this bounded pool, never on the event loop
+GOOGLE_API_MAX_WORKERS = int(os.getenv("GOOGLE_API_MAX_WORKERS", "32"))
+_google_executor = ThreadPoolExecutor(
+    max_workers=GOOGLE_API_MAX_WORKERS, thread_name_prefix="google-api"
+)
+
+def _prime_resources(resource, resource_desc: Dict[str, Any]) -> None:
+    """Instantiate every nested resource once.
+
+    The client library fixes up method descriptions in place the first time a
+    resource is created; doing it up front keeps the shared document read-only
+    afterwards.
+    """
+    for name, desc in resource_desc.get("resources", {}).items():
+        _prime_resources(getattr(resource, fix_method_name(name))(), desc)
+
+def _get_discovery_document(service_name: str, version: str) -> Optional[Dict[str, Any]]:
+    """Return the parsed discovery document bundled with the client library."""
+    key = (service_name, version)
+    document = _discovery_documents.get(key)
+    if document is None:
+        with _discovery_lock:
+            document = _discovery_documents.get(key)
+            if document is None:
+                content = discovery_cache.get_static_doc(service_name, version)
+                if content is None:
+                    return None
+                document = json.loads(content)
+                _prime_resources(
+                    build_from_document(document, credentials=Credentials(token=None)),
+                    document,
+                )
+                _discovery_documents[key] = document
+    return document
+
+def build_google_service(service_name: str, version: str, credentials):
+    """Build a lightweight service object for one set of credentials."""
+    document = _get_discovery_document(service_name, version)
+    if document is None:
+        # Not bundled with the client library, let build() fetch it
+        return build(service_name, version, credentials=credentials)
+    return build_from_document(document, credentials=credentials)
+
+async def execute_google_request(request):
+    """Run a request's blocking execute() on the Google API thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_google_executor, request.execute)
+
+async def run_google_call(func, *args):
+    """Run a blocking helper that calls Google APIs on the Google API thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_google_executor, func, *args)
+
+# The Calendar API accepts up to 50 calls per batch request
+GOOGLE_BATCH_MAX_SIZE = 50
+
+# execute_google_batch is shared with the other batching Google server and
+# kept identical there, like the helpers above.
+async def execute_google_batch(
+    service, requests: Dict[str, Any], batch_size: int = GOOGLE_BATCH_MAX_SIZE
+) -> Dict[str, Dict[str, Any]]:
+    """Execute independent requests through the Google batch endpoint.
+
+    Requests are sent in groups of at most batch_size calls, one HTTP round trip
+    per group. Returns {key: {"result": ...}} or {key: {"error": ..., "status": ...}}
+    for every key, so one failing item does not fail the others.
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+
+    def callback(request_id, response, exception):
+        if exception is None:
+            results[request_id] = {"result": response}
+        elif isinstance(exception, HttpError):
+            results[request_id] = {"error": exception.reason, "status": exception.status_code}
+        else:
+            results[request_id] = {"error": str(exception)}
+
+    items = list(requests.items())
+    for start in range(0, len(items), batch_size):
+        batch = service.new_batch_http_request(callback=callback)
+        for key, request in items[start:start + batch_size]:
+            batch.add(request, request_id=key)
+        await run_google_call(batch.execute)
+    return results
+
 def get_calendar_service(access_token: str):
     """Create Google Calendar service with access token."""
     credentials = Credentials(token=access_token)
-    return build('calendar', 'v3', credentials=credentials)
+    return build_google_service('calendar', 'v3', credentials)
 
 def get_people_service(access_token: str):
     """Create Google People service with access token."""
     credentials = Credentials(token=access_token)
-    return build('people', 'v1', credentials=credentials)
+    return build_google_service('people', 'v1', credentials)
 
 def get_auth_token() -> str:
     """Get the authentication token from context."""
@@ -133,7 +236,7 @@ async def list_calendars(
         service = get_calendar_service(access_token)
         
         max_results = max(1, min(max_results, 250))
-        calendars = (
+        calendars = await execute_google_request(
             service.calendarList()
             .list(
                 pageToken=next_page_token,
@@ -141,7 +244,6 @@ async def list_calendars(
                 showHidden=show_hidden,
                 maxResults=max_results,
             )
-            .execute()
         )
 
         items = calendars.get("items", [])
@@ -179,8 +281,12 @@ async def create_event(
         access_token = get_auth_token()
         service = get_calendar_service(access_token)
 
+        if attendees:
+            # Attendees given by name are looked up in the user's contacts
+            attendees = await resolve_attendee_emails(access_token, attendees)
+
         # Get the calendar's time zone
-        calendar = service.calendars().get(calendarId=calendar_id).execute()
+        calendar = await execute_google_request(service.calendars().get(calendarId=calendar_id))
         time_zone = calendar["timeZone"]
 
         # Parse datetime strings
@@ -217,12 +323,12 @@ async def create_event(
         # Set conferenceDataVersion to 1 when creating conferences
         conference_data_version = 1 if add_google_meet else 0
 
-        created_event = service.events().insert(
+        created_event = await execute_google_request(service.events().insert(
             calendarId=calendar_id, 
             body=event,
             sendUpdates=send_updates,
             conferenceDataVersion=conference_data_version
-        ).execute()
+        ))
         return {"event": created_event}
     except HttpError as e:
         logger.error(f"Google Calendar API error: {e}")
@@ -232,6 +338,25 @@ async def create_event(
         logger.exception(f"Error executing tool create_event: {e}")
         raise e
 
+# Event fields returned by the list/get event tools
+EVENT_ITEM_KEYS = [
+    "attachments",
+    "attendees",
+    "creator",
+    "description",
+    "end",
+    "eventType",
+    "htmlLink",
+    "id",
+    "location",
+    "organizer",
+    "recurrence",
+    "recurringEventId",
+    "start",
+    "summary",
+    "visibility",
+]
+
 async def list_events(
     min_end_datetime: str,
     max_start_datetime: str,
@@ -245,7 +370,7 @@ async def list_events(
         service = get_calendar_service(access_token)
 
         # Get the calendar's time zone
-        calendar = service.calendars().get(calendarId=calendar_id).execute()
+        calendar = await execute_google_request(service.calendars().get(calendarId=calendar_id))
         time_zone = calendar["timeZone"]
 
         # Parse datetime strings
@@ -255,7 +380,7 @@ async def list_events(
         if min_end_dt > max_start_dt:
             min_end_dt, max_start_dt = max_start_dt, min_end_dt
 
-        events_result = (
+        events_result = await execute_google_request(
             service.events()
             .list(
                 calendarId=calendar_id,
@@ -265,29 +390,10 @@ async def list_events(
                 singleEvents=True,
                 orderBy="startTime",
             )
-            .execute()
         )
 
-        items_keys = [
-            "attachments",
-            "attendees",
-            "creator",
-            "description",
-            "end",
-            "eventType",
-            "htmlLink",
-            "id",
-            "location",
-            "organizer",
-            "recurrence",
-            "recurringEventId",
-            "start",
-            "summary",
-            "visibility",
-        ]
-
         events = [
-            {key: event[key] for key in items_keys if key in event}
+            {key: event[key] for key in EVENT_ITEM_KEYS if key in event}
             for event in events_result.get("items", [])
         ]
 
@@ -319,13 +425,20 @@ async def update_event(
         access_token = get_auth_token()
         service = get_calendar_service(access_token)
 
-        calendar = service.calendars().get(calendarId="primary").execute()
-        time_zone = calendar["timeZone"]
+        # The calendar and the event are independent lookups, fetch both in one batch
+        lookups = await execute_google_batch(service, {
+            "calendar": service.calendars().get(calendarId="primary"),
+            "event": service.events().get(calendarId="primary", eventId=event_id),
+        })
+        if "error" in lookups["calendar"]:
+            raise RuntimeError(
+                f"Google Calendar API Error ({lookups['calendar'].get('status')}): {lookups['calendar']['error']}"
+            )
+        time_zone = lookups["calendar"]["result"]["timeZone"]
 
-        try:
-            event = service.events().get(calendarId="primary", eventId=event_id).execute()
-        except HttpError:
-            valid_events_with_id = (
+        event = lookups["event"].get("result")
+        if event is None:
+            valid_events_with_id = await execute_google_request(
                 service.events()
                 .list(
                     calendarId="primary",
@@ -335,7 +448,6 @@ async def update_event(
                     singleEvents=True,
                     orderBy="startTime",
                 )
-                .execute()
             )
             raise RuntimeError(f"Event with ID {event_id} not found. Available events: {valid_events_with_id}")
 
@@ -385,7 +497,7 @@ async def update_event(
             ]
             event["attendees"] = event.get("attendees", []) + new_attendees
 
-        updated_event = (
+        updated_event = await execute_google_request(
             service.events()
             .update(
                 calendarId="primary",
@@ -393,7 +505,6 @@ async def update_event(
                 sendUpdates=send_updates,
                 body=event,
             )
-            .execute()
         )
         return (
             f"Event with ID {event_id} successfully updated at {updated_event['updated']}. "
@@ -418,12 +529,13 @@ async def add_attendees_to_event(
     try:
         access_token = get_auth_token()
         service = get_calendar_service(access_token)
+        attendees = await resolve_attendee_emails(access_token, attendees)
 
         # Get the existing event
         try:
-            event = service.events().get(calendarId=calendar_id, eventId=event_id).execute()
+            event = await execute_google_request(service.events().get(calendarId=calendar_id, eventId=event_id))
         except HttpError:
-            valid_events_with_id = (
+            valid_events_with_id = await execute_google_request(
                 service.events()
                 .list(
                     calendarId=calendar_id,
@@ -433,7 +545,6 @@ async def add_attendees_to_event(
                     singleEvents=True,
                     orderBy="startTime",
                 )
-                .execute()
             )
             raise RuntimeError(f"Event with ID {event_id} not found. Available events: {valid_events_with_id}")
 
@@ -460,7 +571,7 @@ async def add_attendees_to_event(
         event["attendees"] = event.get("attendees", []) + new_attendees
 
         # Update the event
-        updated_event = (
+        updated_event = await execute_google_request(
             service.events()
             .update(
                 calendarId=calendar_id,
@@ -468,7 +579,6 @@ async def add_attendees_to_event(
                 sendUpdates=send_updates,
                 body=event,
             )
-            .execute()
         )
 
         added_emails = [attendee["email"] for attendee in new_attendees]
@@ -503,9 +613,9 @@ async def delete_event(
         access_token = get_auth_token()
         service = get_calendar_service(access_token)
 
-        service.events().delete(
+        await execute_google_request(service.events().delete(
             calendarId=calendar_id, eventId=event_id, sendUpdates=send_updates
-        ).execute()
+        ))
 
         notification_message = ""
         if send_updates == "all":
@@ -527,6 +637,71 @@ async def delete_event(
         logger.exception(f"Error executing tool delete_event: {e}")
         raise e
 
+async def get_events(
+    event_ids: list[str],
+    calendar_id: str = "primary",
+) -> Dict[str, Any]:
+    """Get several events by ID using batched requests."""
+    logger.info(f"Executing tool: get_events with {len(event_ids)} event IDs")
+    try:
+        access_token = get_auth_token()
+        service = get_calendar_service(access_token)
+
+        event_ids = list(dict.fromkeys(event_ids))
+        results = await execute_google_batch(service, {
+            event_id: service.events().get(calendarId=calendar_id, eventId=event_id)
+            for event_id in event_ids
+        })
+
+        events = []
+        errors = []
+        for event_id in event_ids:
+            item = results[event_id]
+            if "result" in item:
+                events.append({key: item["result"][key] for key in EVENT_ITEM_KEYS if key in item["result"]})
+            else:
+                errors.append({"event_id": event_id, **item})
+
+        return {"events_count": len(events), "events": events, "errors": errors}
+    except Exception as e:
+        logger.exception(f"Error executing tool get_events: {e}")
+        raise e
+
+async def delete_events(
+    event_ids: list[str],
+    calendar_id: str = "primary",
+    send_updates: str = "all",
+) -> Dict[str, Any]:
+    """Delete several events using batched requests."""
+    logger.info(f"Executing tool: delete_events with {len(event_ids)} event IDs")
+    try:
+        access_token = get_auth_token()
+        service = get_calendar_service(access_token)
+
+        event_ids = list(dict.fromkeys(event_ids))
+        results = await execute_google_batch(service, {
+            event_id: service.events().delete(
+                calendarId=calendar_id, eventId=event_id, sendUpdates=send_updates
+            )
+            for event_id in event_ids
+        })
+
+        deleted = [event_id for event_id in event_ids if "error" not in results[event_id]]
+        errors = [
+            {"event_id": event_id, **results[event_id]}
+            for event_id in event_ids
+            if "error" in results[event_id]
+        ]
+
+        return {
+            "deleted_count": len(deleted),
+            "deleted": deleted,
+            "errors": errors,
+        }
+    except Exception as e:
+        logger.exception(f"Error executing tool delete_events: {e}")
+        raise e
+
 async def get_current_time() -> Dict[str, Any]:
     """
     Get the current date and time using the user's Google Calendar timezone setting.
@@ -542,7 +717,7 @@ async def get_current_time() -> Dict[str, Any]:
         
         # Get user's timezone setting from Google Calendar settings - https://developers.google.com/workspace/calendar/api/v3/reference/settings#resource  
         try:
-            timezone_setting = service.settings().get(setting='timezone').execute()
+            timezone_setting = await execute_google_request(service.settings().get(setting='timezone'))
             timezone = timezone_setting.get('value', 'UTC')
             logger.info(f"Retrieved user timezone: {timezone}")
         except Exception as e:
@@ -570,6 +745,10 @@ async def get_current_time() -> Dict[str, Any]:
         logger.exception(f"Error executing tool get_current_time: {e}")
         raise e
 
+def _parse_busy_time(value: str, tz: ZoneInfo) -> datetime:
+    """Parse a freebusy timestamp (RFC 3339, often with a 'Z' suffix) into tz."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).astimezone(tz)
+
 async def find_free_slots(
     items: list[str] | None = None,
     time_min: str | None = None,
@@ -635,7 +814,7 @@ async def find_free_slots(
         }
         
         # Query freebusy information
-        freebusy_result = service.freebusy().query(body=body).execute()
+        freebusy_result = await execute_google_request(service.freebusy().query(body=body))
         
         # Process results for each calendar - create simple structure
         calendars = {}
@@ -654,27 +833,21 @@ async def find_free_slots(
             
             busy_periods = calendar_data.get("busy", [])
             
+            # Parse busy periods once, sorted by start time
+            sorted_busy = sorted(
+                (_parse_busy_time(b["start"], tz), _parse_busy_time(b["end"], tz))
+                for b in busy_periods
+            )
+            
             # Convert busy periods to simple format with timezone
-            busy_slots = []
-            for busy in busy_periods:
-                busy_start = datetime.fromisoformat(busy["start"].replace('Z', '+00:00')).astimezone(tz)
-                busy_end = datetime.fromisoformat(busy["end"].replace('Z', '+00:00')).astimezone(tz)
-                busy_slots.append({
-                    "start": busy_start.isoformat(),
-                    "end": busy_end.isoformat(),
-                })
+            busy_slots = [
+                {"start": busy_start.isoformat(), "end": busy_end.isoformat()}
+                for busy_start, busy_end in sorted_busy
+            ]
             
             # Calculate free slots (gaps between busy periods)
             free_slots = []
             
-            # Sort busy periods by start time
-            sorted_busy = sorted(
-                [(datetime.fromisoformat(b["start"].replace('Z', '+00:00')).astimezone(tz),
-                  datetime.fromisoformat(b["end"].replace('Z', '+00:00')).astimezone(tz))
-                 for b in busy_periods],
-                key=lambda x: x[0]
-            )
-            
             # Check for free slot at the beginning
             if not sorted_busy or sorted_busy[0][0] > time_min_dt:
                 gap_end = sorted_busy[0][0] if sorted_busy else time_max_dt
@@ -734,7 +907,245 @@ async def find_free_slots(
         logger.exception(f"Error executing tool find_free_slots: {e}")
         raise e
 
-def _warmup_contact_search(service, contact_type: str):
+# The freebusy endpoint accepts at most 50 calendars per query
+FREEBUSY_MAX_CALENDARS = 50
+
+def merge_busy_intervals(intervals: list[tuple[float, float]]) -> list[tuple[float, float]]:
+    """Merge busy intervals from any number of calendars with a sweep line.
+
+    Intervals are (start, end) epoch seconds. Touching intervals merge, so the
+    result is sorted and non-overlapping.
+    """
+    events = []
+    for start, end in intervals:
+        if start < end:
+            events.append((start, 1))
+            events.append((end, -1))
+    # At equal times, starts sort before ends
+    events.sort(key=lambda event: (event[0], -event[1]))
+
+    merged = []
+    depth = 0
+    opened = 0.0
+    for at, delta in events:
+        if depth == 0:
+            opened = at
+        depth += delta
+        if depth == 0:
+            merged.append((opened, at))
+    return merged
+
+def _working_windows(
+    range_start: datetime,
+    range_end: datetime,
+    tz: ZoneInfo,
+    day_start: dt_time,
+    day_end: dt_time,
+    working_days: set[int],
+) -> list[tuple[float, float]]:
+    """Working-hour windows (epoch seconds) inside the range, in local time of tz."""
+    windows = []
+    day = range_start.astimezone(tz).date()
+    last_day = range_end.astimezone(tz).date()
+    while day <= last_day:
+        if day.isoweekday() in working_days:
+            start = max(datetime.combine(day, day_start, tzinfo=tz), range_start)
+            end = min(datetime.combine(day, day_end, tzinfo=tz), range_end)
+            if start < end:
+                windows.append((start.timestamp(), end.timestamp()))
+        day += timedelta(days=1)
+    return windows
+
+def _subtract_busy(
+    windows: list[tuple[float, float]], busy: list[tuple[float, float]]
+) -> list[tuple[float, float]]:
+    """Free parts of sorted windows, given sorted non-overlapping busy intervals."""
+    free = []
+    first = 0
+    for window_start, window_end in windows:
+        while first < len(busy) and busy[first][1] <= window_start:
+            first += 1
+        cursor = window_start
+        index = first
+        while index < len(busy) and busy[index][0] < window_end:
+            if busy[index][0] > cursor:
+                free.append((cursor, busy[index][0]))
+            cursor = max(cursor, busy[index][1])
+            index += 1
+        if cursor < window_end:
+            free.append((cursor, window_end))
+    return free
+
+def _is_busy(busy: list[tuple[float, float]], busy_ends: list[float], start: float, end: float) -> bool:
+    """Whether [start, end) overlaps a sorted, merged busy list."""
+    index = bisect.bisect_right(busy_ends, start)
+    return index < len(busy) and busy[index][0] < end
+
+def _parse_time_of_day(value: str) -> dt_time:
+    try:
+        return dt_time.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Invalid time of day: {value}. Use HH:MM, e.g. '09:00'")
+
+async def _query_freebusy(
+    access_token: str, calendar_ids: list[str], time_min: datetime, time_max: datetime
+) -> Dict[str, Any]:
+    """Run freebusy queries of at most FREEBUSY_MAX_CALENDARS calendars concurrently.
+
+    Each query gets its own service object: the underlying HTTP connection is
+    not thread-safe, and the queries run on different pool threads.
+    """
+    chunks = [
+        calendar_ids[start:start + FREEBUSY_MAX_CALENDARS]
+        for start in range(0, len(calendar_ids), FREEBUSY_MAX_CALENDARS)
+    ]
+    responses = await asyncio.gather(*(
+        execute_google_request(get_calendar_service(access_token).freebusy().query(body={
+            "timeMin": time_min.isoformat(),
+            "timeMax": time_max.isoformat(),
+            "items": [{"id": calendar_id} for calendar_id in chunk],
+        }))
+        for chunk in chunks
+    ))
+    calendars: Dict[str, Any] = {}
+    for response in responses:
+        calendars.update(response.get("calendars", {}))
+    return calendars
+
+async def find_meeting_times(
+    attendees: list[str] | None = None,
+    optional_attendees: list[str] | None = None,
+    duration_minutes: int = 30,
+    time_min: str | None = None,
+    time_max: str | None = None,
+    timezone: str | None = None,
+    working_hours_start: str = "09:00",
+    working_hours_end: str = "17:00",
+    working_days: list[int] | None = None,
+    slot_step_minutes: int = 30,
+    max_results: int = 10,
+) -> Dict[str, Any]:
+    """
+    Find meeting times when all attendees are free.
+
+    Busy intervals of every attendee are merged with a sweep line, intersected
+    with working hours in the given timezone, and cut into candidate slots of
+    duration_minutes starting every slot_step_minutes. Slots are ranked by how
+    many optional attendees are free, then by start time. Defaults to the next
+    7 days from now.
+    """
+    logger.info(f"Executing tool: find_meeting_times for attendees: {attendees}")
+    try:
+        access_token = get_auth_token()
+
+        required = list(dict.fromkeys(attendees or ["primary"]))
+        optional = [a for a in dict.fromkeys(optional_attendees or []) if a not in required]
+        if duration_minutes < 1 or slot_step_minutes < 1 or max_results < 1:
+            raise ValueError("duration_minutes, slot_step_minutes and max_results must be positive")
+
+        if not timezone:
+            # Use the user's calendar timezone
+            setting = await execute_google_request(
+                get_calendar_service(access_token).settings().get(setting='timezone')
+            )
+            timezone = setting.get('value', 'UTC')
+        try:
+            tz = ZoneInfo(timezone)
+        except Exception:
+            raise ValueError(f"Invalid timezone: {timezone}")
+
+        day_start = _parse_time_of_day(working_hours_start)
+        day_end = _parse_time_of_day(working_hours_end)
+        if day_start >= day_end:
+            raise ValueError("working_hours_start must precede working_hours_end")
+        days = set(working_days or [1, 2, 3, 4, 5])
+        if not days <= set(range(1, 8)):
+            raise ValueError("working_days must be ISO weekday numbers, 1 (Monday) to 7 (Sunday)")
+
+        now = datetime.now(tz).replace(second=0, microsecond=0)
+        range_start = parse_datetime(time_min, timezone).astimezone(tz) if time_min else now
+        range_end = parse_datetime(time_max, timezone).astimezone(tz) if time_max else range_start + timedelta(days=7)
+        if range_start >= range_end:
+            raise ValueError("time_min must precede time_max")
+
+        calendars = await _query_freebusy(access_token, required + optional, range_start, range_end)
+
+        calendar_errors = {}
+        busy_by_calendar: Dict[str, list[tuple[float, float]]] = {}
+        for calendar_id in required + optional:
+            data = calendars.get(calendar_id, {})
+            if "errors" in data:
+                # Usually a calendar that is not shared with the user
+                calendar_errors[calendar_id] = data["errors"][0].get("reason", "Unknown error")
+                continue
+            busy_by_calendar[calendar_id] = merge_busy_intervals([
+                (_parse_busy_time(b["start"], tz).timestamp(), _parse_busy_time(b["end"], tz).timestamp())
+                for b in data.get("busy", [])
+            ])
+
+        required_busy = merge_busy_intervals([
+            interval for calendar_id in required for interval in busy_by_calendar.get(calendar_id, [])
+        ])
+        windows = _working_windows(range_start, range_end, tz, day_start, day_end, days)
+        free_windows = _subtract_busy(windows, required_busy)
+
+        duration = duration_minutes * 60
+        step = slot_step_minutes * 60
+        optional_busy = {
+            calendar_id: (busy_by_calendar[calendar_id], [end for _, end in busy_by_calendar[calendar_id]])
+            for calendar_id in optional if calendar_id in busy_by_calendar
+        }
+
+        total_candidates = 0
+
+        def candidates():
+            # Every slot is scored; only the best max_results are kept below
+            nonlocal total_candidates
+            for window_start, window_end in free_windows:
+                # Align starts to the step in local time (e.g. :00 and :30)
+                offset = datetime.fromtimestamp(window_start, tz).utcoffset().total_seconds()
+                start = -(-(window_start + offset) // step) * step - offset
+                while start + duration <= window_end:
+                    busy_optional = [
+                        calendar_id for calendar_id, (busy, ends) in optional_busy.items()
+                        if _is_busy(busy, ends, start, start + duration)
+                    ]
+                    total_candidates += 1
+                    yield len(busy_optional), start, busy_optional
+                    start += step
+
+        best = heapq.nsmallest(max_results, candidates(), key=lambda candidate: (candidate[0], candidate[1]))
+        slots = [
+            {
+                "start": datetime.fromtimestamp(start, tz).isoformat(),
+                "end": datetime.fromtimestamp(start + duration, tz).isoformat(),
+                "optional_attendees_free": len(optional_busy) - busy_count,
+                "optional_attendees_busy": busy_optional,
+            }
+            for busy_count, start, busy_optional in best
+        ]
+
+        return {
+            "timezone": timezone,
+            "duration_minutes": duration_minutes,
+            "time_min": range_start.isoformat(),
+            "time_max": range_end.isoformat(),
+            "required_attendees": required,
+            "optional_attendees": optional,
+            "total_candidate_slots": total_candidates,
+            "slots": slots,
+            "calendar_errors": calendar_errors,
+        }
+
+    except HttpError as e:
+        logger.error(f"Google Calendar API error: {e}")
+        error_detail = json.loads(e.content.decode('utf-8'))
+        raise RuntimeError(f"Google Calendar API Error ({e.resp.status}): {error_detail.get('error', {}).get('message', 'Unknown error')}")
+    except Exception as e:
+        logger.exception(f"Error executing tool find_meeting_times: {e}")
+        raise e
+
+def _warmup_contact_search(service, contact_type: str) -> bool:
     """
     Send warmup request with empty query to update the cache.
 
@@ -742,6 +1153,8 @@ def _warmup_contact_search(service, contact_type: str):
     require a warmup request before actual searches for better performance.
     See: https://developers.google.com/people/v1/contacts#search_the_users_contacts
     and https://developers.google.com/people/v1/other-contacts#search_the_users_other_contacts
+
+    Returns whether the warmup succeeded.
     """
     try:
         if contact_type == 'personal':
@@ -760,9 +1173,177 @@ def _warmup_contact_search(service, contact_type: str):
                 readMask='names'
             ).execute()
             logger.info("Warmup request sent for other contacts")
+        return True
     except Exception as e:
         # Don't fail if warmup fails, just log it
         logger.warning(f"Warmup request failed for {contact_type} contacts: {e}")
+        return False
+
+class TTLCache:
+    """Small LRU cache whose entries expire after a per-entry TTL."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Any, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any, ttl: float) -> None:
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+def token_cache_key(token: str) -> str:
+    """Hash a token so it is never kept in cache keys verbatim."""
+    return hashlib.sha256((token or "").encode("utf-8")).hexdigest()
+
+# How long the People API search cache stays warm after a warmup request
+CONTACT_WARMUP_TTL_SECONDS = float(os.getenv("GOOGLE_CONTACTS_WARMUP_TTL", "300"))
+# Contact search results are reused for this long, per user
+CONTACT_CACHE_TTL_SECONDS = float(os.getenv("GOOGLE_CONTACTS_CACHE_TTL", "60"))
+
+_contact_warmups = TTLCache(4096)
+_contact_warmup_requests: Dict[tuple, asyncio.Future] = {}
+_contact_cache = TTLCache(2048)
+
+# Person fields needed for calendar operations (creating events, adding attendees)
+CONTACT_READ_MASK = 'names,emailAddresses,organizations,phoneNumbers,metadata'
+# Limited read mask for other contacts
+OTHER_CONTACT_READ_MASK = 'emailAddresses,metadata,names,phoneNumbers'
+
+DIRECTORY_SOURCES = {
+    'UNSPECIFIED': ['DIRECTORY_SOURCE_TYPE_DOMAIN_PROFILE', 'DIRECTORY_SOURCE_TYPE_DOMAIN_CONTACT'],
+    'DOMAIN_DIRECTORY': ['DIRECTORY_SOURCE_TYPE_DOMAIN_PROFILE'],
+    'DOMAIN_CONTACTS': ['DIRECTORY_SOURCE_TYPE_DOMAIN_CONTACT'],
+}
+
+async def _ensure_contact_warmup(access_token: str, contact_type: str) -> None:
+    """Send the warmup request for a contact source unless it was sent recently."""
+    key = (token_cache_key(access_token), contact_type)
+    if _contact_warmups.get(key):
+        return
+    warmup = _contact_warmup_requests.get(key)
+    if warmup is None:
+        warmup = asyncio.ensure_future(
+            run_google_call(_warmup_contact_search, get_people_service(access_token), contact_type)
+        )
+        _contact_warmup_requests[key] = warmup
+        warmup.add_done_callback(lambda _: _contact_warmup_requests.pop(key, None))
+    if await asyncio.shield(warmup):
+        _contact_warmups.set(key, True, CONTACT_WARMUP_TTL_SECONDS)
+
+async def _search_contact_source(
+    access_token: str,
+    contact_type: str,
+    query: str,
+    page_size: int,
+    page_token: str | None = None,
+    directory_sources: str = "UNSPECIFIED",
+) -> Dict[str, Any]:
+    """Search one contact source, through the per-user contact cache.
+
+    Every call builds its own service object: searches of different sources
+    run concurrently on pool threads, and the HTTP connection is not thread-safe.
+    """
+    key = (
+        token_cache_key(access_token), contact_type, query.strip().lower(),
+        page_size, page_token, directory_sources,
+    )
+    response = _contact_cache.get(key)
+    if response is not None:
+        return response
+
+    if contact_type in ('personal', 'other'):
+        await _ensure_contact_warmup(access_token, contact_type)
+
+    service = get_people_service(access_token)
+    if contact_type == 'personal':
+        request = service.people().searchContacts(
+            query=query,
+            pageSize=min(page_size, 30),
+            readMask=CONTACT_READ_MASK,
+        )
+    elif contact_type == 'other':
+        request = service.otherContacts().search(
+            query=query,
+            pageSize=min(page_size, 30),
+            readMask=OTHER_CONTACT_READ_MASK,
+        )
+    else:
+        request = service.people().searchDirectoryPeople(
+            query=query,
+            pageSize=min(page_size, 500),
+            readMask=CONTACT_READ_MASK,
+            sources=DIRECTORY_SOURCES.get(directory_sources, DIRECTORY_SOURCES['UNSPECIFIED']),
+            pageToken=page_token,
+        )
+    response = await execute_google_request(request)
+    _contact_cache.set(key, response, CONTACT_CACHE_TTL_SECONDS)
+    return response
+
+def _contact_people(response: Dict[str, Any], contact_type: str) -> list[Dict[str, Any]]:
+    """Person objects of a search response (directory search returns them unwrapped)."""
+    if contact_type == 'directory':
+        return response.get('people', [])
+    return [result.get('person', {}) for result in response.get('results', [])]
+
+async def resolve_attendee_emails(access_token: str, attendees: list[str]) -> list[str]:
+    """Resolve attendee names to email addresses; email addresses pass through.
+
+    Names are looked up in all contact sources concurrently, through the same
+    per-user contact cache as search_contacts. A name must match exactly one
+    email address.
+    """
+    names = list(dict.fromkeys(a.strip() for a in attendees if '@' not in a))
+    if not names:
+        return attendees
+
+    async def lookup(name: str) -> list[str]:
+        responses = await asyncio.gather(*(
+            _search_contact_source(access_token, contact_type, name, 10)
+            for contact_type in ('personal', 'other', 'directory')
+        ), return_exceptions=True)
+        candidates: Dict[str, list[str]] = {}
+        for contact_type, response in zip(('personal', 'other', 'directory'), responses):
+            if isinstance(response, Exception):
+                logger.warning(f"Contact search in {contact_type} failed for '{name}': {response}")
+                continue
+            for person in _contact_people(response, contact_type):
+                display_names = [n.get('displayName', '') for n in person.get('names', [])]
+                for email in person.get('emailAddresses', []):
+                    if email.get('value'):
+                        candidates.setdefault(email['value'].lower(), display_names)
+        # Prefer contacts whose display name is exactly the requested name
+        exact = [email for email, display_names in candidates.items()
+                 if any(d.lower() == name.lower() for d in display_names)]
+        return exact or list(candidates)
+
+    matches = dict(zip(names, await asyncio.gather(*(lookup(name) for name in names))))
+    problems = []
+    for name, emails in matches.items():
+        if not emails:
+            problems.append(f"no contact found for '{name}'")
+        elif len(emails) > 1:
+            problems.append(f"'{name}' matches several contacts: {', '.join(emails[:5])}")
+    if problems:
+        raise ValueError(f"Could not resolve attendees: {'; '.join(problems)}. Use email addresses instead.")
+
+    return [a if '@' in a else matches[a.strip()][0] for a in attendees]
 
 async def search_contacts(
     query: str,
@@ -782,14 +1363,6 @@ async def search_contacts(
     logger.info(f"Executing tool: search_contacts with query: {query}, contact_type: {contact_type}")
     try:
         access_token = get_auth_token()
-        service = get_people_service(access_token)
-
-        # Define the read mask for calendar-relevant person fields
-        # Only includes fields necessary for calendar operations (creating events, adding attendees)
-        comprehensive_read_mask = 'names,emailAddresses,organizations,phoneNumbers,metadata'
-
-        # Limited read mask for other contacts
-        limited_read_mask = 'emailAddresses,metadata,names,phoneNumbers'
 
         def format_contact(person: Dict[str, Any], contact_type_label: str) -> Dict[str, Any]:
             """Helper function to format a person object into structured contact data."""
@@ -828,56 +1401,12 @@ async def search_contacts(
             }
 
         if contact_type == 'all':
-            # Execute all three searches in parallel (with warmup for personal and other)
-            import asyncio
-
-            # Use ThreadPoolExecutor for blocking Google API calls
-            from concurrent.futures import ThreadPoolExecutor
-
-            def search_personal():
-                return service.people().searchContacts(
-                    query=query,
-                    pageSize=min(page_size, 30),
-                    readMask=comprehensive_read_mask,
-                ).execute()
-
-            def search_other():
-                return service.otherContacts().search(
-                    query=query,
-                    pageSize=min(page_size, 30),
-                    readMask=limited_read_mask,
-                ).execute()
-
-            def search_directory():
-                return service.people().searchDirectoryPeople(
-                    query=query,
-                    pageSize=min(page_size, 500),
-                    readMask=comprehensive_read_mask,
-                    sources=['DIRECTORY_SOURCE_TYPE_DOMAIN_PROFILE', 'DIRECTORY_SOURCE_TYPE_DOMAIN_CONTACT'],
-                ).execute()
-
-            # Run warmup requests first, then all three searches in parallel
-            loop = asyncio.get_event_loop()
-            with ThreadPoolExecutor(max_workers=5) as executor:
-                # Send warmup requests for personal and other contacts
-                warmup_personal_future = loop.run_in_executor(
-                    executor, _warmup_contact_search, service, 'personal'
-                )
-                warmup_other_future = loop.run_in_executor(
-                    executor, _warmup_contact_search, service, 'other'
-                )
-
-                # Wait for warmup to complete
-                await asyncio.gather(warmup_personal_future, warmup_other_future)
-
-                # Now execute actual searches in parallel
-                personal_future = loop.run_in_executor(executor, search_personal)
-                other_future = loop.run_in_executor(executor, search_other)
-                directory_future = loop.run_in_executor(executor, search_directory)
-
-                personal_res, other_res, directory_res = await asyncio.gather(
-                    personal_future, other_future, directory_future
-                )
+            # Search the three sources concurrently; each warms up only when its cache is cold
+            personal_res, other_res, directory_res = await asyncio.gather(
+                _search_contact_source(access_token, 'personal', query, page_size),
+                _search_contact_source(access_token, 'other', query, page_size),
+                _search_contact_source(access_token, 'directory', query, page_size),
+            )
 
             # Process personal results
             personal_results = [
@@ -920,19 +1449,7 @@ async def search_contacts(
             }
 
         elif contact_type == 'personal':
-            # Send warmup request before actual search
-            import asyncio
-            from concurrent.futures import ThreadPoolExecutor
-
-            loop = asyncio.get_event_loop()
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                await loop.run_in_executor(executor, _warmup_contact_search, service, 'personal')
-
-            response = service.people().searchContacts(
-                query=query,
-                pageSize=min(page_size, 30),
-                readMask=comprehensive_read_mask,
-            ).execute()
+            response = await _search_contact_source(access_token, 'personal', query, page_size)
 
             results = [
                 format_contact(result.get('person', {}), 'personal')
@@ -949,19 +1466,7 @@ async def search_contacts(
             }
 
         elif contact_type == 'other':
-            # Send warmup request before actual search
-            import asyncio
-            from concurrent.futures import ThreadPoolExecutor
-
-            loop = asyncio.get_event_loop()
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                await loop.run_in_executor(executor, _warmup_contact_search, service, 'other')
-
-            response = service.otherContacts().search(
-                query=query,
-                pageSize=min(page_size, 30),
-                readMask=limited_read_mask,
-            ).execute()
+            response = await _search_contact_source(access_token, 'other', query, page_size)
 
             results = [
                 format_contact(result.get('person', {}), 'other')
@@ -978,21 +1483,9 @@ async def search_contacts(
             }
 
         elif contact_type == 'directory':
-            # Map directory sources
-            source_map = {
-                'UNSPECIFIED': ['DIRECTORY_SOURCE_TYPE_DOMAIN_PROFILE', 'DIRECTORY_SOURCE_TYPE_DOMAIN_CONTACT'],
-                'DOMAIN_DIRECTORY': ['DIRECTORY_SOURCE_TYPE_DOMAIN_PROFILE'],
-                'DOMAIN_CONTACTS': ['DIRECTORY_SOURCE_TYPE_DOMAIN_CONTACT'],
-            }
-            sources = source_map.get(directory_sources, source_map['UNSPECIFIED'])
-
-            response = service.people().searchDirectoryPeople(
-                query=query,
-                pageSize=min(page_size, 500),
-                readMask=comprehensive_read_mask,
-                sources=sources,
-                pageToken=page_token,
-            ).execute()
+            response = await _search_contact_source(
+                access_token, 'directory', query, page_size, page_token, directory_sources
+            )
 
             results = [
                 format_contact(person, 'directory')
@@ -1134,7 +1627,7 @@ def main(
                         "attendees": {
                             "type": "array",
                             "items": {"type": "string"},
-                            "description": "The list of attendee emails. Must be valid email addresses e.g., username@domain.com.",
+                            "description": "The list of attendees, as email addresses (e.g., username@domain.com) or contact names. Names are looked up in the user's contacts and must match exactly one email address.",
                         },
                         "send_updates": {
                             "type": "string",
@@ -1280,6 +1773,58 @@ def main(
                     **{"category": "GOOGLE_CALENDAR_EVENT"}
                 ),
             ),
+            types.Tool(
+                name="google_calendar_get_events",
+                description="Get several events from Google Calendar by ID in a single batched request. Returns the events that were found and a per-event error for the ones that could not be fetched.",
+                inputSchema={
+                    "type": "object",
+                    "required": ["event_ids"],
+                    "properties": {
+                        "event_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "The IDs of the events to get",
+                        },
+                        "calendar_id": {
+                            "type": "string",
+                            "description": "The ID of the calendar containing the events",
+                            "default": "primary",
+                        },
+                    },
+                },
+                annotations=types.ToolAnnotations(
+                    **{"category": "GOOGLE_CALENDAR_EVENT", "readOnlyHint": True}
+                ),
+            ),
+            types.Tool(
+                name="google_calendar_delete_events",
+                description="Delete several events from Google Calendar in a single batched request. Returns the IDs that were deleted and a per-event error for the ones that could not be deleted.",
+                inputSchema={
+                    "type": "object",
+                    "required": ["event_ids"],
+                    "properties": {
+                        "event_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "The IDs of the events to delete",
+                        },
+                        "calendar_id": {
+                            "type": "string",
+                            "description": "The ID of the calendar containing the events",
+                            "default": "primary",
+                        },
+                        "send_updates": {
+                            "type": "string",
+                            "description": "Specifies which attendees to notify about the deletion",
+                            "enum": ["all", "externalOnly", "none"],
+                            "default": "all",
+                        },
+                    },
+                },
+                annotations=types.ToolAnnotations(
+                    **{"category": "GOOGLE_CALENDAR_EVENT"}
+                ),
+            ),
             types.Tool(
                 name="google_calendar_add_attendees_to_event",
                 description="Add attendees to an existing event in Google Calendar.",
@@ -1294,7 +1839,7 @@ def main(
                         "attendees": {
                             "type": "array",
                             "items": {"type": "string"},
-                            "description": "The list of attendee emails to add. Must be valid email addresses e.g., username@domain.com.",
+                            "description": "The list of attendees to add, as email addresses (e.g., username@domain.com) or contact names. Names are looked up in the user's contacts and must match exactly one email address.",
                         },
                         "calendar_id": {
                             "type": "string",
@@ -1349,6 +1894,73 @@ def main(
                     **{"category": "GOOGLE_CALENDAR_AVAILABILITY", "readOnlyHint": True}
                 ),
             ),
+            types.Tool(
+                name="google_calendar_find_meeting_times",
+                description="Find meeting times when all attendees are free, in one call. Merges the busy times of every attendee's calendar, applies working hours, working days and timezone, and returns ranked slots of the requested duration. Slots where more optional attendees are free rank first, then earlier slots. Calendars that cannot be read (e.g. not shared with the user) are listed in calendar_errors and ignored. Defaults to the next 7 days in the user's calendar timezone.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "attendees": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Calendar email addresses of the required attendees. Use 'primary' for the user's own calendar. Defaults to ['primary'].",
+                        },
+                        "optional_attendees": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Calendar email addresses of optional attendees. They do not block a slot, but slots where more of them are free rank higher.",
+                        },
+                        "duration_minutes": {
+                            "type": "integer",
+                            "description": "Meeting duration in minutes. Defaults to 30.",
+                            "default": 30,
+                            "minimum": 1,
+                        },
+                        "time_min": {
+                            "type": "string",
+                            "description": "Start of the search range in ISO 8601 format (e.g., '2024-12-31T09:00:00' or with an offset). Defaults to now.",
+                        },
+                        "time_max": {
+                            "type": "string",
+                            "description": "End of the search range in ISO 8601 format. Defaults to 7 days after time_min.",
+                        },
+                        "timezone": {
+                            "type": "string",
+                            "description": "Timezone for working hours and returned times (e.g., 'America/Los_Angeles'). Defaults to the user's Google Calendar timezone.",
+                        },
+                        "working_hours_start": {
+                            "type": "string",
+                            "description": "Start of working hours in HH:MM, in the given timezone. Defaults to '09:00'.",
+                            "default": "09:00",
+                        },
+                        "working_hours_end": {
+                            "type": "string",
+                            "description": "End of working hours in HH:MM, in the given timezone. Defaults to '17:00'.",
+                            "default": "17:00",
+                        },
+                        "working_days": {
+                            "type": "array",
+                            "items": {"type": "integer", "minimum": 1, "maximum": 7},
+                            "description": "ISO weekday numbers to schedule on, 1 (Monday) to 7 (Sunday). Defaults to Monday to Friday.",
+                        },
+                        "slot_step_minutes": {
+                            "type": "integer",
+                            "description": "Minutes between candidate start times (e.g., 30 gives :00 and :30 starts). Defaults to 30.",
+                            "default": 30,
+                            "minimum": 1,
+                        },
+                        "max_results": {
+                            "type": "integer",
+                            "description": "Maximum number of slots to return. Defaults to 10.",
+                            "default": 10,
+                            "minimum": 1,
+                        },
+                    },
+                },
+                annotations=types.ToolAnnotations(
+                    **{"category": "GOOGLE_CALENDAR_AVAILABILITY", "readOnlyHint": True}
+                ),
+            ),
             types.Tool(
                 name="google_calendar_search_contacts",
                 description="Search for contacts by name or email address. Supports searching personal contacts, other contact sources, domain directory, or all sources simultaneously. When contactType is 'all' (default), returns three separate result sets (personal, other, directory) each with independent pagination tokens for flexible paginated access to individual sources.",
@@ -1585,6 +2197,40 @@ def main(
                     )
                 ]
         
+        elif name in ("google_calendar_get_events", "google_calendar_delete_events"):
+            try:
+                event_ids = arguments.get("event_ids")
+                
+                if not event_ids:
+                    return [
+                        types.TextContent(
+                            type="text",
+                            text="Error: event_ids parameter is required",
+                        )
+                    ]
+                
+                calendar_id = arguments.get("calendar_id", "primary")
+                
+                if name == "google_calendar_get_events":
+                    result = await get_events(event_ids, calendar_id)
+                else:
+                    send_updates = arguments.get("send_updates", "all")
+                    result = await delete_events(event_ids, calendar_id, send_updates)
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=json.dumps(result, indent=2),
+                    )
+                ]
+            except Exception as e:
+                logger.exception(f"Error executing tool {name}: {e}")
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Error: {str(e)}",
+                    )
+                ]
+        
         elif name == "google_calendar_add_attendees_to_event":
             try:
                 event_id = arguments.get("event_id")
@@ -1655,6 +2301,36 @@ def main(
                     )
                 ]
 
+        elif name == "google_calendar_find_meeting_times":
+            try:
+                result = await find_meeting_times(
+                    attendees=arguments.get("attendees"),
+                    optional_attendees=arguments.get("optional_attendees"),
+                    duration_minutes=arguments.get("duration_minutes", 30),
+                    time_min=arguments.get("time_min"),
+                    time_max=arguments.get("time_max"),
+                    timezone=arguments.get("timezone"),
+                    working_hours_start=arguments.get("working_hours_start", "09:00"),
+                    working_hours_end=arguments.get("working_hours_end", "17:00"),
+                    working_days=arguments.get("working_days"),
+                    slot_step_minutes=arguments.get("slot_step_minutes", 30),
+                    max_results=arguments.get("max_results", 10),
+                )
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=json.dumps(result, indent=2),
+                    )
+                ]
+            except Exception as e:
+                logger.exception(f"Error executing tool {name}: {e}")
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Error: {str(e)}",
+                    )
+                ]
+
         elif name == "google_calendar_search_contacts":
             try:
                 query = arguments.get("query")
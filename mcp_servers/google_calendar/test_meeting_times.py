@@ -0,0 +1,63 @@
+"""
+Tests for ranking meeting times, with the freebusy query mocked out.
+
+Run from this directory: python -m pytest test_meeting_times.py
+"""
+
+import asyncio
+
+import pytest
+
+import server
+
+
+@pytest.fixture
+def freebusy(monkeypatch):
+    """Answer freebusy queries from a dict of busy intervals by calendar."""
+    busy = {}
+
+    async def fake_query(access_token, calendar_ids, time_min, time_max):
+        return {calendar_id: {"busy": busy.get(calendar_id, [])} for calendar_id in calendar_ids}
+
+    monkeypatch.setattr(server, "_query_freebusy", fake_query)
+    token = server.auth_token_context.set("token")
+    yield busy
+    server.auth_token_context.reset(token)
+
+
+def test_best_slots_are_found_past_many_earlier_candidates(freebusy):
+    # The optional attendee is only free in the fourth week, after thousands of one-minute slots
+    freebusy["optional@example.com"] = [{"start": "2025-03-03T00:00:00Z", "end": "2025-03-24T00:00:00Z"}]
+
+    result = asyncio.run(server.find_meeting_times(
+        attendees=["primary"],
+        optional_attendees=["optional@example.com"],
+        time_min="2025-03-03T00:00:00Z",
+        time_max="2025-03-29T00:00:00Z",
+        timezone="UTC",
+        slot_step_minutes=1,
+        max_results=3,
+    ))
+
+    assert result["total_candidate_slots"] > 5000
+    assert [slot["start"] for slot in result["slots"]] == [
+        "2025-03-24T09:00:00+00:00",
+        "2025-03-24T09:01:00+00:00",
+        "2025-03-24T09:02:00+00:00",
+    ]
+    assert all(slot["optional_attendees_free"] == 1 for slot in result["slots"])
+
+
+def test_slots_rank_by_start_when_all_free(freebusy):
+    result = asyncio.run(server.find_meeting_times(
+        time_min="2025-03-03T00:00:00Z",
+        time_max="2025-03-04T00:00:00Z",
+        timezone="UTC",
+        max_results=2,
+    ))
+
+    assert result["total_candidate_slots"] == 16
+    assert [slot["start"] for slot in result["slots"]] == [
+        "2025-03-03T09:00:00+00:00",
+        "2025-03-03T09:30:00+00:00",
+    ]
@@ -1,10 +1,13 @@
+import asyncio
+import threading
 import contextlib
 import base64
 import logging
 import os
 import json
 from collections.abc import AsyncIterator
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
 from contextvars import ContextVar
 
 import click
@@ -18,7 +21,8 @@ from starlette.routing import Mount, Route
 from starlette.types import Receive, Scope, Send
 from dotenv import load_dotenv
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build, build_from_document, fix_method_name
 from googleapiclient.errors import HttpError
 
 # Configure logging
@@ -60,15 +64,77 @@ def extract_access_token(request_or_scope) -> str:
         logger.warning(f"Failed to parse auth data JSON: {e}")
         return ""
 
+# The Google API helpers below are kept identical in every google_* server.
+# Each Docker image copies only its own server, so they cannot live in a
+# shared module.
+
+# Parsed discovery documents, loaded once per process and shared by every
+# per-token service object
+_discovery_documents: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_discovery_lock = threading.Lock()
+
+# Blocking googleapiclient calls run on this bounded pool, never on the event loop
+GOOGLE_API_MAX_WORKERS = int(os.getenv("GOOGLE_API_MAX_WORKERS", "32"))
+_google_executor = ThreadPoolExecutor(
+    max_workers=GOOGLE_API_MAX_WORKERS, thread_name_prefix="google-api"
+)
+
+def _prime_resources(resource, resource_desc: Dict[str, Any]) -> None:
+    """Instantiate every nested resource once.
+
+    The client library fixes up method descriptions in place the first time a
+    resource is created; doing it up front keeps the shared document read-only
+    afterwards.
+    """
+    for name, desc in resource_desc.get("resources", {}).items():
+        _prime_resources(getattr(resource, fix_method_name(name))(), desc)
+
+def _get_discovery_document(service_name: str, version: str) -> Optional[Dict[str, Any]]:
+    """Return the parsed discovery document bundled with the client library."""
+    key = (service_name, version)
+    document = _discovery_documents.get(key)
+    if document is None:
+        with _discovery_lock:
+            document = _discovery_documents.get(key)
+            if document is None:
+                content = discovery_cache.get_static_doc(service_name, version)
+                if content is None:
+                    return None
+                document = json.loads(content)
+                _prime_resources(
+                    build_from_document(document, credentials=Credentials(token=None)),
+                    document,
+                )
+                _discovery_documents[key] = document
+    return document
+
+def build_google_service(service_name: str, version: str, credentials):
+    """Build a lightweight service object for one set of credentials."""
+    document = _get_discovery_document(service_name, version)
+    if document is None:
+        # Not bundled with the client library, let build() fetch it
+        return build(service_name, version, credentials=credentials)
+    return build_from_document(document, credentials=credentials)
+
+async def execute_google_request(request):
+    """Run a request's blocking execute() on the Google API thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_google_executor, request.execute)
+
+async def run_google_call(func, *args):
+    """Run a blocking helper that calls Google APIs on the Google API thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_google_executor, func, *args)
+
 def get_docs_service(access_token: str):
     """Create Google Docs service with access token."""
     credentials = Credentials(token=access_token)
-    return build('docs', 'v1', credentials=credentials)
+    return build_google_service('docs', 'v1', credentials)
 
 def get_drive_service(access_token: str):
     """Create Google Drive service with access token."""
     credentials = Credentials(token=access_token)
-    return build('drive', 'v3', credentials=credentials)
+    return build_google_service('drive', 'v3', credentials)
 
 def get_auth_token() -> str:
     """Get the authentication token from context."""
@@ -85,7 +151,7 @@ async def get_document_by_id(document_id: str) -> Dict[str, Any]:
         service = get_docs_service(access_token)
         
         request = service.documents().get(documentId=document_id)
-        response = request.execute()
+        response = await execute_google_request(request)
         
         return dict(response)
     except HttpError as e:
@@ -119,10 +185,9 @@ async def insert_text_at_end(document_id: str, text: str) -> Dict[str, Any]:
         ]
         
         # Execute the request
-        response = (
+        response = await execute_google_request(
             service.documents()
             .batchUpdate(documentId=document_id, body={"requests": requests})
-            .execute()
         )
         
         return dict(response)
@@ -144,7 +209,7 @@ async def create_blank_document(title: str) -> Dict[str, Any]:
         body = {"title": title}
         
         request = service.documents().create(body=body)
-        response = request.execute()
+        response = await execute_google_request(request)
         
         return {
             "title": response["title"],
@@ -182,9 +247,9 @@ async def create_document_from_text(title: str, text_content: str) -> Dict[str,
         ]
         
         # Execute the batchUpdate method to insert text
-        service.documents().batchUpdate(
+        await execute_google_request(service.documents().batchUpdate(
             documentId=document["document_id"], body={"requests": requests}
-        ).execute()
+        ))
         
         return {
             "title": document["title"],
@@ -214,7 +279,7 @@ async def get_all_documents() -> Dict[str, Any]:
             fields="nextPageToken, files(id, name, createdTime, modifiedTime, webViewLink)",
             orderBy="modifiedTime desc"
         )
-        response = request.execute()
+        response = await execute_google_request(request)
         
         documents = []
         for file in response.get('files', []):
@@ -1,10 +1,13 @@
+import asyncio
+import threading
 import contextlib
 import base64
 import logging
 import os
 import json
 from collections.abc import AsyncIterator
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
 from contextvars import ContextVar
 from enum import Enum
 
@@ -19,7 +22,8 @@ from starlette.routing import Mount, Route
 from starlette.types import Receive, Scope, Send
 from dotenv import load_dotenv
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build, build_from_document, fix_method_name
 from googleapiclient.errors import HttpError
 
 from utils import convert_document_to_html, convert_document_to_markdown
@@ -52,15 +56,109 @@ class Corpora(Enum):
     DRIVE = "drive"
     DOMAIN = "domain"
 
+# The Google API helpers below are kept identical in every google_* server.
+# Each Docker image copies only its own server, so they cannot live in a
+# shared module.
+
+# Parsed discovery documents, loaded once per process and shared by every
+# per-token service object
+_discovery_documents: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_discovery_lock = threading.Lock()
+
+# Blocking googleapiclient calls run on this bounded pool, never on the event loop
+GOOGLE_API_MAX_WORKERS = int(os.getenv("GOOGLE_API_MAX_WORKERS", "32"))
+_google_executor = ThreadPoolExecutor(
+    max_workers=GOOGLE_API_MAX_WORKERS, thread_name_prefix="google-api"
+)
+
+def _prime_resources(resource, resource_desc: Dict[str, Any]) -> None:
+    """Instantiate every nested resource once.
+
+    The client library fixes up method descriptions in place the first time a
+    resource is created; doing it up front keeps the shared document read-only
+    afterwards.
+    """
+    for name, desc in resource_desc.get("resources", {}).items():
+        _prime_resources(getattr(resource, fix_method_name(name))(), desc)
+
+def _get_discovery_document(service_name: str, version: str) -> Optional[Dict[str, Any]]:
+    """Return the parsed discovery document bundled with the client library."""
+    key = (service_name, version)
+    document = _discovery_documents.get(key)
+    if document is None:
+        with _discovery_lock:
+            document = _discovery_documents.get(key)
+            if document is None:
+                content = discovery_cache.get_static_doc(service_name, version)
+                if content is None:
+                    return None
+                document = json.loads(content)
+                _prime_resources(
+                    build_from_document(document, credentials=Credentials(token=None)),
+                    document,
+                )
+                _discovery_documents[key] = document
+    return document
+
+def build_google_service(service_name: str, version: str, credentials):
+    """Build a lightweight service object for one set of credentials."""
+    document = _get_discovery_document(service_name, version)
+    if document is None:
+        # Not bundled with the client library, let build() fetch it
+        return build(service_name, version, credentials=credentials)
+    return build_from_document(document, credentials=credentials)
+
+async def execute_google_request(request):
+    """Run a request's blocking execute() on the Google API thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_google_executor, request.execute)
+
+async def run_google_call(func, *args):
+    """Run a blocking helper that calls Google APIs on the Google API thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_google_executor, func, *args)
+
+# The Drive API accepts up to 100 calls per batch request
+GOOGLE_BATCH_MAX_SIZE = 100
+
+# execute_google_batch is shared with the other batching Google server and
+# kept identical there, like the helpers above.
+async def execute_google_batch(
+    service, requests: Dict[str, Any], batch_size: int = GOOGLE_BATCH_MAX_SIZE
+) -> Dict[str, Dict[str, Any]]:
+    """Execute independent requests through the Google batch endpoint.
+
+    Requests are sent in groups of at most batch_size calls, one HTTP round trip
+    per group. Returns {key: {"result": ...}} or {key: {"error": ..., "status": ...}}
+    for every key, so one failing item does not fail the others.
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+
+    def callback(request_id, response, exception):
+        if exception is None:
+            results[request_id] = {"result": response}
+        elif isinstance(exception, HttpError):
+            results[request_id] = {"error": exception.reason, "status": exception.status_code}
+        else:
+            results[request_id] = {"error": str(exception)}
+
+    items = list(requests.items())
+    for start in range(0, len(items), batch_size):
+        batch = service.new_batch_http_request(callback=callback)
+        for key, request in items[start:start + batch_size]:
+            batch.add(request, request_id=key)
+        await run_google_call(batch.execute)
+    return results
+
 def get_drive_service(access_token: str):
     """Create Google Drive service with access token."""
     credentials = Credentials(token=access_token)
-    return build('drive', 'v3', credentials=credentials)
+    return build_google_service('drive', 'v3', credentials)
 
 def get_docs_service(access_token: str):
     """Create Google Docs service with access token."""
     credentials = Credentials(token=access_token)
-    return build('docs', 'v1', credentials=credentials)
+    return build_google_service('docs', 'v1', credentials)
 
 def extract_access_token(request_or_scope) -> str:
     """Extract access token from x-auth-data header."""
@@ -110,7 +208,7 @@ async def get_document_content_by_id(document_id: str) -> Dict[str, Any]:
         service = get_docs_service(access_token)
         
         request = service.documents().get(documentId=document_id)
-        response = request.execute()
+        response = await execute_google_request(request)
         
         return dict(response)
     except HttpError as e:
@@ -335,7 +433,7 @@ async def search_documents(
             else:
                 params.pop("pageToken", None)
 
-            results = service.files().list(**params).execute()
+            results = await execute_google_request(service.files().list(**params))
             batch = results.get("files", [])
             files.extend(batch[: limit - len(files)])
 
@@ -415,13 +513,13 @@ async def empty_trash(
         
         # Use v2 API for empty trash operation
         credentials = Credentials(token=access_token)
-        service = build('drive', 'v2', credentials=credentials)
+        service = build_google_service('drive', 'v2', credentials)
         
         params = {}
         if drive_id:
             params['driveId'] = drive_id
             
-        service.files().emptyTrash(**params).execute()
+        await execute_google_request(service.files().emptyTrash(**params))
         
         return {"success": True, "message": "Trash emptied successfully"}
     except HttpError as e:
@@ -446,10 +544,10 @@ async def create_shared_drive(
             'name': name
         }
         
-        result = service.drives().create(
+        result = await execute_google_request(service.drives().create(
             body=drive_metadata,
             requestId=request_id
-        ).execute()
+        ))
         
         return result
     except HttpError as e:
@@ -499,7 +597,7 @@ async def get_file_tree_structure(
 
         while keep_paginating:
             # Get a list of files
-            results = service.files().list(**params).execute()
+            results = await execute_google_request(service.files().list(**params))
 
             # Update page token
             page_token = results.get("nextPageToken")
@@ -514,18 +612,25 @@ async def get_file_tree_structure(
 
         file_tree = build_file_tree(files)
 
+        # Look up all shared drive names in batched requests instead of one call per drive
+        drive_details = await execute_google_batch(service, {
+            drive_id: service.drives().get(driveId=drive_id)
+            for drive_id in file_tree
+            if drive_id != "My Drive"
+        })
+
         drives = []
 
         for drive_id, drive_files in file_tree.items():
             if drive_id == "My Drive":
                 drive = {"name": "My Drive", "children": drive_files}
             else:
-                try:
-                    drive_details = service.drives().get(driveId=drive_id).execute()
-                    drive_name = drive_details.get("name", "Shared Drive (name unavailable)")
-                except HttpError as e:
+                details = drive_details[drive_id]
+                if "result" in details:
+                    drive_name = details["result"].get("name", "Shared Drive (name unavailable)")
+                else:
                     drive_name = (
-                        f"Shared Drive (name unavailable: 'HttpError {e.status_code}: {e.reason}')"
+                        f"Shared Drive (name unavailable: 'HttpError {details.get('status')}: {details['error']}')"
                     )
 
                 drive = {"name": drive_name, "id": drive_id, "children": drive_files}
@@ -541,6 +646,37 @@ async def get_file_tree_structure(
         logger.exception(f"Error executing tool get_file_tree_structure: {e}")
         raise e
 
+async def get_files_metadata(
+    file_ids: list[str],
+    fields: str | None = None,
+) -> Dict[str, Any]:
+    """Get metadata for several files using batched requests."""
+    logger.info(f"Executing tool: get_files_metadata with {len(file_ids)} file IDs")
+    try:
+        access_token = get_auth_token()
+        service = get_drive_service(access_token)
+
+        file_ids = list(dict.fromkeys(file_ids))
+        fields = fields or "id,name,mimeType,size,createdTime,modifiedTime,owners,parents,webViewLink,driveId,trashed"
+        results = await execute_google_batch(service, {
+            file_id: service.files().get(fileId=file_id, fields=fields, supportsAllDrives=True)
+            for file_id in file_ids
+        })
+
+        files = []
+        errors = []
+        for file_id in file_ids:
+            item = results[file_id]
+            if "result" in item:
+                files.append(item["result"])
+            else:
+                errors.append({"file_id": file_id, **item})
+
+        return {"files_count": len(files), "files": files, "errors": errors}
+    except Exception as e:
+        logger.exception(f"Error executing tool get_files_metadata: {e}")
+        raise e
+
 @click.command()
 @click.option("--port", default=GOOGLE_DRIVE_MCP_SERVER_PORT, help="Port to listen on for HTTP")
 @click.option(
@@ -721,6 +857,28 @@ def main(
                     **{"category": "GOOGLE_DRIVE_FILE", "readOnlyHint": True}
                 ),
             ),
+            types.Tool(
+                name="google_drive_get_files_metadata",
+                description="Get metadata for several files in the user's Google Drive in a single batched request. Returns the files that were found and a per-file error for the ones that could not be fetched.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "file_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "The IDs of the files to get metadata for.",
+                        },
+                        "fields": {
+                            "type": "string",
+                            "description": "Comma-separated list of file fields to return, e.g. 'id,name,mimeType'. Defaults to the most commonly used fields.",
+                        },
+                    },
+                    "required": ["file_ids"],
+                },
+                annotations=types.ToolAnnotations(
+                    **{"category": "GOOGLE_DRIVE_FILE", "readOnlyHint": True}
+                ),
+            ),
             types.Tool(
                 name="google_drive_empty_trash",
                 description="Permanently delete all of the user's trashed files.",
@@ -843,6 +1001,30 @@ def main(
                     )
                 ]
 
+        elif name == "google_drive_get_files_metadata":
+            try:
+                file_ids = arguments.get("file_ids")
+                if not file_ids:
+                    raise ValueError("The 'file_ids' argument is required.")
+                result = await get_files_metadata(
+                    file_ids=file_ids,
+                    fields=arguments.get("fields"),
+                )
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=json.dumps(result, indent=2),
+                    )
+                ]
+            except Exception as e:
+                logger.exception(f"Error executing tool {name}: {e}")
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Error: {str(e)}",
+                    )
+                ]
+
         elif name == "google_drive_empty_trash":
             try:
                 result = await empty_trash(
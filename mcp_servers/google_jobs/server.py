@@ -26,6 +26,7 @@ from tools import (
     search_remote_jobs,
     get_job_search_suggestions,
 )
+from tools.base import init_http_clients, close_http_clients
 
 load_dotenv()
 
@@ -524,8 +525,9 @@ def main(
 
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
-        """Context manager for session manager."""
+        """Context manager for session manager and shared HTTP client."""
         try:
+            await init_http_clients()
             async with session_manager.run():
                 logger.info("Application started with dual transports!")
                 yield
@@ -534,6 +536,7 @@ def main(
             raise
         finally:
             logger.info("Application shutting down...")
+            await close_http_clients()
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
@@ -33,6 +33,41 @@ def _get_ssl_context():
     """Create secure SSL context."""
     return ssl.create_default_context()
 
+# Shared HTTP session, reused across tool calls so connections stay pooled
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Return the process-wide HTTP session, creating it on first use."""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        connector = aiohttp.TCPConnector(
+            ssl=_get_ssl_context(),
+            limit=100,
+            keepalive_timeout=30,
+        )
+        # No cookie jar: the session is shared across tenants
+        _http_session = aiohttp.ClientSession(
+            connector=connector, cookie_jar=aiohttp.DummyCookieJar()
+        )
+    return _http_session
+
+
+async def init_http_clients() -> None:
+    """Create the shared HTTP session (called from the server lifespan)."""
+    get_http_session()
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP session on server shutdown."""
+    global _http_session
+    if _http_session is not None:
+        try:
+            await _http_session.close()
+        finally:
+            _http_session = None
+
+
 async def make_serpapi_request(
     params: Dict[str, Any],
     expect_empty_response: bool = False
@@ -54,43 +89,42 @@ async def make_serpapi_request(
     url = SERPAPI_BASE_URL
     headers = _get_serpapi_headers()
     
-    connector = aiohttp.TCPConnector(ssl=_get_ssl_context())
-    async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
-        try:
-            async with session.get(url, params=params) as response:
-                response.raise_for_status()
-                
-                if expect_empty_response:
-                    if response.status in [200, 201, 204]:
-                        return None
-                    else:
-                        logger.warning(f"Expected empty response for SerpApi request, but got status {response.status}")
-                        try:
-                            return await response.json()
-                        except aiohttp.ContentTypeError:
-                            return await response.text()
+    session = get_http_session()
+    try:
+        async with session.get(url, params=params, headers=headers) as response:
+            response.raise_for_status()
+            
+            if expect_empty_response:
+                if response.status in [200, 201, 204]:
+                    return None
+                else:
+                    logger.warning(f"Expected empty response for SerpApi request, but got status {response.status}")
+                    try:
+                        return await response.json()
+                    except aiohttp.ContentTypeError:
+                        return await response.text()
+            else:
+                if 'application/json' in response.headers.get('Content-Type', ''):
+                    data = await response.json()
+                    
+                    if "error" in data:
+                        raise RuntimeError(f"SerpApi error: {data['error']}")
+                    
+                    return data
                 else:
-                    if 'application/json' in response.headers.get('Content-Type', ''):
-                        data = await response.json()
-                        
-                        if "error" in data:
-                            raise RuntimeError(f"SerpApi error: {data['error']}")
-                        
-                        return data
-                    else:
-                        text_content = await response.text()
-                        logger.warning(f"Received non-JSON response from SerpApi: {text_content[:100]}...")
-                        return {"raw_content": text_content}
-                        
-        except aiohttp.ClientResponseError as e:
-            logger.error(f"SerpApi request failed: {e.status} {e.message} for {url}")
-            error_details = e.message
-            try:
-                error_body = await e.response.json()
-                error_details = f"{e.message} - {error_body}"
-            except Exception:
-                pass
-            raise RuntimeError(f"SerpApi Error ({e.status}): {error_details}") from e
-        except Exception as e:
-            logger.error(f"An unexpected error occurred during SerpApi request: {e}")
-            raise RuntimeError(f"Unexpected error during API call to SerpApi") from e
+                    text_content = await response.text()
+                    logger.warning(f"Received non-JSON response from SerpApi: {text_content[:100]}...")
+                    return {"raw_content": text_content}
+                    
+    except aiohttp.ClientResponseError as e:
+        logger.error(f"SerpApi request failed: {e.status} {e.message} for {url}")
+        error_details = e.message
+        try:
+            error_body = await e.response.json()
+            error_details = f"{e.message} - {error_body}"
+        except Exception:
+            pass
+        raise RuntimeError(f"SerpApi Error ({e.status}): {error_details}") from e
+    except Exception as e:
+        logger.error(f"An unexpected error occurred during SerpApi request: {e}")
+        raise RuntimeError(f"Unexpected error during API call to SerpApi") from e
@@ -1,10 +1,13 @@
+import asyncio
+import threading
 import contextlib
 import base64
 import logging
 import os
 import json
 from collections.abc import AsyncIterator
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
 from contextvars import ContextVar
 
 import click
@@ -18,7 +21,8 @@ from starlette.routing import Mount, Route
 from starlette.types import Receive, Scope, Send
 from dotenv import load_dotenv
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build, build_from_document, fix_method_name
 from googleapiclient.errors import HttpError
 
 from exceptions import RetryableToolError
@@ -73,16 +77,78 @@ def extract_access_token(request_or_scope) -> str:
         logger.warning(f"Failed to parse auth data JSON: {e}")
         return ""
 
+# The Google API helpers below are kept identical in every google_* server.
+# Each Docker image copies only its own server, so they cannot live in a
+# shared module.
+
+# Parsed discovery documents, loaded once per process and shared by every
+# per-token service object
+_discovery_documents: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_discovery_lock = threading.Lock()
+
+# Blocking googleapiclient calls run on this bounded pool, never on the event loop
+GOOGLE_API_MAX_WORKERS = int(os.getenv("GOOGLE_API_MAX_WORKERS", "32"))
+_google_executor = ThreadPoolExecutor(
+    max_workers=GOOGLE_API_MAX_WORKERS, thread_name_prefix="google-api"
+)
+
+def _prime_resources(resource, resource_desc: Dict[str, Any]) -> None:
+    """Instantiate every nested resource once.
+
+    The client library fixes up method descriptions in place the first time a
+    resource is created; doing it up front keeps the shared document read-only
+    afterwards.
+    """
+    for name, desc in resource_desc.get("resources", {}).items():
+        _prime_resources(getattr(resource, fix_method_name(name))(), desc)
+
+def _get_discovery_document(service_name: str, version: str) -> Optional[Dict[str, Any]]:
+    """Return the parsed discovery document bundled with the client library."""
+    key = (service_name, version)
+    document = _discovery_documents.get(key)
+    if document is None:
+        with _discovery_lock:
+            document = _discovery_documents.get(key)
+            if document is None:
+                content = discovery_cache.get_static_doc(service_name, version)
+                if content is None:
+                    return None
+                document = json.loads(content)
+                _prime_resources(
+                    build_from_document(document, credentials=Credentials(token=None)),
+                    document,
+                )
+                _discovery_documents[key] = document
+    return document
+
+def build_google_service(service_name: str, version: str, credentials):
+    """Build a lightweight service object for one set of credentials."""
+    document = _get_discovery_document(service_name, version)
+    if document is None:
+        # Not bundled with the client library, let build() fetch it
+        return build(service_name, version, credentials=credentials)
+    return build_from_document(document, credentials=credentials)
+
+async def execute_google_request(request):
+    """Run a request's blocking execute() on the Google API thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_google_executor, request.execute)
+
+async def run_google_call(func, *args):
+    """Run a blocking helper that calls Google APIs on the Google API thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_google_executor, func, *args)
+
 def get_sheets_service(access_token: str):
     """Create Google Sheets service with access token."""
     credentials = Credentials(token=access_token)
-    return build('sheets', 'v4', credentials=credentials)
+    return build_google_service('sheets', 'v4', credentials)
 
 # This is used for the list_all_sheets tool
 def get_drive_service(access_token: str):
     """Create Google Drive service with access token."""
     credentials = Credentials(token=access_token)
-    return build('drive', 'v3', credentials=credentials)
+    return build_google_service('drive', 'v3', credentials)
 
 def get_auth_token() -> str:
     """Get the authentication token from context."""
@@ -132,10 +198,9 @@ async def create_spreadsheet_tool(
 
         body = spreadsheet.model_dump()
 
-        response = (
+        response = await execute_google_request(
             service.spreadsheets()
             .create(body=body, fields="spreadsheetId,spreadsheetUrl,properties/title")
-            .execute()
         )
 
         return {
@@ -158,14 +223,13 @@ async def get_spreadsheet_tool(spreadsheet_id: str) -> Dict[str, Any]:
         access_token = get_auth_token()
         service = get_sheets_service(access_token)
         
-        response = (
+        response = await execute_google_request(
             service.spreadsheets()
             .get(
                 spreadsheetId=spreadsheet_id,
                 includeGridData=True,
                 fields="spreadsheetId,spreadsheetUrl,properties/title,sheets/properties,sheets/data/rowData/values/userEnteredValue,sheets/data/rowData/values/formattedValue,sheets/data/rowData/values/effectiveValue",
             )
-            .execute()
         )
         return parse_get_spreadsheet_response(response)
     except HttpError as e:
@@ -189,7 +253,9 @@ async def write_to_cell_tool(
         access_token = get_auth_token()
         service = get_sheets_service(access_token)
         
-        validate_write_to_cell_params(service, spreadsheet_id, sheet_name, column, row)
+        await run_google_call(
+            validate_write_to_cell_params, service, spreadsheet_id, sheet_name, column, row
+        )
 
         range_ = f"'{sheet_name}'!{column.upper()}{row}"
         body = {
@@ -198,7 +264,7 @@ async def write_to_cell_tool(
             "values": [[value]],
         }
 
-        sheet_properties = (
+        sheet_properties = await execute_google_request(
             service.spreadsheets()
             .values()
             .update(
@@ -208,7 +274,6 @@ async def write_to_cell_tool(
                 includeValuesInResponse=True,
                 body=body,
             )
-            .execute()
         )
 
         return parse_write_to_cell_response(sheet_properties)
@@ -230,11 +295,11 @@ async def list_all_sheets_tool() -> Dict[str, Any]:
         # Search for Google Sheets files (mimeType for Google Sheets)
         query = "mimeType='application/vnd.google-apps.spreadsheet'"
         
-        results = service.files().list(
+        results = await execute_google_request(service.files().list(
             q=query,
             fields="files(id,name,createdTime,modifiedTime,owners,webViewLink)",
             orderBy="modifiedTime desc"
-        ).execute()
+        ))
         
         files = results.get('files', [])
         
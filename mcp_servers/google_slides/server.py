@@ -1,3 +1,5 @@
+import asyncio
+import threading
 import os
 import base64
 import json
@@ -5,12 +7,14 @@ import uuid
 import logging
 import contextlib
 from collections.abc import AsyncIterator
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Tuple
 from contextvars import ContextVar
 
 import click
 from dotenv import load_dotenv
-from googleapiclient.discovery import build
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build, build_from_document, fix_method_name
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request as GoogleRequest
@@ -73,15 +77,77 @@ def get_auth_token() -> str:
     except LookupError:
         raise RuntimeError("Authentication token not found in request context")
 
+# The Google API helpers below are kept identical in every google_* server.
+# Each Docker image copies only its own server, so they cannot live in a
+# shared module.
+
+# Parsed discovery documents, loaded once per process and shared by every
+# per-token service object
+_discovery_documents: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_discovery_lock = threading.Lock()
+
+# Blocking googleapiclient calls run on this bounded pool, never on the event loop
+GOOGLE_API_MAX_WORKERS = int(os.getenv("GOOGLE_API_MAX_WORKERS", "32"))
+_google_executor = ThreadPoolExecutor(
+    max_workers=GOOGLE_API_MAX_WORKERS, thread_name_prefix="google-api"
+)
+
+def _prime_resources(resource, resource_desc: Dict[str, Any]) -> None:
+    """Instantiate every nested resource once.
+
+    The client library fixes up method descriptions in place the first time a
+    resource is created; doing it up front keeps the shared document read-only
+    afterwards.
+    """
+    for name, desc in resource_desc.get("resources", {}).items():
+        _prime_resources(getattr(resource, fix_method_name(name))(), desc)
+
+def _get_discovery_document(service_name: str, version: str) -> Optional[Dict[str, Any]]:
+    """Return the parsed discovery document bundled with the client library."""
+    key = (service_name, version)
+    document = _discovery_documents.get(key)
+    if document is None:
+        with _discovery_lock:
+            document = _discovery_documents.get(key)
+            if document is None:
+                content = discovery_cache.get_static_doc(service_name, version)
+                if content is None:
+                    return None
+                document = json.loads(content)
+                _prime_resources(
+                    build_from_document(document, credentials=Credentials(token=None)),
+                    document,
+                )
+                _discovery_documents[key] = document
+    return document
+
+def build_google_service(service_name: str, version: str, credentials):
+    """Build a lightweight service object for one set of credentials."""
+    document = _get_discovery_document(service_name, version)
+    if document is None:
+        # Not bundled with the client library, let build() fetch it
+        return build(service_name, version, credentials=credentials)
+    return build_from_document(document, credentials=credentials)
+
+async def execute_google_request(request):
+    """Run a request's blocking execute() on the Google API thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_google_executor, request.execute)
+
+async def run_google_call(func, *args):
+    """Run a blocking helper that calls Google APIs on the Google API thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_google_executor, func, *args)
+
 def get_slides_service(access_token: str):
     """Create Google Slides service with access token."""
     credentials = Credentials(token=access_token)
-    return build('slides', 'v1', credentials=credentials)
+    return build_google_service('slides', 'v1', credentials)
 
 def get_drive_service(access_token: str):
     """Create Google Drive service with access token."""
     credentials = Credentials(token=access_token)
-    return build('drive', 'v3', credentials=credentials)
+    return build_google_service('drive', 'v3', credentials)
 
 def get_credentials():
     """
@@ -137,13 +203,13 @@ async def create_presentation(title: str) -> str:
     """
     try:
         creds = get_credentials()
-        service = build('slides', 'v1', credentials=creds)
+        service = build_google_service('slides', 'v1', creds)
         
         presentation = {
             'title': title
         }
         
-        presentation = service.presentations().create(body=presentation).execute()
+        presentation = await execute_google_request(service.presentations().create(body=presentation))
         presentation_id = presentation.get('presentationId')
         
         return f"Presentation created: https://docs.google.com/presentation/d/{presentation_id}/edit"
@@ -165,7 +231,7 @@ async def add_slide(presentation_id: str, title: Optional[str] = None, content:
     """
     try:
         creds = get_credentials()
-        service = build('slides', 'v1', credentials=creds)
+        service = build_google_service('slides', 'v1', creds)
         
         # Create a blank slide
         requests = [
@@ -180,10 +246,10 @@ async def add_slide(presentation_id: str, title: Optional[str] = None, content:
             }
         ]
         
-        response = service.presentations().batchUpdate(
+        response = await execute_google_request(service.presentations().batchUpdate(
             presentationId=presentation_id,
             body={'requests': requests}
-        ).execute()
+        ))
         
         slide_id = response.get('replies', [{}])[0].get('createSlide', {}).get('objectId')
         
@@ -210,10 +276,10 @@ async def add_slide(presentation_id: str, title: Optional[str] = None, content:
                 })
                 
             if content_requests:
-                service.presentations().batchUpdate(
+                await execute_google_request(service.presentations().batchUpdate(
                     presentationId=presentation_id,
                     body={'requests': content_requests}
-                ).execute()
+                ))
         
         return f"Slide added to presentation: https://docs.google.com/presentation/d/{presentation_id}/edit"
     except Exception as e:
@@ -229,14 +295,14 @@ async def list_presentations() -> str:
     """
     try:
         creds = get_credentials()
-        drive_service = build('drive', 'v3', credentials=creds)
+        drive_service = build_google_service('drive', 'v3', creds)
         
         # Query for Google Slides files
-        results = drive_service.files().list(
+        results = await execute_google_request(drive_service.files().list(
             q="mimeType='application/vnd.google-apps.presentation'",
             pageSize=10,
             fields="files(id, name, webViewLink)"
-        ).execute()
+        ))
         
         presentations = results.get('files', [])
         
@@ -265,17 +331,17 @@ async def get_presentation(presentation_id: str, fields: Optional[str] = None) -
     """
     try:
         creds = get_credentials()
-        service = build('slides', 'v1', credentials=creds)
+        service = build_google_service('slides', 'v1', creds)
         
         # Set default fields if none specified
         if not fields:
             fields = "presentationId,title,revisionId,slides,pageSize"
             
         # Retrieve the presentation
-        presentation = service.presentations().get(
+        presentation = await execute_google_request(service.presentations().get(
             presentationId=presentation_id,
             fields=fields
-        ).execute()
+        ))
         
         # Format the response
         title = presentation.get('title', 'Untitled')
@@ -316,13 +382,13 @@ async def batch_update_presentation(presentation_id: str, requests: List[Dict])
     """
     try:
         creds = get_credentials()
-        service = build('slides', 'v1', credentials=creds)
+        service = build_google_service('slides', 'v1', creds)
         
         # Execute the batch update
-        response = service.presentations().batchUpdate(
+        response = await execute_google_request(service.presentations().batchUpdate(
             presentationId=presentation_id,
             body={'requests': requests}
-        ).execute()
+        ))
         
         # Format the response
         replies = response.get('replies', [])
@@ -353,12 +419,12 @@ async def summarize_presentation(presentation_id: str, include_notes: bool = Fal
     """
     try:
         creds = get_credentials()
-        service = build('slides', 'v1', credentials=creds)
+        service = build_google_service('slides', 'v1', creds)
         
         # Retrieve the presentation with all text elements
-        presentation = service.presentations().get(
+        presentation = await execute_google_request(service.presentations().get(
             presentationId=presentation_id
-        ).execute()
+        ))
         
         title = presentation.get('title', 'Untitled')
         slides = presentation.get('slides', [])
@@ -16,6 +16,8 @@ from starlette.types import Receive, Scope, Send
 
 from tools import (
     hackerNews_item,
+    hackerNews_items,
+    hackerNews_comment_tree,
     hackerNews_user,
     hackerNews_askstories,
     hackerNews_jobstories,
@@ -25,6 +27,7 @@ from tools import (
     hackerNews_newstories,
     hackerNews_beststories
 )
+from tools.helpers import init_http_clients, close_http_clients
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -79,6 +82,51 @@ def main(
                 annotations=types.ToolAnnotations(**{"category": "HACKER_NEWS_ITEM", "readOnlyHint": True})
             ),
 
+            # For hackerNews_items
+            types.Tool(
+                name="hackerNews_items",
+                description="Fetch several Hacker News items concurrently by their numeric ids.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "ids": {
+                            "type": "array",
+                            "items": {"type": "integer"},
+                            "description": "The items' unique identifiers (e.g., [8863, 8864])"
+                        }
+                    },
+                    "required": ["ids"]
+                },
+                annotations=types.ToolAnnotations(**{"category": "HACKER_NEWS_ITEM", "readOnlyHint": True})
+            ),
+
+            # For hackerNews_comment_tree
+            types.Tool(
+                name="hackerNews_comment_tree",
+                description="Fetch a Hacker News story or comment with its nested comment tree (replies).",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "item_id": {
+                            "type": "integer",
+                            "description": "The story or comment id (e.g., 8863)"
+                        },
+                        "max_depth": {
+                            "type": "integer",
+                            "description": "Levels of replies to fetch below the item (default: 3)",
+                            "default": 3
+                        },
+                        "max_comments": {
+                            "type": "integer",
+                            "description": "Maximum number of comments to fetch in total (default: 200)",
+                            "default": 200
+                        }
+                    },
+                    "required": ["item_id"]
+                },
+                annotations=types.ToolAnnotations(**{"category": "HACKER_NEWS_ITEM", "readOnlyHint": True})
+            ),
+
             # For hackerNews_user
             types.Tool(
                 name="hackerNews_user",
@@ -254,6 +302,66 @@ def main(
                     )
                 ]
 
+        # Hacker News Items
+        elif name == "hackerNews_items":
+            try:
+                ids = arguments.get("ids")
+                if not ids:
+                    return [
+                        types.TextContent(
+                            type="text",
+                            text="Missing required parameter: ids",
+                        )
+                    ]
+
+                result = await hackerNews_items(ids)
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=json.dumps(result, indent=2),
+                    )
+                ]
+            except Exception as e:
+                logger.exception(f"Error executing hackerNews_items: {e}")
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Error: {str(e)}",
+                    )
+                ]
+
+        # Hacker News Comment Tree
+        elif name == "hackerNews_comment_tree":
+            try:
+                item_id = arguments.get("item_id")
+                if not item_id:
+                    return [
+                        types.TextContent(
+                            type="text",
+                            text="Missing required parameter: item_id",
+                        )
+                    ]
+
+                result = await hackerNews_comment_tree(
+                    item_id,
+                    max_depth=arguments.get("max_depth", 3),
+                    max_comments=arguments.get("max_comments", 200),
+                )
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=result if isinstance(result, str) else json.dumps(result, indent=2)
+                    )
+                ]
+            except Exception as e:
+                logger.exception(f"Error executing hackerNews_comment_tree: {e}")
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Error: {str(e)}",
+                    )
+                ]
+
         # Hacker News User
         elif name == "hackerNews_user":
             try:
@@ -457,13 +565,15 @@ def main(
 
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
-        """Context manager for session manager."""
+        """Context manager for session manager and shared HTTP client."""
+        await init_http_clients()
         async with session_manager.run():
             logger.info("Application started with dual transports!")
             try:
                 yield
             finally:
                 logger.info("Application shutting down...")
+                await close_http_clients()
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
@@ -1,5 +1,7 @@
 from .hackerNews_mcp_tools import (
     hackerNews_item,
+    hackerNews_items,
+    hackerNews_comment_tree,
     hackerNews_user,
     hackerNews_askstories,
     hackerNews_jobstories,
@@ -12,6 +14,8 @@ from .hackerNews_mcp_tools import (
 
 __all__ = [
     "hackerNews_item",
+    "hackerNews_items",
+    "hackerNews_comment_tree",
     "hackerNews_user",
 
     "hackerNews_askstories",
@@ -1,7 +1,10 @@
+import asyncio
 import json
 import httpx
 import logging
 from .helpers import (
+    fetch_item,
+    get_http_client,
     hackerNews_showstories_ids,
     hackerNews_beststories_ids,
     hackerNews_topstories_ids,
@@ -23,15 +26,10 @@ async def hackerNews_item(item_id: int) -> dict:
     Args:
         item_id (int): Required. The item's unique item_identifier (e.g., `8863`).
     """
-    url = f"{base_url}/item/{item_id}.json"
-    logger.info(f"Requesting item {item_id} from {url}")
     try:
-        # Use an async client to make a non-blocking request
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            response.raise_for_status()  # Raise an exception for 4xx/5xx responses
-            logger.info(f"Successfully fetched item {item_id}")
-            return response.json()  # This returns a dict
+        item = await fetch_item(item_id)
+        logger.info(f"Successfully fetched item {item_id}")
+        return item
     except httpx.RequestError as e:
         logger.error(f"Could not get item {item_id}: {e}")
         return {"error": f"An error occurred while requesting {e.request.url!r}."}
@@ -39,6 +37,58 @@ async def hackerNews_item(item_id: int) -> dict:
         logger.error(f"Unexpected error when fetching item {item_id}: {e}")
         return json.dumps({"error": str(e)})
 
+
+async def hackerNews_items(ids: list) -> list:
+    """Fetch several Hacker News items concurrently.
+
+    Args:
+        ids (list): Required. Item ids; the result keeps their order.
+    """
+    return list(await asyncio.gather(*(hackerNews_item(item_id) for item_id in ids)))
+
+
+async def hackerNews_comment_tree(item_id: int, max_depth: int = 3, max_comments: int = 200) -> dict:
+    """Fetch an item together with its comment tree.
+
+    Each level of `kids` is fetched concurrently. Comments are nested under
+    `replies`; `truncated` is true when max_depth or max_comments cut the tree short.
+
+    Args:
+        item_id (int): Required. The story or comment id.
+        max_depth (int): Levels of replies to fetch below the item.
+        max_comments (int): Maximum number of comments to fetch in total.
+    """
+    root = await hackerNews_item(item_id)
+    if not isinstance(root, dict) or "error" in root:
+        return root
+
+    # Copy nodes before attaching replies so cached items are never mutated
+    root = dict(root)
+    level = [root]
+    fetched = 0
+    truncated = False
+    for depth in range(max(max_depth, 0) + 1):
+        wanted = []
+        kid_ids = []
+        for node in level:
+            kids = node.get("kids") or []
+            take = kids[:max(max_comments - fetched - len(kid_ids), 0)] if depth < max_depth else []
+            truncated = truncated or len(take) < len(kids)
+            wanted.append((node, take))
+            kid_ids.extend(take)
+        if not kid_ids:
+            break
+        items = iter(await hackerNews_items(kid_ids))
+        fetched += len(kid_ids)
+        level = []
+        for node, take in wanted:
+            replies = [next(items) for _ in take]
+            node["replies"] = [dict(reply) for reply in replies if isinstance(reply, dict)]
+            level.extend(reply for reply in node["replies"] if "error" not in reply)
+
+    return {"item": root, "comment_count": fetched, "truncated": truncated}
+
+
 async def hackerNews_user(username: str) -> dict:
     """Fetch a Hacker News user by username.
 
@@ -48,12 +98,12 @@ async def hackerNews_user(username: str) -> dict:
     url = f"{base_url}/user/{username}.json"
     logger.info(f"Requesting user {username} from {url}")
     try:
-        # Use an async client to make a non-blocking request
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            response.raise_for_status()  # Raise an exception for 4xx/5xx responses
-            logger.info(f"Successfully fetched item {username}")
-            return response.json()  # This returns a dict
+        # Reuse the shared client so the connection stays pooled
+        client = get_http_client()
+        response = await client.get(url)
+        response.raise_for_status()  # Raise an exception for 4xx/5xx responses
+        logger.info(f"Successfully fetched item {username}")
+        return response.json()  # This returns a dict
     except httpx.RequestError as e:
         logger.error(f"Could not get username {username}: {e}")
         return {"error": f"An error occurred while requesting {e.request.url!r}."}
@@ -76,10 +126,7 @@ async def hackerNews_topstories(count:int=5) -> dict:
         ids = await hackerNews_topstories_ids()
         if 'error' in ids:
             return json.dumps(ids)
-        news = []
-        for item_id in ids[:count]:
-            item = await hackerNews_item(item_id)
-            news.append(item)
+        news = await hackerNews_items(ids[:count])
         return json.dumps(news)
     except Exception as e:
         logger.error(f"Error in hackerNews_topstories: {e}")
@@ -100,10 +147,7 @@ async def hackerNews_beststories(count:int=5) -> dict:
         ids = await hackerNews_beststories_ids()
         if 'error' in ids:
             return json.dumps(ids)
-        news = []
-        for item_id in ids[:count]:
-            item = await hackerNews_item(item_id)
-            news.append(item)
+        news = await hackerNews_items(ids[:count])
         return json.dumps(news)
     except Exception as e:
         logger.error(f"Error in hackerNews_beststories: {e}")
@@ -124,10 +168,7 @@ async def hackerNews_newstories(count:int=5) -> dict:
         ids = await hackerNews_newstories_ids()
         if 'error' in ids:
             return json.dumps(ids)
-        news = []
-        for item_id in ids[:count]:
-            item = await hackerNews_item(item_id)
-            news.append(item)
+        news = await hackerNews_items(ids[:count])
         return json.dumps(news)
     except Exception as e:
         logger.error(f"Error in hackerNews_newstories: {e}")
@@ -148,10 +189,7 @@ async def hackerNews_showstories(count:int=5) -> dict:
         ids = await hackerNews_showstories_ids()
         if 'error' in ids:
             return json.dumps(ids)
-        news = []
-        for item_id in ids[:count]:
-            item = await hackerNews_item(item_id)
-            news.append(item)
+        news = await hackerNews_items(ids[:count])
         return json.dumps(news)
     except Exception as e:
         logger.error(f"Error in hackerNews_showstories: {e}")
@@ -172,10 +210,7 @@ async def hackerNews_askstories(count:int=5) -> dict:
         ids = await hackerNews_askstories_ids()
         if 'error' in ids:
             return json.dumps(ids)
-        news = []
-        for item_id in ids[:count]:
-            item = await hackerNews_item(item_id)
-            news.append(item)
+        news = await hackerNews_items(ids[:count])
         return json.dumps(news)
     except Exception as e:
         logger.error(f"Error in hackerNews_askstories: {e}")
@@ -196,10 +231,7 @@ async def hackerNews_jobstories(count:int=5) -> dict:
         ids = await hackerNews_jobstories_ids()
         if 'error' in ids:
             return json.dumps(ids)
-        news = []
-        for item_id in ids[:count]:
-            item = await hackerNews_item(item_id)
-            news.append(item)
+        news = await hackerNews_items(ids[:count])
         return json.dumps(news)
     except Exception as e:
         logger.error(f"Error in hackerNews_jobstories: {e}")
@@ -220,11 +252,8 @@ async def hackerNews_updates(count:int=5) -> dict:
         ids = await hackerNews_updates_ids()
         if 'error' in ids:
             return json.dumps(ids)
-        news = []
         profiles = ids.get('profiles', [])[:count]
-        for item_id in ids.get('items', [])[:count]:
-            item = await hackerNews_item(item_id)
-            news.append(item)
+        news = await hackerNews_items(ids.get('items', [])[:count])
         return json.dumps({
             "items": news,
             "profiles": profiles
@@ -1,33 +1,165 @@
+import asyncio
+import http.cookiejar
+import importlib.util
 import httpx
+from collections import OrderedDict
+from typing import Any, Optional
 import logging
-import json
+import os
+import time
 
 # Configure logging
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 base_url = 'https://hacker-news.firebaseio.com/v0'
-async def hackerNews_item(item_id: int) -> dict:
-    """Fetch a Hacker News item by its numeric item_id.
 
-    Args:
-        item_id (int): Required. The item's unique item_identifier (e.g., `8863`).
+# Concurrency and caching for the Firebase API. Items are effectively immutable
+# once their thread is archived, so old items are cached much longer than the
+# constantly changing story id lists.
+HN_MAX_CONCURRENT_REQUESTS = int(os.getenv("HN_MAX_CONCURRENT_REQUESTS", "16"))
+HN_LIST_TTL_SECONDS = float(os.getenv("HN_LIST_TTL_SECONDS", "60"))
+HN_ITEM_TTL_SECONDS = float(os.getenv("HN_ITEM_TTL_SECONDS", "300"))
+HN_ARCHIVED_ITEM_TTL_SECONDS = float(os.getenv("HN_ARCHIVED_ITEM_TTL_SECONDS", "86400"))
+HN_ARCHIVED_ITEM_AGE_SECONDS = float(os.getenv("HN_ARCHIVED_ITEM_AGE_SECONDS", str(14 * 86400)))
+HN_ITEM_CACHE_SIZE = int(os.getenv("HN_ITEM_CACHE_SIZE", "10000"))
+
+
+class TTLCache:
+    """Small LRU cache whose entries expire after a per-entry TTL."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Any, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any, ttl: float) -> None:
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_item_cache = TTLCache(HN_ITEM_CACHE_SIZE)
+_list_cache = TTLCache(32)
+_request_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _get_request_semaphore() -> asyncio.Semaphore:
+    global _request_semaphore
+    if _request_semaphore is None:
+        _request_semaphore = asyncio.Semaphore(HN_MAX_CONCURRENT_REQUESTS)
+    return _request_semaphore
+
+
+def _item_ttl(item: dict) -> float:
+    """Cache archived items for long, recent ones (votes, new kids) briefly."""
+    created = item.get("time")
+    if isinstance(created, (int, float)) and time.time() - created > HN_ARCHIVED_ITEM_AGE_SECONDS:
+        return HN_ARCHIVED_ITEM_TTL_SECONDS
+    return HN_ITEM_TTL_SECONDS
+
+
+# Shared HTTP client, reused across tool calls so connections stay pooled
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            # Reject all cookies: the client is shared across tenants
+            cookies=http.cookiejar.CookieJar(
+                policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+            ),
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _http_client
+
+
+async def init_http_clients() -> None:
+    """Create the shared HTTP client (called from the server lifespan)."""
+    get_http_client()
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP client on server shutdown."""
+    global _http_client
+    if _http_client is not None:
+        try:
+            await _http_client.aclose()
+        finally:
+            _http_client = None
+
+
+async def fetch_item(item_id: int) -> Optional[dict]:
+    """Fetch a Hacker News item, serving it from the process-wide cache when fresh.
+
+    At most HN_MAX_CONCURRENT_REQUESTS item requests are in flight at once.
+    Returns None for items that do not exist; raises httpx errors on failure.
     """
+    cached = _item_cache.get(item_id)
+    if cached is not None:
+        return cached
+
     url = f"{base_url}/item/{item_id}.json"
-    logger.info(f"Requesting item {item_id} from {url}")
+    async with _get_request_semaphore():
+        logger.info(f"Requesting item {item_id} from {url}")
+        # Reuse the shared client so the connection stays pooled
+        client = get_http_client()
+        response = await client.get(url)
+        response.raise_for_status()  # Raise an exception for 4xx/5xx responses
+    item = response.json()
+    if item is not None:
+        _item_cache.set(item_id, item, _item_ttl(item))
+    return item
+
+
+async def _fetch_id_list(name: str):
+    """Fetch `<name>.json` (a story id list or updates), cached for HN_LIST_TTL_SECONDS."""
+    cached = _list_cache.get(name)
+    if cached is not None:
+        return cached
+
+    url = f"{base_url}/{name}.json"
+    logger.info(f"Requesting {name} from {url}")
     try:
-        # Use an async client to make a non-blocking request
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            response.raise_for_status()  # Raise an exception for 4xx/5xx responses
-            logger.info(f"Successfully fetched item {item_id}")
-            return response.json()  # This returns a dict
+        # Reuse the shared client so the connection stays pooled
+        client = get_http_client()
+        response = await client.get(url)
+        response.raise_for_status()  # Raise an exception for 4xx/5xx responses
+        logger.info(f"Successfully fetched {name}")
+        result = response.json()
     except httpx.RequestError as e:
-        logger.error(f"Could not get item {item_id}: {e}")
-        return {"error": f"An error occurred while requesting {e.request.url!r}."}
+        logger.error(f"Could not get {name}: {e}")
+        return {"error": str(e)}
     except Exception as e:
-        logger.error(f"Unexpected error when fetching item {item_id}: {e}")
-        return json.dumps({"error": str(e)})
+        logger.error(f"Unexpected error when fetching {name}: {e}")
+        return {"error": str(e)}
+    _list_cache.set(name, result, HN_LIST_TTL_SECONDS)
+    return result
+
 
 async def hackerNews_topstories_ids() -> list:
     """
@@ -37,21 +169,7 @@ async def hackerNews_topstories_ids() -> list:
         list: List of IDs on success,
               or {"error": "..."} on failure.
     """
-    url = f"{base_url}/topstories.json"
-    logger.info(f"Requesting topstories from {url}")
-    try:
-        # Use an async client to make a non-blocking request
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            response.raise_for_status()  # Raise an exception for 4xx/5xx responses
-            logger.info(f"Successfully fetched item")
-            return response.json()  # This returns a dict
-    except httpx.RequestError as e:
-        logger.error(f"Could not get topstories: {e}")
-        return {"error": str(e)}
-    except Exception as e:
-        logger.error(f"Unexpected error when fetching topstories: {e}")
-        return {"error": str(e)}
+    return await _fetch_id_list("topstories")
 
 
 async def hackerNews_newstories_ids() -> list:
@@ -62,21 +180,7 @@ async def hackerNews_newstories_ids() -> list:
         list: List of IDs on success,
               or {"error": "..."} on failure.
     """
-    url = f"{base_url}/newstories.json"
-    logger.info(f"Requesting newstories from {url}")
-    try:
-        # Use an async client to make a non-blocking request
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            response.raise_for_status()  # Raise an exception for 4xx/5xx responses
-            logger.info(f"Successfully fetched item")
-            return response.json()  # This returns a dict
-    except httpx.RequestError as e:
-        logger.error(f"Could not get newstories: {e}")
-        return {"error": str(e)}
-    except Exception as e:
-        logger.error(f"Unexpected error when fetching newstories: {e}")
-        return {"error": str(e)}
+    return await _fetch_id_list("newstories")
 
 
 async def hackerNews_askstories_ids() -> list:
@@ -87,21 +191,7 @@ async def hackerNews_askstories_ids() -> list:
         list: List of IDs on success,
               or {"error": "..."} on failure.
     """
-    url = f"{base_url}/askstories.json"
-    logger.info(f"Requesting askstories from {url}")
-    try:
-        # Use an async client to make a non-blocking request
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            response.raise_for_status()  # Raise an exception for 4xx/5xx responses
-            logger.info(f"Successfully fetched item")
-            return response.json()  # This returns a dict
-    except httpx.RequestError as e:
-        logger.error(f"Could not get askstories: {e}")
-        return {"error": str(e)}
-    except Exception as e:
-        logger.error(f"Unexpected error when fetching askstories: {e}")
-        return {"error": str(e)}
+    return await _fetch_id_list("askstories")
 
 
 async def hackerNews_showstories_ids() -> list:
@@ -112,21 +202,7 @@ async def hackerNews_showstories_ids() -> list:
         list: List of IDs on success,
               or {"error": "..."} on failure.
     """
-    url = f"{base_url}/showstories.json"
-    logger.info(f"Requesting showstories from {url}")
-    try:
-        # Use an async client to make a non-blocking request
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            response.raise_for_status()  # Raise an exception for 4xx/5xx responses
-            logger.info(f"Successfully fetched item")
-            return response.json()  # This returns a dict
-    except httpx.RequestError as e:
-        logger.error(f"Could not get showstories: {e}")
-        return {"error": str(e)}
-    except Exception as e:
-        logger.error(f"Unexpected error when fetching showstories: {e}")
-        return {"error": str(e)}
+    return await _fetch_id_list("showstories")
 
 
 async def hackerNews_jobstories_ids() -> list:
@@ -137,21 +213,7 @@ async def hackerNews_jobstories_ids() -> list:
         list: List of IDs on success,
               or {"error": "..."} on failure.
     """
-    url = f"{base_url}/jobstories.json"
-    logger.info(f"Requesting jobstories from {url}")
-    try:
-        # Use an async client to make a non-blocking request
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            response.raise_for_status()  # Raise an exception for 4xx/5xx responses
-            logger.info(f"Successfully fetched item")
-            return response.json()  # This returns a dict
-    except httpx.RequestError as e:
-        logger.error(f"Could not get jobstories: {e}")
-        return {"error": str(e)}
-    except Exception as e:
-        logger.error(f"Unexpected error when fetching jobstories: {e}")
-        return {"error": str(e)}
+    return await _fetch_id_list("jobstories")
 
 
 async def hackerNews_updates_ids() -> dict:
@@ -162,21 +224,7 @@ async def hackerNews_updates_ids() -> dict:
         dict: Update JSON on success,
               or {"error": "..."} on failure.
     """
-    url = f"{base_url}/updates.json"
-    logger.info(f"Requesting updates from {url}")
-    try:
-        # Use an async client to make a non-blocking request
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            response.raise_for_status()  # Raise an exception for 4xx/5xx responses
-            logger.info(f"Successfully fetched item")
-            return response.json()  # This returns a dict
-    except httpx.RequestError as e:
-        logger.error(f"Could not get updates: {e}")
-        return {"error": str(e)}
-    except Exception as e:
-        logger.error(f"Unexpected error when fetching updates: {e}")
-        return {"error": str(e)}
+    return await _fetch_id_list("updates")
 
 
 async def hackerNews_beststories_ids() -> list:
@@ -187,18 +235,4 @@ async def hackerNews_beststories_ids() -> list:
         list: List of IDs on success,
               or {"error": "..."} on failure.
     """
-    url = f"{base_url}/beststories.json"
-    logger.info(f"Requesting beststories from {url}")
-    try:
-        # Use an async client to make a non-blocking request
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            response.raise_for_status()  # Raise an exception for 4xx/5xx responses
-            logger.info(f"Successfully fetched item")
-            return response.json()  # This returns a dict
-    except httpx.RequestError as e:
-        logger.error(f"Could not get beststories: {e}")
-        return {"error": str(e)}
-    except Exception as e:
-        logger.error(f"Unexpected error when fetching beststories: {e}")
-        return {"error": str(e)}
+    return await _fetch_id_list("beststories")
@@ -3,6 +3,8 @@ Base HTTP client for HeyGen API with authentication and error handling.
 """
 
 import os
+import http.cookiejar
+import importlib.util
 import httpx
 from typing import Dict, Any, Optional
 from contextvars import ContextVar
@@ -11,6 +13,45 @@ auth_token_context: ContextVar[Optional[str]] = ContextVar('auth_token', default
 
 HEYGEN_API_ENDPOINT = "https://api.heygen.com"
 
+# Shared HTTP client, reused across tool calls so connections stay pooled
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            # Reject all cookies: the client is shared across tenants
+            cookies=http.cookiejar.CookieJar(
+                policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+            ),
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=60.0,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _http_client
+
+
+async def init_http_clients() -> None:
+    """Create the shared HTTP client (called from the server lifespan)."""
+    get_http_client()
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP client on server shutdown."""
+    global _http_client
+    if _http_client is not None:
+        try:
+            await _http_client.aclose()
+        finally:
+            _http_client = None
+
+
 def get_auth_token() -> str:
     """Get the HeyGen API token from context or environment variable."""
     try:
@@ -58,36 +99,36 @@ async def make_request(
     url = f"{HEYGEN_API_ENDPOINT}{endpoint}"
     headers = get_headers()
     
-    async with httpx.AsyncClient(timeout=60.0) as client:
+    client = get_http_client()
+    try:
+        if method.upper() == "GET":
+            response = await client.get(url, headers=headers, params=params)
+        elif method.upper() == "POST":
+            response = await client.post(url, headers=headers, json=data, params=params)
+        elif method.upper() == "DELETE":
+            response = await client.delete(url, headers=headers, params=params)
+        else:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
+        response.raise_for_status()
+        
+        # Some endpoints may return empty response (like delete)
+        if response.status_code == 204 or not response.content:
+            return {"success": True}
+            
+        return response.json()
+        
+    except httpx.HTTPStatusError as e:
+        error_detail = "Unknown error"
         try:
-            if method.upper() == "GET":
-                response = await client.get(url, headers=headers, params=params)
-            elif method.upper() == "POST":
-                response = await client.post(url, headers=headers, json=data, params=params)
-            elif method.upper() == "DELETE":
-                response = await client.delete(url, headers=headers, params=params)
+            error_response = e.response.json()
+            if isinstance(error_response, dict):
+                error_detail = error_response.get("message", error_response.get("error", str(error_response)))
             else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-            
-            response.raise_for_status()
-            
-            # Some endpoints may return empty response (like delete)
-            if response.status_code == 204 or not response.content:
-                return {"success": True}
-                
-            return response.json()
-            
-        except httpx.HTTPStatusError as e:
-            error_detail = "Unknown error"
-            try:
-                error_response = e.response.json()
-                if isinstance(error_response, dict):
-                    error_detail = error_response.get("message", error_response.get("error", str(error_response)))
-                else:
-                    error_detail = str(error_response)
-            except:
-                error_detail = e.response.text if hasattr(e.response, 'text') else str(e)
-            
-            raise RuntimeError(f"HeyGen API error ({e.response.status_code}): {error_detail}")
-        except Exception as e:
-            raise RuntimeError(f"HeyGen API request failed: {str(e)}")
\ No newline at end of file
+                error_detail = str(error_response)
+        except:
+            error_detail = e.response.text if hasattr(e.response, 'text') else str(e)
+        
+        raise RuntimeError(f"HeyGen API error ({e.response.status_code}): {error_detail}")
+    except Exception as e:
+        raise RuntimeError(f"HeyGen API request failed: {str(e)}")
\ No newline at end of file
@@ -55,6 +55,13 @@ from tools import (
     hubspot_create_task,
     hubspot_update_task_by_id,
     hubspot_delete_task_by_id,
+    # Batch
+    hubspot_batch_read_objects,
+    hubspot_batch_create_objects,
+    hubspot_batch_update_objects,
+    hubspot_batch_archive_objects,
+    hubspot_export_objects,
+    shutdown_executor,
 )
 
 # Configure logging
@@ -240,7 +247,7 @@ def main(
             ),
             types.Tool(
                 name="hubspot_search_by_property",
-                description="Search HubSpot objects by a specific property and value using a filter operator.",
+                description="Search HubSpot objects by a specific property and value using a filter operator. Property names are validated, and enumeration values (such as deal stages) may be given by their label.",
                 inputSchema={
                     "type": "object",
                     "properties": {
@@ -764,6 +771,142 @@ def main(
                     **{"category": "HUBSPOT_NOTE"}
                 )
             ),
+            types.Tool(
+                name="hubspot_batch_read_objects",
+                description="Read many HubSpot objects by ID in one call. IDs are sent 100 per request automatically.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "object_type": {
+                            "type": "string",
+                            "description": "CRM object type, e.g. 'contacts', 'companies', 'deals', 'tickets', 'tasks' or 'notes'."
+                        },
+                        "ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Object IDs, or values of id_property."
+                        },
+                        "properties": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Properties to return."
+                        },
+                        "id_property": {
+                            "type": "string",
+                            "description": "Unique property the IDs refer to, e.g. 'email' for contacts. Defaults to the object ID."
+                        }
+                    },
+                    "required": ["object_type", "ids"]
+                },
+                annotations=types.ToolAnnotations(
+                    **{"category": "HUBSPOT_BATCH", "readOnlyHint": True}
+                )
+            ),
+            types.Tool(
+                name="hubspot_batch_create_objects",
+                description="Create many HubSpot objects in one call. Inputs are sent 100 per request automatically.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "object_type": {
+                            "type": "string",
+                            "description": "CRM object type, e.g. 'contacts', 'companies', 'deals', 'tickets', 'tasks' or 'notes'."
+                        },
+                        "inputs": {
+                            "type": "array",
+                            "items": {"type": "object"},
+                            "description": "Property dictionaries of the objects to create, e.g. [{\"email\": \"a@example.com\"}]."
+                        }
+                    },
+                    "required": ["object_type", "inputs"]
+                },
+                annotations=types.ToolAnnotations(
+                    **{"category": "HUBSPOT_BATCH"}
+                )
+            ),
+            types.Tool(
+                name="hubspot_batch_update_objects",
+                description="Update many HubSpot objects in one call. Inputs are sent 100 per request automatically.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "object_type": {
+                            "type": "string",
+                            "description": "CRM object type, e.g. 'contacts', 'companies', 'deals', 'tickets', 'tasks' or 'notes'."
+                        },
+                        "inputs": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "id": {"type": "string"},
+                                    "properties": {"type": "object"}
+                                },
+                                "required": ["id", "properties"]
+                            },
+                            "description": "Objects to update, each with its id and the properties to change."
+                        }
+                    },
+                    "required": ["object_type", "inputs"]
+                },
+                annotations=types.ToolAnnotations(
+                    **{"category": "HUBSPOT_BATCH"}
+                )
+            ),
+            types.Tool(
+                name="hubspot_batch_archive_objects",
+                description="Archive (delete) many HubSpot objects by ID in one call. IDs are sent 100 per request automatically.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "object_type": {
+                            "type": "string",
+                            "description": "CRM object type, e.g. 'contacts', 'companies', 'deals', 'tickets', 'tasks' or 'notes'."
+                        },
+                        "ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "IDs of the objects to archive."
+                        }
+                    },
+                    "required": ["object_type", "ids"]
+                },
+                annotations=types.ToolAnnotations(
+                    **{"category": "HUBSPOT_BATCH"}
+                )
+            ),
+            types.Tool(
+                name="hubspot_export_objects",
+                description="Export all objects of a type, following pagination. If more objects remain after max_records, the result includes an 'after' cursor to continue from.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "object_type": {
+                            "type": "string",
+                            "description": "CRM object type, e.g. 'contacts', 'companies', 'deals', 'tickets', 'tasks' or 'notes'."
+                        },
+                        "properties": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Properties to return."
+                        },
+                        "max_records": {
+                            "type": "integer",
+                            "description": "Maximum number of objects to return. Defaults to 1000.",
+                            "default": 1000,
+                            "minimum": 1
+                        },
+                        "after": {
+                            "type": "string",
+                            "description": "Cursor from a previous export, to continue it."
+                        }
+                    },
+                    "required": ["object_type"]
+                },
+                annotations=types.ToolAnnotations(
+                    **{"category": "HUBSPOT_BATCH", "readOnlyHint": True}
+                )
+            ),
         ]
 
     @app.call_tool()
@@ -1483,6 +1626,107 @@ def main(
                     )
                 ]
         
+        # Batch
+        elif name == "hubspot_batch_read_objects":
+            try:
+                result = await hubspot_batch_read_objects(
+                    arguments["object_type"],
+                    arguments["ids"],
+                    arguments.get("properties"),
+                    arguments.get("id_property"),
+                )
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=json.dumps(result, indent=2),
+                    )
+                ]
+            except Exception as e:
+                logger.exception(f"Error executing tool {name}: {e}")
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Error: {str(e)}",
+                    )
+                ]
+        
+        elif name == "hubspot_batch_create_objects":
+            try:
+                result = await hubspot_batch_create_objects(arguments["object_type"], arguments["inputs"])
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=json.dumps(result, indent=2),
+                    )
+                ]
+            except Exception as e:
+                logger.exception(f"Error executing tool {name}: {e}")
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Error: {str(e)}",
+                    )
+                ]
+        
+        elif name == "hubspot_batch_update_objects":
+            try:
+                result = await hubspot_batch_update_objects(arguments["object_type"], arguments["inputs"])
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=json.dumps(result, indent=2),
+                    )
+                ]
+            except Exception as e:
+                logger.exception(f"Error executing tool {name}: {e}")
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Error: {str(e)}",
+                    )
+                ]
+        
+        elif name == "hubspot_batch_archive_objects":
+            try:
+                result = await hubspot_batch_archive_objects(arguments["object_type"], arguments["ids"])
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=json.dumps(result, indent=2),
+                    )
+                ]
+            except Exception as e:
+                logger.exception(f"Error executing tool {name}: {e}")
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Error: {str(e)}",
+                    )
+                ]
+        
+        elif name == "hubspot_export_objects":
+            try:
+                result = await hubspot_export_objects(
+                    arguments["object_type"],
+                    arguments.get("properties"),
+                    arguments.get("max_records", 1000),
+                    arguments.get("after"),
+                )
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=json.dumps(result, indent=2),
+                    )
+                ]
+            except Exception as e:
+                logger.exception(f"Error executing tool {name}: {e}")
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Error: {str(e)}",
+                    )
+                ]
+        
         else:
             return [
                 types.TextContent(
@@ -1539,13 +1783,14 @@ def main(
 
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
-        """Context manager for session manager."""
+        """Context manager for session manager and the HubSpot worker pool."""
         async with session_manager.run():
             logger.info("Application started with dual transports!")
             try:
                 yield
             finally:
                 logger.info("Application shutting down...")
+                shutdown_executor()
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
@@ -0,0 +1,30 @@
+"""
+Tests for the worker pool that runs blocking HubSpot SDK calls.
+
+Run from this directory: python -m pytest test_base.py
+"""
+
+import asyncio
+import threading
+
+from tools import base
+
+
+def test_calls_run_on_worker_pool():
+    thread_name = asyncio.run(base.run_hubspot_call(lambda: threading.current_thread().name))
+    assert thread_name.startswith("hubspot")
+    base.shutdown_executor()
+
+
+def test_shutdown_executor_recreates_pool():
+    asyncio.run(base.run_hubspot_call(int, "1"))
+    pool = base._executor
+
+    base.shutdown_executor()
+    assert base._executor is None
+    assert pool._shutdown
+
+    assert asyncio.run(base.run_hubspot_call(int, "2")) == 2
+    assert base._executor is not pool
+    base.shutdown_executor()
+    base.shutdown_executor()
@@ -1,5 +1,6 @@
 from .base import (
     auth_token_context,
+    shutdown_executor,
 )
 
 from .properties import (
@@ -52,9 +53,18 @@ from .tasks import (
     hubspot_delete_task_by_id,
 )
 
+from .batch import (
+    hubspot_batch_read_objects,
+    hubspot_batch_create_objects,
+    hubspot_batch_update_objects,
+    hubspot_batch_archive_objects,
+    hubspot_export_objects,
+)
+
 __all__ = [
     # Base
     "auth_token_context",
+    "shutdown_executor",
 
     # Properties
     "hubspot_list_properties",
@@ -98,4 +108,11 @@ __all__ = [
     "hubspot_create_task",
     "hubspot_update_task_by_id",
     "hubspot_delete_task_by_id",
+
+    # Batch
+    "hubspot_batch_read_objects",
+    "hubspot_batch_create_objects",
+    "hubspot_batch_update_objects",
+    "hubspot_batch_archive_objects",
+    "hubspot_export_objects",
 ]
@@ -1,8 +1,14 @@
+import asyncio
+import functools
+import hashlib
 import logging
 import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextvars import ContextVar
 from hubspot import HubSpot
-from typing import Optional
+from typing import Any, Callable, Optional
 from dotenv import load_dotenv
 
 # Configure logging
@@ -13,6 +19,66 @@ load_dotenv()
 # Context variable to store the access token for each request
 auth_token_context: ContextVar[str] = ContextVar('auth_token')
 
+# The HubSpot SDK is blocking; its calls run on this pool instead of the event loop
+HUBSPOT_MAX_WORKERS = int(os.getenv("HUBSPOT_MAX_WORKERS", "16"))
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+async def run_hubspot_call(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking HubSpot SDK call on the worker pool."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=HUBSPOT_MAX_WORKERS, thread_name_prefix="hubspot")
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(func, *args, **kwargs))
+
+
+def shutdown_executor() -> None:
+    """Stop the worker pool; a new one is created on the next call."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+class TTLCache:
+    """Small LRU cache whose entries expire after a per-entry TTL."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Any, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any, ttl: float) -> None:
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def token_cache_key(token: str) -> str:
+    """Hash a token so it is never kept in cache keys verbatim."""
+    return hashlib.sha256((token or "").encode("utf-8")).hexdigest()
+
 def get_auth_token() -> str:
     """Get the authentication token from context."""
     try:
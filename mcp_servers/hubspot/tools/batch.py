@@ -0,0 +1,261 @@
+import asyncio
+import logging
+import os
+from typing import Any, Awaitable, Callable, Optional
+
+from hubspot.crm.objects import (
+    BatchInputSimplePublicObjectBatchInput,
+    BatchInputSimplePublicObjectId,
+    BatchInputSimplePublicObjectBatchInputForCreate,
+    BatchReadInputSimplePublicObjectId,
+    SimplePublicObjectBatchInput,
+    SimplePublicObjectBatchInputForCreate,
+    SimplePublicObjectId,
+)
+
+from .base import get_hubspot_client, run_hubspot_call
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# CRM batch endpoints accept at most 100 inputs per request
+BATCH_MAX_SIZE = 100
+BATCH_MAX_CONCURRENT_REQUESTS = int(os.getenv("HUBSPOT_BATCH_MAX_CONCURRENT_REQUESTS", "3"))
+
+# The list endpoint returns at most 100 objects per page
+EXPORT_PAGE_SIZE = 100
+DEFAULT_EXPORT_MAX_RECORDS = 1000
+
+
+def _object_summary(obj) -> dict:
+    return {"id": obj.id, "properties": obj.properties, "archived": obj.archived}
+
+
+def _error_summary(error) -> dict:
+    return {
+        "status": getattr(error, "status", None),
+        "category": getattr(error, "category", None),
+        "message": getattr(error, "message", str(error)),
+        "context": getattr(error, "context", None),
+    }
+
+
+async def _run_in_chunks(
+    items: list,
+    send: Callable[[list], Awaitable[Any]],
+) -> tuple[list[dict], list[dict]]:
+    """
+    Send items in chunks of BATCH_MAX_SIZE, a few chunks at a time.
+
+    A failed chunk does not stop the others; its error is reported along with
+    the items it contained.
+    """
+    semaphore = asyncio.Semaphore(BATCH_MAX_CONCURRENT_REQUESTS)
+    chunks = [items[i:i + BATCH_MAX_SIZE] for i in range(0, len(items), BATCH_MAX_SIZE)]
+
+    async def send_limited(chunk: list):
+        async with semaphore:
+            return await send(chunk)
+
+    responses = await asyncio.gather(*(send_limited(chunk) for chunk in chunks), return_exceptions=True)
+
+    results: list[dict] = []
+    errors: list[dict] = []
+    for chunk, response in zip(chunks, responses):
+        if isinstance(response, Exception):
+            logger.error(f"Batch request failed: {response}")
+            errors.append({"message": str(response), "inputs": chunk})
+        elif response is not None:
+            results.extend(_object_summary(obj) for obj in response.results or [])
+            errors.extend(_error_summary(error) for error in getattr(response, "errors", None) or [])
+    return results, errors
+
+
+async def hubspot_batch_read_objects(
+    object_type: str,
+    ids: list[str],
+    properties: Optional[list[str]] = None,
+    id_property: Optional[str] = None,
+) -> dict:
+    """
+    Read many objects by ID with the CRM batch API.
+
+    Parameters:
+    - object_type: CRM object type, e.g. "contacts", "companies", "deals", "tickets"
+    - ids: Object IDs (or values of id_property)
+    - properties: Properties to return
+    - id_property: Unique property the IDs refer to, e.g. "email" for contacts
+
+    Returns:
+    - The objects found and any per-object errors
+    """
+    client = get_hubspot_client()
+    if not client:
+        raise ValueError("HubSpot client not available. Please check authentication.")
+
+    logger.info(f"Batch reading {len(ids)} {object_type}")
+
+    async def send(chunk: list[str]):
+        request = BatchReadInputSimplePublicObjectId(
+            inputs=[SimplePublicObjectId(id=object_id) for object_id in chunk],
+            properties=properties or [],
+            properties_with_history=[],
+            id_property=id_property,
+        )
+        return await run_hubspot_call(
+            client.crm.objects.batch_api.read,
+            object_type,
+            batch_read_input_simple_public_object_id=request,
+        )
+
+    results, errors = await _run_in_chunks(ids, send)
+    logger.info(f"Batch read {len(results)} of {len(ids)} {object_type}")
+    return {"object_type": object_type, "results": results, "errors": errors}
+
+
+async def hubspot_batch_create_objects(object_type: str, inputs: list[dict]) -> dict:
+    """
+    Create many objects with the CRM batch API.
+
+    Parameters:
+    - object_type: CRM object type, e.g. "contacts", "companies", "deals", "tickets"
+    - inputs: Property dictionaries of the objects to create
+
+    Returns:
+    - The created objects and any errors
+    """
+    client = get_hubspot_client()
+    if not client:
+        raise ValueError("HubSpot client not available. Please check authentication.")
+
+    logger.info(f"Batch creating {len(inputs)} {object_type}")
+
+    async def send(chunk: list[dict]):
+        request = BatchInputSimplePublicObjectBatchInputForCreate(
+            inputs=[SimplePublicObjectBatchInputForCreate(properties=properties) for properties in chunk]
+        )
+        return await run_hubspot_call(
+            client.crm.objects.batch_api.create,
+            object_type,
+            batch_input_simple_public_object_batch_input_for_create=request,
+        )
+
+    results, errors = await _run_in_chunks(inputs, send)
+    logger.info(f"Batch created {len(results)} of {len(inputs)} {object_type}")
+    return {"object_type": object_type, "results": results, "errors": errors}
+
+
+async def hubspot_batch_update_objects(object_type: str, inputs: list[dict]) -> dict:
+    """
+    Update many objects with the CRM batch API.
+
+    Parameters:
+    - object_type: CRM object type, e.g. "contacts", "companies", "deals", "tickets"
+    - inputs: Items of the form {"id": "...", "properties": {...}}
+
+    Returns:
+    - The updated objects and any errors
+    """
+    client = get_hubspot_client()
+    if not client:
+        raise ValueError("HubSpot client not available. Please check authentication.")
+
+    if any(not item.get("id") for item in inputs):
+        raise ValueError("Every input needs an 'id' and a 'properties' object")
+
+    logger.info(f"Batch updating {len(inputs)} {object_type}")
+
+    async def send(chunk: list[dict]):
+        request = BatchInputSimplePublicObjectBatchInput(
+            inputs=[
+                SimplePublicObjectBatchInput(id=str(item["id"]), properties=item.get("properties", {}))
+                for item in chunk
+            ]
+        )
+        return await run_hubspot_call(
+            client.crm.objects.batch_api.update,
+            object_type,
+            batch_input_simple_public_object_batch_input=request,
+        )
+
+    results, errors = await _run_in_chunks(inputs, send)
+    logger.info(f"Batch updated {len(results)} of {len(inputs)} {object_type}")
+    return {"object_type": object_type, "results": results, "errors": errors}
+
+
+async def hubspot_batch_archive_objects(object_type: str, ids: list[str]) -> dict:
+    """
+    Archive (delete) many objects with the CRM batch API.
+
+    Parameters:
+    - object_type: CRM object type, e.g. "contacts", "companies", "deals", "tickets"
+    - ids: IDs of the objects to archive
+
+    Returns:
+    - The number of objects archived and any errors
+    """
+    client = get_hubspot_client()
+    if not client:
+        raise ValueError("HubSpot client not available. Please check authentication.")
+
+    logger.info(f"Batch archiving {len(ids)} {object_type}")
+
+    async def send(chunk: list[str]):
+        request = BatchInputSimplePublicObjectId(
+            inputs=[SimplePublicObjectId(id=object_id) for object_id in chunk]
+        )
+        return await run_hubspot_call(
+            client.crm.objects.batch_api.archive,
+            object_type,
+            batch_input_simple_public_object_id=request,
+        )
+
+    _, errors = await _run_in_chunks(ids, send)
+    failed = sum(len(error.get("inputs", [])) for error in errors)
+    logger.info(f"Batch archived {len(ids) - failed} of {len(ids)} {object_type}")
+    return {"object_type": object_type, "archived": len(ids) - failed, "errors": errors}
+
+
+async def hubspot_export_objects(
+    object_type: str,
+    properties: Optional[list[str]] = None,
+    max_records: int = DEFAULT_EXPORT_MAX_RECORDS,
+    after: Optional[str] = None,
+) -> dict:
+    """
+    Export objects page by page, following the paging cursor.
+
+    Parameters:
+    - object_type: CRM object type, e.g. "contacts", "companies", "deals", "tickets"
+    - properties: Properties to return
+    - max_records: Stop after this many objects
+    - after: Cursor from a previous export, to continue it
+
+    Returns:
+    - The objects and, if more remain, the cursor to pass as after
+    """
+    client = get_hubspot_client()
+    if not client:
+        raise ValueError("HubSpot client not available. Please check authentication.")
+
+    logger.info(f"Exporting up to {max_records} {object_type}")
+    results: list[dict] = []
+    while len(results) < max_records:
+        page = await run_hubspot_call(
+            client.crm.objects.basic_api.get_page,
+            object_type,
+            limit=min(EXPORT_PAGE_SIZE, max_records - len(results)),
+            after=after,
+            properties=properties or None,
+        )
+        results.extend(_object_summary(obj) for obj in page.results or [])
+        next_page = page.paging.next if page.paging else None
+        after = next_page.after if next_page else None
+        if not after:
+            break
+
+    logger.info(f"Exported {len(results)} {object_type}")
+    response = {"object_type": object_type, "count": len(results), "results": results}
+    if after:
+        response["after"] = after
+    return response
@@ -1,7 +1,7 @@
 import logging
 import json
 from hubspot.crm.companies import SimplePublicObjectInputForCreate, SimplePublicObjectInput
-from .base import get_hubspot_client
+from .base import get_hubspot_client, run_hubspot_call
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -24,7 +24,7 @@ async def hubspot_create_companies(properties: str) -> str:
         logger.info("Creating company...")
         properties = json.loads(properties)
         data = SimplePublicObjectInputForCreate(properties=properties)
-        client.crm.companies.basic_api.create(simple_public_object_input_for_create=data)
+        await run_hubspot_call(client.crm.companies.basic_api.create, simple_public_object_input_for_create=data)
         logger.info("Company created successfully.")
         return "Created"
     except Exception as e:
@@ -47,7 +47,7 @@ async def hubspot_get_companies(limit: int = 10):
     
     try:
         logger.info(f"Fetching up to {limit} companies...")
-        result = client.crm.companies.basic_api.get_page(limit=limit)
+        result = await run_hubspot_call(client.crm.companies.basic_api.get_page, limit=limit)
         logger.info(f"Fetched {len(result.results)} companies successfully.")
         return result
     except Exception as e:
@@ -70,7 +70,7 @@ async def hubspot_get_company_by_id(company_id: str):
     
     try:
         logger.info(f"Fetching company with ID: {company_id}...")
-        result = client.crm.companies.basic_api.get_by_id(company_id)
+        result = await run_hubspot_call(client.crm.companies.basic_api.get_by_id, company_id)
         logger.info(f"Fetched company ID: {company_id} successfully.")
         return result
     except Exception as e:
@@ -96,7 +96,7 @@ async def hubspot_update_company_by_id(company_id: str, updates: str) -> str:
         logger.info(f"Updating company ID: {company_id}...")
         updates = json.loads(updates)
         update = SimplePublicObjectInput(properties=updates)
-        client.crm.companies.basic_api.update(company_id, update)
+        await run_hubspot_call(client.crm.companies.basic_api.update, company_id, update)
         logger.info(f"Company ID: {company_id} updated successfully.")
         return "Done"
     except Exception as e:
@@ -119,7 +119,7 @@ async def hubspot_delete_company_by_id(company_id: str) -> str:
     
     try:
         logger.info(f"Deleting company ID: {company_id}...")
-        client.crm.companies.basic_api.archive(company_id)
+        await run_hubspot_call(client.crm.companies.basic_api.archive, company_id)
         logger.info(f"Company ID: {company_id} deleted successfully.")
         return "Deleted"
     except Exception as e:
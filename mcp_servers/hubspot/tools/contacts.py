@@ -1,7 +1,7 @@
 import logging
 import json
 from hubspot.crm.contacts import SimplePublicObjectInputForCreate, SimplePublicObjectInput
-from .base import get_hubspot_client
+from .base import get_hubspot_client, run_hubspot_call
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -22,7 +22,7 @@ async def hubspot_get_contacts(limit: int = 10):
     
     try:
         logger.info(f"Fetching up to {limit} contacts from HubSpot")
-        result = client.crm.contacts.basic_api.get_page(limit=limit)
+        result = await run_hubspot_call(client.crm.contacts.basic_api.get_page, limit=limit)
         logger.info("Successfully fetched contacts")
         return result
     except Exception as e:
@@ -45,7 +45,7 @@ async def hubspot_get_contact_by_id(contact_id: str):
     
     try:
         logger.info(f"Fetching contact with ID: {contact_id}")
-        result = client.crm.contacts.basic_api.get_by_id(contact_id)
+        result = await run_hubspot_call(client.crm.contacts.basic_api.get_by_id, contact_id)
         logger.info("Successfully fetched contact")
         return result
     except Exception as e:
@@ -68,7 +68,7 @@ async def hubspot_delete_contact_by_id(contact_id: str) -> str:
     
     try:
         logger.info(f"Deleting contact with ID: {contact_id}")
-        client.crm.contacts.basic_api.archive(contact_id)
+        await run_hubspot_call(client.crm.contacts.basic_api.archive, contact_id)
         logger.info("Successfully deleted contact")
         return "Deleted"
     except Exception as e:
@@ -93,7 +93,7 @@ async def hubspot_create_contact(properties: str) -> str:
         properties = json.loads(properties)
         logger.info(f"Creating contact with properties: {properties}")
         data = SimplePublicObjectInputForCreate(properties=properties)
-        client.crm.contacts.basic_api.create(simple_public_object_input_for_create=data)
+        await run_hubspot_call(client.crm.contacts.basic_api.create, simple_public_object_input_for_create=data)
         logger.info("Successfully created contact")
         return "Created"
     except Exception as e:
@@ -119,7 +119,7 @@ async def hubspot_update_contact_by_id(contact_id: str, updates: str) -> str:
         updates = json.loads(updates)
         logger.info(f"Updating contact ID: {contact_id} with updates: {updates}")
         data = SimplePublicObjectInput(properties=updates)
-        client.crm.contacts.basic_api.update(contact_id, data)
+        await run_hubspot_call(client.crm.contacts.basic_api.update, contact_id, data)
         logger.info("Successfully updated contact")
         return "Done"
     except Exception as e:
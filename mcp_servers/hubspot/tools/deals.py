@@ -1,7 +1,7 @@
 import logging
 import json
 from hubspot.crm.deals import SimplePublicObjectInputForCreate, SimplePublicObjectInput
-from .base import get_hubspot_client
+from .base import get_hubspot_client, run_hubspot_call
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -44,9 +44,9 @@ async def hubspot_get_deals(limit: int = 10):
     
     try:
         logger.info(f"Fetching up to {limit} deals...")
-        result = client.crm.deals.basic_api.get_page(limit=limit)
+        result = await run_hubspot_call(client.crm.deals.basic_api.get_page, limit=limit)
         # Enrich with human-readable dealstage label
-        stage_label_map = _build_dealstage_label_map(client)
+        stage_label_map = await run_hubspot_call(_build_dealstage_label_map, client)
         for obj in getattr(result, "results", []) or []:
             props = getattr(obj, "properties", {}) or {}
             stage_id = props.get("dealstage")
@@ -75,9 +75,9 @@ async def hubspot_get_deal_by_id(deal_id: str):
     
     try:
         logger.info(f"Fetching deal ID: {deal_id}...")
-        result = client.crm.deals.basic_api.get_by_id(deal_id)
+        result = await run_hubspot_call(client.crm.deals.basic_api.get_by_id, deal_id)
         # Enrich with human-readable dealstage label
-        stage_label_map = _build_dealstage_label_map(client)
+        stage_label_map = await run_hubspot_call(_build_dealstage_label_map, client)
         props = getattr(result, "properties", {}) or {}
         stage_id = props.get("dealstage")
         if stage_id and stage_id in stage_label_map:
@@ -107,7 +107,7 @@ async def hubspot_create_deal(properties: str):
         logger.info("Creating a new deal...")
         props = json.loads(properties)
         data = SimplePublicObjectInputForCreate(properties=props)
-        result = client.crm.deals.basic_api.create(simple_public_object_input_for_create=data)
+        result = await run_hubspot_call(client.crm.deals.basic_api.create, simple_public_object_input_for_create=data)
         logger.info("Deal created successfully.")
         return result
     except Exception as e:
@@ -132,7 +132,7 @@ async def hubspot_update_deal_by_id(deal_id: str, updates: str):
     try:
         logger.info(f"Updating deal ID: {deal_id}...")
         data = SimplePublicObjectInput(properties=json.loads(updates))
-        client.crm.deals.basic_api.update(deal_id, data)
+        await run_hubspot_call(client.crm.deals.basic_api.update, deal_id, data)
         logger.info(f"Deal ID: {deal_id} updated successfully.")
         return "Done"
     except Exception as e:
@@ -155,7 +155,7 @@ async def hubspot_delete_deal_by_id(deal_id: str):
     
     try:
         logger.info(f"Deleting deal ID: {deal_id}...")
-        client.crm.deals.basic_api.archive(deal_id)
+        await run_hubspot_call(client.crm.deals.basic_api.archive, deal_id)
         logger.info(f"Deal ID: {deal_id} deleted successfully.")
         return "Deleted"
     except Exception as e:
@@ -3,7 +3,7 @@ import json
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from hubspot.crm.objects import SimplePublicObjectInputForCreate
-from .base import get_hubspot_client
+from .base import get_hubspot_client, run_hubspot_call
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -97,7 +97,8 @@ async def hubspot_create_note(
             associations=associations if associations else None
         )
         
-        result = client.crm.objects.notes.basic_api.create(
+        result = await run_hubspot_call(
+            client.crm.objects.notes.basic_api.create,
             simple_public_object_input_for_create=note_input
         )
         
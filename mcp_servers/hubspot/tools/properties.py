@@ -1,14 +1,87 @@
+import asyncio
+import difflib
 import logging
 import json
 import ast
+import os
+from typing import Any
 from hubspot.crm.objects import Filter, FilterGroup, PublicObjectSearchRequest
 from hubspot.crm.properties import PropertyCreate
-from .base import get_hubspot_client
+from .base import get_auth_token, get_hubspot_client, run_hubspot_call, token_cache_key, TTLCache
 from .deals import _build_dealstage_label_map
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Property definitions change rarely; they are cached per portal (access token) and object type
+PROPERTIES_CACHE_TTL_SECONDS = float(os.getenv("HUBSPOT_PROPERTIES_CACHE_TTL", "300"))
+
+_properties_cache = TTLCache(256)
+_properties_requests: dict[tuple, asyncio.Future] = {}
+
+BOOLEAN_VALUES = {"true": "true", "yes": "true", "1": "true", "false": "false", "no": "false", "0": "false"}
+
+
+async def _load_property_definitions(client, object_type: str) -> dict[str, Any]:
+    response = await run_hubspot_call(client.crm.properties.core_api.get_all, object_type)
+    return {p.name: p for p in response.results}
+
+
+async def get_property_definitions(client, object_type: str) -> dict[str, Any]:
+    """
+    Get an object type's property definitions by name, from cache when fresh.
+
+    Concurrent lookups for the same portal and object type share one request.
+    """
+    key = (token_cache_key(get_auth_token()), object_type)
+    definitions = _properties_cache.get(key)
+    if definitions is None:
+        lookup = _properties_requests.get(key)
+        if lookup is None:
+            lookup = asyncio.ensure_future(_load_property_definitions(client, object_type))
+            _properties_requests[key] = lookup
+            lookup.add_done_callback(lambda _: _properties_requests.pop(key, None))
+        definitions = await asyncio.shield(lookup)
+        _properties_cache.set(key, definitions, PROPERTIES_CACHE_TTL_SECONDS)
+    return definitions
+
+
+def _require_properties(definitions: dict[str, Any], names: list[str], object_type: str) -> None:
+    """Raise ValueError naming unknown properties, with close matches as suggestions."""
+    problems = []
+    for name in names:
+        if name not in definitions:
+            matches = difflib.get_close_matches(name, list(definitions), n=3)
+            hint = f" (did you mean {', '.join(matches)}?)" if matches else ""
+            problems.append(f"'{name}'{hint}")
+    if problems:
+        raise ValueError(f"Unknown {object_type} properties: {'; '.join(problems)}")
+
+
+def _shape_filter_value(definition, value: str) -> str:
+    """
+    Convert a filter value to the form HubSpot stores for the property.
+
+    Enumeration option labels are mapped to their internal values, booleans
+    are normalized, and number values are checked before the request is sent.
+    """
+    if definition.type == "enumeration":
+        options = definition.options or []
+        if any(option.value == value for option in options):
+            return value
+        for option in options:
+            if (option.label or "").strip().lower() == value.strip().lower():
+                return option.value
+        return value
+    if definition.type == "bool":
+        return BOOLEAN_VALUES.get(value.strip().lower(), value)
+    if definition.type == "number":
+        try:
+            float(value)
+        except ValueError:
+            raise ValueError(f"Property '{definition.name}' is a number, got '{value}'")
+    return value
+
 async def hubspot_list_properties(object_type: str) -> list[dict]:
     """
     List all properties for a given object type.
@@ -25,7 +98,7 @@ async def hubspot_list_properties(object_type: str) -> list[dict]:
     
     logger.info(f"Executing hubspot_list_properties for object_type: {object_type}")
     try:
-        props = client.crm.properties.core_api.get_all(object_type)
+        props = await get_property_definitions(client, object_type)
         logger.info(f"Successfully Executed hubspot_list_properties for object_type: {object_type}")
         return [
             {
@@ -34,7 +107,7 @@ async def hubspot_list_properties(object_type: str) -> list[dict]:
                 "type": p.type,
                 "field_type": p.field_type
             }
-            for p in props.results
+            for p in props.values()
         ]
     except Exception as e:
         logger.exception(f"Error executing hubspot_list_properties: {e}")
@@ -116,6 +189,9 @@ async def hubspot_search_by_property(
     Value type rules:
     - If the operator expects a list (e.g., IN, BETWEEN), pass value as a JSON-encoded string list: '["a", "b"]'
     - All other operators expect a single string (even for numbers or dates)
+
+    Property names are checked against the cached property definitions, and
+    enumeration values may be given by label (e.g. a deal stage's name).
     """
     client = get_hubspot_client()
     if not client:
@@ -124,6 +200,10 @@ async def hubspot_search_by_property(
     logger.info(f"Executing hubspot_search_by_property on {object_type}: {property_name} {operator} {value}")
 
     try:
+        definitions = await get_property_definitions(client, object_type)
+        _require_properties(definitions, [property_name, *properties], object_type)
+        definition = definitions[property_name]
+
         # Build Filter with correct fields depending on operator
         filter_kwargs = {"property_name": property_name, "operator": operator}
 
@@ -150,7 +230,7 @@ async def hubspot_search_by_property(
             if not values_list:
                 raise ValueError("Operator IN/NOT_IN requires a non-empty list of values")
 
-            filter_kwargs["values"] = values_list
+            filter_kwargs["values"] = [_shape_filter_value(definition, v) for v in values_list]
 
         # Between expects two endpoints: low and high
         elif operator == "BETWEEN":
@@ -171,12 +251,12 @@ async def hubspot_search_by_property(
             if low is None or high is None:
                 raise ValueError("Operator BETWEEN requires a list with two values [low, high]")
 
-            filter_kwargs["value"] = low
-            filter_kwargs["high_value"] = high
+            filter_kwargs["value"] = _shape_filter_value(definition, low)
+            filter_kwargs["high_value"] = _shape_filter_value(definition, high)
 
         # All other operators use single value
         else:
-            filter_kwargs["value"] = value
+            filter_kwargs["value"] = _shape_filter_value(definition, value)
 
         search_request = PublicObjectSearchRequest(
             filter_groups=[
@@ -189,20 +269,20 @@ async def hubspot_search_by_property(
         )
 
         if object_type == "contacts":
-            results =  client.crm.contacts.search_api.do_search(public_object_search_request=search_request)
+            results = await run_hubspot_call(client.crm.contacts.search_api.do_search, public_object_search_request=search_request)
         elif object_type == "companies":
-            results =  client.crm.companies.search_api.do_search(public_object_search_request=search_request)
+            results = await run_hubspot_call(client.crm.companies.search_api.do_search, public_object_search_request=search_request)
         elif object_type == "deals":
-            results =  client.crm.deals.search_api.do_search(public_object_search_request=search_request)
+            results = await run_hubspot_call(client.crm.deals.search_api.do_search, public_object_search_request=search_request)
         elif object_type == "tickets":
-            results =  client.crm.tickets.search_api.do_search(public_object_search_request=search_request)
+            results = await run_hubspot_call(client.crm.tickets.search_api.do_search, public_object_search_request=search_request)
         else:
             raise ValueError(f"Unsupported object type: {object_type}")
 
         logger.info(f"hubspot_search_by_property: Found {len(results.results)} result(s)")
         # Enrich deals with human-readable dealstage label
         if object_type == "deals":
-            stage_label_map = _build_dealstage_label_map(client)
+            stage_label_map = await run_hubspot_call(_build_dealstage_label_map, client)
             enriched: list[dict] = []
             for obj in results.results:
                 props = (getattr(obj, "properties", {}) or {}).copy()
@@ -250,10 +330,12 @@ async def hubspot_create_property(name: str, label: str, description: str, objec
             description=description
         )
 
-        client.crm.properties.core_api.create(
+        await run_hubspot_call(
+            client.crm.properties.core_api.create,
             object_type=object_type,
             property_create=property
         )
+        _properties_cache.pop((token_cache_key(get_auth_token()), object_type))
 
         logger.info("Successfully created property")
         return "Property Created"
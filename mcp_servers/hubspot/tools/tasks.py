@@ -7,7 +7,7 @@ from hubspot.crm.objects import (
     SimplePublicObjectInput,
 )
 
-from .base import get_hubspot_client
+from .base import get_hubspot_client, run_hubspot_call
 
 
 # Configure logging
@@ -38,7 +38,8 @@ async def hubspot_get_tasks(limit: int = 10):
             "hs_timestamp",
             "hubspot_owner_id",
         ]
-        result = client.crm.objects.tasks.basic_api.get_page(
+        result = await run_hubspot_call(
+            client.crm.objects.tasks.basic_api.get_page,
             limit=limit,
             properties=common_properties,
         )
@@ -73,7 +74,8 @@ async def hubspot_get_task_by_id(task_id: str):
             "hs_timestamp",
             "hubspot_owner_id",
         ]
-        result = client.crm.objects.tasks.basic_api.get_by_id(
+        result = await run_hubspot_call(
+            client.crm.objects.tasks.basic_api.get_by_id,
             task_id,
             properties=common_properties,
         )
@@ -103,7 +105,8 @@ async def hubspot_create_task(properties: str):
         logger.info("Creating new task...")
         props = json.loads(properties)
         data = SimplePublicObjectInputForCreate(properties=props)
-        result = client.crm.objects.tasks.basic_api.create(
+        result = await run_hubspot_call(
+            client.crm.objects.tasks.basic_api.create,
             simple_public_object_input_for_create=data
         )
         logger.info("Task created successfully.")
@@ -131,7 +134,7 @@ async def hubspot_update_task_by_id(task_id: str, updates: str):
     try:
         logger.info(f"Updating task ID: {task_id}...")
         data = SimplePublicObjectInput(properties=json.loads(updates))
-        client.crm.objects.tasks.basic_api.update(task_id, data)
+        await run_hubspot_call(client.crm.objects.tasks.basic_api.update, task_id, data)
         logger.info(f"Task ID: {task_id} updated successfully.")
         return "Done"
     except Exception as e:
@@ -155,7 +158,7 @@ async def hubspot_delete_task_by_id(task_id: str):
 
     try:
         logger.info(f"Deleting task ID: {task_id}...")
-        client.crm.objects.tasks.basic_api.archive(task_id)
+        await run_hubspot_call(client.crm.objects.tasks.basic_api.archive, task_id)
         logger.info(f"Task ID: {task_id} deleted successfully.")
         return "Deleted"
     except Exception as e:
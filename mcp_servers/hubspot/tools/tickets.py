@@ -1,7 +1,7 @@
 import logging
 import json
 from hubspot.crm.tickets import SimplePublicObjectInputForCreate, SimplePublicObjectInput
-from .base import get_hubspot_client
+from .base import get_hubspot_client, run_hubspot_call
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -22,7 +22,7 @@ async def hubspot_get_tickets(limit: int = 10):
     
     try:
         logger.info(f"Fetching up to {limit} tickets...")
-        result = client.crm.tickets.basic_api.get_page(limit=limit)
+        result = await run_hubspot_call(client.crm.tickets.basic_api.get_page, limit=limit)
         logger.info(f"Fetched {len(result.results)} tickets successfully.")
         return result
     except Exception as e:
@@ -45,7 +45,7 @@ async def hubspot_get_ticket_by_id(ticket_id: str):
     
     try:
         logger.info(f"Fetching ticket ID: {ticket_id}...")
-        result = client.crm.tickets.basic_api.get_by_id(ticket_id)
+        result = await run_hubspot_call(client.crm.tickets.basic_api.get_by_id, ticket_id)
         logger.info(f"Fetched ticket ID: {ticket_id} successfully.")
         return result
     except Exception as e:
@@ -70,7 +70,7 @@ async def hubspot_create_ticket(properties: str):
         logger.info("Creating new ticket...")
         props = json.loads(properties)
         data = SimplePublicObjectInputForCreate(properties=props)
-        result = client.crm.tickets.basic_api.create(simple_public_object_input_for_create=data)
+        result = await run_hubspot_call(client.crm.tickets.basic_api.create, simple_public_object_input_for_create=data)
         logger.info("Ticket created successfully.")
         return result
     except Exception as e:
@@ -95,7 +95,7 @@ async def hubspot_update_ticket_by_id(ticket_id: str, updates: str):
     try:
         logger.info(f"Updating ticket ID: {ticket_id}...")
         data = SimplePublicObjectInput(properties=json.loads(updates))
-        client.crm.tickets.basic_api.update(ticket_id, data)
+        await run_hubspot_call(client.crm.tickets.basic_api.update, ticket_id, data)
         logger.info(f"Ticket ID: {ticket_id} updated successfully.")
         return "Done"
     except Exception as e:
@@ -118,7 +118,7 @@ async def hubspot_delete_ticket_by_id(ticket_id: str):
     
     try:
         logger.info(f"Deleting ticket ID: {ticket_id}...")
-        client.crm.tickets.basic_api.archive(ticket_id)
+        await run_hubspot_call(client.crm.tickets.basic_api.archive, ticket_id)
         logger.info(f"Ticket ID: {ticket_id} deleted successfully.")
         return "Deleted"
     except Exception as e:
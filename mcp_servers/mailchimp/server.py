@@ -35,6 +35,7 @@ from tools import (
     schedule_campaign,
     delete_campaign,
 )
+from tools.base import init_http_clients, close_http_clients
 
 # Load env early
 load_dotenv()
@@ -635,8 +636,12 @@ async def run_server(log_level: str = "INFO"):
 
     # Run with stdio transport for Claude Desktop
     logger.info("Starting Mailchimp MCP server with stdio transport")
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(read_stream, write_stream, app.create_initialization_options())
+    await init_http_clients()
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(read_stream, write_stream, app.create_initialization_options())
+    finally:
+        await close_http_clients()
 
 
 @click.command()
@@ -26,11 +26,16 @@ from tools import (
     get_events,
     get_event_properties,
     get_event_property_values,
+    query_events,
+    get_event_count,
+    get_top_events,
+    get_todays_top_events,
     run_funnels_query,
     run_frequency_query,
     run_retention_query,
     run_segmentation_query,
 )
+from tools.base import init_http_clients, close_http_clients
 
 logger = logging.getLogger(__name__)
 
@@ -157,6 +162,135 @@ def main(
                 },
                 annotations=types.ToolAnnotations(**{"category": "MIXPANEL_EVENT", "readOnlyHint": True}),
             ),
+            types.Tool(
+                name="mixpanel_query_events",
+                description="Query raw events from the Mixpanel export API, a page at a time. Returns up to `limit` events starting at `offset`, plus `next_offset` when more may follow. Use `sample_rate` to page through a random fraction of the events, or `sample` for a uniform random sample of `limit` events over the whole range. For counts and rankings use mixpanel_get_event_count or mixpanel_get_top_events, which aggregate without returning raw events.",
+                inputSchema={
+                    "type": "object",
+                    "required": ["from_date", "to_date"],
+                    "properties": {
+                        "from_date": {
+                            "type": "string",
+                            "description": "Start date in YYYY-MM-DD format (inclusive)",
+                        },
+                        "to_date": {
+                            "type": "string",
+                            "description": "End date in YYYY-MM-DD format (inclusive)",
+                        },
+                        "event": {
+                            "type": "string",
+                            "description": "Only return events with this name",
+                        },
+                        "where": {
+                            "type": "string",
+                            "description": "Mixpanel expression to filter events, e.g. 'properties[\"$os\"] == \"iOS\"'",
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Maximum number of events to return (default 1000)",
+                            "default": 1000,
+                            "minimum": 1,
+                            "maximum": 10000,
+                        },
+                        "offset": {
+                            "type": "integer",
+                            "description": "Number of events to skip, e.g. the next_offset of the previous page (default 0)",
+                            "default": 0,
+                            "minimum": 0,
+                        },
+                        "sample_rate": {
+                            "type": "number",
+                            "description": "Keep each event with this probability (0 to 1) before paging. Use the same seed on every page for consistent pages",
+                            "exclusiveMinimum": 0,
+                            "maximum": 1,
+                        },
+                        "sample": {
+                            "type": "boolean",
+                            "description": "Return a uniform random sample of `limit` events from the whole range instead of a page (offset and sample_rate are ignored)",
+                            "default": False,
+                        },
+                        "seed": {
+                            "type": "integer",
+                            "description": "Random seed for sample and sample_rate, for reproducible results",
+                        },
+                    },
+                },
+                annotations=types.ToolAnnotations(**{"category": "MIXPANEL_EVENT", "readOnlyHint": True}),
+            ),
+            types.Tool(
+                name="mixpanel_get_event_count",
+                description="Count events over a date range, with a per-event breakdown and the number of unique users. Events are aggregated while the raw export streams in, so no raw events are returned.",
+                inputSchema={
+                    "type": "object",
+                    "required": ["from_date", "to_date"],
+                    "properties": {
+                        "from_date": {
+                            "type": "string",
+                            "description": "Start date in YYYY-MM-DD format (inclusive)",
+                        },
+                        "to_date": {
+                            "type": "string",
+                            "description": "End date in YYYY-MM-DD format (inclusive)",
+                        },
+                        "event": {
+                            "type": "string",
+                            "description": "Only count events with this name",
+                        },
+                        "approximate_unique_users": {
+                            "type": "boolean",
+                            "description": "Estimate unique users with HyperLogLog from the start instead of counting exactly up to 100,000 distinct IDs (default false)",
+                            "default": False,
+                        },
+                    },
+                },
+                annotations=types.ToolAnnotations(**{"category": "MIXPANEL_EVENT", "readOnlyHint": True}),
+            ),
+            types.Tool(
+                name="mixpanel_get_top_events",
+                description="Get the most common events over a date range, with their counts, share of all events and unique users. Events are aggregated while the raw export streams in.",
+                inputSchema={
+                    "type": "object",
+                    "required": ["from_date", "to_date"],
+                    "properties": {
+                        "from_date": {
+                            "type": "string",
+                            "description": "Start date in YYYY-MM-DD format (inclusive)",
+                        },
+                        "to_date": {
+                            "type": "string",
+                            "description": "End date in YYYY-MM-DD format (inclusive)",
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Number of top events to return (default 10)",
+                            "default": 10,
+                            "minimum": 1,
+                        },
+                        "approximate_unique_users": {
+                            "type": "boolean",
+                            "description": "Estimate unique users with HyperLogLog from the start instead of counting exactly up to 100,000 distinct IDs (default false)",
+                            "default": False,
+                        },
+                    },
+                },
+                annotations=types.ToolAnnotations(**{"category": "MIXPANEL_EVENT", "readOnlyHint": True}),
+            ),
+            types.Tool(
+                name="mixpanel_get_todays_top_events",
+                description="Get the most common events of today, with their counts, share of all events and unique users.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "limit": {
+                            "type": "integer",
+                            "description": "Number of top events to return (default 10)",
+                            "default": 10,
+                            "minimum": 1,
+                        },
+                    },
+                },
+                annotations=types.ToolAnnotations(**{"category": "MIXPANEL_EVENT", "readOnlyHint": True}),
+            ),
             types.Tool(
                 name="mixpanel_get_event_properties",
                 description=(
@@ -515,6 +649,115 @@ def main(
                 ]
         
 
+        elif name == "mixpanel_query_events":
+            if not arguments.get("from_date"):
+                return [types.TextContent(type="text", text="Error: from_date parameter is required")]
+            if not arguments.get("to_date"):
+                return [types.TextContent(type="text", text="Error: to_date parameter is required")]
+
+            try:
+                result = await query_events(
+                    from_date=arguments["from_date"],
+                    to_date=arguments["to_date"],
+                    event=arguments.get("event"),
+                    where=arguments.get("where"),
+                    limit=arguments.get("limit", 1000),
+                    offset=arguments.get("offset", 0),
+                    sample=arguments.get("sample", False),
+                    seed=arguments.get("seed"),
+                    sample_rate=arguments.get("sample_rate"),
+                )
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=json.dumps(result, indent=2),
+                    )
+                ]
+            except Exception as e:
+                logger.exception(f"Error executing tool {name}: {e}")
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Error: {str(e)}",
+                    )
+                ]
+
+        elif name == "mixpanel_get_event_count":
+            if not arguments.get("from_date"):
+                return [types.TextContent(type="text", text="Error: from_date parameter is required")]
+            if not arguments.get("to_date"):
+                return [types.TextContent(type="text", text="Error: to_date parameter is required")]
+
+            try:
+                result = await get_event_count(
+                    from_date=arguments["from_date"],
+                    to_date=arguments["to_date"],
+                    event=arguments.get("event"),
+                    approximate_unique_users=arguments.get("approximate_unique_users", False),
+                )
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=json.dumps(result, indent=2),
+                    )
+                ]
+            except Exception as e:
+                logger.exception(f"Error executing tool {name}: {e}")
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Error: {str(e)}",
+                    )
+                ]
+
+        elif name == "mixpanel_get_top_events":
+            if not arguments.get("from_date"):
+                return [types.TextContent(type="text", text="Error: from_date parameter is required")]
+            if not arguments.get("to_date"):
+                return [types.TextContent(type="text", text="Error: to_date parameter is required")]
+
+            try:
+                result = await get_top_events(
+                    from_date=arguments["from_date"],
+                    to_date=arguments["to_date"],
+                    limit=arguments.get("limit", 10),
+                    approximate_unique_users=arguments.get("approximate_unique_users", False),
+                )
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=json.dumps(result, indent=2),
+                    )
+                ]
+            except Exception as e:
+                logger.exception(f"Error executing tool {name}: {e}")
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Error: {str(e)}",
+                    )
+                ]
+
+        elif name == "mixpanel_get_todays_top_events":
+            try:
+                result = await get_todays_top_events(
+                    limit=arguments.get("limit", 10),
+                )
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=json.dumps(result, indent=2),
+                    )
+                ]
+            except Exception as e:
+                logger.exception(f"Error executing tool {name}: {e}")
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Error: {str(e)}",
+                    )
+                ]
+
         elif name == "mixpanel_get_event_properties":
             project_id = arguments.get("project_id")
             event = arguments.get("event")
@@ -843,13 +1086,15 @@ def main(
 
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
-        """Context manager for session manager."""
+        """Context manager for session manager and shared HTTP client."""
+        await init_http_clients()
         async with session_manager.run():
             logger.info("Application started with dual transports!")
             try:
                 yield
             finally:
                 logger.info("Application shutting down...")
+                await close_http_clients()
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
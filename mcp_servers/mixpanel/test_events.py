@@ -0,0 +1,105 @@
+"""
+Tests for the raw event tools, against a mocked Mixpanel export endpoint.
+
+Run from this directory: python -m pytest test_events.py
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+import tools
+from tools import base
+
+EVENTS = [
+    {"event": "Sign Up" if i % 4 == 0 else "Page View", "properties": {"distinct_id": f"user-{i % 5}", "n": i}}
+    for i in range(100)
+]
+
+
+@pytest.fixture
+def export_requests(monkeypatch):
+    """Serve EVENTS as newline-delimited JSON and record the export query params."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(dict(request.url.params))
+        events = EVENTS
+        if "event" in request.url.params:
+            names = json.loads(request.url.params["event"])
+            events = [e for e in events if e["event"] in names]
+        if "limit" in request.url.params:
+            events = events[:int(request.url.params["limit"])]
+        return httpx.Response(200, text="\n".join(json.dumps(e) for e in events) + "\n")
+
+    monkeypatch.setattr(base, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setenv("MIXPANEL_SERVICE_ACCOUNT_USERNAME", "user")
+    monkeypatch.setenv("MIXPANEL_SERVICE_ACCOUNT_SECRET", "secret")
+    return requests
+
+
+def test_tools_are_exported():
+    for name in ("query_events", "get_event_count", "get_top_events", "get_todays_top_events"):
+        assert name in tools.__all__
+
+
+def test_query_events_pages(export_requests):
+    first = asyncio.run(tools.query_events("2025-01-01", "2025-01-31", limit=30))
+    second = asyncio.run(tools.query_events("2025-01-01", "2025-01-31", limit=30, offset=first["next_offset"]))
+
+    assert [e["properties"]["n"] for e in first["events"]] == list(range(30))
+    assert [e["properties"]["n"] for e in second["events"]] == list(range(30, 60))
+    # Mixpanel is asked to stop after the requested page
+    assert export_requests[1]["limit"] == "60"
+
+
+def test_query_events_last_page(export_requests):
+    result = asyncio.run(tools.query_events("2025-01-01", "2025-01-31", limit=30, offset=90))
+    assert result["count"] == 10
+    assert result["next_offset"] is None
+
+
+def test_query_events_sample_rate(export_requests):
+    result = asyncio.run(tools.query_events("2025-01-01", "2025-01-31", limit=1000, sample_rate=0.25, seed=1))
+    again = asyncio.run(tools.query_events("2025-01-01", "2025-01-31", limit=1000, sample_rate=0.25, seed=1))
+
+    assert 0 < result["count"] < 60
+    assert result["scanned"] == 100
+    assert result["events"] == again["events"]
+    # The whole range is streamed to sample it
+    assert "limit" not in export_requests[0]
+
+
+def test_query_events_sample_rate_pages(export_requests):
+    whole = asyncio.run(tools.query_events("2025-01-01", "2025-01-31", limit=1000, sample_rate=0.5, seed=7))
+    page = asyncio.run(tools.query_events("2025-01-01", "2025-01-31", limit=5, offset=5, sample_rate=0.5, seed=7))
+    assert page["events"] == whole["events"][5:10]
+
+
+def test_query_events_invalid_sample_rate(export_requests):
+    result = asyncio.run(tools.query_events("2025-01-01", "2025-01-31", sample_rate=1.5))
+    assert result["success"] is False
+    assert export_requests == []
+
+
+def test_query_events_reservoir_sample(export_requests):
+    result = asyncio.run(tools.query_events("2025-01-01", "2025-01-31", limit=10, sample=True, seed=3))
+    assert result["count"] == 10
+    assert result["sampled_from"] == 100
+    assert len({e["properties"]["n"] for e in result["events"]}) == 10
+
+
+def test_get_event_count(export_requests):
+    result = asyncio.run(tools.get_event_count("2025-01-01", "2025-01-31"))
+    assert result["total_events"] == 100
+    assert result["event_breakdown"] == {"Sign Up": 25, "Page View": 75}
+    assert result["unique_users"] == 5
+
+
+def test_get_top_events(export_requests):
+    result = asyncio.run(tools.get_top_events("2025-01-01", "2025-01-31", limit=1))
+    assert result["top_events"] == [
+        {"event_name": "Page View", "count": 75, "percentage": 75.0, "unique_users": 5}
+    ]
@@ -0,0 +1,121 @@
+"""Bounded-memory aggregation over streamed Mixpanel export events."""
+
+import hashlib
+import math
+from typing import Any, Dict, Optional
+
+
+class HyperLogLog:
+    """HyperLogLog cardinality estimator.
+
+    Uses 2**precision one-byte registers; the standard error is about
+    1.04 / sqrt(2**precision) (0.8% for the default precision of 14, in 16KB).
+    """
+
+    def __init__(self, precision: int = 14):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.num_registers = 1 << precision
+        self.registers = bytearray(self.num_registers)
+
+    def add(self, value: str) -> None:
+        hashed = int.from_bytes(
+            hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        index = hashed >> (64 - self.precision)
+        remaining_bits = 64 - self.precision
+        remainder = hashed & ((1 << remaining_bits) - 1)
+        rank = remaining_bits - remainder.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def count(self) -> int:
+        m = self.num_registers
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small cardinalities
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+class UniqueCounter:
+    """Counts distinct values exactly up to a limit, then switches to HyperLogLog.
+
+    exact_limit=0 always estimates; exact_limit=None never does.
+    """
+
+    def __init__(self, exact_limit: Optional[int] = 100_000, precision: int = 14):
+        self.exact_limit = exact_limit
+        self.precision = precision
+        self._exact: Optional[set] = set()
+        self._sketch: Optional[HyperLogLog] = None
+        if exact_limit == 0:
+            self._switch_to_sketch()
+
+    def _switch_to_sketch(self) -> None:
+        self._sketch = HyperLogLog(self.precision)
+        for value in self._exact or ():
+            self._sketch.add(value)
+        self._exact = None
+
+    def add(self, value: Any) -> None:
+        value = str(value)
+        if self._exact is None:
+            self._sketch.add(value)
+            return
+        self._exact.add(value)
+        if self.exact_limit is not None and len(self._exact) > self.exact_limit:
+            self._switch_to_sketch()
+
+    @property
+    def is_estimate(self) -> bool:
+        return self._exact is None
+
+    def count(self) -> int:
+        if self._exact is not None:
+            return len(self._exact)
+        return self._sketch.count()
+
+
+class EventStreamStats:
+    """Running totals over a stream of raw export events.
+
+    Tracks the total event count, per-event counts and unique distinct_ids,
+    optionally also per event name.
+    """
+
+    def __init__(
+        self,
+        exact_unique_limit: Optional[int] = 100_000,
+        per_event_unique_users: bool = False,
+    ):
+        self.exact_unique_limit = exact_unique_limit
+        self.per_event_unique_users = per_event_unique_users
+        self.total_events = 0
+        self.event_counts: Dict[str, int] = {}
+        self.unique_users = UniqueCounter(exact_unique_limit)
+        self.event_unique_users: Dict[str, UniqueCounter] = {}
+
+    def add(self, event_data: Dict[str, Any]) -> None:
+        self.total_events += 1
+        event_name = event_data.get("event", "Unknown")
+        self.event_counts[event_name] = self.event_counts.get(event_name, 0) + 1
+
+        distinct_id = (event_data.get("properties") or {}).get("distinct_id")
+        if distinct_id is None:
+            return
+        self.unique_users.add(distinct_id)
+        if self.per_event_unique_users:
+            counter = self.event_unique_users.get(event_name)
+            if counter is None:
+                # Smaller sketches per event name keep memory bounded
+                limit = None if self.exact_unique_limit is None else min(self.exact_unique_limit, 10_000)
+                counter = self.event_unique_users[event_name] = UniqueCounter(limit, precision=12)
+            counter.add(distinct_id)
+
+    def event_unique_user_count(self, event_name: str) -> Optional[int]:
+        counter = self.event_unique_users.get(event_name)
+        return counter.count() if counter is not None else None
@@ -2,8 +2,10 @@ import logging
 import json
 import base64
 import os
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 from contextvars import ContextVar
+import http.cookiejar
+import importlib.util
 import httpx
 
 logger = logging.getLogger(__name__)
@@ -14,6 +16,48 @@ MIXPANEL_EXPORT_ENDPOINT = "https://data.mixpanel.com/api/2.0/export"  # Raw Dat
 MIXPANEL_QUERY_ENDPOINT = "https://mixpanel.com/api"  # Query API
 MIXPANEL_APP_ENDPOINT = "https://mixpanel.com/api/app"  # App Management APIs (projects, GDPR, etc.)
 
+# Raw exports can take minutes for long date ranges, so allow long gaps between chunks
+MIXPANEL_EXPORT_TIMEOUT = httpx.Timeout(30.0, read=300.0)
+
+# Shared HTTP client, reused across tool calls so connections stay pooled
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            # Reject all cookies: the client is shared across tenants
+            cookies=http.cookiejar.CookieJar(
+                policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+            ),
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _http_client
+
+
+async def init_http_clients() -> None:
+    """Create the shared HTTP client (called from the server lifespan)."""
+    get_http_client()
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP client on server shutdown."""
+    global _http_client
+    if _http_client is not None:
+        try:
+            await _http_client.aclose()
+        finally:
+            _http_client = None
+
+
 # Context variables to store the credentials for each request
 username_context: ContextVar[str] = ContextVar('serviceaccount_username')
 secret_context: ContextVar[str] = ContextVar('serviceaccount_secret')
@@ -94,13 +138,13 @@ class MixpanelIngestionClient:
         # Use Basic Auth with service account credentials
         auth = httpx.BasicAuth(username, secret)
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            if method.upper() == "POST":
-                response = await client.post(url, auth=auth, headers=headers, json=data, params=params)
-            elif method.upper() == "GET":
-                response = await client.get(url, auth=auth, headers=headers, params=params)
-            else:
-                raise ValueError(f"Unsupported HTTP method for ingestion: {method}")
+        client = get_http_client()
+        if method.upper() == "POST":
+            response = await client.post(url, auth=auth, headers=headers, json=data, params=params)
+        elif method.upper() == "GET":
+            response = await client.get(url, auth=auth, headers=headers, params=params)
+        else:
+            raise ValueError(f"Unsupported HTTP method for ingestion: {method}")
         
         response.raise_for_status()
         
@@ -126,61 +170,40 @@ class MixpanelExportClient:
     """
     
     @staticmethod
-    async def make_request(
-        method: str, 
-        endpoint: str = "", 
-        data: Optional[Dict[str, Any]] = None,
+    async def stream_events(
         params: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
-        """Make an HTTP request to Mixpanel Export API using Service Account authentication.
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream raw events from the Mixpanel Export API one at a time.
+        
+        The endpoint returns newline-delimited JSON. Lines are parsed as they arrive,
+        so memory stays bounded regardless of the date range. Wrap the iterator in
+        contextlib.aclosing() so that stopping early closes the connection.
         
         Args:
-            method: HTTP method
-            endpoint: API endpoint (usually empty as the full path is in MIXPANEL_EXPORT_ENDPOINT)
-            data: Request body data
-            params: Query parameters
+            params: Query parameters (from_date, to_date, event, where, limit, ...)
         """
-        # Get service account credentials
         username, secret = get_service_account_credentials()
-        
-        # Use Basic Auth with service account credentials
         auth = httpx.BasicAuth(username, secret)
         
-        headers = {
-            "Content-Type": "application/json"
-        }
-        
-        # MIXPANEL_EXPORT_ENDPOINT already includes the full path /api/2.0/export
-        url = MIXPANEL_EXPORT_ENDPOINT
-        
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            if method.upper() == "GET":
-                response = await client.get(url, auth=auth, headers=headers, params=params)
-            elif method.upper() == "POST":
-                response = await client.post(url, auth=auth, headers=headers, json=data)
-            else:
-                raise ValueError(f"Unsupported HTTP method for export: {method}")
-            
+        client = get_http_client()
+        async with client.stream(
+            "GET",
+            MIXPANEL_EXPORT_ENDPOINT,
+            auth=auth,
+            params=params,
+            timeout=MIXPANEL_EXPORT_TIMEOUT,
+        ) as response:
+            if response.is_error:
+                await response.aread()
             response.raise_for_status()
             
-            # Handle different response types
-            content_type = response.headers.get("content-type", "")
-            
-            if "application/json" in content_type:
-                return response.json()
-            elif response.text:
-                # The export endpoint returns newline-delimited JSON
-                lines = response.text.strip().split('\n')
-                events = []
-                for line in lines:
-                    if line:
-                        try:
-                            events.append(json.loads(line))
-                        except ValueError:
-                            continue
-                return {"events": events}
-            else:
-                return {"success": True}
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
 
 class MixpanelQueryClient:
     """Client for Mixpanel Query API using Service Account authentication.
@@ -215,28 +238,28 @@ class MixpanelQueryClient:
         
         url = f"{MIXPANEL_QUERY_ENDPOINT}{endpoint}"
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            if method.upper() == "GET":
-                response = await client.get(url, auth=auth, headers=headers, params=params)
-            elif method.upper() == "POST":
-                response = await client.post(url, auth=auth, headers=headers, json=data)
-            else:
-                raise ValueError(f"Unsupported HTTP method for query: {method}")
-            
-            response.raise_for_status()
-            
-            # Handle response
-            content_type = response.headers.get("content-type", "")
-            
-            if "application/json" in content_type:
+        client = get_http_client()
+        if method.upper() == "GET":
+            response = await client.get(url, auth=auth, headers=headers, params=params)
+        elif method.upper() == "POST":
+            response = await client.post(url, auth=auth, headers=headers, json=data)
+        else:
+            raise ValueError(f"Unsupported HTTP method for query: {method}")
+        
+        response.raise_for_status()
+        
+        # Handle response
+        content_type = response.headers.get("content-type", "")
+        
+        if "application/json" in content_type:
+            return response.json()
+        elif response.text:
+            try:
                 return response.json()
-            elif response.text:
-                try:
-                    return response.json()
-                except ValueError:
-                    return {"data": response.text}
-            else:
-                return {"success": True}
+            except ValueError:
+                return {"data": response.text}
+        else:
+            return {"success": True}
 
 class MixpanelAppAPIClient:
     """Client for Mixpanel App Management API using Service Account authentication.
@@ -271,25 +294,25 @@ class MixpanelAppAPIClient:
         
         url = f"{MIXPANEL_APP_ENDPOINT}{endpoint}"
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            if method.upper() == "GET":
-                response = await client.get(url, auth=auth, headers=headers, params=params)
-            elif method.upper() == "POST":
-                response = await client.post(url, auth=auth, headers=headers, json=data)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-            
-            response.raise_for_status()
-            
-            # Handle response
-            content_type = response.headers.get("content-type", "")
-            
-            if "application/json" in content_type:
+        client = get_http_client()
+        if method.upper() == "GET":
+            response = await client.get(url, auth=auth, headers=headers, params=params)
+        elif method.upper() == "POST":
+            response = await client.post(url, auth=auth, headers=headers, json=data)
+        else:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
+        response.raise_for_status()
+        
+        # Handle response
+        content_type = response.headers.get("content-type", "")
+        
+        if "application/json" in content_type:
+            return response.json()
+        elif response.text:
+            try:
                 return response.json()
-            elif response.text:
-                try:
-                    return response.json()
-                except ValueError:
-                    return {"data": response.text}
-            else:
-                return {"success": True}
\ No newline at end of file
+            except ValueError:
+                return {"data": response.text}
+        else:
+            return {"success": True}
\ No newline at end of file
@@ -1,5 +1,7 @@
 import logging
 import json
+import random
+from contextlib import aclosing
 from typing import Any, Dict, Optional, List
 import time
 import uuid
@@ -9,9 +11,13 @@ from .base import (
     MixpanelExportClient,
     MixpanelQueryClient
 )
+from .aggregation import EventStreamStats
 
 logger = logging.getLogger(__name__)
 
+# Distinct IDs counted exactly before switching to a HyperLogLog estimate
+EXACT_UNIQUE_LIMIT = 100_000
+
 async def send_events(
     project_id: str,
     events: List[Dict[str, Any]]
@@ -91,15 +97,46 @@ async def send_events(
             "project_id": project_id
         }
 
+async def _aggregate_export(
+    params: Dict[str, Any],
+    exact_unique_limit: Optional[int],
+    per_event_unique_users: bool = False,
+) -> EventStreamStats:
+    """Stream the raw export for params and aggregate it on the fly."""
+    stats = EventStreamStats(
+        exact_unique_limit=exact_unique_limit,
+        per_event_unique_users=per_event_unique_users,
+    )
+    async with aclosing(MixpanelExportClient.stream_events(params)) as events:
+        async for event_data in events:
+            stats.add(event_data)
+    return stats
+
 async def query_events(
     from_date: str,
     to_date: str,
     event: Optional[str] = None,
     where: Optional[str] = None,
-    limit: Optional[int] = 1000
+    limit: Optional[int] = 1000,
+    offset: int = 0,
+    sample: bool = False,
+    seed: Optional[int] = None,
+    sample_rate: Optional[float] = None
 ) -> Dict[str, Any]:
-    """Query raw event data from Mixpanel."""
+    """Query raw event data from Mixpanel.
+    
+    By default returns the page of `limit` events starting at `offset`; the export
+    stream is closed as soon as the page is filled. With sample_rate, each event is
+    kept with that probability and `limit`/`offset` page through the sampled events.
+    With sample=True the whole range is streamed and a uniform random sample of
+    `limit` events is returned (reservoir sampling), so memory stays bounded either way.
+    """
     try:
+        if sample_rate is not None and not 0 < sample_rate <= 1:
+            raise ValueError("sample_rate must be greater than 0 and at most 1")
+        if sample_rate == 1:
+            sample_rate = None
+        
         params = {
             "from_date": from_date,
             "to_date": to_date
@@ -111,25 +148,54 @@ async def query_events(
         if where:
             params["where"] = where
             
-        if limit:
-            params["limit"] = str(limit)
+        if limit and not sample and sample_rate is None:
+            # Let Mixpanel stop sending once the requested page is covered
+            params["limit"] = str(offset + limit)
         
-        # The export endpoint is already included in MIXPANEL_EXPORT_ENDPOINT
-        result = await MixpanelExportClient.make_request("GET", "", params=params)
+        events: List[Dict[str, Any]] = []
+        scanned = 0
+        kept = 0
+        rng = random.Random(seed)
         
-        if isinstance(result, dict) and "events" in result:
-            return {
-                "success": True,
-                "events": result["events"],
-                "count": len(result["events"]),
-                "message": f"Retrieved {len(result['events'])} events from {from_date} to {to_date}"
-            }
+        async with aclosing(MixpanelExportClient.stream_events(params)) as stream:
+            async for event_data in stream:
+                scanned += 1
+                if sample:
+                    if not limit or len(events) < limit:
+                        events.append(event_data)
+                    else:
+                        slot = rng.randrange(scanned)
+                        if slot < limit:
+                            events[slot] = event_data
+                    continue
+                if sample_rate is not None and rng.random() >= sample_rate:
+                    continue
+                kept += 1
+                if kept <= offset:
+                    continue
+                events.append(event_data)
+                if limit and len(events) >= limit:
+                    break
+        
+        result = {
+            "success": True,
+            "events": events,
+            "count": len(events),
+            "message": f"Retrieved {len(events)} events from {from_date} to {to_date}"
+        }
+        if sample:
+            result["sampled_from"] = scanned
+            result["message"] = (
+                f"Sampled {len(events)} of {scanned} events from {from_date} to {to_date}"
+            )
         else:
-            return {
-                "success": False,
-                "events": [],
-                "error": f"Unexpected response format: {result}"
-            }
+            if sample_rate is not None:
+                result["sample_rate"] = sample_rate
+                result["scanned"] = scanned
+            result["offset"] = offset
+            # A full page means there may be more events after it
+            result["next_offset"] = offset + len(events) if limit and len(events) >= limit else None
+        return result
             
     except Exception as e:
         return {
@@ -141,9 +207,15 @@ async def query_events(
 async def get_event_count(
     from_date: str,
     to_date: str,
-    event: Optional[str] = None
+    event: Optional[str] = None,
+    approximate_unique_users: bool = False
 ) -> Dict[str, Any]:
-    """Get total event count for a date range from Mixpanel."""
+    """Get total event count for a date range from Mixpanel.
+    
+    Events are counted while the export streams in. Unique users are counted exactly
+    up to 100,000 distinct IDs and estimated with HyperLogLog beyond that, or from the
+    start when approximate_unique_users is set.
+    """
     try:
         params = {
             "from_date": from_date,
@@ -154,44 +226,23 @@ async def get_event_count(
         if event:
             params["event"] = f'["{event}"]'
         
-        # Query events and count them
-        # The export endpoint is already included in MIXPANEL_EXPORT_ENDPOINT
-        result = await MixpanelExportClient.make_request("GET", "", params=params)
+        stats = await _aggregate_export(
+            params, exact_unique_limit=0 if approximate_unique_users else EXACT_UNIQUE_LIMIT
+        )
         
-        if isinstance(result, dict) and "events" in result:
-            event_count = len(result["events"])
-            
-            # Calculate additional stats
-            unique_users = set()
-            event_types = {}
-            
-            for event_data in result["events"]:
-                # Count unique users
-                if "properties" in event_data and "distinct_id" in event_data["properties"]:
-                    unique_users.add(event_data["properties"]["distinct_id"])
-                
-                # Count event types
-                event_name = event_data.get("event", "Unknown")
-                event_types[event_name] = event_types.get(event_name, 0) + 1
-            
-            return {
-                "success": True,
-                "total_events": event_count,
-                "unique_users": len(unique_users),
-                "date_range": {
-                    "from": from_date,
-                    "to": to_date
-                },
-                "event_breakdown": event_types,
-                "filtered_event": event if event else "All events",
-                "message": f"Found {event_count} events from {from_date} to {to_date}"
-            }
-        else:
-            return {
-                "success": False,
-                "total_events": 0,
-                "error": f"Unexpected response format: {result}"
-            }
+        return {
+            "success": True,
+            "total_events": stats.total_events,
+            "unique_users": stats.unique_users.count(),
+            "unique_users_estimated": stats.unique_users.is_estimate,
+            "date_range": {
+                "from": from_date,
+                "to": to_date
+            },
+            "event_breakdown": stats.event_counts,
+            "filtered_event": event if event else "All events",
+            "message": f"Found {stats.total_events} events from {from_date} to {to_date}"
+        }
             
     except Exception as e:
         return {
@@ -203,7 +254,8 @@ async def get_event_count(
 async def get_top_events(
     from_date: str,
     to_date: str,
-    limit: Optional[int] = 10
+    limit: Optional[int] = 10,
+    approximate_unique_users: bool = False
 ) -> Dict[str, Any]:
     """Get the most common events over a time period from Mixpanel."""
     try:
@@ -212,60 +264,42 @@ async def get_top_events(
             "to_date": to_date
         }
         
-        # Query all events for the time period
-        # The export endpoint is already included in MIXPANEL_EXPORT_ENDPOINT
-        result = await MixpanelExportClient.make_request("GET", "", params=params)
+        stats = await _aggregate_export(
+            params,
+            exact_unique_limit=0 if approximate_unique_users else EXACT_UNIQUE_LIMIT,
+            per_event_unique_users=True,
+        )
+        total_events = stats.total_events
         
-        if isinstance(result, dict) and "events" in result:
-            events = result["events"]
-            
-            # Count events by type
-            event_counts = {}
-            total_events = len(events)
-            unique_users = set()
-            
-            for event_data in events:
-                # Count events by name
-                event_name = event_data.get("event", "Unknown")
-                event_counts[event_name] = event_counts.get(event_name, 0) + 1
-                
-                # Track unique users
-                if "properties" in event_data and "distinct_id" in event_data["properties"]:
-                    unique_users.add(event_data["properties"]["distinct_id"])
-            
-            # Sort events by count (descending) and get top N
-            sorted_events = sorted(event_counts.items(), key=lambda x: x[1], reverse=True)
-            top_events = sorted_events[:limit] if limit else sorted_events
-            
-            # Calculate percentages
-            top_events_with_stats = []
-            for event_name, count in top_events:
-                percentage = (count / total_events * 100) if total_events > 0 else 0
-                top_events_with_stats.append({
-                    "event_name": event_name,
-                    "count": count,
-                    "percentage": round(percentage, 2)
-                })
-            
-            return {
-                "success": True,
-                "top_events": top_events_with_stats,
-                "total_events_analyzed": total_events,
-                "unique_users": len(unique_users),
-                "date_range": {
-                    "from": from_date,
-                    "to": to_date
-                },
-                "limit_requested": limit,
-                "events_returned": len(top_events_with_stats),
-                "message": f"Found top {len(top_events_with_stats)} events from {from_date} to {to_date}"
-            }
-        else:
-            return {
-                "success": False,
-                "top_events": [],
-                "error": f"Unexpected response format: {result}"
-            }
+        # Sort events by count (descending) and get top N
+        sorted_events = sorted(stats.event_counts.items(), key=lambda x: x[1], reverse=True)
+        top_events = sorted_events[:limit] if limit else sorted_events
+        
+        # Calculate percentages
+        top_events_with_stats = []
+        for event_name, count in top_events:
+            percentage = (count / total_events * 100) if total_events > 0 else 0
+            top_events_with_stats.append({
+                "event_name": event_name,
+                "count": count,
+                "percentage": round(percentage, 2),
+                "unique_users": stats.event_unique_user_count(event_name) or 0
+            })
+        
+        return {
+            "success": True,
+            "top_events": top_events_with_stats,
+            "total_events_analyzed": total_events,
+            "unique_users": stats.unique_users.count(),
+            "unique_users_estimated": stats.unique_users.is_estimate,
+            "date_range": {
+                "from": from_date,
+                "to": to_date
+            },
+            "limit_requested": limit,
+            "events_returned": len(top_events_with_stats),
+            "message": f"Found top {len(top_events_with_stats)} events from {from_date} to {to_date}"
+        }
             
     except Exception as e:
         return {
@@ -1,7 +1,6 @@
 import logging
 from typing import Any, Dict
-from .base import get_auth_token, MONEYBIRD_API_ENDPOINT
-import httpx
+from .base import get_auth_token, MONEYBIRD_API_ENDPOINT, get_http_client
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -25,19 +24,19 @@ async def moneybird_list_administrations() -> Dict[str, Any]:
     url = f"{MONEYBIRD_API_ENDPOINT}/administrations"
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-            
-            try:
-                json_response = response.json()
-                if json_response is None:
-                    return {"data": None, "message": "API returned null response"}
-                return json_response
-            except ValueError as e:
-                logger.error(f"Failed to parse JSON response: {e}")
-                logger.error(f"Response content: {response.content}")
-                return {"error": "Invalid JSON response", "content": response.text}
+        client = get_http_client()
+        response = await client.get(url, headers=headers)
+        response.raise_for_status()
+        
+        try:
+            json_response = response.json()
+            if json_response is None:
+                return {"data": None, "message": "API returned null response"}
+            return json_response
+        except ValueError as e:
+            logger.error(f"Failed to parse JSON response: {e}")
+            logger.error(f"Response content: {response.content}")
+            return {"error": "Invalid JSON response", "content": response.text}
                 
     except Exception as e:
         logger.exception(f"Error executing tool moneybird_list_administrations: {e}")
@@ -19,6 +19,8 @@ from starlette.types import Receive, Scope, Send
 
 from tools import (
     auth_token_context,
+    init_http_clients,
+    close_http_clients,
     create_page,
     get_page,
     update_page_properties,
@@ -39,6 +41,7 @@ from tools import (
     delete_block,
     get_block_children,
     append_block_children,
+    export_page_markdown,
 )
 
 load_dotenv()
@@ -670,7 +673,7 @@ def main(
                         "children": {
                             "type": "array",
                             "items": {"type": "object"},
-                            "description": "Array of block objects to append",
+                            "description": "Array of block objects to append (more than 100 are appended in chunks)",
                         },
                         "after": {
                             "type": "string",
@@ -683,6 +686,38 @@ def main(
                     **{"category": "NOTION_BLOCK"}
                 ),
             ),
+            types.Tool(
+                name="notion_export_page_markdown",
+                description="Export a page with all of its nested blocks as markdown in one call. Nested blocks are fetched concurrently; child pages and databases are linked, not inlined.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "page_id": {
+                            "type": "string",
+                            "description": "ID of the page (or block) to export",
+                        },
+                        "max_depth": {
+                            "type": "integer",
+                            "description": "Maximum nesting depth of blocks to load (default 10)",
+                            "default": 10,
+                        },
+                        "max_blocks": {
+                            "type": "integer",
+                            "description": "Maximum number of blocks to load (default 2000)",
+                            "default": 2000,
+                        },
+                        "max_chars": {
+                            "type": "integer",
+                            "description": "Maximum length of the returned markdown (default 200000)",
+                            "default": 200000,
+                        },
+                    },
+                    "required": ["page_id"],
+                },
+                annotations=types.ToolAnnotations(
+                    **{"category": "NOTION_PAGE", "readOnlyHint": True}
+                ),
+            ),
         ]
 
     @app.call_tool()
@@ -1116,6 +1151,28 @@ def main(
                         text=f"Error: {str(e)}",
                     )
                 ]
+        elif name == "notion_export_page_markdown":
+            try:
+                result = await export_page_markdown(
+                    page_id=arguments.get("page_id"),
+                    max_depth=arguments.get("max_depth", 10),
+                    max_blocks=arguments.get("max_blocks", 2000),
+                    max_chars=arguments.get("max_chars", 200000),
+                )
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=json.dumps(result, indent=2),
+                    )
+                ]
+            except Exception as e:
+                logger.exception(f"Error executing tool {name}: {e}")
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Error: {str(e)}",
+                    )
+                ]
 
         return [
             types.TextContent(
@@ -1173,11 +1230,13 @@ def main(
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
         """Context manager for session manager."""
+        await init_http_clients()
         async with session_manager.run():
             logger.info("Application started with dual transports!")
             try:
                 yield
             finally:
+                await close_http_clients()
                 logger.info("Application shutting down...")
 
     # Create an ASGI application with routes for both transports
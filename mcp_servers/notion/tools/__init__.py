@@ -1,13 +1,16 @@
-from .base import auth_token_context
+from .base import auth_token_context, init_http_clients, close_http_clients
 from .pages import create_page, get_page, update_page_properties, retrieve_page_property
 from .databases import query_database, get_database, create_database, update_database, create_database_item
 from .search import search_notion
 from .users import get_user, list_users, get_me
 from .comments import create_comment, get_comments
 from .blocks import retrieve_block, update_block, delete_block, get_block_children, append_block_children
+from .export import export_page_markdown
 
 __all__ = [
     'auth_token_context',
+    'init_http_clients',
+    'close_http_clients',
     'create_page',
     'get_page', 
     'update_page_properties',
@@ -27,5 +30,6 @@ __all__ = [
     'update_block',
     'delete_block',
     'get_block_children',
-    'append_block_children'
+    'append_block_children',
+    'export_page_markdown'
 ] 
\ No newline at end of file
@@ -1,28 +1,69 @@
 import os
 from typing import Optional
 from contextvars import ContextVar
-from notion_client import Client
+import importlib.util
+import httpx
+from notion_client import AsyncClient
 
 # Context variable to store auth token for the current request
 auth_token_context: ContextVar[str] = ContextVar('auth_token', default="")
 
+# Shared connection pool. notion_client writes the auth header onto the httpx
+# client it is given, so each Notion client gets its own thin httpx client on
+# top of this transport instead of sharing one httpx client.
+_http_transport: Optional[httpx.AsyncHTTPTransport] = None
 
-def get_notion_client() -> Client:
-    """Get Notion client with authentication token from context or environment."""
+
+def get_http_transport() -> httpx.AsyncHTTPTransport:
+    """Return the process-wide HTTP transport, creating it on first use."""
+    global _http_transport
+    if _http_transport is None:
+        _http_transport = httpx.AsyncHTTPTransport(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _http_transport
+
+
+async def init_http_clients() -> None:
+    """Create the shared HTTP transport (called from the server lifespan)."""
+    get_http_transport()
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP transport on server shutdown."""
+    global _http_transport
+    if _http_transport is not None:
+        try:
+            await _http_transport.aclose()
+        finally:
+            _http_transport = None
+
+
+def get_notion_client() -> AsyncClient:
+    """Get an async Notion client with authentication token from context or environment.
+
+    The client shares the process-wide connection pool. Do not close it:
+    closing would close the shared transport.
+    """
     # Try to get token from context first (for HTTP requests)
+    token = None
     try:
         token = auth_token_context.get()
-        if token:
-            return Client(auth=token)
     except LookupError:
         pass
     
     # Fall back to environment variable
-    token = os.getenv("NOTION_API_KEY")
+    if not token:
+        token = os.getenv("NOTION_API_KEY")
     if not token:
         raise ValueError("Notion API key not found. Please set NOTION_API_KEY environment variable or provide x-auth-token header.")
     
-    return Client(auth=token)
+    return AsyncClient(auth=token, client=httpx.AsyncClient(transport=get_http_transport()))
 
 
 def handle_notion_error(error: Exception) -> dict:
@@ -1,12 +1,41 @@
 from typing import Dict, Any, Optional, List
 from .base import get_notion_client, handle_notion_error, clean_notion_response
 
+# The API accepts at most 100 children per create or append request
+MAX_CHILDREN_PER_REQUEST = 100
+
+
+async def append_children_in_chunks(
+    notion,
+    block_id: str,
+    children: List[Dict[str, Any]],
+    after: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Append any number of children, 100 per request, keeping their order.
+
+    Each chunk is appended after the last block of the previous chunk.
+    Returns the API response of the last chunk with the results of all chunks.
+    """
+    results: List[Dict[str, Any]] = []
+    response: Dict[str, Any] = {}
+    for start in range(0, len(children), MAX_CHILDREN_PER_REQUEST):
+        append_data = {"children": children[start:start + MAX_CHILDREN_PER_REQUEST]}
+        if after:
+            append_data["after"] = after
+        response = await notion.blocks.children.append(block_id, **append_data)
+        chunk_results = response.get("results", [])
+        results.extend(chunk_results)
+        if chunk_results:
+            after = chunk_results[-1]["id"]
+    return {**response, "results": results}
+
 
 async def retrieve_block(block_id: str) -> Dict[str, Any]:
     """Retrieve a block from Notion."""
     try:
         notion = get_notion_client()
-        response = notion.blocks.retrieve(block_id)
+        response = await notion.blocks.retrieve(block_id)
         return clean_notion_response(response)
         
     except Exception as e:
@@ -29,7 +58,7 @@ async def update_block(
         if archived is not None:
             update_data["archived"] = archived
         
-        response = notion.blocks.update(block_id, **update_data)
+        response = await notion.blocks.update(block_id, **update_data)
         return clean_notion_response(response)
         
     except Exception as e:
@@ -40,7 +69,7 @@ async def delete_block(block_id: str) -> Dict[str, Any]:
     """Delete a block from Notion."""
     try:
         notion = get_notion_client()
-        response = notion.blocks.delete(block_id)
+        response = await notion.blocks.delete(block_id)
         return clean_notion_response(response)
         
     except Exception as e:
@@ -62,7 +91,7 @@ async def get_block_children(
         if page_size:
             params["page_size"] = page_size
         
-        response = notion.blocks.children.list(block_id, **params)
+        response = await notion.blocks.children.list(block_id, **params)
         return clean_notion_response(response)
         
     except Exception as e:
@@ -74,15 +103,10 @@ async def append_block_children(
     children: List[Dict[str, Any]],
     after: Optional[str] = None
 ) -> Dict[str, Any]:
-    """Append block children to a container block."""
+    """Append block children to a container block, in chunks of 100."""
     try:
         notion = get_notion_client()
-        
-        append_data = {"children": children}
-        if after:
-            append_data["after"] = after
-        
-        response = notion.blocks.children.append(block_id, **append_data)
+        response = await append_children_in_chunks(notion, block_id, children, after)
         return clean_notion_response(response)
         
     except Exception as e:
@@ -20,7 +20,7 @@ async def create_comment(
         else:
             comment_data["parent"] = parent
         
-        response = notion.comments.create(**comment_data)
+        response = await notion.comments.create(**comment_data)
         return clean_notion_response(response)
         
     except Exception as e:
@@ -42,7 +42,7 @@ async def get_comments(
         if page_size:
             params["page_size"] = page_size
         
-        response = notion.comments.list(**params)
+        response = await notion.comments.list(**params)
         return clean_notion_response(response)
         
     except Exception as e:
@@ -1,5 +1,6 @@
 from typing import Dict, Any, Optional, List
 from .base import get_notion_client, handle_notion_error, clean_notion_response
+from .blocks import MAX_CHILDREN_PER_REQUEST, append_children_in_chunks
 
 
 async def query_database(
@@ -32,7 +33,7 @@ async def query_database(
         if in_trash is not None:
             query_params["in_trash"] = in_trash
         
-        response = notion.databases.query(database_id, **query_params)
+        response = await notion.databases.query(database_id, **query_params)
         return clean_notion_response(response)
         
     except Exception as e:
@@ -43,7 +44,7 @@ async def get_database(database_id: str) -> Dict[str, Any]:
     """Retrieve a database from Notion."""
     try:
         notion = get_notion_client()
-        response = notion.databases.retrieve(database_id)
+        response = await notion.databases.retrieve(database_id)
         return clean_notion_response(response)
         
     except Exception as e:
@@ -75,7 +76,7 @@ async def create_database(
         if description:
             database_data["description"] = description
         
-        response = notion.databases.create(**database_data)
+        response = await notion.databases.create(**database_data)
         return clean_notion_response(response)
         
     except Exception as e:
@@ -109,7 +110,7 @@ async def update_database(
         if archived is not None:
             update_data["archived"] = archived
         
-        response = notion.databases.update(database_id, **update_data)
+        response = await notion.databases.update(database_id, **update_data)
         return clean_notion_response(response)
         
     except Exception as e:
@@ -133,13 +134,18 @@ async def create_database_item(
         }
         
         if children:
-            page_data["children"] = children
+            # Send the first 100 children with the page and append the rest afterwards
+            page_data["children"] = children[:MAX_CHILDREN_PER_REQUEST]
         if icon:
             page_data["icon"] = icon
         if cover:
             page_data["cover"] = cover
         
-        response = notion.pages.create(**page_data)
+        response = await notion.pages.create(**page_data)
+        if children and len(children) > MAX_CHILDREN_PER_REQUEST:
+            await append_children_in_chunks(
+                notion, response["id"], children[MAX_CHILDREN_PER_REQUEST:]
+            )
         return clean_notion_response(response)
         
     except Exception as e:
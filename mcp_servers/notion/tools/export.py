@@ -0,0 +1,232 @@
+import asyncio
+import itertools
+import logging
+import os
+from typing import Dict, Any, Iterator, List, Optional
+
+from .base import get_notion_client, handle_notion_error
+
+logger = logging.getLogger(__name__)
+
+# Concurrent block requests per export; Notion allows about 3 requests/s per integration
+EXPORT_MAX_CONCURRENT_REQUESTS = int(os.getenv("NOTION_EXPORT_MAX_CONCURRENT_REQUESTS", "3"))
+DEFAULT_EXPORT_MAX_DEPTH = 10
+DEFAULT_EXPORT_MAX_BLOCKS = 2000
+DEFAULT_EXPORT_MAX_CHARS = 200_000
+
+# Child pages and databases are separate documents; they are linked, not inlined
+NON_EXPANDED_BLOCK_TYPES = {"child_page", "child_database"}
+
+
+class _ExportState:
+    """Shared state of one export: request limiter and block budget."""
+
+    def __init__(self, max_blocks: int):
+        self.semaphore = asyncio.Semaphore(EXPORT_MAX_CONCURRENT_REQUESTS)
+        self.remaining_blocks = max_blocks
+        self.block_count = 0
+        self.truncated = False
+
+
+async def _request(state: _ExportState, call, *args, **kwargs) -> Dict[str, Any]:
+    """Run a Notion call under the export's semaphore (the client retries rate limits)."""
+    async with state.semaphore:
+        return await call(*args, **kwargs)
+
+
+async def _list_all_children(notion, block_id: str, state: _ExportState) -> List[Dict[str, Any]]:
+    """List a block's children, following has_more cursors until the budget runs out."""
+    children: List[Dict[str, Any]] = []
+    params: Dict[str, Any] = {"page_size": 100}
+    while True:
+        if state.remaining_blocks <= 0:
+            state.truncated = True
+            break
+        response = await _request(state, notion.blocks.children.list, block_id, **params)
+        results = response.get("results", [])[:state.remaining_blocks]
+        state.remaining_blocks -= len(results)
+        state.block_count += len(results)
+        children.extend(results)
+        if not response.get("has_more"):
+            break
+        params["start_cursor"] = response["next_cursor"]
+    return children
+
+
+async def _load_block_tree(
+    notion,
+    block_id: str,
+    depth: int,
+    max_depth: int,
+    state: _ExportState,
+) -> List[Dict[str, Any]]:
+    """Load a block's children and, concurrently, their descendants up to max_depth."""
+    blocks = await _list_all_children(notion, block_id, state)
+    expandable = [
+        block for block in blocks
+        if block.get("has_children") and block.get("type") not in NON_EXPANDED_BLOCK_TYPES
+    ]
+    if expandable and depth >= max_depth:
+        state.truncated = True
+    elif expandable:
+        subtrees = await asyncio.gather(
+            *(_load_block_tree(notion, block["id"], depth + 1, max_depth, state) for block in expandable)
+        )
+        for block, children in zip(expandable, subtrees):
+            block["children"] = children
+    return blocks
+
+
+def rich_text_to_markdown(rich_text: List[Dict[str, Any]]) -> str:
+    """Convert Notion rich text to inline markdown."""
+    parts = []
+    for item in rich_text or []:
+        text = item.get("plain_text")
+        if text is None:
+            text = (item.get("text") or {}).get("content", "")
+        if item.get("type") == "equation":
+            parts.append(f"${item['equation']['expression']}$")
+            continue
+        annotations = item.get("annotations") or {}
+        if text.strip():
+            if annotations.get("code"):
+                text = f"`{text}`"
+            if annotations.get("bold"):
+                text = f"**{text}**"
+            if annotations.get("italic"):
+                text = f"*{text}*"
+            if annotations.get("strikethrough"):
+                text = f"~~{text}~~"
+        href = item.get("href") or ((item.get("text") or {}).get("link") or {}).get("url")
+        parts.append(f"[{text}]({href})" if href else text)
+    return "".join(parts)
+
+
+def _file_url(data: Dict[str, Any]) -> str:
+    return (data.get("file") or data.get("external") or {}).get("url", "")
+
+
+def _block_lines(block: Dict[str, Any], number: int) -> List[str]:
+    """Markdown lines for a single block, without its children."""
+    block_type = block.get("type", "")
+    data = block.get(block_type) or {}
+    text = rich_text_to_markdown(data.get("rich_text", []))
+
+    if block_type in ("heading_1", "heading_2", "heading_3"):
+        return [f"{'#' * int(block_type[-1])} {text}"]
+    if block_type == "paragraph":
+        return [text]
+    if block_type == "bulleted_list_item":
+        return [f"- {text}"]
+    if block_type == "numbered_list_item":
+        return [f"{number}. {text}"]
+    if block_type == "to_do":
+        return [f"- [{'x' if data.get('checked') else ' '}] {text}"]
+    if block_type == "toggle":
+        return [f"- {text}"]
+    if block_type == "quote":
+        return [f"> {text}"]
+    if block_type == "callout":
+        emoji = (data.get("icon") or {}).get("emoji")
+        return [f"> {emoji} {text}" if emoji else f"> {text}"]
+    if block_type == "code":
+        code = "".join(item.get("plain_text", "") for item in data.get("rich_text", []))
+        language = data.get("language", "")
+        return [f"```{'' if language == 'plain text' else language}", *code.split("\n"), "```"]
+    if block_type == "equation":
+        return ["$$", data.get("expression", ""), "$$"]
+    if block_type == "divider":
+        return ["---"]
+    if block_type == "child_page":
+        return [f"[{data.get('title', 'Untitled')}](notion://page/{block['id']})"]
+    if block_type == "child_database":
+        return [f"[{data.get('title', 'Untitled database')}](notion://database/{block['id']})"]
+    if block_type in ("image", "file", "pdf", "video", "audio"):
+        caption = rich_text_to_markdown(data.get("caption", [])) or block_type
+        prefix = "!" if block_type == "image" else ""
+        return [f"{prefix}[{caption}]({_file_url(data)})"]
+    if block_type in ("bookmark", "embed", "link_preview"):
+        url = data.get("url", "")
+        return [f"[{rich_text_to_markdown(data.get('caption', [])) or url}]({url})"]
+    if block_type == "table":
+        rows = [row.get("table_row", {}).get("cells", []) for row in block.get("children", [])]
+        lines = ["| " + " | ".join(rich_text_to_markdown(cell) for cell in cells) + " |" for cells in rows]
+        if lines:
+            columns = data.get("table_width") or len(rows[0])
+            lines.insert(1, "|" + " --- |" * columns)
+        return lines
+    if text:
+        return [text]
+    return [f"<!-- unsupported block: {block_type} -->"]
+
+
+def iter_markdown_lines(blocks: List[Dict[str, Any]], indent: str = "") -> Iterator[str]:
+    """Yield markdown lines for a block tree in document order.
+
+    This is the inverse of markdown_to_notion_blocks, extended to nested blocks:
+    children of a block are indented under it.
+    """
+    number = 0
+    for block in blocks:
+        block_type = block.get("type")
+        number = number + 1 if block_type == "numbered_list_item" else 0
+        for line in _block_lines(block, number):
+            yield f"{indent}{line}" if line else ""
+        if block.get("children") and block_type != "table":
+            yield from iter_markdown_lines(block["children"], indent + "  ")
+        if block_type not in ("bulleted_list_item", "numbered_list_item", "to_do"):
+            yield ""
+
+
+def _page_title(page: Dict[str, Any]) -> str:
+    for prop in (page.get("properties") or {}).values():
+        if prop.get("type") == "title":
+            return rich_text_to_markdown(prop.get("title", []))
+    return ""
+
+
+async def export_page_markdown(
+    page_id: str,
+    max_depth: int = DEFAULT_EXPORT_MAX_DEPTH,
+    max_blocks: int = DEFAULT_EXPORT_MAX_BLOCKS,
+    max_chars: int = DEFAULT_EXPORT_MAX_CHARS
+) -> Dict[str, Any]:
+    """
+    Export a page and all of its nested blocks as markdown.
+
+    Block children are fetched concurrently (at most
+    NOTION_EXPORT_MAX_CONCURRENT_REQUESTS requests at a time), following
+    pagination cursors. Loading stops at max_depth levels or max_blocks blocks,
+    and the markdown is cut at max_chars characters; truncated reports either.
+    """
+    try:
+        notion = get_notion_client()
+        state = _ExportState(max_blocks)
+        page, blocks = await asyncio.gather(
+            _request(state, notion.pages.retrieve, page_id),
+            _load_block_tree(notion, page_id, 1, max_depth, state),
+        )
+
+        lines: List[str] = []
+        size = 0
+        title = _page_title(page)
+        header = [f"# {title}", ""] if title else []
+        for line in itertools.chain(header, iter_markdown_lines(blocks)):
+            if not line and lines and not lines[-1]:
+                continue
+            if size + len(line) + 1 > max_chars:
+                state.truncated = True
+                break
+            lines.append(line)
+            size += len(line) + 1
+
+        return {
+            "page_id": page_id,
+            "title": title,
+            "markdown": "\n".join(lines).rstrip() + "\n",
+            "block_count": state.block_count,
+            "truncated": state.truncated,
+        }
+
+    except Exception as e:
+        return handle_notion_error(e)
@@ -1,6 +1,7 @@
 from typing import Dict, Any, Optional, List
 import re
 from .base import get_notion_client, handle_notion_error, clean_notion_response
+from .blocks import MAX_CHILDREN_PER_REQUEST, append_children_in_chunks
 
 
 def markdown_to_notion_blocks(markdown_content: str) -> List[Dict[str, Any]]:
@@ -172,13 +173,18 @@ async def create_page(
         }
         
         if children:
-            page_data["children"] = children
+            # Send the first 100 children with the page and append the rest afterwards
+            page_data["children"] = children[:MAX_CHILDREN_PER_REQUEST]
         if icon:
             page_data["icon"] = icon
         if cover:
             page_data["cover"] = cover
         
-        response = notion.pages.create(**page_data)
+        response = await notion.pages.create(**page_data)
+        if children and len(children) > MAX_CHILDREN_PER_REQUEST:
+            await append_children_in_chunks(
+                notion, response["id"], children[MAX_CHILDREN_PER_REQUEST:]
+            )
         return clean_notion_response(response)
         
     except Exception as e:
@@ -197,7 +203,7 @@ async def get_page(
         if filter_properties:
             params["filter_properties"] = filter_properties
         
-        response = notion.pages.retrieve(page_id, **params)
+        response = await notion.pages.retrieve(page_id, **params)
         return clean_notion_response(response)
         
     except Exception as e:
@@ -220,7 +226,7 @@ async def retrieve_page_property(
         if page_size:
             params["page_size"] = page_size
         
-        response = notion.pages.properties.retrieve(page_id, property_id, **params)
+        response = await notion.pages.properties.retrieve(page_id, property_id, **params)
         return clean_notion_response(response)
         
     except Exception as e:
@@ -250,7 +256,7 @@ async def update_page_properties(
         if in_trash is not None:
             update_data["in_trash"] = in_trash
         
-        response = notion.pages.update(page_id, **update_data)
+        response = await notion.pages.update(page_id, **update_data)
         return clean_notion_response(response)
         
     except Exception as e:
@@ -25,7 +25,7 @@ async def search_notion(
         if page_size:
             search_params["page_size"] = page_size
         
-        response = notion.search(**search_params)
+        response = await notion.search(**search_params)
         return clean_notion_response(response)
         
     except Exception as e:
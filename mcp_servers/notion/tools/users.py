@@ -6,7 +6,7 @@ async def get_user(user_id: str) -> Dict[str, Any]:
     """Retrieve a user from Notion."""
     try:
         notion = get_notion_client()
-        response = notion.users.retrieve(user_id)
+        response = await notion.users.retrieve(user_id)
         return clean_notion_response(response)
         
     except Exception as e:
@@ -17,7 +17,7 @@ async def get_me() -> Dict[str, Any]:
     """Retrieve your token's bot user information."""
     try:
         notion = get_notion_client()
-        response = notion.users.me()
+        response = await notion.users.me()
         return clean_notion_response(response)
         
     except Exception as e:
@@ -38,7 +38,7 @@ async def list_users(
         if page_size:
             params["page_size"] = page_size
         
-        response = notion.users.list(**params)
+        response = await notion.users.list(**params)
         return clean_notion_response(response)
         
     except Exception as e:
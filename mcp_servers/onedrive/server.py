@@ -43,6 +43,7 @@ from tools import (
     #Sharing
     onedrive_list_shared_items,
 )
+from tools.base import init_http_clients, close_http_clients
 
 
 # Configure logging
@@ -159,11 +160,14 @@ def main(
             # File Content Operations
             types.Tool(
                 name="onedrive_read_file_content",
-                description="Read the content of a file from OneDrive by its ID.",
+                description="Read the content of a file from OneDrive by its ID. Large files are returned in parts; use offset and length to read a byte range. Text is extracted from PDF, Word, Excel and PowerPoint files.",
                 inputSchema={
                     "type": "object",
                     "properties": {
-                        "file_id": {"type": "string", "description": "ID of the file to read"}
+                        "file_id": {"type": "string", "description": "ID of the file to read"},
+                        "offset": {"type": "integer", "minimum": 0, "default": 0, "description": "Byte offset to start reading from"},
+                        "length": {"type": "integer", "minimum": 1, "description": "Number of bytes to read (default: to the end of the file)"},
+                        "extract_text": {"type": "boolean", "default": True, "description": "Extract text from PDF and Office files when reading the whole file"}
                     },
                     "required": ["file_id"]
                 },
@@ -173,7 +177,7 @@ def main(
             # File Creation
             types.Tool(
                 name="onedrive_create_file",
-                description="Create a new file in OneDrive.",
+                description="Create a new file in OneDrive. Content over 4MB is uploaded in resumable fragments.",
                 inputSchema={
                     "type": "object",
                     "properties": {
@@ -356,7 +360,10 @@ def main(
         elif name == "onedrive_read_file_content":
             try:
                 result = await onedrive_read_file_content(
-                    file_id=arguments["file_id"]
+                    file_id=arguments["file_id"],
+                    offset=arguments.get("offset", 0),
+                    length=arguments.get("length"),
+                    extract_text=arguments.get("extract_text", True)
                 )
                 return [
                     types.TextContent(
@@ -598,13 +605,15 @@ def main(
 
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
-        """Context manager for session manager."""
+        """Context manager for session manager and shared HTTP client."""
+        await init_http_clients()
         async with session_manager.run():
             logger.info("Application started with dual transports!")
             try:
                 yield
             finally:
                 logger.info("Application shutting down...")
+                await close_http_clients()
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
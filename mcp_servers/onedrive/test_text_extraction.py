@@ -0,0 +1,65 @@
+"""
+Tests for choosing between text extraction and plain decoding of downloads.
+
+Run from this directory: python -m pytest test_text_extraction.py
+"""
+
+import asyncio
+import io
+import zipfile
+
+from tools import files, text_extraction
+
+DOCUMENT_XML = (
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    "<w:body><w:p><w:r><w:t>Hello from Word</w:t></w:r></w:p></w:body></w:document>"
+)
+
+
+def make_zip(entries: dict) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, data in entries.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+async def stream(data: bytes, chunk_size: int = 100):
+    for start in range(0, len(data), chunk_size):
+        yield data[start:start + chunk_size]
+
+
+def read_streamed(data: bytes) -> str:
+    chunks = stream(data)
+
+    async def run():
+        first = await anext(chunks)
+        return await files._extract_streamed_text(first, chunks, len(data))
+
+    return asyncio.run(run())
+
+
+def test_is_office_archive():
+    docx = make_zip({"[Content_Types].xml": "<Types/>", "word/document.xml": DOCUMENT_XML})
+    odt = make_zip({"mimetype": "application/vnd.oasis.opendocument.text", "content.xml": "<x/>"})
+    plain = make_zip({"notes.txt": "hello"})
+
+    assert text_extraction.is_office_archive(io.BytesIO(docx))
+    assert text_extraction.is_office_archive(io.BytesIO(odt))
+    assert not text_extraction.is_office_archive(io.BytesIO(plain))
+    assert not text_extraction.is_office_archive(io.BytesIO(b"PK\x03\x04 truncated"))
+
+
+def test_office_document_is_extracted():
+    docx = make_zip({"[Content_Types].xml": "<Types/>", "word/document.xml": DOCUMENT_XML})
+    assert read_streamed(docx).strip() == "Hello from Word"
+
+
+def test_plain_zip_is_decoded():
+    data = make_zip({"notes.txt": "hello"})
+    assert read_streamed(data) == data.decode("utf-8", errors="replace")
+
+
+def test_unsupported_office_archive_is_decoded():
+    data = make_zip({"mimetype": "application/vnd.oasis.opendocument.text", "content.xml": "<x/>"})
+    assert read_streamed(data) == data.decode("utf-8", errors="replace")
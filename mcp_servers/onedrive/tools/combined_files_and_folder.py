@@ -1,7 +1,7 @@
 import httpx
 import logging
 from typing import Tuple, Union
-from .base import get_onedrive_client
+from .base import get_onedrive_client, get_http_client
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -29,13 +29,13 @@ async def onedrive_rename_item(file_id: str, new_name: str) -> Union[Tuple[str,
     try:
         logger.info(f"Renaming item {file_id} to {new_name}")
 
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.patch(
-                url,
-                headers={ **client['headers'], "Content-Type": "application/json"},
-                json=data
-            )
-            return "Renamed successfully:", response.json()
+        httpx_client = get_http_client()
+        response = await httpx_client.patch(
+            url,
+            headers={ **client['headers'], "Content-Type": "application/json"},
+            json=data
+        )
+        return "Renamed successfully:", response.json()
     except Exception as e:
         logger.error(f"Exception occurred while renaming item: {e}")
         return "Error:", str(e)
@@ -64,9 +64,9 @@ async def onedrive_move_item(item_id: str, new_parent_id: str) -> Union[Tuple[st
 
     try:
         logger.info(f"Moving item {item_id} to parent {new_parent_id}")
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.patch(url, headers=client['headers'], json=body)
-            return "Item moved:", response.json()
+        httpx_client = get_http_client()
+        response = await httpx_client.patch(url, headers=client['headers'], json=body)
+        return "Item moved:", response.json()
     except Exception as e:
         logger.error(f"Exception occurred while moving item: {e}")
         return ("Error:", str(e))
@@ -93,22 +93,22 @@ async def onedrive_delete_item(item_id: str) -> Union[Tuple[str], Tuple[str, int
         logger.info(f"Deleting item {item_id}")
         # Although creating a client for each call is inefficient, this works
         # as a self-contained function.
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.delete(url, headers=client['headers'])
-
-            # Key Fix: Check the status code from the response.
-            # A successful delete operation returns 204 No Content.
-            if response.status_code == 204:
-                return "Deleted successfully"
-            else:
-                # If it's not 204, the API returned an error.
-                logger.error(f"Error deleting item {item_id}: {response.status_code} - {response.text}")
-                # Attempt to return the JSON error from the API, falling back to raw text.
-                try:
-                    error_details = response.json()
-                except Exception:
-                    error_details = response.text
-                return "Error:", response.status_code, str(error_details)
+        httpx_client = get_http_client()
+        response = await httpx_client.delete(url, headers=client['headers'])
+
+        # Key Fix: Check the status code from the response.
+        # A successful delete operation returns 204 No Content.
+        if response.status_code == 204:
+            return "Deleted successfully"
+        else:
+            # If it's not 204, the API returned an error.
+            logger.error(f"Error deleting item {item_id}: {response.status_code} - {response.text}")
+            # Attempt to return the JSON error from the API, falling back to raw text.
+            try:
+                error_details = response.json()
+            except Exception:
+                error_details = response.text
+            return "Error:", response.status_code, str(error_details)
 
     except httpx.RequestError as exc:
         # This handles network-level errors (e.g., cannot connect).
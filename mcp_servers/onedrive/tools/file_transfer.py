@@ -0,0 +1,188 @@
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import httpx
+
+from .base import get_http_client
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Bytes read from the network per iteration when streaming a download
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# PUT .../content accepts at most 4MB; larger files need an upload session
+SIMPLE_UPLOAD_MAX_BYTES = 4 * 1024 * 1024
+
+# Upload session fragments must be a multiple of 320KiB (Graph recommends 5-10MiB)
+UPLOAD_FRAGMENT_UNIT = 320 * 1024
+UPLOAD_CHUNK_SIZE = int(os.getenv("ONEDRIVE_UPLOAD_CHUNK_SIZE", str(32 * UPLOAD_FRAGMENT_UNIT)))
+
+# Consecutive failed fragment uploads before an upload session is abandoned
+UPLOAD_MAX_RETRIES = 3
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def byte_range_header(offset: int = 0, length: Optional[int] = None) -> Optional[str]:
+    """Build a Range header value, or None when the whole file is wanted."""
+    if offset < 0 or (length is not None and length <= 0):
+        raise ValueError("offset must be >= 0 and length must be > 0")
+    if length is not None:
+        return f"bytes={offset}-{offset + length - 1}"
+    if offset:
+        return f"bytes={offset}-"
+    return None
+
+
+def content_total_size(response: httpx.Response) -> Optional[int]:
+    """Total file size from Content-Range (ranged responses) or Content-Length."""
+    content_range = response.headers.get("Content-Range", "")
+    if "/" in content_range:
+        total = content_range.rsplit("/", 1)[1]
+        return int(total) if total.isdigit() else None
+    content_length = response.headers.get("Content-Length")
+    return int(content_length) if content_length and content_length.isdigit() else None
+
+
+@asynccontextmanager
+async def stream_file(
+    client: Dict[str, Any],
+    file_id: str,
+    offset: int = 0,
+    length: Optional[int] = None,
+) -> AsyncIterator[Tuple[httpx.Response, AsyncIterator[bytes]]]:
+    """
+    Stream a file's content, optionally limited to a byte range.
+
+    Yields the response and an iterator over its body chunks. The body is
+    never buffered as a whole; leaving the context closes the connection, so
+    callers can stop reading early. If the server ignores the Range header
+    and sends the whole file, the bytes outside the range are skipped.
+    """
+    url = f"{client['base_url']}/me/drive/items/{file_id}/content"
+    headers = dict(client['headers'])
+    range_header = byte_range_header(offset, length)
+    if range_header:
+        headers["Range"] = range_header
+
+    httpx_client = get_http_client()
+    # Graph redirects to a pre-authenticated download URL; httpx drops the
+    # Authorization header when following it to another host
+    async with httpx_client.stream("GET", url, headers=headers, follow_redirects=True) as response:
+        skip = offset if range_header and response.status_code == 200 else 0
+        remaining = length if range_header and response.status_code == 200 else None
+
+        async def chunks() -> AsyncIterator[bytes]:
+            nonlocal skip, remaining
+            async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                if skip:
+                    dropped = min(skip, len(chunk))
+                    chunk = chunk[dropped:]
+                    skip -= dropped
+                if remaining is not None:
+                    chunk = chunk[:remaining]
+                    remaining -= len(chunk)
+                if chunk:
+                    yield chunk
+                if remaining == 0:
+                    return
+
+        yield response, chunks()
+
+
+async def create_upload_session(
+    client: Dict[str, Any],
+    parent_folder: str,
+    file_name: str,
+    conflict_behavior: str = "fail",
+) -> str:
+    """Create a Graph upload session and return its upload URL."""
+    url = f"{client['base_url']}/me/drive/items/{parent_folder}:/{file_name}:/createUploadSession"
+    body = {"item": {"@microsoft.graph.conflictBehavior": conflict_behavior}}
+    httpx_client = get_http_client()
+    response = await httpx_client.post(url, headers=client['headers'], json=body)
+    response.raise_for_status()
+    return response.json()["uploadUrl"]
+
+
+async def get_next_expected_offset(upload_url: str) -> Optional[int]:
+    """Ask an upload session where to resume; None if the session is gone."""
+    httpx_client = get_http_client()
+    response = await httpx_client.get(upload_url)
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    ranges = response.json().get("nextExpectedRanges") or []
+    return int(ranges[0].split("-")[0]) if ranges else None
+
+
+async def upload_large_file(
+    client: Dict[str, Any],
+    parent_folder: str,
+    file_name: str,
+    data: bytes,
+    conflict_behavior: str = "fail",
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """
+    Upload a file through a Graph upload session.
+
+    The payload is sent in fragments of chunk_size bytes (rounded down to a
+    multiple of 320KiB). Graph only accepts fragments in order, so they are
+    sent one after another. When a fragment fails with a transient error, the
+    upload resumes from the session's nextExpectedRanges instead of starting
+    over. If the upload cannot be completed, the session is cancelled.
+
+    Returns:
+    - The created driveItem
+    """
+    chunk_size = max(UPLOAD_FRAGMENT_UNIT, chunk_size - chunk_size % UPLOAD_FRAGMENT_UNIT)
+    total = len(data)
+    upload_url = await create_upload_session(client, parent_folder, file_name, conflict_behavior)
+    httpx_client = get_http_client()
+    offset = 0
+    failures = 0
+
+    try:
+        while True:
+            end = min(offset + chunk_size, total)
+            # The upload URL is pre-authenticated; sending Authorization can fail the request
+            headers = {"Content-Range": f"bytes {offset}-{end - 1}/{total}"}
+            try:
+                response = await httpx_client.put(upload_url, headers=headers, content=data[offset:end])
+            except httpx.TransportError as e:
+                response = None
+                error = str(e)
+            else:
+                if response.status_code in (200, 201):
+                    return response.json()
+                if response.status_code == 202:
+                    failures = 0
+                    ranges = response.json().get("nextExpectedRanges") or []
+                    offset = int(ranges[0].split("-")[0]) if ranges else end
+                    continue
+                if response.status_code not in RETRY_STATUS_CODES:
+                    response.raise_for_status()
+                error = f"HTTP {response.status_code}"
+
+            failures += 1
+            if failures > UPLOAD_MAX_RETRIES:
+                raise RuntimeError(f"Upload of '{file_name}' failed at byte {offset}: {error}")
+            retry_after = response.headers.get("Retry-After") if response is not None else None
+            delay = int(retry_after) if retry_after and retry_after.isdigit() else 2 ** failures
+            logger.warning(f"Fragment upload failed at byte {offset} ({error}), resuming in {delay}s")
+            await asyncio.sleep(delay)
+
+            resume_at = await get_next_expected_offset(upload_url)
+            if resume_at is None:
+                raise RuntimeError(f"Upload session for '{file_name}' expired at byte {offset}")
+            offset = resume_at
+    except BaseException:
+        try:
+            await httpx_client.delete(upload_url)
+        except Exception as e:
+            logger.warning(f"Could not cancel upload session: {e}")
+        raise
@@ -1,21 +1,52 @@
-import httpx
+import asyncio
+import codecs
 import logging
 import os
-from typing import Tuple, Union, Dict, Any
-from .base import get_onedrive_client
+import tempfile
+from typing import AsyncIterator, Optional, Tuple, Union, Dict, Any
+from . import text_extraction
+from .base import get_onedrive_client, get_http_client
+from .file_transfer import (
+    SIMPLE_UPLOAD_MAX_BYTES,
+    content_total_size,
+    stream_file,
+    upload_large_file,
+)
 from .onedrive_explore import onedrive_list_inside_folder
+from .text_extraction import is_extractable
 import uuid
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-
-async def onedrive_read_file_content(file_id: str) -> Union[str, Tuple[str, int, str]]:
+# Most bytes of a file returned as text by one read
+MAX_READ_BYTES = int(os.getenv("ONEDRIVE_MAX_READ_BYTES", str(5 * 1024 * 1024)))
+# Most characters of text extracted from a PDF or Office file
+MAX_EXTRACTED_CHARS = int(os.getenv("ONEDRIVE_MAX_EXTRACTED_CHARS", str(1024 * 1024)))
+# Downloads for text extraction spill from memory to disk beyond this size
+SPOOL_MAX_MEMORY_BYTES = 1024 * 1024
+SPOOL_READ_CHUNK_BYTES = 64 * 1024
+
+
+async def onedrive_read_file_content(
+        file_id: str,
+        offset: int = 0,
+        length: Optional[int] = None,
+        extract_text: bool = True
+) -> Union[str, Tuple[str, int, str]]:
     """
     Read the content of a file from OneDrive.
 
+    The file is streamed rather than loaded whole. Text is returned up to
+    ONEDRIVE_MAX_READ_BYTES; longer files end with a note giving the offset
+    to continue from. PDF, Word, Excel and PowerPoint files are spooled
+    (in memory up to a small limit, then on disk) and their text is extracted.
+
     Parameters:
     - file_id: The ID of the file to read
+    - offset: Byte offset to start reading from (default 0)
+    - length: Number of bytes to read (default: to the end of the file)
+    - extract_text: Extract text from PDF and Office files (only for whole-file reads)
 
     Returns:
     - The file content as string if successful
@@ -26,26 +57,100 @@ async def onedrive_read_file_content(file_id: str) -> Union[str, Tuple[str, int,
         logger.error("Could not get OneDrive client")
         return "Could not get OneDrive client"
 
-    url = f"{client['base_url']}/me/drive/items/{file_id}/content"
-
     try:
-        logger.info(f"Reading content of file ID: {file_id}")
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.get(url, headers=client['headers'],  follow_redirects=True)
-            return response.text
+        logger.info(f"Reading content of file ID: {file_id} (offset={offset}, length={length})")
+        async with stream_file(client, file_id, offset, length) as (response, chunks):
+            if response.status_code >= 400:
+                await response.aread()
+                return "Error:", response.status_code, response.text
+
+            total_size = content_total_size(response)
+            first = b""
+            async for first in chunks:
+                break
+
+            whole_file = offset == 0 and length is None
+            if extract_text and whole_file and is_extractable(response.headers.get("Content-Type"), first):
+                return await _extract_streamed_text(first, chunks, total_size)
+
+            return await _decode_streamed_text(first, chunks, offset, total_size)
     except Exception as e:
         logger.error(f"Exception occurred while reading file content: {e}")
         return "Error:", str(e)
 
+
+async def _decode_streamed_text(
+        first: bytes,
+        chunks: AsyncIterator[bytes],
+        offset: int,
+        total_size: Optional[int]
+) -> str:
+    """Decode streamed chunks as UTF-8 until MAX_READ_BYTES have been read."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    parts = []
+    read = 0
+    chunk = first
+    while chunk:
+        chunk = chunk[:MAX_READ_BYTES - read]
+        read += len(chunk)
+        parts.append(decoder.decode(chunk))
+        if read >= MAX_READ_BYTES:
+            break
+        chunk = await anext(chunks, b"")
+    parts.append(decoder.decode(b"", final=True))
+    text = "".join(parts)
+
+    if read >= MAX_READ_BYTES and (total_size is None or offset + read < total_size):
+        text += (
+            f"\n\n[Truncated after {read} bytes. "
+            f"Call again with offset={offset + read} to continue.]"
+        )
+    return text
+
+
+async def _extract_streamed_text(
+        first: bytes,
+        chunks: AsyncIterator[bytes],
+        total_size: Optional[int]
+) -> str:
+    """
+    Spool streamed chunks to a temporary file and extract their text.
+
+    ZIP files that are not Office documents, and documents of a type that
+    has no extractor, are decoded as text like any other file.
+    """
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY_BYTES) as spool:
+        spool.write(first)
+        async for chunk in chunks:
+            spool.write(chunk)
+
+        if not first.startswith(text_extraction.ZIP_MAGIC) or text_extraction.is_office_archive(spool):
+            try:
+                return await asyncio.to_thread(text_extraction.extract_text, spool, MAX_EXTRACTED_CHARS)
+            except ValueError as e:
+                logger.info(f"Reading file as text instead: {e}")
+
+        spool.seek(0)
+        return await _decode_streamed_text(spool.read(SPOOL_READ_CHUNK_BYTES), _read_spool(spool), 0, total_size)
+
+
+async def _read_spool(spool) -> AsyncIterator[bytes]:
+    """Yield the rest of a spooled download in chunks."""
+    while chunk := spool.read(SPOOL_READ_CHUNK_BYTES):
+        yield chunk
+
+
 async def onedrive_create_file(
         parent_folder: str,
         new_file_name: str,
-        data: str = None,
+        data: Union[str, bytes] = None,
         if_exists: str = 'error'
 ) -> Union[Tuple[str, Dict], Tuple[str]]:
     """
     Create a new file in a specific OneDrive folder.
 
+    Content over 4MB is uploaded in fragments through a resumable upload session.
+
     Parameters:
     - parent_folder: 'root' to create in root or ID of the parent folder
     - new_file_name: Name for the new file
@@ -91,11 +196,18 @@ async def onedrive_create_file(
                 logger.error(f"Invalid if_exists option: {if_exists}")
                 return ("Invalid if_exists option.",)
 
-        # Step 3: create the file
+        # Step 3: create the file, through an upload session if it is too large for one PUT
+        content = data.encode("utf-8") if isinstance(data, str) else (data or b"")
+        if len(content) > SIMPLE_UPLOAD_MAX_BYTES:
+            conflict_behavior = "replace" if if_exists == 'replace' else "fail"
+            logger.info(f"Uploading {len(content)} bytes to '{final_name}' with an upload session")
+            item = await upload_large_file(client, parent_folder, final_name, content, conflict_behavior)
+            return "File created:", item
+
         url = f"{client['base_url']}/me/drive/items/{parent_folder}:/{final_name}:/content"
-        async with httpx.AsyncClient() as httpx_client:
-            put_response = await httpx_client.put(url, headers=client['headers'], data=data or '')
-            return "File created:", put_response.json()
+        httpx_client = get_http_client()
+        put_response = await httpx_client.put(url, headers=client['headers'], content=content)
+        return "File created:", put_response.json()
     except Exception as e:
         logger.error(f"Exception occurred while creating file: {e}")
         return "Error:", str(e)
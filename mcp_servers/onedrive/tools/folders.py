@@ -1,7 +1,6 @@
-import httpx
 import logging
 from typing import Tuple, Union, Dict, Any
-from .base import get_onedrive_client
+from .base import get_onedrive_client, get_http_client
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -38,13 +37,13 @@ async def onedrive_create_folder(
 
     try:
         logger.info(f"Creating folder '{new_folder_name}' in parent {parent_folder} with behavior={behavior}")
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.post(
-                url,
-                headers={**client['headers'], "Content-Type": "application/json"},
-                json=data
-            )
-            return "Folder created successfully:", response.json()
+        httpx_client = get_http_client()
+        response = await httpx_client.post(
+            url,
+            headers={**client['headers'], "Content-Type": "application/json"},
+            json=data
+        )
+        return "Folder created successfully:", response.json()
     except Exception as e:
         logger.error(f"Exception occurred while creating folder: {e}")
         return "Error:", str(e)
\ No newline at end of file
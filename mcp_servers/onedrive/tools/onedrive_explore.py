@@ -1,7 +1,6 @@
-import httpx
 import logging
 from typing import Tuple, Union, Dict, List, Any
-from .base import get_onedrive_client
+from .base import get_onedrive_client, get_http_client
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -23,9 +22,9 @@ async def onedrive_list_root_files_folders() -> Union[Tuple[str, Dict[str, Any]]
 
     try:
         logger.info("Listing files and folders in root directory")
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.get(url, headers=client['headers'])
-            return "Files:", response.json()
+        httpx_client = get_http_client()
+        response = await httpx_client.get(url, headers=client['headers'])
+        return "Files:", response.json()
     except Exception as e:
         logger.error(f"Exception while listing root items: {e}")
         return "Error:", str(e)
@@ -50,9 +49,9 @@ async def onedrive_list_inside_folder(folder_id: str) -> Union[Tuple[str, Dict[s
 
     try:
         logger.info(f"Listing items inside folder ID: {folder_id}")
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.get(url, headers=client['headers'])
-            return "Items inside folder:", response.json()
+        httpx_client = get_http_client()
+        response = await httpx_client.get(url, headers=client['headers'])
+        return "Items inside folder:", response.json()
     except Exception as e:
         logger.error(f"Exception while listing folder items: {e}")
         return "Error:", str(e)
@@ -77,9 +76,9 @@ async def onedrive_search_item_by_name(itemname: str) -> Union[Tuple[str, Dict[s
 
     try:
         logger.info(f"Searching for items with name: {itemname}")
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.get(url, headers=client['headers'])
-            return "Found items:", response.json()
+        httpx_client = get_http_client()
+        response = await httpx_client.get(url, headers=client['headers'])
+        return "Found items:", response.json()
     except Exception as e:
         logger.error(f"Exception while searching items: {e}")
         return "Error:", str(e)
@@ -104,11 +103,11 @@ async def onedrive_search_folder_by_name(folder_name: str) -> Union[Tuple[str, L
 
     try:
         logger.info(f"Searching for folders with name: {folder_name}")
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.get(url, headers=client['headers'])
-            data = response.json()
-            folders = [item for item in data.get('value', []) if 'folder' in item]
-            return "Found folders:", folders
+        httpx_client = get_http_client()
+        response = await httpx_client.get(url, headers=client['headers'])
+        data = response.json()
+        folders = [item for item in data.get('value', []) if 'folder' in item]
+        return "Found folders:", folders
 
     except Exception as e:
         logger.error(f"Exception while searching folders: {e}")
@@ -134,11 +133,11 @@ async def onedrive_get_item_by_id(item_id: str) -> Union[Dict[str, Any], Tuple[s
 
     try:
         logger.info(f"Getting item with ID: {item_id}")
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.get(url, headers=client['headers'])
-            data = response.json()
-            logger.info(f"Successfully retrieved item: {data.get('name', 'unknown')}")
-            return data
+        httpx_client = get_http_client()
+        response = await httpx_client.get(url, headers=client['headers'])
+        data = response.json()
+        logger.info(f"Successfully retrieved item: {data.get('name', 'unknown')}")
+        return data
     except Exception as e:
         logger.error(f"Exception while getting item: {e}")
         return "Error:", str(e)
\ No newline at end of file
@@ -1,7 +1,6 @@
-import httpx
 import logging
 from typing import Tuple, Union, Dict, Any, Literal
-from .base import get_onedrive_client
+from .base import get_onedrive_client, get_http_client
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -23,9 +22,9 @@ async def onedrive_list_shared_items() -> Union[Tuple[str, Dict[str, Any]], Tupl
 
     try:
         logger.info("Requesting list of shared items")
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.get(url, headers=client['headers'])
-            return "Items shared with me:", response.json()
+        httpx_client = get_http_client()
+        response = await httpx_client.get(url, headers=client['headers'])
+        return "Items shared with me:", response.json()
     except Exception as e:
         logger.error(f"Exception while fetching shared items: {str(e)}")
         return ("Error:", str(e))
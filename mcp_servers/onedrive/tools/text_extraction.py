@@ -0,0 +1,225 @@
+import logging
+import re
+import zipfile
+from typing import IO, Iterator, List, Optional
+from xml.etree.ElementTree import iterparse
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+PDF_MAGIC = b"%PDF"
+ZIP_MAGIC = b"PK\x03\x04"
+
+# Content types whose text is extracted instead of being decoded as-is
+EXTRACTABLE_CONTENT_TYPES = {
+    "application/pdf",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+}
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+A_NS = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+S_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+R_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PR_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# Entries that mark a ZIP as an Office Open XML or OpenDocument file
+OFFICE_ARCHIVE_MARKERS = {"[Content_Types].xml", "mimetype"}
+
+
+def is_extractable(content_type: Optional[str], head: bytes) -> bool:
+    """
+    Whether a download should go through text extraction.
+
+    Uses the response content type, falling back to the PDF and ZIP (Office
+    Open XML) signatures when the content type is generic. A ZIP signature
+    only makes a candidate: the archive is checked with is_office_archive
+    once downloaded, since its directory is at the end.
+    """
+    content_type = (content_type or "").split(";")[0].strip().lower()
+    if content_type in EXTRACTABLE_CONTENT_TYPES:
+        return True
+    return head.startswith(PDF_MAGIC) or head.startswith(ZIP_MAGIC)
+
+
+def is_office_archive(file: IO[bytes]) -> bool:
+    """Whether a seekable file is a ZIP holding an Office or OpenDocument marker entry."""
+    file.seek(0)
+    try:
+        with zipfile.ZipFile(file) as archive:
+            return any(name in OFFICE_ARCHIVE_MARKERS for name in archive.namelist())
+    except zipfile.BadZipFile:
+        return False
+    finally:
+        file.seek(0)
+
+
+class _TextBuffer:
+    """Collects text pieces until max_chars is reached."""
+
+    def __init__(self, max_chars: int):
+        self.max_chars = max_chars
+        self.parts: List[str] = []
+        self.size = 0
+
+    @property
+    def full(self) -> bool:
+        return self.size >= self.max_chars
+
+    def add(self, text: str) -> None:
+        if text and not self.full:
+            text = text[: self.max_chars - self.size]
+            self.parts.append(text)
+            self.size += len(text)
+
+    def text(self) -> str:
+        return "".join(self.parts)
+
+
+def _iter_elements(archive: zipfile.ZipFile, name: str) -> Iterator:
+    """Yield elements of an XML part as they are closed, without loading the whole part."""
+    with archive.open(name) as part:
+        for _, elem in iterparse(part, events=("end",)):
+            yield elem
+
+
+def _paragraph_text(archive: zipfile.ZipFile, name: str, ns: str, out: _TextBuffer) -> None:
+    for elem in _iter_elements(archive, name):
+        if elem.tag == f"{ns}t":
+            out.add(elem.text or "")
+        elif elem.tag == f"{W_NS}tab":
+            out.add("\t")
+        elif elem.tag in (f"{W_NS}br", f"{A_NS}br"):
+            out.add("\n")
+        elif elem.tag == f"{ns}p":
+            out.add("\n")
+            elem.clear()
+        if out.full:
+            return
+
+
+def _extract_docx(archive: zipfile.ZipFile, out: _TextBuffer) -> None:
+    _paragraph_text(archive, "word/document.xml", W_NS, out)
+
+
+def _numbered_parts(archive: zipfile.ZipFile, pattern: str) -> List[str]:
+    regex = re.compile(pattern)
+    parts = [(int(m.group(1)), name) for name in archive.namelist() if (m := regex.fullmatch(name))]
+    return [name for _, name in sorted(parts)]
+
+
+def _extract_pptx(archive: zipfile.ZipFile, out: _TextBuffer) -> None:
+    for number, name in enumerate(_numbered_parts(archive, r"ppt/slides/slide(\d+)\.xml"), start=1):
+        out.add(f"--- Slide {number} ---\n")
+        _paragraph_text(archive, name, A_NS, out)
+        if out.full:
+            return
+
+
+def _shared_strings(archive: zipfile.ZipFile) -> List[str]:
+    if "xl/sharedStrings.xml" not in archive.namelist():
+        return []
+    strings = []
+    for elem in _iter_elements(archive, "xl/sharedStrings.xml"):
+        if elem.tag == f"{S_NS}si":
+            strings.append("".join(t.text or "" for t in elem.iter(f"{S_NS}t")))
+            elem.clear()
+    return strings
+
+
+def _sheets(archive: zipfile.ZipFile) -> List[tuple]:
+    """(sheet name, part name) pairs in workbook order."""
+    targets = {}
+    if "xl/_rels/workbook.xml.rels" in archive.namelist():
+        for elem in _iter_elements(archive, "xl/_rels/workbook.xml.rels"):
+            if elem.tag == f"{PR_NS}Relationship":
+                target = elem.get("Target", "").lstrip("/")
+                targets[elem.get("Id")] = target if target.startswith("xl/") else f"xl/{target}"
+
+    sheets = []
+    for elem in _iter_elements(archive, "xl/workbook.xml"):
+        if elem.tag == f"{S_NS}sheet":
+            part = targets.get(elem.get(f"{R_NS}id"))
+            if part in archive.namelist():
+                sheets.append((elem.get("name"), part))
+    if not sheets:
+        parts = _numbered_parts(archive, r"xl/worksheets/sheet(\d+)\.xml")
+        sheets = [(f"Sheet{number}", name) for number, name in enumerate(parts, start=1)]
+    return sheets
+
+
+def _extract_xlsx(archive: zipfile.ZipFile, out: _TextBuffer) -> None:
+    shared = _shared_strings(archive)
+    for sheet_name, part in _sheets(archive):
+        out.add(f"--- Sheet {sheet_name} ---\n")
+        row: List[str] = []
+        for elem in _iter_elements(archive, part):
+            if elem.tag == f"{S_NS}c":
+                cell_type = elem.get("t")
+                value = elem.find(f"{S_NS}v")
+                if cell_type == "s" and value is not None and value.text is not None:
+                    index = int(value.text)
+                    row.append(shared[index] if index < len(shared) else "")
+                elif cell_type == "inlineStr":
+                    row.append("".join(t.text or "" for t in elem.iter(f"{S_NS}t")))
+                else:
+                    row.append((value.text or "") if value is not None else "")
+                elem.clear()
+            elif elem.tag == f"{S_NS}row":
+                out.add("\t".join(row) + "\n")
+                row = []
+                elem.clear()
+                if out.full:
+                    return
+
+
+def _extract_pdf(file: IO[bytes], out: _TextBuffer) -> None:
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise RuntimeError("PDF text extraction requires the 'pypdf' package")
+
+    reader = PdfReader(file)
+    for number, page in enumerate(reader.pages, start=1):
+        out.add(f"--- Page {number} ---\n")
+        out.add((page.extract_text() or "") + "\n")
+        if out.full:
+            return
+
+
+def extract_text(file: IO[bytes], max_chars: int) -> str:
+    """
+    Extract plain text from a PDF, Word, Excel or PowerPoint file.
+
+    The file must be seekable (Office files are ZIP archives, whose directory
+    is at the end). XML parts are parsed incrementally, and extraction stops
+    once max_chars characters have been collected.
+
+    Raises:
+        ValueError: If the file is not a supported document type
+        RuntimeError: If an optional extraction dependency is missing
+    """
+    file.seek(0)
+    head = file.read(len(ZIP_MAGIC))
+    file.seek(0)
+    out = _TextBuffer(max_chars)
+
+    if head.startswith(PDF_MAGIC):
+        _extract_pdf(file, out)
+        return out.text()
+
+    if not head.startswith(ZIP_MAGIC):
+        raise ValueError("Unsupported file type for text extraction")
+
+    with zipfile.ZipFile(file) as archive:
+        names = set(archive.namelist())
+        if "word/document.xml" in names:
+            _extract_docx(archive, out)
+        elif "xl/workbook.xml" in names:
+            _extract_xlsx(archive, out)
+        elif "ppt/presentation.xml" in names:
+            _extract_pptx(archive, out)
+        else:
+            raise ValueError("Unsupported archive type for text extraction")
+    return out.text()
@@ -24,6 +24,7 @@ from tools import models as model_tools
 from tools import chat as chat_tools
 from tools import usage as usage_tools
 from tools import comparison as comparison_tools
+from tools.base import init_http_clients, close_http_clients
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -145,6 +146,48 @@ def main(
                 },
                 annotations=types.ToolAnnotations(**{"category": "OPENROUTER_MODEL", "readOnlyHint": True}),
             ),
+            types.Tool(
+                name="openrouter_filter_models",
+                description="Filter models by provider, category, context length and price, e.g. the cheapest models with at least 128k tokens of context",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "provider": {
+                            "type": "string",
+                            "description": "Filter by provider (e.g., 'anthropic', 'openai', 'meta-llama')",
+                        },
+                        "category": {
+                            "type": "string",
+                            "description": "Filter by category or modality (e.g., 'image', 'text->text', 'text+image->text')",
+                        },
+                        "min_context_length": {
+                            "type": "integer",
+                            "description": "Minimum context length in tokens (e.g., 128000)",
+                        },
+                        "max_input_cost_per_1k_tokens": {
+                            "type": "number",
+                            "description": "Maximum input price in USD per 1k tokens",
+                        },
+                        "max_output_cost_per_1k_tokens": {
+                            "type": "number",
+                            "description": "Maximum output price in USD per 1k tokens",
+                        },
+                        "sort_by": {
+                            "type": "string",
+                            "enum": ["price", "context_length", "created"],
+                            "description": "Sort order: 'price' (cheapest first, default), 'context_length' (largest first) or 'created' (newest first)",
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Maximum number of models to return (1-100, default 20)",
+                            "minimum": 1,
+                            "maximum": 100,
+                        },
+                    },
+                    "required": [],
+                },
+                annotations=types.ToolAnnotations(**{"category": "OPENROUTER_MODEL", "readOnlyHint": True}),
+            ),
             types.Tool(
                 name="openrouter_get_model_pricing",
                 description="Get pricing information for a specific model",
@@ -558,6 +601,8 @@ def main(
 
             elif name == "openrouter_search_models":
                 result = await model_tools.search_models(**arguments)
+            elif name == "openrouter_filter_models":
+                result = await model_tools.filter_models(**arguments)
             elif name == "openrouter_get_model_pricing":
                 result = await model_tools.get_model_pricing(**arguments)
             
@@ -660,13 +705,15 @@ def main(
 
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
-        """Context manager for session manager."""
+        """Context manager for session manager and shared HTTP client."""
+        await init_http_clients()
         async with session_manager.run():
             logger.info("Application started with dual transports!")
             try:
                 yield
             finally:
                 logger.info("Application shutting down...")
+                await close_http_clients()
 
     starlette_app = Starlette(
         debug=True,
@@ -0,0 +1,56 @@
+"""
+Tests for model lookups in the cached catalog, with the OpenRouter API mocked out.
+
+Run from this directory: python -m pytest test_catalog.py
+"""
+
+import asyncio
+
+import pytest
+
+from tools import catalog
+
+
+class FakeClient:
+    """Serves a fixed model list and counts catalog requests."""
+
+    def __init__(self, model_ids):
+        self.model_ids = model_ids
+        self.requests = 0
+
+    async def get_if_modified(self, endpoint, etag=None):
+        self.requests += 1
+        return {"data": [{"id": model_id} for model_id in self.model_ids]}, None
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = FakeClient(["openai/gpt-4o"])
+    monkeypatch.setattr(catalog, "get_client", lambda: client)
+    monkeypatch.setattr(catalog, "_catalog", None)
+    monkeypatch.setattr(catalog, "_catalog_expires_at", 0.0)
+    monkeypatch.setattr(catalog, "_catalog_refreshed_at", float("-inf"))
+    return client
+
+
+def test_find_known_model(client):
+    assert asyncio.run(catalog.find_model("openai/gpt-4o"))["id"] == "openai/gpt-4o"
+    assert client.requests == 1
+
+
+def test_unknown_models_refresh_at_most_once_per_interval(client):
+    async def lookups():
+        return [await catalog.find_model(f"unknown/model-{i}") for i in range(10)]
+
+    assert asyncio.run(lookups()) == [None] * 10
+    assert client.requests == 1
+
+
+def test_unknown_model_refreshes_after_interval(client, monkeypatch):
+    assert asyncio.run(catalog.find_model("openai/gpt-4o"))
+    client.model_ids.append("new/model")
+
+    assert asyncio.run(catalog.find_model("new/model")) is None
+    monkeypatch.setattr(catalog, "_catalog_refreshed_at", float("-inf"))
+    assert asyncio.run(catalog.find_model("new/model"))["id"] == "new/model"
+    assert client.requests == 2
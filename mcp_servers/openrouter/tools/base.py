@@ -4,7 +4,9 @@ Base utilities and error handling for OpenRouter MCP Server.
 
 import contextvars
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+import http.cookiejar
+import importlib.util
 import httpx
 from pydantic import BaseModel, Field
 import json
@@ -15,6 +17,44 @@ auth_token_context = contextvars.ContextVar("auth_token", default="")
 
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 
+# Shared HTTP client, reused across tool calls so connections stay pooled
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            # Reject all cookies: the client is shared across tenants
+            cookies=http.cookiejar.CookieJar(
+                policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+            ),
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _http_client
+
+
+async def init_http_clients() -> None:
+    """Create the shared HTTP client (called from the server lifespan)."""
+    get_http_client()
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP client on server shutdown."""
+    global _http_client
+    if _http_client is not None:
+        try:
+            await _http_client.aclose()
+        finally:
+            _http_client = None
+
 
 class OpenRouterToolExecutionError(Exception):
     """Custom exception for OpenRouter tool execution errors."""
@@ -54,6 +94,28 @@ class OpenRouterClient:
             "X-Title": "Klavis MCP Server",
         }
     
+    @staticmethod
+    def _raise_for_status(response: httpx.Response) -> None:
+        """Raise the matching tool or API error for a 429 or an error status."""
+        if response.status_code == 429:
+            retry_after = response.headers.get("Retry-After")
+            retry_after_ms = int(retry_after) * 1000 if retry_after else 60000
+            raise OpenRouterToolExecutionError(
+                "Rate limit exceeded",
+                retry_after_ms=retry_after_ms,
+                additional_prompt_content="Please wait before making another request.",
+                developer_message=f"Rate limited. Retry after {retry_after_ms}ms",
+            )
+        
+        if response.status_code >= 400:
+            error_data = response.json() if response.content else {}
+            error_message = error_data.get("error", {}).get("message", "Unknown error")
+            raise OpenRouterAPIError(
+                status_code=response.status_code,
+                message=error_message,
+                details=error_data,
+            )
+    
     async def _make_request(
         self,
         method: str,
@@ -64,128 +126,147 @@ class OpenRouterClient:
         """Make an HTTP request to the OpenRouter API."""
         url = f"{self.base_url}{endpoint}"
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=self.headers,
-                    json=data,
-                    params=params,
-                )
-                
-                if response.status_code == 429:
-                    retry_after = response.headers.get("Retry-After")
-                    retry_after_ms = int(retry_after) * 1000 if retry_after else 60000
-                    raise OpenRouterToolExecutionError(
-                        "Rate limit exceeded",
-                        retry_after_ms=retry_after_ms,
-                        additional_prompt_content="Please wait before making another request.",
-                        developer_message=f"Rate limited. Retry after {retry_after_ms}ms",
-                    )
-                
-                if response.status_code >= 400:
-                    error_data = response.json() if response.content else {}
-                    error_message = error_data.get("error", {}).get("message", "Unknown error")
-                    raise OpenRouterAPIError(
-                        status_code=response.status_code,
-                        message=error_message,
-                        details=error_data,
-                    )
-                
-                if data and data.get("stream") and response.status_code == 200:
-                    # For streaming responses, return a generator that yields chunks
-                    async def stream_generator():
-                        try:
-                            chunk_count = 0
-                            async for chunk in response.aiter_text():
-                                lines = chunk.split('\n')
-                                for line in lines:
-                                    if line.startswith('data: '):
-                                        data_line = line[6:]
-                                        if data_line.strip() == '[DONE]':
-                                            logger.info("Received [DONE] marker - stream complete")
-                                            yield {
-                                                "chunk": None,
-                                                "is_complete": True,
-                                                "total_chunks": chunk_count,
-                                                "message": "Stream completed"
-                                            }
-                                            return
-                                        try:
-                                            json_data = json.loads(data_line)
-                                            if 'choices' in json_data and json_data['choices']:
-                                                delta = json_data['choices'][0].get('delta', {})
-                                                if 'content' in delta:
-                                                    chunk_count += 1
-                                                    content = delta['content']
-                                                    logger.info(f"Yielding chunk {chunk_count}: '{content}'")
-                                                    yield {
-                                                        "chunk": content,
-                                                        "is_complete": False,
-                                                        "chunk_number": chunk_count,
-                                                        "message": f"Chunk {chunk_count} received"
-                                                    }
-                                        except json.JSONDecodeError:
-                                            continue
-                            
-                            yield {
-                                "chunk": None,
-                                "is_complete": True,
-                                "total_chunks": chunk_count,
-                                "message": "Stream ended without [DONE] marker"
-                            }
-                            
-                        except Exception as e:
-                            logger.error(f"Error in stream generator: {e}")
-                            yield {
-                                "chunk": None,
-                                "is_complete": True,
-                                "error": str(e),
-                                "message": f"Stream error: {str(e)}"
-                            }
-                    
-                    return {
-                        "stream": True,
-                        "status_code": response.status_code,
-                        "generator": stream_generator(),
-                        "message": "Stream generator created"
-                    }
-                
-                # Try to parse as JSON, but handle empty responses gracefully
-                if response.content:
-                    return response.json()
-                else:
-                    return {"status": "success", "message": "Empty response received"}
+        client = get_http_client()
+        try:
+            response = await client.request(
+                method=method,
+                url=url,
+                headers=self.headers,
+                json=data,
+                params=params,
+            )
+            
+            self._raise_for_status(response)
+            
+            if data and data.get("stream") and response.status_code == 200:
+                # For streaming responses, return a generator that yields chunks
+                async def stream_generator():
+                    try:
+                        chunk_count = 0
+                        async for chunk in response.aiter_text():
+                            lines = chunk.split('\n')
+                            for line in lines:
+                                if line.startswith('data: '):
+                                    data_line = line[6:]
+                                    if data_line.strip() == '[DONE]':
+                                        logger.info("Received [DONE] marker - stream complete")
+                                        yield {
+                                            "chunk": None,
+                                            "is_complete": True,
+                                            "total_chunks": chunk_count,
+                                            "message": "Stream completed"
+                                        }
+                                        return
+                                    try:
+                                        json_data = json.loads(data_line)
+                                        if 'choices' in json_data and json_data['choices']:
+                                            delta = json_data['choices'][0].get('delta', {})
+                                            if 'content' in delta:
+                                                chunk_count += 1
+                                                content = delta['content']
+                                                logger.info(f"Yielding chunk {chunk_count}: '{content}'")
+                                                yield {
+                                                    "chunk": content,
+                                                    "is_complete": False,
+                                                    "chunk_number": chunk_count,
+                                                    "message": f"Chunk {chunk_count} received"
+                                                }
+                                    except json.JSONDecodeError:
+                                        continue
+                        
+                        yield {
+                            "chunk": None,
+                            "is_complete": True,
+                            "total_chunks": chunk_count,
+                            "message": "Stream ended without [DONE] marker"
+                        }
+                        
+                    except Exception as e:
+                        logger.error(f"Error in stream generator: {e}")
+                        yield {
+                            "chunk": None,
+                            "is_complete": True,
+                            "error": str(e),
+                            "message": f"Stream error: {str(e)}"
+                        }
                 
-            except httpx.TimeoutException:
-                raise OpenRouterToolExecutionError(
-                    "Request timeout",
-                    retry_after_ms=5000,
-                    additional_prompt_content="The request took too long. Please try again.",
-                    developer_message="Request timed out after 30 seconds",
-                )
-            except httpx.RequestError as e:
-                raise OpenRouterToolExecutionError(
-                    f"Network error: {str(e)}",
-                    retry_after_ms=5000,
-                    additional_prompt_content="There was a network error. Please check your connection and try again.",
-                    developer_message=f"Network error: {str(e)}",
-                )
-            except Exception as e:
-                if "Expecting value" in str(e) and data and data.get("stream"):
-                    return {
-                        "stream": True,
-                        "status_code": response.status_code,
-                        "content": "Streaming response received",
-                        "message": "This is a streaming response. Use appropriate streaming client to handle it."
-                    }
-                raise
+                return {
+                    "stream": True,
+                    "status_code": response.status_code,
+                    "generator": stream_generator(),
+                    "message": "Stream generator created"
+                }
+            
+            # Try to parse as JSON, but handle empty responses gracefully
+            if response.content:
+                return response.json()
+            else:
+                return {"status": "success", "message": "Empty response received"}
+            
+        except httpx.TimeoutException:
+            raise OpenRouterToolExecutionError(
+                "Request timeout",
+                retry_after_ms=5000,
+                additional_prompt_content="The request took too long. Please try again.",
+                developer_message="Request timed out after 30 seconds",
+            )
+        except httpx.RequestError as e:
+            raise OpenRouterToolExecutionError(
+                f"Network error: {str(e)}",
+                retry_after_ms=5000,
+                additional_prompt_content="There was a network error. Please check your connection and try again.",
+                developer_message=f"Network error: {str(e)}",
+            )
+        except Exception as e:
+            if "Expecting value" in str(e) and data and data.get("stream"):
+                return {
+                    "stream": True,
+                    "status_code": response.status_code,
+                    "content": "Streaming response received",
+                    "message": "This is a streaming response. Use appropriate streaming client to handle it."
+                }
+            raise
     
     async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make a GET request."""
         return await self._make_request("GET", endpoint, params=params)
     
+    async def get_if_modified(
+        self, endpoint: str, etag: Optional[str] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Make a GET request revalidated with If-None-Match.
+        
+        Returns the parsed body and the response ETag, or (None, etag) when
+        the server answers 304 Not Modified.
+        """
+        headers = dict(self.headers)
+        if etag:
+            headers["If-None-Match"] = etag
+        
+        client = get_http_client()
+        try:
+            response = await client.get(f"{self.base_url}{endpoint}", headers=headers)
+        except httpx.TimeoutException:
+            raise OpenRouterToolExecutionError(
+                "Request timeout",
+                retry_after_ms=5000,
+                additional_prompt_content="The request took too long. Please try again.",
+                developer_message="Request timed out after 30 seconds",
+            )
+        except httpx.RequestError as e:
+            raise OpenRouterToolExecutionError(
+                f"Network error: {str(e)}",
+                retry_after_ms=5000,
+                additional_prompt_content="There was a network error. Please check your connection and try again.",
+                developer_message=f"Network error: {str(e)}",
+            )
+        
+        if response.status_code == 304:
+            return None, response.headers.get("ETag") or etag
+        self._raise_for_status(response)
+        return response.json(), response.headers.get("ETag")
+    
     async def post(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Make a POST request."""
         return await self._make_request("POST", endpoint, data=data)
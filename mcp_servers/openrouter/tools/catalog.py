@@ -0,0 +1,257 @@
+"""
+Process-wide, indexed cache of the OpenRouter model catalog.
+"""
+
+import asyncio
+import bisect
+import logging
+import math
+import os
+import time
+from collections import defaultdict
+from typing import Dict, Any, Iterable, List, Optional
+
+from .base import OpenRouterClient, get_client
+
+logger = logging.getLogger(__name__)
+
+# The catalog is public and the same for every API key, so one copy serves all tenants
+MODEL_CATALOG_TTL_SECONDS = float(os.getenv("OPENROUTER_MODEL_CATALOG_TTL", "300"))
+# Lookups of unknown model ids force a refresh at most this often
+MODEL_CATALOG_MIN_REFRESH_SECONDS = float(os.getenv("OPENROUTER_MODEL_CATALOG_MIN_REFRESH", "30"))
+
+SORT_KEYS = ("price", "context_length", "created")
+
+
+def price_per_token(model: Dict[str, Any], kind: str) -> Optional[float]:
+    """
+    Price in USD per token for 'prompt' or 'completion', or None if unknown.
+
+    OpenRouter reports prices as decimal strings; negative values mark
+    variable pricing (e.g. the auto router).
+    """
+    pricing = model.get("pricing") or {}
+    value = pricing.get(kind, pricing.get("input" if kind == "prompt" else "output"))
+    try:
+        price = float(value)
+    except (TypeError, ValueError):
+        return None
+    return price if price >= 0 else None
+
+
+def price_per_1k(model: Dict[str, Any], kind: str) -> float:
+    """Price in USD per 1k tokens, 0 if unknown."""
+    price = price_per_token(model, kind)
+    return price * 1000 if price is not None else 0.0
+
+
+def model_provider(model: Dict[str, Any]) -> str:
+    return model.get("id", "").split("/", 1)[0].lower()
+
+
+def model_categories(model: Dict[str, Any]) -> set:
+    """
+    Category tags of a model: its category (if the API sends one), its
+    modality (e.g. 'text+image->text') and its input/output modalities.
+    """
+    architecture = model.get("architecture") or {}
+    tags = {model.get("category"), architecture.get("modality")}
+    tags.update(architecture.get("input_modalities") or [])
+    tags.update(architecture.get("output_modalities") or [])
+    return {tag.lower() for tag in tags if tag}
+
+
+def _total_price(model: Dict[str, Any]) -> float:
+    prompt = price_per_token(model, "prompt")
+    completion = price_per_token(model, "completion")
+    if prompt is None or completion is None:
+        return math.inf
+    return prompt + completion
+
+
+class ModelCatalog:
+    """
+    The model list with lookup indexes, built once per fetch.
+
+    Models are indexed by id, provider and category tag, and kept sorted by
+    price and by context length, so filters and "cheapest model with at
+    least N tokens of context" queries never rescan the raw list.
+    """
+
+    def __init__(self, models: List[Dict[str, Any]], etag: Optional[str] = None):
+        self.models = models
+        self.etag = etag
+        self.by_id: Dict[str, Dict[str, Any]] = {}
+        self.by_provider: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.by_category: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._search_text: Dict[str, str] = {}
+
+        for model in models:
+            model_id = model.get("id")
+            if not model_id:
+                continue
+            self.by_id[model_id] = model
+            self.by_provider[model_provider(model)].append(model)
+            for tag in model_categories(model):
+                self.by_category[tag].append(model)
+            self._search_text[model_id] = " ".join(
+                (model_id, model.get("name") or "", model.get("description") or "")
+            ).lower()
+
+        indexed = list(self.by_id.values())
+        self.by_price = sorted(indexed, key=_total_price)
+        self.by_context_length = sorted(indexed, key=lambda m: m.get("context_length") or 0)
+        self._context_lengths = [m.get("context_length") or 0 for m in self.by_context_length]
+
+    def get(self, model_id: str) -> Optional[Dict[str, Any]]:
+        return self.by_id.get(model_id)
+
+    def _candidates(
+        self,
+        provider: Optional[str] = None,
+        category: Optional[str] = None,
+        min_context_length: Optional[int] = None,
+    ) -> Iterable[Dict[str, Any]]:
+        """The smallest index slice matching the filters, in catalog order when unfiltered."""
+        slices = []
+        if provider:
+            slices.append(self.by_provider.get(provider.lower(), []))
+        if category:
+            slices.append(self.by_category.get(category.lower(), []))
+        if min_context_length:
+            start = bisect.bisect_left(self._context_lengths, min_context_length)
+            slices.append(self.by_context_length[start:])
+        if not slices:
+            return self.by_id.values()
+
+        smallest = min(slices, key=len)
+        others = [{id(m) for m in s} for s in slices if s is not smallest]
+        return [m for m in smallest if all(id(m) in other for other in others)]
+
+    def search(
+        self,
+        query: str,
+        provider: Optional[str] = None,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Models whose id, name or description contain query, case-insensitively."""
+        query_lower = query.lower()
+        matches = []
+        for model in self._candidates(provider=provider, category=category):
+            if query_lower in self._search_text[model["id"]]:
+                matches.append(model)
+                if limit and len(matches) >= limit:
+                    break
+        return matches
+
+    def filter(
+        self,
+        provider: Optional[str] = None,
+        category: Optional[str] = None,
+        min_context_length: Optional[int] = None,
+        max_prompt_price_per_1k: Optional[float] = None,
+        max_completion_price_per_1k: Optional[float] = None,
+        sort_by: str = "price",
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Models matching all filters, cheapest first by default.
+
+        sort_by is 'price' (ascending), 'context_length' or 'created'
+        (both descending). Models with unknown pricing sort last by price
+        and are excluded when a price limit is given.
+        """
+        candidates = self._candidates(provider, category, min_context_length)
+
+        if max_prompt_price_per_1k is not None or max_completion_price_per_1k is not None:
+            def within_budget(model: Dict[str, Any]) -> bool:
+                for kind, limit_per_1k in (
+                    ("prompt", max_prompt_price_per_1k),
+                    ("completion", max_completion_price_per_1k),
+                ):
+                    price = price_per_token(model, kind)
+                    if limit_per_1k is not None and (price is None or price * 1000 > limit_per_1k):
+                        return False
+                return True
+            candidates = [m for m in candidates if within_budget(m)]
+
+        if sort_by == "price":
+            # Walk the price index instead of sorting the candidates
+            if candidates is self.by_id.values():
+                ordered = self.by_price
+            else:
+                selected = {id(m) for m in candidates}
+                ordered = [m for m in self.by_price if id(m) in selected]
+        elif sort_by == "context_length":
+            ordered = sorted(candidates, key=lambda m: m.get("context_length") or 0, reverse=True)
+        else:
+            ordered = sorted(candidates, key=lambda m: m.get("created") or 0, reverse=True)
+        return ordered[:limit] if limit else ordered
+
+
+_catalog: Optional[ModelCatalog] = None
+_catalog_expires_at = 0.0
+_catalog_refreshed_at = -math.inf
+_catalog_refresh: Optional[asyncio.Future] = None
+
+
+async def _refresh_catalog(client: OpenRouterClient) -> ModelCatalog:
+    global _catalog, _catalog_expires_at, _catalog_refreshed_at
+    _catalog_refreshed_at = time.monotonic()
+    current = _catalog
+    try:
+        response, etag = await client.get_if_modified("/models", current.etag if current else None)
+    except Exception as e:
+        if current is None:
+            raise
+        # Serve the stale catalog rather than failing model lookups
+        logger.warning(f"Model catalog refresh failed, using cached catalog: {e}")
+        _catalog_expires_at = time.monotonic() + min(MODEL_CATALOG_TTL_SECONDS, 30)
+        return current
+
+    if response is None and current is not None:
+        logger.info("Model catalog not modified")
+        current.etag = etag
+    else:
+        current = ModelCatalog(response.get("data", []), etag)
+        logger.info(f"Model catalog loaded with {len(current.by_id)} models")
+    _catalog = current
+    _catalog_expires_at = time.monotonic() + MODEL_CATALOG_TTL_SECONDS
+    return current
+
+
+async def get_model_catalog(force_refresh: bool = False) -> ModelCatalog:
+    """
+    Return the cached model catalog, revalidating it once its TTL expires.
+
+    Revalidation sends the last ETag, so an unchanged catalog costs a 304
+    with no body. Concurrent callers share a single refresh.
+    """
+    global _catalog_refresh
+    if _catalog is not None and not force_refresh and time.monotonic() < _catalog_expires_at:
+        return _catalog
+
+    if _catalog_refresh is None:
+        _catalog_refresh = asyncio.ensure_future(_refresh_catalog(get_client()))
+
+        def _clear(_):
+            global _catalog_refresh
+            _catalog_refresh = None
+
+        _catalog_refresh.add_done_callback(_clear)
+    return await asyncio.shield(_catalog_refresh)
+
+
+async def find_model(model_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up a model, refreshing the catalog once if the id is not in it.
+
+    The refresh is skipped when the catalog was fetched less than
+    OPENROUTER_MODEL_CATALOG_MIN_REFRESH seconds ago, so a stream of unknown
+    ids cannot turn every lookup into a catalog request.
+    """
+    model = (await get_model_catalog()).get(model_id)
+    if model is None and time.monotonic() - _catalog_refreshed_at >= MODEL_CATALOG_MIN_REFRESH_SECONDS:
+        model = (await get_model_catalog(force_refresh=True)).get(model_id)
+    return model
@@ -2,12 +2,18 @@
 Model comparison and analysis tools for OpenRouter MCP Server.
 """
 
+import asyncio
 import logging
+import os
 from typing import Dict, Any, List, Optional
 from .base import get_client, validate_required_params, validate_model_id, OpenRouterToolExecutionError
+from .catalog import get_model_catalog, price_per_1k, price_per_token
 
 logger = logging.getLogger(__name__)
 
+# Completions run at the same time by one comparison or analysis
+COMPARISON_MAX_CONCURRENT_REQUESTS = int(os.getenv("OPENROUTER_COMPARISON_MAX_CONCURRENT_REQUESTS", "5"))
+
 
 async def compare_models(
     models: List[str],
@@ -72,8 +78,9 @@ async def compare_models(
         
         messages = [{"role": "user", "content": test_prompt}]
         
-        results = []
-        for model_id in models:
+        semaphore = asyncio.Semaphore(COMPARISON_MAX_CONCURRENT_REQUESTS)
+        
+        async def run_model(model_id: str) -> Dict[str, Any]:
             try:
                 request_data = {
                     "model": model_id,
@@ -82,13 +89,16 @@ async def compare_models(
                     "temperature": temperature or 0.7,
                 }
                 
-                response = await client.post("/chat/completions", request_data)
+                async with semaphore:
+                    response = await client.post("/chat/completions", request_data)
                 
                 choices = response.get("choices", [])
                 content = choices[0].get("message", {}).get("content", "") if choices else ""
                 usage = response.get("usage", {})
                 
-                results.append({
+                logger.info(f"Successfully tested model: {model_id}")
+                
+                return {
                     "model": model_id,
                     "success": True,
                     "response": content,
@@ -98,19 +108,20 @@ async def compare_models(
                         "total_tokens": usage.get("total_tokens", 0),
                     },
                     "error": None,
-                })
-                
-                logger.info(f"Successfully tested model: {model_id}")
+                }
                 
             except Exception as e:
                 logger.warning(f"Error testing model {model_id}: {e}")
-                results.append({
+                return {
                     "model": model_id,
                     "success": False,
                     "response": None,
                     "usage": None,
                     "error": str(e),
-                })
+                }
+        
+        # Models are queried concurrently; results keep the order of models
+        results = list(await asyncio.gather(*(run_model(model_id) for model_id in models)))
         
         successful_results = [r for r in results if r["success"]]
         
@@ -210,12 +221,9 @@ async def analyze_model_performance(
         
         client = get_client()
         
-        results = []
-        total_prompt_tokens = 0
-        total_completion_tokens = 0
-        total_total_tokens = 0
+        semaphore = asyncio.Semaphore(COMPARISON_MAX_CONCURRENT_REQUESTS)
         
-        for i, prompt in enumerate(test_prompts):
+        async def run_prompt(i: int, prompt: str) -> Dict[str, Any]:
             try:
                 messages = [{"role": "user", "content": prompt}]
                 
@@ -226,45 +234,44 @@ async def analyze_model_performance(
                     "temperature": temperature or 0.7,
                 }
                 
-                response = await client.post("/chat/completions", request_data)
+                async with semaphore:
+                    response = await client.post("/chat/completions", request_data)
                 
                 choices = response.get("choices", [])
                 content = choices[0].get("message", {}).get("content", "") if choices else ""
                 usage = response.get("usage", {})
                 
-                prompt_tokens = usage.get("prompt_tokens", 0)
-                completion_tokens = usage.get("completion_tokens", 0)
-                total_tokens = usage.get("total_tokens", 0)
-                
-                total_prompt_tokens += prompt_tokens
-                total_completion_tokens += completion_tokens
-                total_total_tokens += total_tokens
+                logger.info(f"Successfully tested prompt {i+1}/{len(test_prompts)} with model: {model}")
                 
-                results.append({
+                return {
                     "prompt_index": i,
                     "prompt": prompt,
                     "success": True,
                     "response": content,
                     "usage": {
-                        "prompt_tokens": prompt_tokens,
-                        "completion_tokens": completion_tokens,
-                        "total_tokens": total_tokens,
+                        "prompt_tokens": usage.get("prompt_tokens", 0),
+                        "completion_tokens": usage.get("completion_tokens", 0),
+                        "total_tokens": usage.get("total_tokens", 0),
                     },
                     "error": None,
-                })
-                
-                logger.info(f"Successfully tested prompt {i+1}/{len(test_prompts)} with model: {model}")
+                }
                 
             except Exception as e:
                 logger.warning(f"Error testing prompt {i} with model {model}: {e}")
-                results.append({
+                return {
                     "prompt_index": i,
                     "prompt": prompt,
                     "success": False,
                     "response": None,
                     "usage": None,
                     "error": str(e),
-                })
+                }
+        
+        results = list(await asyncio.gather(*(run_prompt(i, prompt) for i, prompt in enumerate(test_prompts))))
+        
+        total_prompt_tokens = sum(r["usage"]["prompt_tokens"] for r in results if r["success"])
+        total_completion_tokens = sum(r["usage"]["completion_tokens"] for r in results if r["success"])
+        total_total_tokens = sum(r["usage"]["total_tokens"] for r in results if r["success"])
         
         successful_results = [r for r in results if r["success"]]
         
@@ -357,21 +364,22 @@ async def get_model_recommendations(
                 developer_message=f"Invalid performance_priority: {performance_priority}",
             )
         
-        client = get_client()
-        
-        models_response = await client.get("/models")
-        all_models = models_response.get("data", [])
+        catalog = await get_model_catalog()
+        all_models = catalog.models
         
         recommendations = []
         
-        for model in all_models:
+        # The price index is sorted cheapest first, so the first 10 matches are the answer
+        for model in catalog.by_price:
             model_id = model.get("id", "")
-            pricing = model.get("pricing", {})
-            input_cost = pricing.get("input", 0)
-            output_cost = pricing.get("output", 0)
+            input_cost = price_per_1k(model, "prompt")
+            output_cost = price_per_1k(model, "completion")
             total_cost = input_cost + output_cost
             
-            if budget_constraint:
+            if budget_constraint and budget_constraint != "unlimited":
+                # Variable-priced models (e.g. the auto router) cannot be checked against a budget
+                if price_per_token(model, "prompt") is None or price_per_token(model, "completion") is None:
+                    continue
                 if budget_constraint == "low" and total_cost > 0.001:
                     continue
                 elif budget_constraint == "medium" and total_cost > 0.01:
@@ -398,10 +406,9 @@ async def get_model_recommendations(
                 "context_length": model.get("context_length", 0),
                 "category": model.get("category", ""),
             })
-        
-        recommendations.sort(key=lambda x: x["pricing"]["total_cost_per_1k"])
-        
-        recommendations = recommendations[:10]
+            
+            if len(recommendations) >= 10:
+                break
         
         logger.info(f"Generated {len(recommendations)} model recommendations for use case: {use_case}")
         
@@ -5,6 +5,7 @@ Model management tools for OpenRouter MCP Server.
 import logging
 from typing import Dict, Any, Optional
 from .base import get_client, validate_required_params, validate_model_id, OpenRouterToolExecutionError
+from .catalog import SORT_KEYS, find_model, get_model_catalog, price_per_1k
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +58,17 @@ async def list_models(limit: Optional[int] = 50, next_page_token: Optional[str]
             developer_message=f"Unexpected error: {str(e)}",
         )
 
+def _model_summary(model: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "model_id": model.get("id"),
+        "name": model.get("name", model.get("id")),
+        "context_length": model.get("context_length", 0),
+        "input_cost_per_1k_tokens": price_per_1k(model, "prompt"),
+        "output_cost_per_1k_tokens": price_per_1k(model, "completion"),
+        "modality": (model.get("architecture") or {}).get("modality"),
+    }
+
+
 async def search_models(
     query: str,
     limit: Optional[int] = 20,
@@ -85,28 +97,8 @@ async def search_models(
                 developer_message=f"Invalid limit: {limit}",
             )
         
-        client = get_client()
-        
-        all_models_response = await client.get("/models")
-        all_models = all_models_response.get("data", [])
-        
-        filtered_models = []
-        query_lower = query.lower()
-        
-        for model in all_models:
-            model_name = model.get("id", "").lower()
-            model_description = model.get("description", "").lower()
-            
-            if query_lower in model_name or query_lower in model_description:
-                if category and model.get("category") != category:
-                    continue
-                if provider and not model.get("id", "").startswith(f"{provider}/"):
-                    continue
-                
-                filtered_models.append(model)
-                    
-                if limit and len(filtered_models) >= limit:
-                    break
+        catalog = await get_model_catalog()
+        filtered_models = catalog.search(query, provider=provider, category=category, limit=limit)
         
         logger.info(f"Found {len(filtered_models)} models matching query: {query}")
         
@@ -144,20 +136,23 @@ async def get_model_pricing(model_id: str) -> Dict[str, Any]:
         validate_required_params({"model_id": model_id}, ["model_id"])
         validate_model_id(model_id)
         
-        client = get_client()
-        
-        response = await client.get(f"/models/{model_id}")
-        
-        pricing = response.get("pricing", {})
+        model = await find_model(model_id)
+        if model is None:
+            raise OpenRouterToolExecutionError(
+                f"Model not found: {model_id}",
+                additional_prompt_content="Please check the model ID, or use search_models to find the correct one.",
+                developer_message=f"Model {model_id} is not in the OpenRouter model catalog",
+            )
         
         logger.info(f"Successfully retrieved pricing for model: {model_id}")
         
         return {
             "success": True,
             "model_id": model_id,
-            "pricing": pricing,
-            "input_cost_per_1k_tokens": pricing.get("input", 0),
-            "output_cost_per_1k_tokens": pricing.get("output", 0),
+            "pricing": model.get("pricing", {}),
+            "input_cost_per_1k_tokens": price_per_1k(model, "prompt"),
+            "output_cost_per_1k_tokens": price_per_1k(model, "completion"),
+            "context_length": model.get("context_length", 0),
             "currency": "USD",
         }
         
@@ -169,4 +164,77 @@ async def get_model_pricing(model_id: str) -> Dict[str, Any]:
             f"Failed to get pricing for model {model_id}: {str(e)}",
             additional_prompt_content=f"There was an error retrieving pricing for model {model_id}. Please check the model ID and try again.",
             developer_message=f"Unexpected error getting pricing for model {model_id}: {str(e)}",
-        ) 
\ No newline at end of file
+        )
+
+
+async def filter_models(
+    provider: Optional[str] = None,
+    category: Optional[str] = None,
+    min_context_length: Optional[int] = None,
+    max_input_cost_per_1k_tokens: Optional[float] = None,
+    max_output_cost_per_1k_tokens: Optional[float] = None,
+    sort_by: Optional[str] = "price",
+    limit: Optional[int] = 20,
+) -> Dict[str, Any]:
+    """
+    Filter models by provider, category, context length and price.
+    
+    Answered from the cached model catalog, e.g. the cheapest models with at
+    least 128k tokens of context: min_context_length=128000, sort_by='price'.
+    
+    Args:
+        provider: Filter by provider (e.g., 'anthropic', 'openai', 'meta-llama')
+        category: Filter by category or modality (e.g., 'image', 'text->text')
+        min_context_length: Minimum context length in tokens
+        max_input_cost_per_1k_tokens: Maximum input price in USD per 1k tokens
+        max_output_cost_per_1k_tokens: Maximum output price in USD per 1k tokens
+        sort_by: 'price' (cheapest first), 'context_length' or 'created' (largest/newest first)
+        limit: Maximum number of models to return (1-100, default 20)
+        
+    Returns:
+        Dictionary containing the matching models
+    """
+    try:
+        if limit is not None and (limit < 1 or limit > 100):
+            raise OpenRouterToolExecutionError(
+                "Invalid limit parameter",
+                additional_prompt_content="Limit must be between 1 and 100.",
+                developer_message=f"Invalid limit: {limit}",
+            )
+        
+        sort_by = sort_by or "price"
+        if sort_by not in SORT_KEYS:
+            raise OpenRouterToolExecutionError(
+                "Invalid sort_by parameter",
+                additional_prompt_content=f"sort_by must be one of: {', '.join(SORT_KEYS)}.",
+                developer_message=f"Invalid sort_by: {sort_by}",
+            )
+        
+        catalog = await get_model_catalog()
+        models = catalog.filter(
+            provider=provider,
+            category=category,
+            min_context_length=min_context_length,
+            max_prompt_price_per_1k=max_input_cost_per_1k_tokens,
+            max_completion_price_per_1k=max_output_cost_per_1k_tokens,
+            sort_by=sort_by,
+        )
+        
+        logger.info(f"Found {len(models)} models matching filters")
+        
+        return {
+            "success": True,
+            "data": [_model_summary(model) for model in models[:limit or 20]],
+            "sort_by": sort_by,
+            "total_count": len(models),
+        }
+        
+    except OpenRouterToolExecutionError:
+        raise
+    except Exception as e:
+        logger.exception(f"Error filtering models: {e}")
+        raise OpenRouterToolExecutionError(
+            f"Failed to filter models: {str(e)}",
+            additional_prompt_content="There was an error filtering models. Please try again.",
+            developer_message=f"Unexpected error: {str(e)}",
+        )
@@ -6,6 +6,7 @@ import logging
 from typing import Dict, Any, Optional
 from datetime import datetime, date
 from .base import get_client, validate_required_params, OpenRouterToolExecutionError
+from .catalog import find_model, price_per_1k
 
 logger = logging.getLogger(__name__)
 
@@ -241,13 +242,16 @@ async def get_cost_estimate(
                 developer_message=f"Invalid output_tokens: {output_tokens}",
             )
         
-        client = get_client()
-        
-        model_response = await client.get(f"/models/{model}")
-        pricing = model_response.get("pricing", {})
+        model_info = await find_model(model)
+        if model_info is None:
+            raise OpenRouterToolExecutionError(
+                f"Model not found: {model}",
+                additional_prompt_content="Please check the model ID, or use search_models to find the correct one.",
+                developer_message=f"Model {model} is not in the OpenRouter model catalog",
+            )
         
-        input_cost_per_1k = pricing.get("input", 0)
-        output_cost_per_1k = pricing.get("output", 0)
+        input_cost_per_1k = price_per_1k(model_info, "prompt")
+        output_cost_per_1k = price_per_1k(model_info, "completion")
         
         input_cost = (input_tokens / 1000) * input_cost_per_1k
         output_cost = (output_tokens or 0) / 1000 * output_cost_per_1k
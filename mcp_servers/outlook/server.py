@@ -39,8 +39,17 @@ from tools import (
     outlookMail_update_draft,
     outlookMail_create_forward_draft,
     outlookMail_list_messages_from_folder,
-    outlookMail_move_message
+    outlookMail_move_message,
+
+    # batch
+    outlookMail_batch_read_messages,
+    outlookMail_batch_move_messages,
+    outlookMail_batch_delete_messages,
+
+    # sync
+    outlookMail_sync_folder,
 )
+from tools.base import init_http_clients, close_http_clients
 
 
 
@@ -495,6 +504,105 @@ def main(
                     "additionalProperties": False
                 },
                 annotations=types.ToolAnnotations(**{"category": "OUTLOOK_MESSAGE"})
+            ),
+            # batch.py-------------------------------------------------------------
+            types.Tool(
+                name="outlookMail_batch_read_messages",
+                description="Read several Outlook mail messages in one call. Messages are fetched with Microsoft Graph JSON batching, 20 per request, instead of one request each.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "message_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "IDs of the messages to read"
+                        },
+                        "select": {
+                            "type": "string",
+                            "description": "Comma-separated list of fields to include in each message (e.g. 'subject,from,receivedDateTime,bodyPreview')"
+                        }
+                    },
+                    "required": ["message_ids"],
+                    "additionalProperties": False
+                },
+                annotations=types.ToolAnnotations(**{"category": "OUTLOOK_MESSAGE", "readOnlyHint": True})
+            ),
+            types.Tool(
+                name="outlookMail_batch_move_messages",
+                description="Move several Outlook mail messages to another folder in one call, by folder ID or well-known name like 'archive'. Uses Microsoft Graph JSON batching, 20 messages per request. Returns a result per message; moved messages get new IDs.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "message_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "IDs of the messages to move"
+                        },
+                        "destination_folder_id": {
+                            "type": "string",
+                            "description": "ID of the destination folder (e.g. 'archive' or a custom folder ID)"
+                        }
+                    },
+                    "required": ["message_ids", "destination_folder_id"],
+                    "additionalProperties": False
+                },
+                annotations=types.ToolAnnotations(**{"category": "OUTLOOK_MESSAGE"})
+            ),
+            types.Tool(
+                name="outlookMail_batch_delete_messages",
+                description="Delete several Outlook mail messages in one call. Uses Microsoft Graph JSON batching, 20 messages per request. Returns a result per message.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "message_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "IDs of the messages to delete"
+                        }
+                    },
+                    "required": ["message_ids"],
+                    "additionalProperties": False
+                },
+                annotations=types.ToolAnnotations(**{"category": "OUTLOOK_MESSAGE"})
+            ),
+            # sync.py--------------------------------------------------------------
+            types.Tool(
+                name="outlookMail_sync_folder",
+                description="Get the messages added, changed or removed in a mail folder since the last sync, using a Microsoft Graph delta query. The first call returns the folder's messages; later calls return only changes, so monitoring an inbox does not require listing it again. The delta link is stored per user and folder and also returned.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "folder_id": {
+                            "type": "string",
+                            "description": "ID or well-known name of the folder (default 'inbox')",
+                            "default": "inbox"
+                        },
+                        "delta_link": {
+                            "type": "string",
+                            "description": "Delta link returned by an earlier sync to continue from, instead of the stored one (Microsoft Graph links only)"
+                        },
+                        "reset": {
+                            "type": "boolean",
+                            "description": "Discard the stored delta link and sync from scratch (default False)",
+                            "default": False
+                        },
+                        "select": {
+                            "type": "string",
+                            "description": "Comma-separated list of fields to include in each message (e.g. 'subject,from,receivedDateTime,isRead')"
+                        },
+                        "received_after": {
+                            "type": "string",
+                            "description": "On a sync from scratch, only include messages received at or after this ISO 8601 time (e.g. '2025-07-01T00:00:00Z')"
+                        },
+                        "max_changes": {
+                            "type": "integer",
+                            "description": "Stop after about this many changes (default 200); has_more tells whether the next call has more",
+                            "default": 200
+                        }
+                    },
+                    "additionalProperties": False
+                },
+                annotations=types.ToolAnnotations(**{"category": "OUTLOOK_MESSAGE", "readOnlyHint": True})
             )
 
         ]
@@ -847,6 +955,92 @@ def main(
                         text=f"Error: {str(e)}",
                     )
                 ]
+        elif name == "outlookMail_batch_read_messages":
+            try:
+                result = await outlookMail_batch_read_messages(
+                    message_ids=arguments["message_ids"],
+                    select=arguments.get("select")
+                )
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=json.dumps(result, indent=2),
+                    )
+                ]
+            except Exception as e:
+                logger.exception(f"Error reading messages in batch: {e}")
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Error: {str(e)}",
+                    )
+                ]
+
+        elif name == "outlookMail_batch_move_messages":
+            try:
+                result = await outlookMail_batch_move_messages(
+                    message_ids=arguments["message_ids"],
+                    destination_folder_id=arguments["destination_folder_id"]
+                )
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=json.dumps(result, indent=2),
+                    )
+                ]
+            except Exception as e:
+                logger.exception(f"Error moving messages in batch: {e}")
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Error: {str(e)}",
+                    )
+                ]
+
+        elif name == "outlookMail_batch_delete_messages":
+            try:
+                result = await outlookMail_batch_delete_messages(
+                    message_ids=arguments["message_ids"]
+                )
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=json.dumps(result, indent=2),
+                    )
+                ]
+            except Exception as e:
+                logger.exception(f"Error deleting messages in batch: {e}")
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Error: {str(e)}",
+                    )
+                ]
+
+        elif name == "outlookMail_sync_folder":
+            try:
+                result = await outlookMail_sync_folder(
+                    folder_id=arguments.get("folder_id", "inbox"),
+                    delta_link=arguments.get("delta_link"),
+                    reset=arguments.get("reset", False),
+                    select=arguments.get("select"),
+                    received_after=arguments.get("received_after"),
+                    max_changes=arguments.get("max_changes", 200)
+                )
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=json.dumps(result, indent=2),
+                    )
+                ]
+            except Exception as e:
+                logger.exception(f"Error syncing folder: {e}")
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Error: {str(e)}",
+                    )
+                ]
     #-------------------------------------------------------------------------
 
     # Set up SSE transport
@@ -897,13 +1091,15 @@ def main(
 
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
-        """Context manager for session manager."""
+        """Context manager for session manager and shared HTTP client."""
+        await init_http_clients()
         async with session_manager.run():
             logger.info("Application started with dual transports!")
             try:
                 yield
             finally:
                 logger.info("Application shutting down...")
+                await close_http_clients()
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
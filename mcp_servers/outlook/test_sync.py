@@ -0,0 +1,74 @@
+"""
+Tests for folder sync with delta links, against a mocked Microsoft Graph.
+
+Run from this directory: python -m pytest test_sync.py
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from tools import base, sync
+
+GRAPH = "https://graph.microsoft.com/v1.0"
+DELTA_URL = f"{GRAPH}/me/mailFolders/inbox/messages/delta"
+
+
+@pytest.fixture
+def graph(monkeypatch):
+    """Serve delta pages from a dict of URL -> JSON body and record requested URLs."""
+    pages = {}
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        url = str(request.url.copy_with(query=None))
+        requested.append(url)
+        return httpx.Response(200, json=pages[url])
+
+    monkeypatch.setattr(base, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(sync, "_delta_links", type(sync._delta_links)())
+    token = base.auth_token_context.set("token")
+    yield pages, requested
+    base.auth_token_context.reset(token)
+
+
+def test_sync_follows_and_stores_graph_links(graph):
+    pages, requested = graph
+    pages[DELTA_URL] = {"value": [{"id": "1"}], "@odata.nextLink": f"{GRAPH}/me/mailFolders/inbox/messages/page2"}
+    pages[f"{GRAPH}/me/mailFolders/inbox/messages/page2"] = {
+        "value": [{"id": "2", "@removed": {"reason": "deleted"}}],
+        "@odata.deltaLink": f"{GRAPH}/me/mailFolders/inbox/messages/next?token=abc",
+    }
+
+    result = asyncio.run(sync.outlookMail_sync_folder())
+
+    assert [m["id"] for m in result["changed"]] == ["1"]
+    assert result["removed"] == ["2"]
+    assert result["delta_link"] == f"{GRAPH}/me/mailFolders/inbox/messages/next?token=abc"
+    assert list(sync._delta_links.values()) == [f"{GRAPH}/me/mailFolders/inbox/messages/next?token=abc"]
+
+
+@pytest.mark.parametrize("link", [
+    "https://attacker.example/steal",
+    "https://graph.microsoft.com.attacker.example/v1.0/me/delta",
+    "https://graph.microsoft.com/v1.0@attacker.example/me/delta",
+])
+def test_foreign_delta_link_is_refused(graph, link):
+    _, requested = graph
+
+    result = asyncio.run(sync.outlookMail_sync_folder(delta_link=link))
+
+    assert "error" in result
+    assert requested == []
+
+
+def test_foreign_link_from_response_is_not_followed(graph):
+    pages, requested = graph
+    pages[DELTA_URL] = {"value": [{"id": "1"}], "@odata.nextLink": "https://attacker.example/steal"}
+
+    result = asyncio.run(sync.outlookMail_sync_folder())
+
+    assert "error" in result
+    assert requested == [DELTA_URL]
+    assert not sync._delta_links
@@ -26,6 +26,16 @@ outlookMail_send_draft,
 outlookMail_move_message
 )
 
+from .batch import (
+outlookMail_batch_read_messages,
+outlookMail_batch_move_messages,
+outlookMail_batch_delete_messages,
+)
+
+from .sync import (
+outlookMail_sync_folder,
+)
+
 __all__ = [
     #base.py
     "auth_token_context",
@@ -48,5 +58,13 @@ __all__ = [
     "outlookMail_update_draft",
     "outlookMail_create_forward_draft",
     "outlookMail_list_messages_from_folder",
-    "outlookMail_move_message"
+    "outlookMail_move_message",
+
+    #batch.py
+    "outlookMail_batch_read_messages",
+    "outlookMail_batch_move_messages",
+    "outlookMail_batch_delete_messages",
+
+    #sync.py
+    "outlookMail_sync_folder",
 ]
\ No newline at end of file
@@ -0,0 +1,197 @@
+import asyncio
+import logging
+import os
+
+from .base import get_outlookMail_client, get_http_client
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Microsoft Graph accepts at most 20 sub-requests in one $batch request
+GRAPH_BATCH_MAX_REQUESTS = 20
+
+# Batches sent at a time; Outlook throttles more than 4 concurrent requests per mailbox
+BATCH_MAX_CONCURRENT_REQUESTS = int(os.getenv("OUTLOOK_BATCH_MAX_CONCURRENT_REQUESTS", "2"))
+
+# Sub-requests throttled with 429 are resent this many times, after their Retry-After
+BATCH_MAX_RETRIES = 3
+BATCH_MAX_RETRY_AFTER_SECONDS = 30
+
+
+def _retry_after(response: dict) -> float:
+    headers = {key.lower(): value for key, value in (response.get("headers") or {}).items()}
+    try:
+        return min(float(headers.get("retry-after", 1)), BATCH_MAX_RETRY_AFTER_SECONDS)
+    except (TypeError, ValueError):
+        return 1.0
+
+
+async def _send_batch(client: dict, requests: list) -> dict:
+    """POST up to 20 sub-requests to $batch, returning the responses by sub-request id."""
+    httpx_client = get_http_client()
+    response = await httpx_client.post(
+        f"{client['base_url']}/$batch",
+        headers={**client['headers'], "Content-Type": "application/json"},
+        json={"requests": requests},
+    )
+    response.raise_for_status()
+    return {item["id"]: item for item in response.json().get("responses", [])}
+
+
+async def graph_batch(client: dict, requests: list) -> list:
+    """
+    Run Microsoft Graph requests through JSON batching.
+
+    Args:
+        client (dict): Outlook client from get_outlookMail_client().
+        requests (list): Sub-requests as dicts with "method", a "url" relative to
+            the API version (e.g. "/me/messages/{id}") and optionally "body".
+
+    Returns:
+        list: One response dict per request, in request order, with "status",
+              "headers" and "body". Requests are sent 20 per batch; sub-requests
+              throttled with 429 are retried after their Retry-After delay.
+
+    Notes:
+        - Batches are sent concurrently, at most OUTLOOK_BATCH_MAX_CONCURRENT_REQUESTS
+          at a time. Sub-requests of one batch have no ordering guarantee.
+    """
+    pending = {}
+    for index, request in enumerate(requests):
+        sub_request = {"id": str(index), "method": request["method"], "url": request["url"]}
+        if request.get("body") is not None:
+            sub_request["body"] = request["body"]
+            sub_request["headers"] = {"Content-Type": "application/json"}
+        pending[sub_request["id"]] = sub_request
+
+    responses = {}
+    semaphore = asyncio.Semaphore(BATCH_MAX_CONCURRENT_REQUESTS)
+
+    async def send(chunk: list) -> dict:
+        async with semaphore:
+            return await _send_batch(client, chunk)
+
+    for attempt in range(BATCH_MAX_RETRIES + 1):
+        sub_requests = list(pending.values())
+        chunks = [
+            sub_requests[start:start + GRAPH_BATCH_MAX_REQUESTS]
+            for start in range(0, len(sub_requests), GRAPH_BATCH_MAX_REQUESTS)
+        ]
+        for chunk_responses in await asyncio.gather(*(send(chunk) for chunk in chunks)):
+            responses.update(chunk_responses)
+
+        throttled = {
+            request_id: request for request_id, request in pending.items()
+            if responses.get(request_id, {}).get("status") == 429
+        }
+        if not throttled or attempt == BATCH_MAX_RETRIES:
+            break
+        delay = max(_retry_after(responses[request_id]) for request_id in throttled)
+        logger.info(f"Retrying {len(throttled)} throttled batch sub-requests in {delay}s")
+        await asyncio.sleep(delay)
+        pending = throttled
+
+    return [
+        responses.get(str(index), {"status": 500, "body": {"error": {"message": "No response in batch"}}})
+        for index in range(len(requests))
+    ]
+
+
+def _error_message(response: dict) -> str:
+    body = response.get("body")
+    if isinstance(body, dict) and isinstance(body.get("error"), dict):
+        return body["error"].get("message") or body["error"].get("code", "")
+    return f"Unexpected response: {response.get('status')}"
+
+
+async def _run_message_batch(message_ids: list, requests: list, action: str) -> dict:
+    """Send one sub-request per message and collect per-message results."""
+    client = get_outlookMail_client()
+    if not client:
+        logger.error("Could not get Outlook client")
+        return {"error": "Could not get Outlook client"}
+
+    try:
+        responses = await graph_batch(client, requests)
+    except Exception as e:
+        logger.error(f"Could not {action} Outlook messages in batch: {e}")
+        return {"error": f"Could not {action} Outlook messages in batch: {e}"}
+
+    results = []
+    for message_id, response in zip(message_ids, responses):
+        if 200 <= response.get("status", 500) < 300:
+            result = {"message_id": message_id, "status": "success"}
+            if response.get("body"):
+                result["message"] = response["body"]
+        else:
+            result = {"message_id": message_id, "status": "error", "error": _error_message(response)}
+        results.append(result)
+
+    succeeded = sum(1 for result in results if result["status"] == "success")
+    return {"succeeded": succeeded, "failed": len(results) - succeeded, "results": results}
+
+
+async def outlookMail_batch_read_messages(message_ids: list, select: str = None) -> dict:
+    """
+    Read several Outlook mail messages with Graph JSON batching (20 messages per request).
+
+    Args:
+        message_ids (list): IDs of the messages to read.
+        select (str, optional): Comma-separated list of fields to include in each message.
+            Example: "subject,from,receivedDateTime,bodyPreview"
+
+    Returns:
+        dict: Per-message results in the order of message_ids, each with the message
+              object or an error, and the number of messages read and failed.
+    """
+    # Each message is handled once, however often it is listed
+    message_ids = list(dict.fromkeys(message_ids))
+    query = f"?$select={select}" if select else ""
+    requests = [{"method": "GET", "url": f"/me/messages/{message_id}{query}"} for message_id in message_ids]
+    return await _run_message_batch(message_ids, requests, "read")
+
+
+async def outlookMail_batch_move_messages(message_ids: list, destination_folder_id: str) -> dict:
+    """
+    Move several Outlook mail messages to another folder with Graph JSON batching.
+
+    Args:
+        message_ids (list): IDs of the messages to move.
+        destination_folder_id (str): ID of the target folder.
+                                     Example: 'archive' or actual folder ID.
+
+    Returns:
+        dict: Per-message results in the order of message_ids, each with the moved
+              message (which has a new ID) or an error, and the number moved and failed.
+    """
+    # Each message is handled once, however often it is listed
+    message_ids = list(dict.fromkeys(message_ids))
+    requests = [
+        {
+            "method": "POST",
+            "url": f"/me/messages/{message_id}/move",
+            "body": {"destinationId": destination_folder_id},
+        }
+        for message_id in message_ids
+    ]
+    return await _run_message_batch(message_ids, requests, "move")
+
+
+async def outlookMail_batch_delete_messages(message_ids: list) -> dict:
+    """
+    Delete several Outlook mail messages with Graph JSON batching.
+
+    Args:
+        message_ids (list): IDs of the messages to delete.
+
+    Returns:
+        dict: Per-message results in the order of message_ids, and the number
+              of messages deleted and failed.
+
+    Notes:
+        - Deleted messages are moved to the Deleted Items folder.
+    """
+    # Each message is handled once, however often it is listed
+    message_ids = list(dict.fromkeys(message_ids))
+    requests = [{"method": "DELETE", "url": f"/me/messages/{message_id}"} for message_id in message_ids]
+    return await _run_message_batch(message_ids, requests, "delete")
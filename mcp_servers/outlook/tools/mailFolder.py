@@ -1,6 +1,5 @@
-import httpx
 import logging
-from .base import get_outlookMail_client
+from .base import get_outlookMail_client, get_http_client
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -26,8 +25,8 @@ async def outlookMail_list_folders(include_hidden: bool = True) -> dict:
         params["includeHiddenFolders"] = "true"
 
     try:
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.get(url, headers=client['headers'], params=params)
+        httpx_client = get_http_client()
+        response = await httpx_client.get(url, headers=client['headers'], params=params)
         response.raise_for_status()
         return response.json()
     except Exception as e:
@@ -70,8 +69,8 @@ async def outlookMail_get_messages_from_folder(
         params['$select'] = select
 
     try:
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.get(url, headers=client['headers'], params=params)
+        httpx_client = get_http_client()
+        response = await httpx_client.get(url, headers=client['headers'], params=params)
         response.raise_for_status()
         return response.json()
     except Exception as e:
@@ -97,10 +96,10 @@ async def outlookMail_get_mail_folder_details(folder_id: str) -> dict:
     url = f"{client['base_url']}/me/mailFolders/{folder_id}"
 
     try:
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.get(url, headers=client['headers'])
-            response.raise_for_status()
-            return response.json()
+        httpx_client = get_http_client()
+        response = await httpx_client.get(url, headers=client['headers'])
+        response.raise_for_status()
+        return response.json()
     except Exception as e:
         logging.error(f"Could not get mail folder at {url}: {e}")
         return {"error": f"Could not get mail folder at {url}"}
@@ -132,10 +131,10 @@ async def outlookMail_create_mail_folder(
     }
 
     try:
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.post(url, headers=client['headers'], json=payload)
-            response.raise_for_status()
-            return response.json()
+        httpx_client = get_http_client()
+        response = await httpx_client.post(url, headers=client['headers'], json=payload)
+        response.raise_for_status()
+        return response.json()
     except Exception as e:
         logging.error(f"Could not create mail folder at {url}: {e}")
         return {"error": f"Could not create mail folder at {url}"}
@@ -163,10 +162,10 @@ async def outlookMail_update_folder_display_name(
     payload = {"displayName": display_name}
 
     try:
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.patch(url, headers=client['headers'], json=payload)
-            response.raise_for_status()
-            return response.json()
+        httpx_client = get_http_client()
+        response = await httpx_client.patch(url, headers=client['headers'], json=payload)
+        response.raise_for_status()
+        return response.json()
     except Exception as e:
         logging.error(f"Failed to update folder at {url}: {e}")
         return {"error": f"Failed to update folder at {url}"}
@@ -189,8 +188,8 @@ async def outlookMail_delete_folder(folder_id: str) -> dict:
     url = f"{client['base_url']}/me/mailFolders/{folder_id}"
 
     try:
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.delete(url, headers=client['headers'])
+        httpx_client = get_http_client()
+        response = await httpx_client.delete(url, headers=client['headers'])
         if response.status_code == 204:
             logging.info(f"Deleted folder with ID {folder_id}")
             return {"message": f"Folder {folder_id} deleted successfully"}
@@ -1,6 +1,5 @@
-import httpx
 import logging
-from .base import get_outlookMail_client
+from .base import get_outlookMail_client, get_http_client
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -62,9 +61,9 @@ async def outlookMail_list_messages(
         params['$select'] = select
 
     try:
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.get(url, headers=client['headers'], params=params)
-            return response.json()
+        httpx_client = get_http_client()
+        response = await httpx_client.get(url, headers=client['headers'], params=params)
+        return response.json()
     except Exception as e:
         logger.error(f"Could not get Outlook messages from {url}: {e}")
         return {"error": f"Could not get Outlook messages from {url}"}
@@ -130,9 +129,9 @@ async def outlookMail_list_messages_from_folder(
         params['$select'] = select
 
     try:
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.get(url, headers=client['headers'], params=params)
-            return response.json()
+        httpx_client = get_http_client()
+        response = await httpx_client.get(url, headers=client['headers'], params=params)
+        return response.json()
     except Exception as e:
         logger.error(f"Could not get Outlook messages from {url}: {e}")
         return {"error": f"Could not get Outlook messages from {url}"}
@@ -154,9 +153,9 @@ async def outlookMail_read_message(message_id: str) -> dict:
     if not client:
         logger.error("Could not get Outlook client")
         return {"error": "Could not get Outlook client"}
-    async with httpx.AsyncClient() as httpx_client:
-        res = await httpx_client.get(url, headers=client['headers'])
-        return res.json()
+    httpx_client = get_http_client()
+    res = await httpx_client.get(url, headers=client['headers'])
+    return res.json()
 
 
 async def outlookMail_create_draft(
@@ -216,10 +215,10 @@ async def outlookMail_create_draft(
             payload[key] = [{"emailAddress": {"address": email}} for email in emails]
 
     try:
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.post(url, headers=client['headers'], json=payload)
-            response.raise_for_status()
-            return response.json()
+        httpx_client = get_http_client()
+        response = await httpx_client.post(url, headers=client['headers'], json=payload)
+        response.raise_for_status()
+        return response.json()
     except Exception as e:
         logger.error(f"Could not create Outlook draft message at {url}: {e}")
         return {"error": f"Could not create Outlook draft message at {url}"}
@@ -317,10 +316,10 @@ async def outlookMail_update_draft(
             payload[key] = [{"emailAddress": {"address": email}} for email in emails]
 
     try:
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.patch(url, headers=client['headers'], json=payload)
-            response.raise_for_status()
-            return response.json()
+        httpx_client = get_http_client()
+        response = await httpx_client.patch(url, headers=client['headers'], json=payload)
+        response.raise_for_status()
+        return response.json()
     except Exception as e:
         logger.error(f"Could not update Outlook draft message at {url}: {e}")
         return {"error": f"Could not update Outlook draft message at {url}"}
@@ -346,8 +345,8 @@ async def outlookMail_delete_draft(message_id: str) -> dict:
 
     try:
         logger.info(f"Deleting draft Outlook mail message at {url}")
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.delete(url, headers=client['headers'])
+        httpx_client = get_http_client()
+        response = await httpx_client.delete(url, headers=client['headers'])
         if response.status_code == 204:
             return {"Success":"Deleted"}
         else:
@@ -398,9 +397,9 @@ async def outlookMail_create_forward_draft(
     }
 
     try:
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.post(url, headers=client['headers'], json=payload)
-            return response.json()
+        httpx_client = get_http_client()
+        response = await httpx_client.post(url, headers=client['headers'], json=payload)
+        return response.json()
     except Exception as e:
         logger.error(f"Could not create Outlook forward draft message at {url}: {e}")
         return {"error": f"Could not create Outlook forward draft message at {url}"}
@@ -434,9 +433,9 @@ async def outlookMail_create_reply_draft(
 
 
     try:
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.post(url, headers=client['headers'], json=payload)
-            return response.json()
+        httpx_client = get_http_client()
+        response = await httpx_client.post(url, headers=client['headers'], json=payload)
+        return response.json()
     except Exception as e:
         logger.error(f"Could not create Outlook reply draft message at {url}: {e}")
         return {"error": f"Could not create Outlook reply draft message at {url}"}
@@ -469,9 +468,9 @@ async def outlookMail_create_reply_all_draft(
     }
 
     try:
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.post(url, headers=client['headers'], json=payload)
-            return response.json()
+        httpx_client = get_http_client()
+        response = await httpx_client.post(url, headers=client['headers'], json=payload)
+        return response.json()
     except Exception as e:
         logger.error(f"Could not create reply-all draft at {url}: {e}")
         return {"error": f"Could not create reply-all draft at {url}"}
@@ -494,8 +493,8 @@ async def outlookMail_send_draft(message_id: str) -> dict:
     url = f"{client['base_url']}/me/messages/{message_id}/send"
 
     try:
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.post(url, headers=client['headers'])
+        httpx_client = get_http_client()
+        response = await httpx_client.post(url, headers=client['headers'])
         if response.status_code == 202 or response.status_code == 200 or response.status_code == 204:
             logger.info("Draft sent successfully")
             return {"success": "Draft sent successfully"}
@@ -536,9 +535,9 @@ async def outlookMail_move_message(
     }
 
     try:
-        async with httpx.AsyncClient() as httpx_client:
-            response = await httpx_client.post(url, headers=client['headers'], json=payload)
-            return response.json()
+        httpx_client = get_http_client()
+        response = await httpx_client.post(url, headers=client['headers'], json=payload)
+        return response.json()
     except Exception as e:
         logger.error(f"Could not move Outlook mail message at {url}: {e}")
         return {"error": f"Could not move Outlook mail message at {url}"}
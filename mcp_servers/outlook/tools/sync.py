@@ -0,0 +1,144 @@
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+
+from .base import get_outlookMail_client, get_auth_token, get_http_client
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Delta links kept in memory, one per (user, folder), least recently used evicted first
+DELTA_LINK_STORE_MAX_SIZE = int(os.getenv("OUTLOOK_DELTA_LINK_STORE_MAX_SIZE", "1024"))
+
+# Page size asked of the delta query (Graph caps message pages)
+DELTA_PAGE_SIZE = 50
+DEFAULT_SYNC_MAX_CHANGES = 200
+
+_delta_links: "OrderedDict[tuple, str]" = OrderedDict()
+
+
+def token_cache_key(token: str) -> str:
+    """Hash a token so it is never kept in cache keys verbatim."""
+    return hashlib.sha256((token or "").encode("utf-8")).hexdigest()
+
+
+def _is_graph_link(client: dict, link: str) -> bool:
+    """Whether a link points into the Graph API, so the bearer token may be sent to it."""
+    return isinstance(link, str) and link.startswith(f"{client['base_url']}/")
+
+
+def _store_delta_link(key: tuple, link: str) -> None:
+    _delta_links[key] = link
+    _delta_links.move_to_end(key)
+    while len(_delta_links) > DELTA_LINK_STORE_MAX_SIZE:
+        _delta_links.popitem(last=False)
+
+
+async def outlookMail_sync_folder(
+        folder_id: str = "inbox",
+        delta_link: str = None,
+        reset: bool = False,
+        select: str = None,
+        received_after: str = None,
+        max_changes: int = DEFAULT_SYNC_MAX_CHANGES
+) -> dict:
+    """
+    Get the messages added, changed or removed in a mail folder since the last sync.
+
+    Uses the Microsoft Graph delta query. The first sync of a folder returns its
+    messages; later syncs return only the changes since the previous one. The
+    delta link of the last sync is stored per user and folder, so repeated calls
+    need no arguments besides the folder.
+
+    Args:
+        folder_id (str, optional): ID or well-known name of the folder. Defaults to 'inbox'.
+        delta_link (str, optional): Delta link returned by an earlier sync to continue
+            from, instead of the stored one (e.g. after a server restart). Only
+            Microsoft Graph links are accepted.
+        reset (bool, optional): Discard the stored delta link and sync from scratch.
+        select (str, optional): Comma-separated list of fields to include in each message.
+            Example: "subject,from,receivedDateTime,isRead"
+        received_after (str, optional): On a sync from scratch, only include messages
+            received at or after this ISO 8601 time (e.g. "2025-07-01T00:00:00Z").
+        max_changes (int, optional): Stop fetching pages once this many changes were
+            returned. Defaults to 200. If more changes are pending, has_more is true
+            and the next call continues where this one stopped.
+
+    Returns:
+        dict: changed (added or updated messages), removed (IDs of messages deleted or
+              moved out of the folder), delta_link for the next sync, has_more, and
+              initial_sync (true when the sync started from scratch).
+    """
+    client = get_outlookMail_client()
+    if not client:
+        logger.error("Could not get Outlook client")
+        return {"error": "Could not get Outlook client"}
+
+    if delta_link and not _is_graph_link(client, delta_link):
+        logger.error(f"Refusing delta link outside Microsoft Graph for folder {folder_id}")
+        return {"error": f"delta_link must be a Microsoft Graph link starting with {client['base_url']}/"}
+
+    key = (token_cache_key(get_auth_token()), folder_id)
+    if reset:
+        _delta_links.pop(key, None)
+    link = delta_link or _delta_links.get(key)
+
+    initial_url = f"{client['base_url']}/me/mailFolders/{folder_id}/messages/delta"
+    initial_params = {}
+    if select:
+        initial_params['$select'] = select
+    if received_after:
+        initial_params['$filter'] = f"receivedDateTime ge {received_after}"
+
+    headers = {**client['headers'], "Prefer": f"odata.maxpagesize={DELTA_PAGE_SIZE}"}
+    initial_sync = link is None
+    url, params = (initial_url, initial_params) if initial_sync else (link, None)
+
+    changed, removed = [], []
+    next_link, has_more = None, False
+    try:
+        httpx_client = get_http_client()
+        while True:
+            response = await httpx_client.get(url, headers=headers, params=params)
+            if response.status_code == 410 and not initial_sync:
+                # The sync state expired on the server; start over
+                logger.info(f"Delta link for folder {folder_id} expired, syncing from scratch")
+                initial_sync = True
+                url, params = initial_url, initial_params
+                changed, removed = [], []
+                continue
+            response.raise_for_status()
+            data = response.json()
+
+            for message in data.get("value", []):
+                if "@removed" in message:
+                    removed.append(message.get("id"))
+                else:
+                    changed.append(message)
+
+            # A delta link ends this sync; a next link resumes it where this page ended
+            next_link = data.get("@odata.deltaLink") or data.get("@odata.nextLink")
+            if next_link and not _is_graph_link(client, next_link):
+                raise ValueError("Graph returned a sync link outside Microsoft Graph")
+            if "@odata.deltaLink" in data or not next_link:
+                break
+            if len(changed) + len(removed) >= max_changes:
+                has_more = True
+                break
+            url, params = next_link, None
+    except Exception as e:
+        logger.error(f"Could not sync Outlook folder {folder_id}: {e}")
+        return {"error": f"Could not sync Outlook folder {folder_id}: {e}"}
+
+    if next_link:
+        _store_delta_link(key, next_link)
+
+    return {
+        "folder_id": folder_id,
+        "initial_sync": initial_sync,
+        "changed": changed,
+        "removed": removed,
+        "has_more": has_more,
+        "delta_link": next_link,
+    }
@@ -22,6 +22,7 @@ from tools import (
     perplexity_search,
     perplexity_reason,
 )
+from tools.base import init_http_clients, close_http_clients
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -208,13 +209,15 @@ def main(
 
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
-        """Context manager for session manager."""
+        """Context manager for session manager and shared HTTP client."""
+        await init_http_clients()
         async with session_manager.run():
             logger.info("Perplexity AI MCP Server started with dual transports!")
             try:
                 yield
             finally:
                 logger.info("Perplexity AI MCP Server shutting down...")
+                await close_http_clients()
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
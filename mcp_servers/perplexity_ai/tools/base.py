@@ -1,6 +1,8 @@
 import logging
 from typing import Any, Dict, Optional
 from contextvars import ContextVar
+import http.cookiejar
+import importlib.util
 import httpx
 
 # Configure logging
@@ -8,6 +10,45 @@ logger = logging.getLogger(__name__)
 
 PERPLEXITY_API_BASE_URL = "https://api.perplexity.ai"
 
+# Shared HTTP client, reused across tool calls so connections stay pooled
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            # Reject all cookies: the client is shared across tenants
+            cookies=http.cookiejar.CookieJar(
+                policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+            ),
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=60.0,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _http_client
+
+
+async def init_http_clients() -> None:
+    """Create the shared HTTP client (called from the server lifespan)."""
+    get_http_client()
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP client on server shutdown."""
+    global _http_client
+    if _http_client is not None:
+        try:
+            await _http_client.aclose()
+        finally:
+            _http_client = None
+
+
 # Context variable to store the API key for each request
 auth_token_context: ContextVar[str] = ContextVar('auth_token')
 
@@ -34,17 +75,17 @@ async def make_perplexity_request(
     
     url = f"{PERPLEXITY_API_BASE_URL}/{endpoint.lstrip('/')}"
     
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        if method.upper() == "GET":
-            response = await client.get(url, headers=headers, params=params)
-        elif method.upper() == "POST":
-            response = await client.post(url, headers=headers, json=data, params=params)
-        elif method.upper() == "PUT":
-            response = await client.put(url, headers=headers, json=data, params=params)
-        elif method.upper() == "DELETE":
-            response = await client.delete(url, headers=headers, params=params)
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
-        
-        response.raise_for_status()
-        return response.json()
+    client = get_http_client()
+    if method.upper() == "GET":
+        response = await client.get(url, headers=headers, params=params)
+    elif method.upper() == "POST":
+        response = await client.post(url, headers=headers, json=data, params=params)
+    elif method.upper() == "PUT":
+        response = await client.put(url, headers=headers, json=data, params=params)
+    elif method.upper() == "DELETE":
+        response = await client.delete(url, headers=headers, params=params)
+    else:
+        raise ValueError(f"Unsupported HTTP method: {method}")
+    
+    response.raise_for_status()
+    return response.json()
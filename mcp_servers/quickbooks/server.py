@@ -24,7 +24,7 @@ from starlette.responses import Response
 from starlette.routing import Mount, Route
 from starlette.types import Receive, Scope, Send
 
-from tools import accounts, invoices, customers, payments, vendors
+from tools import accounts, invoices, customers, payments, vendors, batch
 from session_manager import SessionManager
 
 # Configure logging
@@ -49,7 +49,7 @@ server = Server("quickbooks-mcp-server")
 async def list_tools() -> list[types.Tool]:
     """List available QuickBooks tools."""
     tool_list = [*accounts.tools, *invoices.tools, *
-                 customers.tools, *payments.tools, *vendors.tools]
+                 customers.tools, *payments.tools, *vendors.tools, *batch.tools]
     logger.debug(f"Available tools: {[tool.name for tool in tool_list]}")
     return tool_list
 
@@ -75,14 +75,18 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
 
     try:
         # Get session for this request
-        session = session_manager_instance.get_session(
-            qb_access_token, qb_realm_id, qb_environment)
+        async with session_manager_instance.use_session(
+                qb_access_token, qb_realm_id, qb_environment) as session:
+            return await run_session_tool(session, name, arguments)
     except ValueError as e:
         return [types.TextContent(
             type="text",
             text=f"Configuration error: {str(e)}. Please provide qb_access_token and qb_realm_id in the request arguments, or set QB_ACCESS_TOKEN and QB_REALM_ID environment variables, or provide credentials via HTTP headers (x-qb-access-token, x-qb-realm-id, x-qb-environment)."
         )]
 
+
+async def run_session_tool(session, name: str, arguments: dict[str, Any]) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    """Run a tool against the managers of a QuickBooks session."""
     # Map tools to session managers
     tool_map = {
         "quickbooks_list_accounts": session.account_manager.list_accounts,
@@ -120,6 +124,8 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
         "quickbooks_activate_vendor": session.vendor_manager.activate_vendor,
         "quickbooks_deactivate_vendor": session.vendor_manager.deactivate_vendor,
         "quickbooks_search_vendors": session.vendor_manager.search_vendors,
+        "quickbooks_batch": session.batch_manager.batch,
+        "quickbooks_change_data_capture": session.batch_manager.change_data_capture,
     }
 
     if name not in tool_map:
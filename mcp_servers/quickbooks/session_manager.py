@@ -3,9 +3,13 @@ Session-based QuickBooks configuration management for MCP server.
 Allows clients to provide QB credentials via headers or initialization.
 """
 
+import contextlib
+import hashlib
 import json
 import logging
-from typing import Dict, Any, Optional, Tuple
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, List, Optional, Tuple
 import os
 import base64
 
@@ -15,9 +19,14 @@ from tools.invoices import InvoiceManager
 from tools.customers import CustomerManager
 from tools.payments import PaymentManager
 from tools.vendors import VendorManager
+from tools.batch import BatchManager
 
 logger = logging.getLogger(__name__)
 
+# Sessions are kept per access token; tokens rotate hourly, so idle sessions are dropped
+SESSION_CACHE_MAX_SIZE = int(os.getenv("QB_SESSION_CACHE_MAX_SIZE", "256"))
+SESSION_IDLE_TTL_SECONDS = float(os.getenv("QB_SESSION_IDLE_TTL_SECONDS", "3600"))
+
 
 class QuickBooksSession:
     """Represents a QuickBooks session with specific credentials."""
@@ -38,6 +47,11 @@ class QuickBooksSession:
         self.customer_manager = CustomerManager(self.client)
         self.payment_manager = PaymentManager(self.client)
         self.vendor_manager = VendorManager(self.client)
+        self.batch_manager = BatchManager(self.client)
+
+        self.last_used = time.monotonic()
+        self.active_calls = 0
+        self.retired = False
         
         logger.info(f"QuickBooks session created for realm: {realm_id or 'env'}")
     
@@ -45,12 +59,22 @@ class QuickBooksSession:
         """Close the session and cleanup resources."""
         await self.client.close()
 
+    async def retire(self):
+        """Close the session once no tool call is using it any more."""
+        self.retired = True
+        if not self.active_calls:
+            await self.close()
+
 
 class SessionManager:
     """Manages QuickBooks sessions and routes requests to appropriate sessions."""
     
-    def __init__(self):
-        self.sessions: Dict[str, QuickBooksSession] = {}
+    def __init__(self, max_sessions: int = SESSION_CACHE_MAX_SIZE, idle_ttl: float = SESSION_IDLE_TTL_SECONDS):
+        # LRU order: least recently used sessions first
+        self.sessions: "OrderedDict[str, QuickBooksSession]" = OrderedDict()
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self._evicted: List[QuickBooksSession] = []
         self.default_session: Optional[QuickBooksSession] = None
         
         # Try to create a default session from environment variables
@@ -61,8 +85,18 @@ class SessionManager:
             logger.warning("No default QuickBooks session available. Clients must provide credentials.")
     
     def create_session_key(self, access_token: str = None, realm_id: str = None, environment: str = None) -> str:
-        """Create a unique key for session caching."""
-        return f"{access_token or 'env'}_{realm_id or 'env'}_{environment or 'env'}"
+        """Create a unique key for session caching; the token is hashed, never kept verbatim."""
+        token_hash = hashlib.sha256(access_token.encode("utf-8")).hexdigest() if access_token else 'env'
+        return f"{token_hash}_{realm_id or 'env'}_{environment or 'env'}"
+
+    def _evict(self, now: float) -> None:
+        """Drop idle sessions and the least recently used ones beyond max_sessions."""
+        while self.sessions:
+            key, session = next(iter(self.sessions.items()))
+            if len(self.sessions) <= self.max_sessions and now - session.last_used < self.idle_ttl:
+                break
+            del self.sessions[key]
+            self._evicted.append(session)
     
     def get_session(self, access_token: str = None, realm_id: str = None, environment: str = None) -> QuickBooksSession:
         """Get or create a session for the given credentials."""
@@ -73,17 +107,44 @@ class SessionManager:
             raise ValueError("No credentials provided and no default session available")
         
         # Check cache
+        now = time.monotonic()
         session_key = self.create_session_key(access_token, realm_id, environment)
-        if session_key in self.sessions:
-            return self.sessions[session_key]
+        session = self.sessions.get(session_key)
+        if session is not None and now - session.last_used < self.idle_ttl:
+            session.last_used = now
+            self.sessions.move_to_end(session_key)
+            return session
         
         # Create new session
         try:
             session = QuickBooksSession(access_token, realm_id, environment)
-            self.sessions[session_key] = session
-            return session
         except ValueError as e:
             raise ValueError(f"Failed to create QuickBooks session: {str(e)}")
+        if session_key in self.sessions:
+            self._evicted.append(self.sessions.pop(session_key))
+        self.sessions[session_key] = session
+        self._evict(now)
+        return session
+
+    @contextlib.asynccontextmanager
+    async def use_session(self, access_token: str = None, realm_id: str = None, environment: str = None) -> AsyncIterator[QuickBooksSession]:
+        """
+        Get a session for the duration of a tool call.
+
+        Sessions evicted from the cache are closed here, but only after the
+        tool calls still using them have finished.
+        """
+        session = self.get_session(access_token, realm_id, environment)
+        session.active_calls += 1
+        try:
+            evicted, self._evicted = self._evicted, []
+            for old_session in evicted:
+                await old_session.retire()
+            yield session
+        finally:
+            session.active_calls -= 1
+            if session.retired and not session.active_calls:
+                await session.close()
     
     def extract_credentials_from_headers(self, request_or_scope) -> Tuple[str, str, str]:
         """Extract QuickBooks credentials from request headers.
@@ -126,8 +187,9 @@ class SessionManager:
         if self.default_session:
             await self.default_session.close()
         
-        for session in self.sessions.values():
+        for session in [*self.sessions.values(), *self._evicted]:
             await session.close()
         
         self.sessions.clear()
+        self._evicted.clear()
         logger.info("All QuickBooks sessions cleaned up")
@@ -232,19 +232,14 @@ class AccountManager:
         if not account_id:
             raise ValueError("Id is required for updating an account")
 
-        # Auto-fetch current sync token
-        current_account_response = await self.client._get(f"account/{account_id}")
-        sync_token = current_account_response.get(
-            'Account', {}).get('SyncToken', '0')
-
         account_data = mcp_object_to_account_data(**kwargs)
         account_data.update({
             "Id": account_id,
-            "SyncToken": sync_token,
             "sparse": True,
         })
 
-        response = await self.client._post('account', account_data)
+        # The client supplies the current sync token
+        response = await self.client.post_with_sync_token('Account', account_data)
         return account_data_to_mcp_object(response['Account'])
 
     async def search_accounts(self, **kwargs) -> List[Dict[str, Any]]:
@@ -0,0 +1,174 @@
+from typing import Any, Dict, List, Optional
+
+from mcp.types import Tool
+import mcp.types as types
+from .http_client import QuickBooksHTTPClient, BATCH_MAX_ITEMS
+from .accounts import account_data_to_mcp_object
+from .customers import customer_data_to_mcp_object
+from .invoices import invoice_data_to_mcp_object
+from .payments import payment_data_to_mcp_object
+from .vendors import vendor_data_to_mcp_object
+
+# Entities the change data capture tool supports, with their MCP converters
+CDC_ENTITIES = {
+    "Invoice": invoice_data_to_mcp_object,
+    "Customer": customer_data_to_mcp_object,
+    "Payment": payment_data_to_mcp_object,
+    "Vendor": vendor_data_to_mcp_object,
+    "Account": account_data_to_mcp_object,
+}
+
+# QuickBooks returns at most this many changed objects per entity in one CDC call
+CDC_MAX_RESULTS_PER_ENTITY = 1000
+
+batch_tool = Tool(
+    name="quickbooks_batch",
+    title="Batch Operations",
+    description="Batch Operations - Run several create, update, delete or query operations in QuickBooks with one request per 30 operations. Update and delete operations without a SyncToken get it filled in automatically",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "Operations": {
+                "type": "array",
+                "description": "Operations in QuickBooks BatchItemRequest format, e.g. {\"operation\": \"update\", \"Invoice\": {\"Id\": \"42\", \"sparse\": true, \"DueDate\": \"2025-01-31\"}} or {\"Query\": \"select * from Customer where Active = true\"}. An optional bId identifies the operation in the results",
+                "items": {"type": "object"}
+            }
+        },
+        "required": ["Operations"]
+    },
+    annotations=types.ToolAnnotations(**{"category": "QUICKBOOKS_BATCH"})
+)
+
+change_data_capture_tool = Tool(
+    name="quickbooks_change_data_capture",
+    title="Change Data Capture",
+    description="Change Data Capture - Get the invoices, customers, payments, vendors or accounts created, updated or deleted since a timestamp (at most 30 days ago). Use the returned Time as ChangedSince of the next call for incremental sync",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "ChangedSince": {
+                "type": "string",
+                "description": "ISO 8601 timestamp, e.g. 2025-01-01T00:00:00-08:00 or 2025-01-01"
+            },
+            "Entities": {
+                "type": "array",
+                "items": {"type": "string", "enum": list(CDC_ENTITIES)},
+                "description": "Entities to check. Defaults to Invoice, Customer, Payment and Vendor"
+            }
+        },
+        "required": ["ChangedSince"]
+    },
+    annotations=types.ToolAnnotations(**{"category": "QUICKBOOKS_BATCH", "readOnlyHint": True})
+)
+
+
+def _operation_entity(operation: Dict[str, Any]) -> Optional[str]:
+    """The entity name of a create/update/delete batch item, e.g. 'Invoice'."""
+    for key, value in operation.items():
+        if key[:1].isupper() and key != "Query" and isinstance(value, dict):
+            return key
+    return None
+
+
+class BatchManager:
+    def __init__(self, client: QuickBooksHTTPClient):
+        self.client = client
+
+    async def _fill_sync_tokens(self, operations: List[Dict[str, Any]]) -> None:
+        """
+        Add missing SyncTokens to update and delete operations.
+
+        Tokens come from the client's cache; the rest are read with batched
+        queries, one per entity type, instead of one read per object.
+        """
+        missing: Dict[str, set] = {}
+        for operation in operations:
+            entity = _operation_entity(operation)
+            if operation.get("operation") not in ("update", "delete") or not entity:
+                continue
+            obj = operation[entity]
+            if "Id" in obj and "SyncToken" not in obj:
+                if (entity.lower(), str(obj["Id"])) not in self.client.sync_tokens:
+                    missing.setdefault(entity, set()).add(str(obj["Id"]))
+
+        queries = []
+        for entity, ids in missing.items():
+            ids = sorted(ids)
+            # A query returns at most 1000 objects
+            for start in range(0, len(ids), 1000):
+                id_list = ", ".join(f"'{entity_id}'" for entity_id in ids[start:start + 1000])
+                queries.append({
+                    "bId": f"synctoken-{entity}-{start}",
+                    "Query": f"select * from {entity} where Id in ({id_list}) maxresults 1000",
+                })
+        for start in range(0, len(queries), BATCH_MAX_ITEMS):
+            # Responses are recorded in the client's SyncToken cache
+            await self.client._batch(queries[start:start + BATCH_MAX_ITEMS])
+
+        for operation in operations:
+            entity = _operation_entity(operation)
+            if operation.get("operation") not in ("update", "delete") or not entity:
+                continue
+            obj = operation[entity]
+            token = self.client.sync_tokens.get((entity.lower(), str(obj.get("Id"))))
+            if "Id" in obj and "SyncToken" not in obj and token is not None:
+                operation[entity] = {**obj, "SyncToken": token}
+
+    async def batch(self, Operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run batch operations, 30 per request, in the given order.
+
+        Each result carries the bId of its operation and either the entity, a
+        QueryResponse or a Fault; one failing operation does not stop the others.
+        """
+        operations = [
+            {"bId": str(operation.get("bId", index)), **{k: v for k, v in operation.items() if k != "bId"}}
+            for index, operation in enumerate(Operations, start=1)
+        ]
+        await self._fill_sync_tokens(operations)
+
+        results = []
+        for start in range(0, len(operations), BATCH_MAX_ITEMS):
+            results.extend(await self.client._batch(operations[start:start + BATCH_MAX_ITEMS]))
+        return results
+
+    async def change_data_capture(self, ChangedSince: str, Entities: List[str] = None) -> Dict[str, Any]:
+        """
+        Get the objects changed since a timestamp, grouped by entity.
+
+        Deleted objects are listed by Id only. If an entity reached the
+        1000-object limit of one call, it is listed in Truncated and the
+        changes should be fetched again from a later ChangedSince.
+        """
+        entities = Entities or ["Invoice", "Customer", "Payment", "Vendor"]
+        unknown = [entity for entity in entities if entity not in CDC_ENTITIES]
+        if unknown:
+            raise ValueError(f"Unsupported entities: {', '.join(unknown)}. Supported: {', '.join(CDC_ENTITIES)}")
+
+        response = await self.client._get('cdc', params={
+            'entities': ",".join(entities),
+            'changedSince': ChangedSince,
+        })
+
+        result: Dict[str, Any] = {"Time": response.get("time")}
+        truncated = []
+        for entity in entities:
+            result[entity] = {"Changed": [], "Deleted": []}
+        for cdc in response.get("CDCResponse", []):
+            for query_response in cdc.get("QueryResponse", []):
+                for entity in entities:
+                    objects = query_response.get(entity, [])
+                    for obj in objects:
+                        if obj.get("status") == "Deleted":
+                            result[entity]["Deleted"].append(obj.get("Id"))
+                        else:
+                            result[entity]["Changed"].append(CDC_ENTITIES[entity](obj))
+                    if len(objects) >= CDC_MAX_RESULTS_PER_ENTITY:
+                        truncated.append(entity)
+        if truncated:
+            result["Truncated"] = truncated
+        return result
+
+
+# Export tools
+tools = [batch_tool, change_data_capture_tool]
@@ -512,58 +512,42 @@ class CustomerManager:
         if not customer_id:
             raise ValueError("Id is required for updating a customer")
 
-        # Auto-fetch current sync token
-        current_customer_response = await self.client._get(f"customer/{customer_id}")
-        sync_token = current_customer_response.get(
-            'Customer', {}).get('SyncToken', '0')
-
         # Use the mcp_object_to_customer_data function to convert the input
         customer_data = mcp_object_to_customer_data(**kwargs)
 
-        # Add required fields for update
+        # Add required fields for update; the client supplies the current sync token
         customer_data.update({
             "Id": customer_id,
-            "SyncToken": sync_token,
             "sparse": True
         })
 
-        response = await self.client._post('customer', customer_data)
+        response = await self.client.post_with_sync_token('Customer', customer_data)
 
         # Convert response back to MCP format
         return customer_data_to_mcp_object(response['Customer'])
 
     async def deactivate_customer(self, Id: str) -> Dict[str, Any]:
-        # First get the current customer to obtain the SyncToken
-        current_customer_response = await self.client._get(f"customer/{Id}")
-        current_data = current_customer_response.get('Customer', {})
-
-        # Set Active to false for deactivation
+        # Set Active to false for deactivation; the client supplies the current sync token
         customer_data = {
-            "Id": str(current_data.get('Id')),
-            "SyncToken": str(current_data.get('SyncToken')),
+            "Id": str(Id),
             "Active": False,
             "sparse": True
         }
 
-        response = await self.client._post('customer', customer_data)
+        response = await self.client.post_with_sync_token('Customer', customer_data)
 
         # Convert response back to MCP format
         return customer_data_to_mcp_object(response['Customer'])
 
     async def activate_customer(self, Id: str) -> Dict[str, Any]:
-        # First get the current customer to obtain the SyncToken
-        current_customer_response = await self.client._get(f"customer/{Id}")
-        current_data = current_customer_response.get('Customer', {})
-
-        # Set Active to true for activation
+        # Set Active to true for activation; the client supplies the current sync token
         customer_data = {
-            "Id": str(current_data.get('Id')),
-            "SyncToken": str(current_data.get('SyncToken')),
+            "Id": str(Id),
             "Active": True,
             "sparse": True
         }
 
-        response = await self.client._post('customer', customer_data)
+        response = await self.client.post_with_sync_token('Customer', customer_data)
 
         # Convert response back to MCP format
         return customer_data_to_mcp_object(response['Customer'])
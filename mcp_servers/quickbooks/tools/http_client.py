@@ -1,11 +1,31 @@
 import os
 import logging
 import httpx
-from typing import Dict, Any
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
 from errors import QuickBooksError
 
 logger = logging.getLogger(__name__)
 
+# SyncTokens remembered per client, so updates can skip the read before the write
+SYNC_TOKEN_CACHE_SIZE = 1000
+
+# Error code QuickBooks returns when a write carries an outdated SyncToken
+STALE_OBJECT_ERROR_CODE = "5010"
+
+# The batch endpoint accepts at most 30 operations per request
+BATCH_MAX_ITEMS = 30
+
+
+def _fault_codes(error: QuickBooksError) -> List[str]:
+    """Error codes of the Fault in a failed response, if any."""
+    response = getattr(error.original_exception, 'response', None)
+    try:
+        fault = response.json().get('Fault', {})
+    except Exception:
+        return []
+    return [str(item.get('code')) for item in fault.get('Error', [])]
+
 
 class QuickBooksHTTPClient:
     """Direct HTTP client for QuickBooks API using httpx library."""
@@ -17,6 +37,7 @@ class QuickBooksHTTPClient:
         self.environment = (environment or os.getenv('QB_ENVIRONMENT', 'production')).lower()
         self.minor_version = minor_version
         self.async_session = httpx.AsyncClient()
+        self.sync_tokens: "OrderedDict[tuple, str]" = OrderedDict()
 
         if self.environment == 'sandbox':
             self.base_url = "https://sandbox-quickbooks.api.intuit.com"
@@ -61,7 +82,9 @@ class QuickBooksHTTPClient:
                 method, url, headers=headers, params=params, **kwargs
             )
             response.raise_for_status()
-            return try_get_resp_json(response)
+            data = try_get_resp_json(response)
+            self._remember_sync_tokens(data)
+            return data
         except httpx.HTTPStatusError as e:
             logger.error(f"Request failed: {e}")
             if hasattr(e, 'response') and e.response is not None:
@@ -84,5 +107,73 @@ class QuickBooksHTTPClient:
         """POST request."""
         return await self._make_request('POST', endpoint, params=params, json=data)
 
+    def _remember_sync_token(self, entity: str, obj: Any) -> None:
+        if not isinstance(obj, dict) or 'Id' not in obj:
+            return
+        key = (entity.lower(), str(obj['Id']))
+        if obj.get('SyncToken') is None or obj.get('status') == 'Deleted':
+            self.sync_tokens.pop(key, None)
+            return
+        self.sync_tokens[key] = str(obj['SyncToken'])
+        self.sync_tokens.move_to_end(key)
+        while len(self.sync_tokens) > SYNC_TOKEN_CACHE_SIZE:
+            self.sync_tokens.popitem(last=False)
+
+    def _remember_sync_tokens(self, data: Any) -> None:
+        """Record the SyncToken of every entity in a response (single, query or batch)."""
+        if not isinstance(data, dict):
+            return
+        for key, value in data.items():
+            if key == 'QueryResponse' and isinstance(value, dict):
+                self._remember_sync_tokens(value)
+            elif key in ('BatchItemResponse', 'CDCResponse', 'QueryResponse') and isinstance(value, list):
+                for item in value:
+                    self._remember_sync_tokens(item)
+            elif key[:1].isupper() and isinstance(value, list):
+                for obj in value:
+                    self._remember_sync_token(key, obj)
+            elif key[:1].isupper():
+                self._remember_sync_token(key, value)
+
+    async def get_sync_token(self, entity: str, entity_id: str, refresh: bool = False) -> str:
+        """Current SyncToken of an entity, from the cache unless missing or refresh is set."""
+        token = None if refresh else self.sync_tokens.get((entity.lower(), str(entity_id)))
+        if token is None:
+            await self._get(f"{entity.lower()}/{entity_id}")
+            token = self.sync_tokens.get((entity.lower(), str(entity_id)), '0')
+        return token
+
+    async def post_with_sync_token(
+        self,
+        entity: str,
+        data: Dict[str, Any],
+        params: Dict[str, Any] = None,
+        sync_token: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        POST a write that needs the entity's current SyncToken.
+
+        The token is taken from sync_token or the cache, which is filled by
+        every response that contains the entity, so the usual read before the
+        write is skipped. If QuickBooks rejects the token as stale, it is
+        re-read once and the write is retried.
+        """
+        entity_id = str(data['Id'])
+        cached = sync_token is None and (entity.lower(), entity_id) in self.sync_tokens
+        data = {**data, 'SyncToken': sync_token or await self.get_sync_token(entity, entity_id)}
+        try:
+            return await self._post(entity.lower(), data, params=params)
+        except QuickBooksError as e:
+            if not cached or STALE_OBJECT_ERROR_CODE not in _fault_codes(e):
+                raise
+            logger.info(f"Stale SyncToken for {entity} {entity_id}, re-reading and retrying")
+            data['SyncToken'] = await self.get_sync_token(entity, entity_id, refresh=True)
+            return await self._post(entity.lower(), data, params=params)
+
+    async def _batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send up to BATCH_MAX_ITEMS batch operations and return their responses."""
+        response = await self._post('batch', {'BatchItemRequest': items})
+        return response.get('BatchItemResponse', [])
+
     async def close(self):
         await self.async_session.aclose()
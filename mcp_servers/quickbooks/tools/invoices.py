@@ -960,38 +960,23 @@ class InvoiceManager:
         if not Id:
             raise ValueError("Id is required for updating an invoice")
 
-        # Auto-fetch current sync token
-        current_invoice_response = await self.client._get(f"invoice/{Id}")
-        sync_token = current_invoice_response.get(
-            'Invoice', {}).get('SyncToken', '0')
-
         invoice_data = mcp_object_to_invoice_data(**kwargs)
         invoice_data.update({
             "Id": Id,
-            "SyncToken": sync_token,
             "sparse": True,
         })
 
-        response = await self.client._post('invoice', invoice_data)
+        # The client supplies the current sync token
+        response = await self.client.post_with_sync_token('Invoice', invoice_data)
         return invoice_data_to_mcp_object(response['Invoice'])
 
     async def delete_invoice(self, Id: str) -> Dict[str, Any]:
         """Delete an invoice."""
-        # Auto-fetch current sync token
-        current_invoice_response = await self.client._get(f"invoice/{Id}")
-        current_invoice = current_invoice_response.get('Invoice', {})
-
-        if not current_invoice:
-            raise ValueError(f"Invoice with ID {Id} not found")
-
-        sync_token = current_invoice.get('SyncToken', '0')
-
-        # For delete operation, wrap in Invoice object
+        # For delete operation, wrap in Invoice object; the client supplies the current sync token
         delete_data = {
             "Id": Id,
-            "SyncToken": sync_token,
         }
-        return await self.client._post("invoice", delete_data, params={'operation': 'delete'})
+        return await self.client.post_with_sync_token("Invoice", delete_data, params={'operation': 'delete'})
 
     async def send_invoice(self, Id: str, SendTo: str = None) -> Dict[str, Any]:
         """
@@ -1041,22 +1026,12 @@ class InvoiceManager:
         Returns:
             The invoice response body with voided status.
         """
-        # Auto-fetch current sync token
-        current_invoice_response = await self.client._get(f"invoice/{Id}")
-        current_invoice = current_invoice_response.get('Invoice', {})
-
-        if not current_invoice:
-            raise ValueError(f"Invoice with ID {Id} not found")
-
-        sync_token = current_invoice.get('SyncToken', '0')
-
-        # For void operation, wrap in Invoice object
+        # For void operation, wrap in Invoice object; the client supplies the current sync token
         void_data = {
             "Id": Id,
-            "SyncToken": sync_token,
         }
 
-        response = await self.client._post("invoice", void_data, params={'operation': 'void'})
+        response = await self.client.post_with_sync_token("Invoice", void_data, params={'operation': 'void'})
 
         # The response should contain the voided invoice data
         if 'Invoice' in response:
@@ -599,38 +599,23 @@ class PaymentManager:
         if not Id:
             raise ValueError("Id is required for updating a payment")
 
-        # Auto-fetch current sync token
-        current_payment_response = await self.client._get(f"payment/{Id}")
-        sync_token = current_payment_response.get(
-            'Payment', {}).get('SyncToken', '0')
-
         payment_data = mcp_object_to_payment_data(**kwargs)
         payment_data.update({
             "Id": Id,
-            "SyncToken": sync_token,
             "sparse": True,
         })
 
-        response = await self.client._post('payment', payment_data)
+        # The client supplies the current sync token
+        response = await self.client.post_with_sync_token('Payment', payment_data)
         return payment_data_to_mcp_object(response['Payment'])
 
     async def delete_payment(self, Id: str) -> Dict[str, Any]:
         """Delete a payment."""
-        # Auto-fetch current sync token
-        current_payment_response = await self.client._get(f"payment/{Id}")
-        current_payment = current_payment_response.get('Payment', {})
-
-        if not current_payment:
-            raise ValueError(f"Payment with ID {Id} not found")
-
-        sync_token = current_payment.get('SyncToken', '0')
-
-        # For delete operation, wrap in Payment object
+        # For delete operation, wrap in Payment object; the client supplies the current sync token
         delete_data = {
             "Id": Id,
-            "SyncToken": sync_token,
         }
-        return await self.client._post("payment", delete_data, params={'operation': 'delete'})
+        return await self.client.post_with_sync_token("Payment", delete_data, params={'operation': 'delete'})
 
     async def send_payment(self, Id: str, SendTo: str) -> Dict[str, Any]:
         """
@@ -673,23 +658,13 @@ class PaymentManager:
         Returns:
             The payment response body with voided status.
         """
-        # Auto-fetch current sync token
-        current_payment_response = await self.client._get(f"payment/{Id}")
-        current_payment = current_payment_response.get('Payment', {})
-
-        if not current_payment:
-            raise ValueError(f"Payment with ID {Id} not found")
-
-        sync_token = current_payment.get('SyncToken', '0')
-
-        # For void operation, wrap in Payment object
+        # For void operation, wrap in Payment object; the client supplies the current sync token
         void_data = {
             "Id": Id,
-            "SyncToken": sync_token,
             "sparse": True,
         }
 
-        response = await self.client._post("payment", void_data, params={'operation': 'void'})
+        response = await self.client.post_with_sync_token("Payment", void_data, params={'operation': 'void'})
 
         # The response should contain the voided payment data
         if 'Payment' in response:
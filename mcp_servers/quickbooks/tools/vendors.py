@@ -566,19 +566,14 @@ class VendorManager:
         if not Id:
             raise ValueError("Id is required for updating a vendor")
 
-        # Auto-fetch current sync token
-        current_vendor_response = await self.client._get(f"vendor/{Id}")
-        sync_token = current_vendor_response.get(
-            'Vendor', {}).get('SyncToken', '0')
-
         vendor_data = mcp_object_to_vendor_data(**kwargs)
         vendor_data.update({
             "Id": Id,
-            "SyncToken": sync_token,
             "sparse": True,
         })
 
-        response = await self.client._post('vendor', vendor_data)
+        # The client supplies the current sync token
+        response = await self.client.post_with_sync_token('Vendor', vendor_data)
         return vendor_data_to_mcp_object(response['Vendor'])
 
     async def activate_vendor(self, Id: str) -> Dict[str, Any]:
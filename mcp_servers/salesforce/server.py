@@ -33,7 +33,10 @@ from tools import (
     # Campaigns
     get_campaigns, create_campaign, update_campaign, delete_campaign,
     # Metadata & Queries
-    describe_object, execute_soql_query
+    describe_object, execute_soql_query,
+    # Bulk operations
+    bulk_create_records, bulk_update_records, bulk_delete_records, bulk_export_query,
+    close_http_session
 )
 
 # Configure logging
@@ -441,12 +444,13 @@ def main(port: int, log_level: str, json_response: bool) -> int:
             # Query and Metadata Tools
             types.Tool(
                 name="salesforce_query",
-                description="Execute a SOQL query on Salesforce",
+                description="Execute a SOQL query on Salesforce. All result batches are followed unless max_records is set; then the result includes nextRecordsUrl, which can be passed back as next_records_url to fetch the next records. For very large exports use salesforce_bulk_export.",
                 inputSchema={
                     "type": "object",
-                    "required": ["query"],
                     "properties": {
-                        "query": {"type": "string", "description": "SOQL query to execute"}
+                        "query": {"type": "string", "description": "SOQL query to execute. Not needed when next_records_url is given."},
+                        "max_records": {"type": "integer", "description": "Stop after at least this many records (rounded up to a whole batch of up to 2000 records)"},
+                        "next_records_url": {"type": "string", "description": "nextRecordsUrl from a previous result, to continue that query"}
                     }
                 },
                 annotations=types.ToolAnnotations(**{"category": "SALESFORCE_QUERY", "readOnlyHint": True})
@@ -464,6 +468,62 @@ def main(port: int, log_level: str, json_response: bool) -> int:
                 },
                 annotations=types.ToolAnnotations(**{"category": "SALESFORCE_METADATA", "readOnlyHint": True})
             ),
+
+            # Bulk Tools
+            types.Tool(
+                name="salesforce_bulk_create_records",
+                description="Create many records of one object type at once (sent 200 per request). Returns one result per record, in input order.",
+                inputSchema={
+                    "type": "object",
+                    "required": ["object_type", "records"],
+                    "properties": {
+                        "object_type": {"type": "string", "description": "API name of the object, e.g. Account or Custom__c"},
+                        "records": {"type": "array", "items": {"type": "object"}, "description": "Field values of the records to create"},
+                        "all_or_none": {"type": "boolean", "description": "Roll back each request of 200 records if any record in it fails, and stop at the first failed request", "default": False}
+                    }
+                },
+                annotations=types.ToolAnnotations(**{"category": "SALESFORCE_BULK"})
+            ),
+            types.Tool(
+                name="salesforce_bulk_update_records",
+                description="Update many records of one object type at once (sent 200 per request). Each record must include its Id.",
+                inputSchema={
+                    "type": "object",
+                    "required": ["object_type", "records"],
+                    "properties": {
+                        "object_type": {"type": "string", "description": "API name of the object, e.g. Account or Custom__c"},
+                        "records": {"type": "array", "items": {"type": "object"}, "description": "Records with Id and the fields to update"},
+                        "all_or_none": {"type": "boolean", "description": "Roll back each request of 200 records if any record in it fails, and stop at the first failed request", "default": False}
+                    }
+                },
+                annotations=types.ToolAnnotations(**{"category": "SALESFORCE_BULK"})
+            ),
+            types.Tool(
+                name="salesforce_bulk_delete_records",
+                description="Delete many records by ID at once (sent 200 per request).",
+                inputSchema={
+                    "type": "object",
+                    "required": ["record_ids"],
+                    "properties": {
+                        "record_ids": {"type": "array", "items": {"type": "string"}, "description": "IDs of the records to delete"},
+                        "all_or_none": {"type": "boolean", "description": "Roll back each request of 200 records if any record in it fails, and stop at the first failed request", "default": False}
+                    }
+                },
+                annotations=types.ToolAnnotations(**{"category": "SALESFORCE_BULK"})
+            ),
+            types.Tool(
+                name="salesforce_bulk_export",
+                description="Export the results of a SOQL query as CSV using Bulk API 2.0. Suited to exports of many thousands of records.",
+                inputSchema={
+                    "type": "object",
+                    "required": ["query"],
+                    "properties": {
+                        "query": {"type": "string", "description": "SOQL query to export (no subqueries or aggregates)"},
+                        "max_records": {"type": "integer", "description": "Maximum number of rows to return", "default": 10000}
+                    }
+                },
+                annotations=types.ToolAnnotations(**{"category": "SALESFORCE_BULK", "readOnlyHint": True})
+            ),
         ]
 
     @app.call_tool()
@@ -580,9 +640,19 @@ def main(port: int, log_level: str, json_response: bool) -> int:
             
             # Query and metadata tools  
             elif name == "salesforce_query":
-                result = await execute_soql_query(arguments["query"])
+                result = await execute_soql_query(arguments.get("query"), arguments.get("max_records"), arguments.get("next_records_url"))
             elif name == "salesforce_describe_object":
                 result = await describe_object(arguments["object_name"], arguments.get("detailed", False))
+
+            # Bulk tools
+            elif name == "salesforce_bulk_create_records":
+                result = await bulk_create_records(arguments["object_type"], arguments["records"], arguments.get("all_or_none", False))
+            elif name == "salesforce_bulk_update_records":
+                result = await bulk_update_records(arguments["object_type"], arguments["records"], arguments.get("all_or_none", False))
+            elif name == "salesforce_bulk_delete_records":
+                result = await bulk_delete_records(arguments["record_ids"], arguments.get("all_or_none", False))
+            elif name == "salesforce_bulk_export":
+                result = await bulk_export_query(arguments["query"], arguments.get("max_records", 10000))
             
             else:
                 return [types.TextContent(type="text", text=f"Unknown tool: {name}")]
@@ -645,6 +715,7 @@ def main(port: int, log_level: str, json_response: bool) -> int:
             try:
                 yield
             finally:
+                close_http_session()
                 logger.info("Application shutting down...")
 
     # Create an ASGI application with routes for both transports
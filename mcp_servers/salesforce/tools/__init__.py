@@ -23,7 +23,10 @@ from .campaigns import (
 from .metadata import (
     describe_object, execute_soql_query
 )
-from .base import access_token_context, instance_url_context
+from .bulk import (
+    bulk_create_records, bulk_update_records, bulk_delete_records, bulk_export_query
+)
+from .base import access_token_context, instance_url_context, close_http_session
 
 __all__ = [
     # Accounts
@@ -67,8 +70,15 @@ __all__ = [
     # Metadata & Queries
     "describe_object",
     "execute_soql_query",
+
+    # Bulk operations
+    "bulk_create_records",
+    "bulk_update_records",
+    "bulk_delete_records",
+    "bulk_export_query",
     
     # Base
     "access_token_context",
     "instance_url_context",
+    "close_http_session",
 ] 
\ No newline at end of file
@@ -1,6 +1,6 @@
 import logging
 from typing import Any, Dict, List, Optional
-from .base import get_salesforce_conn, handle_salesforce_error, format_success_response
+from .base import get_salesforce_conn, run_salesforce_call, run_soql_query, handle_salesforce_error, format_success_response
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -40,8 +40,7 @@ async def get_accounts(limit: int = 50, fields: Optional[List[str]] = None, name
         where_clause = " WHERE " + " AND ".join(where_clauses) if where_clauses else ""
         query = f"SELECT {field_list} FROM Account{where_clause} ORDER BY Name LIMIT {limit}"
         
-        result = sf.query(query)
-        return dict(result)
+        return await run_soql_query(sf, query)
         
     except Exception as e:
         logger.exception(f"Error executing tool get_accounts: {e}")
@@ -64,8 +63,7 @@ async def get_account_by_id(account_id: str, fields: Optional[List[str]] = None)
         field_list = ', '.join(fields)
         query = f"SELECT {field_list} FROM Account WHERE Id = '{account_id}'"
         
-        result = sf.query(query)
-        return dict(result)
+        return await run_soql_query(sf, query)
         
     except Exception as e:
         logger.exception(f"Error executing tool get_account_by_id: {e}")
@@ -85,7 +83,7 @@ async def create_account(account_data: Dict[str, Any]) -> Dict[str, Any]:
                 "message": "Failed to create Account"
             }
         
-        result = sf.Account.create(account_data)
+        result = await run_salesforce_call(sf.Account.create, account_data)
         
         if result.get('success'):
             return format_success_response(result.get('id'), "created", "Account", account_data)
@@ -105,7 +103,7 @@ async def update_account(account_id: str, account_data: Dict[str, Any]) -> Dict[
     try:
         sf = get_salesforce_conn()
         
-        result = sf.Account.update(account_id, account_data)
+        result = await run_salesforce_call(sf.Account.update, account_id, account_data)
         
         # simple-salesforce returns HTTP status code for updates
         if result == 204:  # HTTP 204 No Content indicates successful update
@@ -125,7 +123,7 @@ async def delete_account(account_id: str) -> Dict[str, Any]:
     try:
         sf = get_salesforce_conn()
         
-        result = sf.Account.delete(account_id)
+        result = await run_salesforce_call(sf.Account.delete, account_id)
         
         # simple-salesforce returns HTTP status code for deletes
         if result == 204:  # HTTP 204 No Content indicates successful deletion
@@ -1,6 +1,17 @@
+import asyncio
+import functools
+import hashlib
+import http.cookiejar
 import logging
-from typing import Any, Dict
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Optional
 from contextvars import ContextVar
+
+import requests
+from requests.adapters import HTTPAdapter
 from simple_salesforce import Salesforce
 from simple_salesforce.exceptions import SalesforceError
 
@@ -11,9 +22,51 @@ logger = logging.getLogger(__name__)
 access_token_context: ContextVar[str] = ContextVar('access_token')
 instance_url_context: ContextVar[str] = ContextVar('instance_url')
 
+# simple-salesforce is blocking; its calls run on this pool instead of the event loop
+SALESFORCE_MAX_WORKERS = int(os.getenv("SALESFORCE_MAX_WORKERS", "16"))
+DESCRIBE_CACHE_TTL_SECONDS = float(os.getenv("SALESFORCE_DESCRIBE_CACHE_TTL", "600"))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_http_session: Optional[requests.Session] = None
+
+
+def get_http_session() -> requests.Session:
+    """Return the process-wide requests session, so connections are reused across calls."""
+    global _http_session
+    if _http_session is None:
+        session = requests.Session()
+        # Sessions are shared between tenants: never keep cookies from one org's responses
+        session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(pool_connections=SALESFORCE_MAX_WORKERS, pool_maxsize=SALESFORCE_MAX_WORKERS)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _http_session = session
+    return _http_session
+
+
+def close_http_session() -> None:
+    """Shut down the worker pool and close pooled connections."""
+    global _executor, _http_session
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+    if _http_session is not None:
+        _http_session.close()
+        _http_session = None
+
+
+async def run_salesforce_call(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking simple-salesforce call on the worker pool."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=SALESFORCE_MAX_WORKERS, thread_name_prefix="salesforce")
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(func, *args, **kwargs))
+
+
 def get_salesforce_connection(access_token: str, instance_url: str) -> Salesforce:
     """Create Salesforce connection with access token."""
-    return Salesforce(instance_url=instance_url, session_id=access_token)
+    return Salesforce(instance_url=instance_url, session_id=access_token, session=get_http_session())
 
 def get_salesforce_conn() -> Salesforce:
     """Get the Salesforce connection from context - created fresh each time."""
@@ -83,4 +136,120 @@ def create_case_insensitive_like_conditions(search_term: str, *field_names: str)
         field_conditions = [f"{field_name} LIKE '%{variation}%'" for variation in set(variations)]
         all_conditions.extend(field_conditions)
     
-    return " OR ".join(all_conditions) 
\ No newline at end of file
+    return " OR ".join(all_conditions)
+
+
+async def iter_query_batches(
+    sf: Salesforce,
+    query: Optional[str] = None,
+    next_records_url: Optional[str] = None,
+    include_deleted: bool = False,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Run a SOQL query and yield its result batches, following nextRecordsUrl.
+
+    Salesforce returns at most 2000 records per batch. Each batch is fetched on
+    the worker pool, and the next one is only requested when the consumer asks
+    for it, so callers can stop early. Pass next_records_url instead of query
+    to resume a query where a previous call stopped.
+    """
+    if next_records_url:
+        batch = await run_salesforce_call(sf.query_more, next_records_url, identifier_is_url=True)
+    else:
+        batch = await run_salesforce_call(sf.query, query, include_deleted=include_deleted)
+    while True:
+        yield batch
+        if batch.get("done", True) or not batch.get("nextRecordsUrl"):
+            return
+        batch = await run_salesforce_call(sf.query_more, batch["nextRecordsUrl"], identifier_is_url=True)
+
+
+async def run_soql_query(
+    sf: Salesforce,
+    query: Optional[str] = None,
+    max_records: Optional[int] = None,
+    next_records_url: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Run a SOQL query without blocking the event loop and collect its records.
+
+    All batches are followed unless max_records is given; then collection
+    stops at the first batch boundary at or after max_records, and the result
+    keeps nextRecordsUrl so the rest can be fetched with another call.
+    """
+    records = []
+    total_size = 0
+    done = True
+    next_url = None
+    async for batch in iter_query_batches(sf, query, next_records_url):
+        total_size = batch.get("totalSize", 0)
+        records.extend(batch.get("records", []))
+        done = batch.get("done", True)
+        next_url = batch.get("nextRecordsUrl")
+        if max_records is not None and len(records) >= max_records:
+            break
+
+    result = {"totalSize": total_size, "done": done, "records": records}
+    if not done and next_url:
+        result["nextRecordsUrl"] = next_url
+    return result
+
+
+class TTLCache:
+    """Small LRU cache whose entries expire after a per-entry TTL."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Any, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any, ttl: float) -> None:
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_describe_cache = TTLCache(512)
+_describe_requests: Dict[Any, asyncio.Future] = {}
+
+
+def token_cache_key(token: str) -> str:
+    """Hash a token so it is never kept in cache keys verbatim."""
+    return hashlib.sha256((token or "").encode("utf-8")).hexdigest()
+
+
+async def get_cached_describe(sf: Salesforce, path: str) -> Any:
+    """
+    GET a describe/metadata REST path, cached per org and user.
+
+    Describe results depend on the caller's field-level security, so entries
+    are keyed by instance URL and a hash of the access token. Concurrent
+    lookups of the same path share one request.
+    """
+    key = (sf.sf_instance, token_cache_key(sf.session_id), path)
+    result = _describe_cache.get(key)
+    if result is None:
+        lookup = _describe_requests.get(key)
+        if lookup is None:
+            lookup = asyncio.ensure_future(run_salesforce_call(sf.restful, path))
+            _describe_requests[key] = lookup
+            lookup.add_done_callback(lambda _: _describe_requests.pop(key, None))
+        result = await asyncio.shield(lookup)
+        _describe_cache.set(key, result, DESCRIBE_CACHE_TTL_SECONDS)
+    return result
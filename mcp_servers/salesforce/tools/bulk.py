@@ -0,0 +1,212 @@
+import asyncio
+import csv
+import io
+import logging
+import os
+import re
+from typing import Any, Callable, Awaitable, Dict, List, Optional
+from .base import get_salesforce_conn, run_salesforce_call, handle_salesforce_error
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# The sObject Collections API accepts at most 200 records per request
+COLLECTION_CHUNK_SIZE = 200
+BULK_MAX_CONCURRENT_REQUESTS = int(os.getenv("SALESFORCE_BULK_MAX_CONCURRENT_REQUESTS", "4"))
+
+# Bulk API 2.0 returns query results in pages of up to this many records
+BULK_EXPORT_PAGE_SIZE = 50000
+DEFAULT_EXPORT_MAX_RECORDS = 10000
+
+_FROM_PATTERN = re.compile(r"\bFROM\s+(\w+)", re.IGNORECASE)
+
+
+def _chunks(items: List[Any], size: int = COLLECTION_CHUNK_SIZE) -> List[List[Any]]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+async def _send_chunks(
+    chunks: List[List[Any]],
+    send: Callable[[List[Any]], Awaitable[List[Dict[str, Any]]]],
+    all_or_none: bool,
+) -> List[Dict[str, Any]]:
+    """
+    Send collection chunks and concatenate their per-record results.
+
+    Without all_or_none, chunks are sent concurrently. With it, each chunk is
+    atomic on its own, so chunks are sent one at a time and sending stops at
+    the first chunk that was rolled back.
+    """
+    if all_or_none:
+        results: List[Dict[str, Any]] = []
+        for chunk in chunks:
+            chunk_results = await send(chunk)
+            results.extend(chunk_results)
+            if not all(result.get("success") for result in chunk_results):
+                break
+        return results
+
+    semaphore = asyncio.Semaphore(BULK_MAX_CONCURRENT_REQUESTS)
+
+    async def send_limited(chunk: List[Any]) -> List[Dict[str, Any]]:
+        async with semaphore:
+            return await send(chunk)
+
+    chunk_results = await asyncio.gather(*(send_limited(chunk) for chunk in chunks))
+    return [result for results in chunk_results for result in results]
+
+
+def _summarize(results: List[Dict[str, Any]], total: int, operation: str, object_type: str) -> Dict[str, Any]:
+    succeeded = sum(1 for result in results if result.get("success"))
+    failed = len(results) - succeeded
+    response = {
+        "success": succeeded == total,
+        "message": f"{succeeded} of {total} {object_type} records {operation}".strip(),
+        "object_type": object_type,
+        "total": total,
+        "succeeded": succeeded,
+        "failed": failed,
+        "results": results,
+    }
+    if len(results) < total:
+        response["not_attempted"] = total - len(results)
+    return response
+
+
+async def bulk_create_records(object_type: str, records: List[Dict[str, Any]], all_or_none: bool = False) -> Dict[str, Any]:
+    """
+    Create many records of one object type with the sObject Collections API.
+
+    Records are sent 200 per request. Results are returned in input order, one
+    per record, with the new record id or the errors.
+    """
+    logger.info(f"Executing tool: bulk_create_records with object_type: {object_type}, count: {len(records)}")
+    try:
+        sf = get_salesforce_conn()
+        payload = [{**record, "attributes": {"type": object_type}} for record in records]
+
+        async def send(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            return await run_salesforce_call(
+                sf.restful, "composite/sobjects", method="POST",
+                json={"allOrNone": all_or_none, "records": chunk}
+            )
+
+        results = await _send_chunks(_chunks(payload), send, all_or_none)
+        return _summarize(results, len(records), "created", object_type)
+
+    except Exception as e:
+        return handle_salesforce_error(e, "bulk create", object_type)
+
+
+async def bulk_update_records(object_type: str, records: List[Dict[str, Any]], all_or_none: bool = False) -> Dict[str, Any]:
+    """
+    Update many records of one object type with the sObject Collections API.
+
+    Each record must include its Id and the fields to change. Records are sent
+    200 per request.
+    """
+    logger.info(f"Executing tool: bulk_update_records with object_type: {object_type}, count: {len(records)}")
+    try:
+        missing_ids = [index for index, record in enumerate(records) if not record.get("Id")]
+        if missing_ids:
+            return {
+                "success": False,
+                "error": f"Records at positions {missing_ids} have no Id",
+                "message": f"Failed to bulk update {object_type}"
+            }
+
+        sf = get_salesforce_conn()
+        payload = [{**record, "attributes": {"type": object_type}} for record in records]
+
+        async def send(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            return await run_salesforce_call(
+                sf.restful, "composite/sobjects", method="PATCH",
+                json={"allOrNone": all_or_none, "records": chunk}
+            )
+
+        results = await _send_chunks(_chunks(payload), send, all_or_none)
+        return _summarize(results, len(records), "updated", object_type)
+
+    except Exception as e:
+        return handle_salesforce_error(e, "bulk update", object_type)
+
+
+async def bulk_delete_records(record_ids: List[str], all_or_none: bool = False) -> Dict[str, Any]:
+    """
+    Delete many records, of any object types, with the sObject Collections API.
+
+    Ids are sent 200 per request.
+    """
+    logger.info(f"Executing tool: bulk_delete_records with count: {len(record_ids)}")
+    try:
+        sf = get_salesforce_conn()
+
+        async def send(chunk: List[str]) -> List[Dict[str, Any]]:
+            return await run_salesforce_call(
+                sf.restful, "composite/sobjects", method="DELETE",
+                params={"ids": ",".join(chunk), "allOrNone": str(all_or_none).lower()}
+            )
+
+        results = await _send_chunks(_chunks(record_ids), send, all_or_none)
+        return _summarize(results, len(record_ids), "deleted", "")
+
+    except Exception as e:
+        return handle_salesforce_error(e, "bulk delete", "records")
+
+
+async def bulk_export_query(query: str, max_records: int = DEFAULT_EXPORT_MAX_RECORDS) -> Dict[str, Any]:
+    """
+    Export the results of a SOQL query as CSV with Bulk API 2.0.
+
+    Bulk API 2.0 runs the query as an asynchronous job, which suits exports far
+    larger than the REST query API handles well. Result pages are downloaded on
+    the worker pool one at a time, and downloading stops after max_records rows.
+    """
+    logger.info(f"Executing tool: bulk_export_query with query: {query}, max_records: {max_records}")
+    try:
+        match = _FROM_PATTERN.search(query)
+        if not match:
+            raise ValueError("Could not find the object name (FROM clause) in the query")
+        object_type = match.group(1)
+
+        sf = get_salesforce_conn()
+        bulk_object = getattr(sf.bulk2, object_type)
+        pages = await run_salesforce_call(
+            bulk_object.query, query, max_records=min(max_records, BULK_EXPORT_PAGE_SIZE)
+        )
+
+        output = io.StringIO()
+        writer = csv.writer(output, lineterminator="\n")
+        columns: List[str] = []
+        record_count = 0
+        truncated = False
+        while True:
+            # Each step of the generator polls the job or downloads a page, so run it off the loop
+            page = await run_salesforce_call(next, pages, None)
+            if page is None:
+                break
+            rows = list(csv.reader(io.StringIO(page)))
+            if not rows:
+                continue
+            if not columns:
+                columns = rows[0]
+                writer.writerow(columns)
+            rows = rows[1:max_records - record_count + 1]
+            writer.writerows(rows)
+            record_count += len(rows)
+            if record_count >= max_records:
+                # Checking for more would download another page; report the cap as truncation
+                truncated = True
+                break
+
+        return {
+            "success": True,
+            "object_type": object_type,
+            "columns": columns,
+            "record_count": record_count,
+            "truncated": truncated,
+            "csv": output.getvalue(),
+        }
+
+    except Exception as e:
+        return handle_salesforce_error(e, "export", "records")
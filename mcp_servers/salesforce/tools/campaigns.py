@@ -1,6 +1,6 @@
 import logging
 from typing import Any, Dict, List, Optional
-from .base import get_salesforce_conn, handle_salesforce_error, format_success_response
+from .base import get_salesforce_conn, run_salesforce_call, run_soql_query, handle_salesforce_error, format_success_response
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -31,8 +31,7 @@ async def get_campaigns(status: Optional[str] = None, type_filter: Optional[str]
         where_clause = " WHERE " + " AND ".join(where_clauses) if where_clauses else ""
         query = f"SELECT {field_list} FROM Campaign{where_clause} ORDER BY StartDate DESC LIMIT {limit}"
         
-        result = sf.query(query)
-        return dict(result)
+        return await run_soql_query(sf, query)
         
     except Exception as e:
         logger.exception(f"Error executing tool get_campaigns: {e}")
@@ -56,8 +55,7 @@ async def get_campaign_by_id(campaign_id: str, fields: Optional[List[str]] = Non
         field_list = ', '.join(fields)
         query = f"SELECT {field_list} FROM Campaign WHERE Id = '{campaign_id}'"
         
-        result = sf.query(query)
-        return dict(result)
+        return await run_soql_query(sf, query)
         
     except Exception as e:
         logger.exception(f"Error executing tool get_campaign_by_id: {e}")
@@ -77,7 +75,7 @@ async def create_campaign(campaign_data: Dict[str, Any]) -> Dict[str, Any]:
                 "message": "Failed to create Campaign"
             }
         
-        result = sf.Campaign.create(campaign_data)
+        result = await run_salesforce_call(sf.Campaign.create, campaign_data)
         
         if result.get('success'):
             return format_success_response(result.get('id'), "created", "Campaign", campaign_data)
@@ -97,7 +95,7 @@ async def update_campaign(campaign_id: str, campaign_data: Dict[str, Any]) -> Di
     try:
         sf = get_salesforce_conn()
         
-        result = sf.Campaign.update(campaign_id, campaign_data)
+        result = await run_salesforce_call(sf.Campaign.update, campaign_id, campaign_data)
         
         # simple-salesforce returns HTTP status code for updates
         if result == 204:  # HTTP 204 No Content indicates successful update
@@ -117,7 +115,7 @@ async def delete_campaign(campaign_id: str) -> Dict[str, Any]:
     try:
         sf = get_salesforce_conn()
         
-        result = sf.Campaign.delete(campaign_id)
+        result = await run_salesforce_call(sf.Campaign.delete, campaign_id)
         
         # simple-salesforce returns HTTP status code for deletes
         if result == 204:  # HTTP 204 No Content indicates successful deletion
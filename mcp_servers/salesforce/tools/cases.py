@@ -1,6 +1,6 @@
 import logging
 from typing import Any, Dict, List, Optional
-from .base import get_salesforce_conn, handle_salesforce_error, format_success_response
+from .base import get_salesforce_conn, run_salesforce_call, run_soql_query, handle_salesforce_error, format_success_response
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -43,8 +43,7 @@ async def get_cases(account_id: Optional[str] = None, status: Optional[str] = No
         where_clause = " WHERE " + " AND ".join(where_clauses) if where_clauses else ""
         query = f"SELECT {field_list} FROM Case{where_clause} ORDER BY CreatedDate DESC LIMIT {limit}"
         
-        result = sf.query(query)
-        return dict(result)
+        return await run_soql_query(sf, query)
         
     except Exception as e:
         logger.exception(f"Error executing tool get_cases: {e}")
@@ -67,8 +66,7 @@ async def get_case_by_id(case_id: str, fields: Optional[List[str]] = None) -> Di
         field_list = ', '.join(fields)
         query = f"SELECT {field_list} FROM Case WHERE Id = '{case_id}'"
         
-        result = sf.query(query)
-        return dict(result)
+        return await run_soql_query(sf, query)
         
     except Exception as e:
         logger.exception(f"Error executing tool get_case_by_id: {e}")
@@ -88,7 +86,7 @@ async def create_case(case_data: Dict[str, Any]) -> Dict[str, Any]:
                 "message": "Failed to create Case"
             }
         
-        result = sf.Case.create(case_data)
+        result = await run_salesforce_call(sf.Case.create, case_data)
         
         if result.get('success'):
             return format_success_response(result.get('id'), "created", "Case", case_data)
@@ -108,7 +106,7 @@ async def update_case(case_id: str, case_data: Dict[str, Any]) -> Dict[str, Any]
     try:
         sf = get_salesforce_conn()
         
-        result = sf.Case.update(case_id, case_data)
+        result = await run_salesforce_call(sf.Case.update, case_id, case_data)
         
         # simple-salesforce returns HTTP status code for updates
         if result == 204:  # HTTP 204 No Content indicates successful update
@@ -128,7 +126,7 @@ async def delete_case(case_id: str) -> Dict[str, Any]:
     try:
         sf = get_salesforce_conn()
         
-        result = sf.Case.delete(case_id)
+        result = await run_salesforce_call(sf.Case.delete, case_id)
         
         # simple-salesforce returns HTTP status code for deletes
         if result == 204:  # HTTP 204 No Content indicates successful deletion
@@ -1,6 +1,6 @@
 import logging
 from typing import Any, Dict, List, Optional
-from .base import get_salesforce_conn, handle_salesforce_error, format_success_response
+from .base import get_salesforce_conn, run_salesforce_call, run_soql_query, handle_salesforce_error, format_success_response
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -60,8 +60,7 @@ async def get_contacts(account_id: Optional[str] = None, limit: int = 50, fields
         where_clause = " WHERE " + " AND ".join(where_clauses) if where_clauses else ""
         query = f"SELECT {field_list} FROM Contact{where_clause} ORDER BY LastName, FirstName LIMIT {limit}"
         
-        result = sf.query(query)
-        return dict(result)
+        return await run_soql_query(sf, query)
         
     except Exception as e:
         logger.exception(f"Error executing tool get_contacts: {e}")
@@ -83,8 +82,7 @@ async def get_contact_by_id(contact_id: str, fields: Optional[List[str]] = None)
         field_list = ', '.join(fields)
         query = f"SELECT {field_list} FROM Contact WHERE Id = '{contact_id}'"
         
-        result = sf.query(query)
-        return dict(result)
+        return await run_soql_query(sf, query)
         
     except Exception as e:
         logger.exception(f"Error executing tool get_contact_by_id: {e}")
@@ -104,7 +102,7 @@ async def create_contact(contact_data: Dict[str, Any]) -> Dict[str, Any]:
                 "message": "Failed to create Contact"
             }
         
-        result = sf.Contact.create(contact_data)
+        result = await run_salesforce_call(sf.Contact.create, contact_data)
         
         if result.get('success'):
             return format_success_response(result.get('id'), "created", "Contact", contact_data)
@@ -124,7 +122,7 @@ async def update_contact(contact_id: str, contact_data: Dict[str, Any]) -> Dict[
     try:
         sf = get_salesforce_conn()
         
-        result = sf.Contact.update(contact_id, contact_data)
+        result = await run_salesforce_call(sf.Contact.update, contact_id, contact_data)
         
         # simple-salesforce returns HTTP status code for updates
         if result == 204:  # HTTP 204 No Content indicates successful update
@@ -144,7 +142,7 @@ async def delete_contact(contact_id: str) -> Dict[str, Any]:
     try:
         sf = get_salesforce_conn()
         
-        result = sf.Contact.delete(contact_id)
+        result = await run_salesforce_call(sf.Contact.delete, contact_id)
         
         # simple-salesforce returns HTTP status code for deletes
         if result == 204:  # HTTP 204 No Content indicates successful deletion
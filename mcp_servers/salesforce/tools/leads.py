@@ -1,6 +1,6 @@
 import logging
 from typing import Any, Dict, List, Optional
-from .base import get_salesforce_conn, handle_salesforce_error, format_success_response
+from .base import get_salesforce_conn, run_salesforce_call, run_soql_query, handle_salesforce_error, format_success_response
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -63,8 +63,7 @@ async def get_leads(status: Optional[str] = None, limit: int = 50, fields: Optio
         where_clause = " WHERE " + " AND ".join(where_clauses) if where_clauses else ""
         query = f"SELECT {field_list} FROM Lead{where_clause} ORDER BY CreatedDate DESC LIMIT {limit}"
         
-        result = sf.query(query)
-        return dict(result)
+        return await run_soql_query(sf, query)
         
     except Exception as e:
         logger.exception(f"Error executing tool get_leads: {e}")
@@ -87,8 +86,7 @@ async def get_lead_by_id(lead_id: str, fields: Optional[List[str]] = None) -> Di
         field_list = ', '.join(fields)
         query = f"SELECT {field_list} FROM Lead WHERE Id = '{lead_id}'"
         
-        result = sf.query(query)
-        return dict(result)
+        return await run_soql_query(sf, query)
         
     except Exception as e:
         logger.exception(f"Error executing tool get_lead_by_id: {e}")
@@ -111,7 +109,7 @@ async def create_lead(lead_data: Dict[str, Any]) -> Dict[str, Any]:
                 "message": "Failed to create Lead"
             }
         
-        result = sf.Lead.create(lead_data)
+        result = await run_salesforce_call(sf.Lead.create, lead_data)
         
         if result.get('success'):
             return format_success_response(result.get('id'), "created", "Lead", lead_data)
@@ -131,7 +129,7 @@ async def update_lead(lead_id: str, lead_data: Dict[str, Any]) -> Dict[str, Any]
     try:
         sf = get_salesforce_conn()
         
-        result = sf.Lead.update(lead_id, lead_data)
+        result = await run_salesforce_call(sf.Lead.update, lead_id, lead_data)
         
         # simple-salesforce returns HTTP status code for updates
         if result == 204:  # HTTP 204 No Content indicates successful update
@@ -151,7 +149,7 @@ async def delete_lead(lead_id: str) -> Dict[str, Any]:
     try:
         sf = get_salesforce_conn()
         
-        result = sf.Lead.delete(lead_id)
+        result = await run_salesforce_call(sf.Lead.delete, lead_id)
         
         # simple-salesforce returns HTTP status code for deletes
         if result == 204:  # HTTP 204 No Content indicates successful deletion
@@ -180,7 +178,7 @@ async def convert_lead(lead_id: str, conversion_data: Dict[str, Any] = None) ->
         
         # Lead conversion is done via REST API
         conversion_url = f"sobjects/Lead/{lead_id}/convert"
-        result = sf.restful(conversion_url, method='POST', json=conversion_data)
+        result = await run_salesforce_call(sf.restful, conversion_url, method='POST', json=conversion_data)
         
         if result.get('success'):
             return {
@@ -1,17 +1,25 @@
+import asyncio
 import logging
-from typing import Any, Dict, List
-from .base import get_salesforce_conn
+from typing import Any, Dict, List, Optional
+from .base import get_salesforce_conn, get_cached_describe, run_salesforce_call, run_soql_query
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-async def execute_soql_query(query: str) -> Dict[str, Any]:
-    """Execute a SOQL query on Salesforce."""
-    logger.info(f"Executing tool: execute_soql_query with query: {query}")
+async def execute_soql_query(query: Optional[str] = None, max_records: Optional[int] = None, next_records_url: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Execute a SOQL query on Salesforce.
+
+    Result batches are followed through nextRecordsUrl. With max_records, the
+    result stops at a batch boundary and includes nextRecordsUrl; pass it back
+    as next_records_url (without query) to continue.
+    """
+    logger.info(f"Executing tool: execute_soql_query with query: {query}, next_records_url: {next_records_url}")
     try:
+        if not query and not next_records_url:
+            raise ValueError("Either query or next_records_url is required")
         sf = get_salesforce_conn()
-        result = sf.query(query)
-        return dict(result)
+        return await run_soql_query(sf, query, max_records=max_records, next_records_url=next_records_url)
     except Exception as e:
         logger.exception(f"Error executing SOQL query: {e}")
         raise e
@@ -21,26 +29,25 @@ async def execute_tooling_query(query: str) -> Dict[str, Any]:
     logger.info(f"Executing tool: execute_tooling_query with query: {query}")
     try:
         sf = get_salesforce_conn()
-        result = sf.toolingexecute(f"query/?q={query}")
+        result = await run_salesforce_call(sf.toolingexecute, f"query/?q={query}")
         return dict(result)
     except Exception as e:
         logger.exception(f"Error executing tooling query: {e}")
         raise e
 
 async def describe_object(object_name: str, detailed: bool = False) -> Dict[str, Any]:
-    """Get detailed metadata about a Salesforce object."""
+    """Get detailed metadata about a Salesforce object (cached per org and user)."""
     logger.info(f"Executing tool: describe_object with object_name: {object_name}")
     try:
         sf = get_salesforce_conn()
-        sobject = getattr(sf, object_name)
-        result = sobject.describe()
+        result = await get_cached_describe(sf, f"sobjects/{object_name}/describe")
         
         if detailed and object_name.endswith('__c'):
-            # For custom objects, get additional metadata if requested
-            metadata_result = sf.restful(f"sobjects/{object_name}/describe/")
+            # For custom objects, get additional metadata if requested; it is
+            # the same describe response, so the one fetched above is reused
             return {
                 "describe": dict(result),
-                "metadata": metadata_result
+                "metadata": result
             }
         
         return dict(result)
@@ -63,9 +70,8 @@ async def get_component_source(metadata_type: str, component_names: List[str]) -
         if metadata_type not in valid_types:
             raise ValueError(f"Invalid metadata type: {metadata_type}")
         
-        # Use Tooling API for metadata queries
-        results = []
-        for name in component_names:
+        # Use Tooling API for metadata queries; components are fetched concurrently
+        async def fetch_component(name: str) -> Dict[str, Any]:
             try:
                 if metadata_type == 'ApexClass':
                     query = f"SELECT Id, Name, Body FROM ApexClass WHERE Name = '{name}'"
@@ -77,20 +83,21 @@ async def get_component_source(metadata_type: str, component_names: List[str]) -
                     # For other types, use general metadata query
                     query = f"SELECT Id, DeveloperName FROM {metadata_type} WHERE DeveloperName = '{name}'"
                 
-                result = sf.toolingexecute(f"query/?q={query}")
-                results.append({
+                result = await run_salesforce_call(sf.toolingexecute, f"query/?q={query}")
+                return {
                     "name": name,
                     "type": metadata_type,
                     "data": dict(result)
-                })
+                }
             except Exception as e:
-                results.append({
+                return {
                     "name": name,
                     "type": metadata_type,
                     "error": str(e)
-                })
+                }
         
-        return {"results": results}
+        results = await asyncio.gather(*(fetch_component(name) for name in component_names))
+        return {"results": list(results)}
     except Exception as e:
         logger.exception(f"Error retrieving metadata: {e}")
         raise e 
\ No newline at end of file
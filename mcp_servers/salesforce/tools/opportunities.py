@@ -1,6 +1,6 @@
 import logging
 from typing import Any, Dict, List, Optional
-from .base import get_salesforce_conn, handle_salesforce_error, format_success_response
+from .base import get_salesforce_conn, run_salesforce_call, run_soql_query, handle_salesforce_error, format_success_response
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -59,8 +59,7 @@ async def get_opportunities(
         where_clause = " WHERE " + " AND ".join(where_clauses) if where_clauses else ""
         query = f"SELECT {field_list} FROM Opportunity{where_clause} ORDER BY CloseDate ASC LIMIT {limit}"
         
-        result = sf.query(query)
-        return dict(result)
+        return await run_soql_query(sf, query)
         
     except Exception as e:
         logger.exception(f"Error executing tool get_opportunities: {e}")
@@ -83,8 +82,7 @@ async def get_opportunity_by_id(opportunity_id: str, fields: Optional[List[str]]
         field_list = ', '.join(fields)
         query = f"SELECT {field_list} FROM Opportunity WHERE Id = '{opportunity_id}'"
         
-        result = sf.query(query)
-        return dict(result)
+        return await run_soql_query(sf, query)
         
     except Exception as e:
         logger.exception(f"Error executing tool get_opportunity_by_id: {e}")
@@ -107,7 +105,7 @@ async def create_opportunity(opportunity_data: Dict[str, Any]) -> Dict[str, Any]
                 "message": "Failed to create Opportunity"
             }
         
-        result = sf.Opportunity.create(opportunity_data)
+        result = await run_salesforce_call(sf.Opportunity.create, opportunity_data)
         
         if result.get('success'):
             return format_success_response(result.get('id'), "created", "Opportunity", opportunity_data)
@@ -160,7 +158,7 @@ async def update_opportunity(
                 "message": "No fields provided to update"
             }
         
-        result = sf.Opportunity.update(opportunity_id, opportunity_data)
+        result = await run_salesforce_call(sf.Opportunity.update, opportunity_id, opportunity_data)
         
         # simple-salesforce returns HTTP status code for updates
         if result == 204:  # HTTP 204 No Content indicates successful update
@@ -180,7 +178,7 @@ async def delete_opportunity(opportunity_id: str) -> Dict[str, Any]:
     try:
         sf = get_salesforce_conn()
         
-        result = sf.Opportunity.delete(opportunity_id)
+        result = await run_salesforce_call(sf.Opportunity.delete, opportunity_id)
         
         # simple-salesforce returns HTTP status code for deletes
         if result == 204:  # HTTP 204 No Content indicates successful deletion
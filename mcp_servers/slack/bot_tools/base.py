@@ -1,6 +1,8 @@
 import logging
 from typing import Any, Dict, Optional
 from contextvars import ContextVar
+import http.cookiejar
+import importlib.util
 import httpx
 
 # Configure logging
@@ -8,6 +10,44 @@ logger = logging.getLogger(__name__)
 
 SLACK_API_ENDPOINT = "https://slack.com/api"
 
+# Shared HTTP client, reused across tool calls so connections stay pooled
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            # Reject all cookies: the client is shared across tenants
+            cookies=http.cookiejar.CookieJar(
+                policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+            ),
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _http_client
+
+
+async def init_http_clients() -> None:
+    """Create the shared HTTP client (called from the server lifespan)."""
+    get_http_client()
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP client on server shutdown."""
+    global _http_client
+    if _http_client is not None:
+        try:
+            await _http_client.aclose()
+        finally:
+            _http_client = None
+
+
 # Context variable to store the bot token for each request
 bot_token_context: ContextVar[str] = ContextVar('bot_token')
 
@@ -42,40 +82,40 @@ class SlackBotClient:
         
         url = f"{SLACK_API_ENDPOINT}/{endpoint}"
         
-        async with httpx.AsyncClient() as client:
-            if method.upper() == "GET":
-                response = await client.get(url, headers=headers, params=params)
-            elif method.upper() == "POST":
-                response = await client.post(url, headers=headers, json=data)
-            elif method.upper() == "PUT":
-                response = await client.put(url, headers=headers, json=data)
-            elif method.upper() == "DELETE":
-                response = await client.delete(url, headers=headers)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-            
-            # Check HTTP status
-            response.raise_for_status()
+        client = get_http_client()
+        if method.upper() == "GET":
+            response = await client.get(url, headers=headers, params=params)
+        elif method.upper() == "POST":
+            response = await client.post(url, headers=headers, json=data)
+        elif method.upper() == "PUT":
+            response = await client.put(url, headers=headers, json=data)
+        elif method.upper() == "DELETE":
+            response = await client.delete(url, headers=headers)
+        else:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
+        # Check HTTP status
+        response.raise_for_status()
+        
+        # Handle empty responses
+        if response.status_code == 204 or not response.content:
+            return {"ok": True}
+        
+        try:
+            json_response = response.json()
             
-            # Handle empty responses
-            if response.status_code == 204 or not response.content:
-                return {"ok": True}
+            # Check for Slack API errors
+            if not json_response.get("ok", False):
+                error_msg = json_response.get("error", "Unknown Slack API error")
+                logger.error(f"Slack API error: {error_msg}")
+                raise SlackAPIError(error_msg, json_response)
             
-            try:
-                json_response = response.json()
-                
-                # Check for Slack API errors
-                if not json_response.get("ok", False):
-                    error_msg = json_response.get("error", "Unknown Slack API error")
-                    logger.error(f"Slack API error: {error_msg}")
-                    raise SlackAPIError(error_msg, json_response)
-                
-                return json_response
-            except ValueError as e:
-                # Handle cases where response content exists but isn't valid JSON
-                logger.error(f"Failed to parse JSON response: {e}")
-                logger.error(f"Response content: {response.content}")
-                return {"error": "Invalid JSON response", "content": response.text}
+            return json_response
+        except ValueError as e:
+            # Handle cases where response content exists but isn't valid JSON
+            logger.error(f"Failed to parse JSON response: {e}")
+            logger.error(f"Response content: {response.content}")
+            return {"error": "Invalid JSON response", "content": response.text}
 
 async def make_slack_bot_request(
     method: str, 
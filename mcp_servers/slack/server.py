@@ -42,6 +42,14 @@ from user_tools.user_messages import (
 )
 from user_tools.search import user_search_messages
 from user_tools.users import list_users, user_get_info
+from bot_tools.base import (
+    init_http_clients as init_bot_http_clients,
+    close_http_clients as close_bot_http_clients,
+)
+from user_tools.base import (
+    init_http_clients as init_user_http_clients,
+    close_http_clients as close_user_http_clients,
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -959,13 +967,17 @@ def main(
 
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
-        """Context manager for session manager."""
+        """Context manager for session manager and shared HTTP client."""
+        await init_bot_http_clients()
+        await init_user_http_clients()
         async with session_manager.run():
             logger.info("Application started with dual transports!")
             try:
                 yield
             finally:
                 logger.info("Application shutting down...")
+                await close_bot_http_clients()
+                await close_user_http_clients()
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
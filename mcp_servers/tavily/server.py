@@ -4,7 +4,7 @@ import logging
 import contextlib
 import base64
 from collections.abc import AsyncIterator
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import click
 from dotenv import load_dotenv
@@ -24,6 +24,7 @@ from tools import (
     tavily_crawl,
     tavily_map,
 )
+from tools.progress import ProgressCallback
 
 # Load env early
 load_dotenv()
@@ -240,6 +241,24 @@ def main(port: int, log_level: str, json_response: bool) -> int:
             ),
         ]
 
+    def progress_reporter() -> Optional[ProgressCallback]:
+        """Progress callback for the current request, if the client asked for progress."""
+        ctx = app.request_context
+        progress_token = ctx.meta.progressToken if ctx.meta else None
+        if progress_token is None:
+            return None
+
+        async def report(progress: float, total: Optional[float], message: Optional[str]) -> None:
+            await ctx.session.send_progress_notification(
+                progress_token,
+                progress,
+                total=total,
+                message=message,
+                related_request_id=str(ctx.request_id),
+            )
+
+        return report
+
     # ---------------------------- Tool Dispatcher ----------------------------#
     @app.call_tool()
     async def call_tool(name: str, arguments: Dict[str, Any]) -> list[types.TextContent]:
@@ -248,19 +267,19 @@ def main(port: int, log_level: str, json_response: bool) -> int:
 
         try:
             if name == "tavily_search":
-                result = tavily_search(arguments)
+                result = await tavily_search(arguments)
                 return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
 
             if name == "tavily_extract":
-                result = tavily_extract(arguments)
+                result = await tavily_extract(arguments)
                 return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
 
             if name == "tavily_crawl":
-                result = tavily_crawl(arguments)
+                result = await tavily_crawl(arguments, on_progress=progress_reporter())
                 return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
 
             if name == "tavily_map":
-                result = tavily_map(arguments)
+                result = await tavily_map(arguments, on_progress=progress_reporter())
                 return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
 
             return [types.TextContent(type="text", text=f"Unknown tool: {name}")]
@@ -1,9 +1,11 @@
 import os
 import logging
+from contextlib import asynccontextmanager
 from contextvars import ContextVar
+from typing import AsyncIterator
 
 from dotenv import load_dotenv
-from tavily import TavilyClient
+from tavily import AsyncTavilyClient, TavilyClient
 
 logger = logging.getLogger(__name__)
 
@@ -35,3 +37,16 @@ def get_tavily_client() -> TavilyClient:
     """Create a TavilyClient bound to the current request's API key."""
     api_key = get_tavily_api_key()
     return TavilyClient(api_key=api_key)
+
+
+@asynccontextmanager
+async def get_async_tavily_client() -> AsyncIterator[AsyncTavilyClient]:
+    """Create an AsyncTavilyClient for the current request's API key, closed on exit."""
+    client = AsyncTavilyClient(api_key=get_tavily_api_key())
+    try:
+        yield client
+    finally:
+        # Older tavily-python versions open a connection per request and have no close()
+        close = getattr(client, "close", None)
+        if close is not None:
+            await close()
@@ -0,0 +1,86 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict
+
+from .auth import get_tavily_api_key
+
+logger = logging.getLogger(__name__)
+
+# Agents often repeat the same search or extract within a session
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("TAVILY_CACHE_TTL", "300"))
+RESPONSE_CACHE_MAX_SIZE = int(os.getenv("TAVILY_CACHE_MAX_SIZE", "512"))
+
+
+class TTLCache:
+    """Small LRU cache whose entries expire after a per-entry TTL."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Any, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any, ttl: float) -> None:
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def token_cache_key(token: str) -> str:
+    """Hash a token so it is never kept in cache keys verbatim."""
+    return hashlib.sha256((token or "").encode("utf-8")).hexdigest()
+
+
+_response_cache = TTLCache(RESPONSE_CACHE_MAX_SIZE)
+_response_requests: Dict[tuple, asyncio.Future] = {}
+
+
+async def cached_response(
+    tool: str,
+    params: Dict[str, Any],
+    load: Callable[[], Awaitable[Dict[str, Any]]],
+) -> Dict[str, Any]:
+    """
+    Return a cached response for identical tool arguments of the same API key.
+
+    Identical calls running at the same time share one Tavily request.
+    Failed requests are not cached.
+    """
+    key = (
+        token_cache_key(get_tavily_api_key()),
+        tool,
+        json.dumps(params, sort_keys=True, default=str),
+    )
+    result = _response_cache.get(key)
+    if result is not None:
+        logger.info(f"{tool}: served from cache")
+        return result
+
+    lookup = _response_requests.get(key)
+    if lookup is None:
+        lookup = asyncio.ensure_future(load())
+        _response_requests[key] = lookup
+        lookup.add_done_callback(lambda _: _response_requests.pop(key, None))
+    result = await asyncio.shield(lookup)
+    _response_cache.set(key, result, RESPONSE_CACHE_TTL_SECONDS)
+    return result
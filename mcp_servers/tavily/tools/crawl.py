@@ -1,20 +1,22 @@
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from .auth import get_tavily_client
+from .auth import get_async_tavily_client
+from .progress import ProgressCallback, run_with_progress
 
 logger = logging.getLogger(__name__)
 
 
-def tavily_crawl(arguments: Dict[str, Any]) -> Dict[str, Any]:
+async def tavily_crawl(
+    arguments: Dict[str, Any],
+    on_progress: Optional[ProgressCallback] = None,
+) -> Dict[str, Any]:
     """
     Crawl Website — start from a root URL and follow links with depth/breadth controls.
     Expected args include: url (required), max_depth, max_breadth, limit,
     instructions, select_paths, select_domains, allow_external, categories,
     extract_depth, format, include_favicon.
     """
-    client = get_tavily_client()
-
     url = arguments.get("url")
     if not url:
         raise RuntimeError("Parameter 'url' is required for tavily_crawl")
@@ -59,4 +61,9 @@ def tavily_crawl(arguments: Dict[str, Any]) -> Dict[str, Any]:
         params[k] = _b(params[k])
 
     logger.info(f"tavily_crawl: {url}")
-    return client.crawl(**{k: v for k, v in params.items() if v is not None})
+    async with get_async_tavily_client() as client:
+        return await run_with_progress(
+            client.crawl(**{k: v for k, v in params.items() if v is not None}),
+            on_progress,
+            f"Crawling {url}",
+        )
@@ -1,18 +1,18 @@
 import logging
 from typing import Any, Dict, List
 
-from .auth import get_tavily_client
+from .auth import get_async_tavily_client
+from .cache import cached_response
 
 logger = logging.getLogger(__name__)
 
 
-def tavily_extract(arguments: Dict[str, Any]) -> Dict[str, Any]:
+async def tavily_extract(arguments: Dict[str, Any]) -> Dict[str, Any]:
     """
     Extract Web Content — fetch and parse content from one or more URLs.
     Expected args: urls (List[str]), extract_depth, include_images, format, include_favicon
+    Identical extracts with the same API key are served from a short-lived cache.
     """
-    client = get_tavily_client()
-
     urls = arguments.get("urls")
     if not urls or not isinstance(urls, list):
         raise RuntimeError("Parameter 'urls' (list) is required for tavily_extract")
@@ -40,5 +40,11 @@ def tavily_extract(arguments: Dict[str, Any]) -> Dict[str, Any]:
     params["include_images"] = _b(params["include_images"])
     params["include_favicon"] = _b(params["include_favicon"])
 
-    logger.info(f"tavily_extract: {len(urls)} url(s)")
-    return client.extract(**{k: v for k, v in params.items() if v is not None})
+    params = {k: v for k, v in params.items() if v is not None}
+
+    async def load() -> Dict[str, Any]:
+        logger.info(f"tavily_extract: {len(urls)} url(s)")
+        async with get_async_tavily_client() as client:
+            return await client.extract(**params)
+
+    return await cached_response("tavily_extract", params, load)
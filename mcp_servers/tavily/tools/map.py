@@ -1,19 +1,21 @@
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from .auth import get_tavily_client
+from .auth import get_async_tavily_client
+from .progress import ProgressCallback, run_with_progress
 
 logger = logging.getLogger(__name__)
 
 
-def tavily_map(arguments: Dict[str, Any]) -> Dict[str, Any]:
+async def tavily_map(
+    arguments: Dict[str, Any],
+    on_progress: Optional[ProgressCallback] = None,
+) -> Dict[str, Any]:
     """
     Generate Website Map — discover reachable URLs from a root without heavy extraction.
     Expected args include: url (required), max_depth, max_breadth, limit,
     instructions, select_paths, select_domains, allow_external, categories.
     """
-    client = get_tavily_client()
-
     url = arguments.get("url")
     if not url:
         raise RuntimeError("Parameter 'url' is required for tavily_map")
@@ -55,4 +57,9 @@ def tavily_map(arguments: Dict[str, Any]) -> Dict[str, Any]:
     params["allow_external"] = _b(params["allow_external"])
 
     logger.info(f"tavily_map: {url}")
-    return client.map(**{k: v for k, v in params.items() if v is not None})
+    async with get_async_tavily_client() as client:
+        return await run_with_progress(
+            client.map(**{k: v for k, v in params.items() if v is not None}),
+            on_progress,
+            f"Mapping {url}",
+        )
@@ -0,0 +1,45 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# (progress, total, message) -> None; sends an MCP progress notification
+ProgressCallback = Callable[[float, Optional[float], Optional[str]], Awaitable[None]]
+
+PROGRESS_INTERVAL_SECONDS = float(os.getenv("TAVILY_PROGRESS_INTERVAL", "5"))
+
+
+async def run_with_progress(
+    awaitable: Awaitable[Any],
+    on_progress: Optional[ProgressCallback],
+    message: str,
+    interval: float = PROGRESS_INTERVAL_SECONDS,
+) -> Any:
+    """
+    Await a long Tavily call, reporting elapsed seconds every interval.
+
+    Tavily does not report crawl progress itself, so the notifications are a
+    heartbeat that lets clients show activity and keep the request alive.
+    A failing notification never fails the call.
+    """
+    if on_progress is None:
+        return await awaitable
+
+    task = asyncio.ensure_future(awaitable)
+    started = time.monotonic()
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=interval)
+            if done:
+                return task.result()
+            elapsed = time.monotonic() - started
+            try:
+                await on_progress(elapsed, None, f"{message} ({elapsed:.0f}s elapsed)")
+            except Exception as e:
+                logger.debug(f"Could not send progress notification: {e}")
+    finally:
+        if not task.done():
+            task.cancel()
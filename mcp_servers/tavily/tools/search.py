@@ -1,7 +1,8 @@
 import logging
 from typing import Any, Dict
 
-from .auth import get_tavily_client
+from .auth import get_async_tavily_client
+from .cache import cached_response
 
 logger = logging.getLogger(__name__)
 
@@ -81,15 +82,20 @@ def _normalize_args(arguments: Dict[str, Any]) -> Dict[str, Any]:
     return norm
 
 
-def tavily_search(arguments: Dict[str, Any]) -> Dict[str, Any]:
+async def tavily_search(arguments: Dict[str, Any]) -> Dict[str, Any]:
     """
     Web Search (Tavily).
     Arguments: see server list_tools schema; this function expects a plain dict.
-    Returns a dict as provided by Tavily's client.
+    Returns a dict as provided by Tavily's client. Identical searches with the
+    same API key are served from a short-lived cache.
     """
-    client = get_tavily_client()
     params = _normalize_args(arguments)
     if "query" not in params or not params["query"]:
         raise RuntimeError("Parameter 'query' is required for tavily_search")
-    logger.info(f"tavily_search: {params.get('query')}")
-    return client.search(**params)
+
+    async def load() -> Dict[str, Any]:
+        logger.info(f"tavily_search: {params.get('query')}")
+        async with get_async_tavily_client() as client:
+            return await client.search(**params)
+
+    return await cached_response("tavily_search", params, load)
@@ -3,7 +3,7 @@ import logging
 import os
 import re
 from collections.abc import AsyncIterator
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from urllib.parse import urlparse, parse_qs
 
 import click
@@ -112,6 +112,40 @@ def _extract_video_id(url: str) -> str:
     
     raise ValueError(f"Could not extract video ID from URL: {url}")
 
+# Shared HTTP session, reused across tool calls so connections stay pooled
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Return the process-wide HTTP session, creating it on first use."""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            keepalive_timeout=30,
+        )
+        # No cookie jar: the session is shared across tenants
+        _http_session = aiohttp.ClientSession(
+            connector=connector, cookie_jar=aiohttp.DummyCookieJar()
+        )
+    return _http_session
+
+
+async def init_http_clients() -> None:
+    """Create the shared HTTP session (called from the server lifespan)."""
+    get_http_session()
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP session on server shutdown."""
+    global _http_session
+    if _http_session is not None:
+        try:
+            await _http_session.close()
+        finally:
+            _http_session = None
+
+
 async def _make_youtube_request(endpoint: str, params: Dict[str, Any], headers: Dict[str, Any] = None) -> Any:
     """
     Makes an HTTP request to the YouTube Data API.
@@ -119,25 +153,25 @@ async def _make_youtube_request(endpoint: str, params: Dict[str, Any], headers:
     params["key"] = YOUTUBE_API_KEY
     url = f"{YOUTUBE_API_BASE}/{endpoint}"
     
-    async with aiohttp.ClientSession() as session:
+    session = get_http_session()
+    try:
+        async with session.get(url, params=params, headers=headers) as response:
+            response.raise_for_status()
+            if endpoint == "captions/download":
+                return await response.text()
+            return await response.json()
+    except aiohttp.ClientResponseError as e:
+        logger.error(f"YouTube API request failed: {e.status} {e.message} for GET {url}")
+        error_details = e.message
         try:
-            async with session.get(url, params=params, headers=headers) as response:
-                response.raise_for_status()
-                if endpoint == "captions/download":
-                    return await response.text()
-                return await response.json()
-        except aiohttp.ClientResponseError as e:
-            logger.error(f"YouTube API request failed: {e.status} {e.message} for GET {url}")
-            error_details = e.message
-            try:
-                error_body = await e.response.json()
-                error_details = f"{e.message} - {error_body}"
-            except Exception:
-                pass
-            raise RuntimeError(f"YouTube API Error ({e.status}): {error_details}") from e
-        except Exception as e:
-            logger.error(f"An unexpected error occurred during YouTube API request: {e}")
-            raise RuntimeError(f"Unexpected error during API call to {url}") from e
+            error_body = await e.response.json()
+            error_details = f"{e.message} - {error_body}"
+        except Exception:
+            pass
+        raise RuntimeError(f"YouTube API Error ({e.status}): {error_details}") from e
+    except Exception as e:
+        logger.error(f"An unexpected error occurred during YouTube API request: {e}")
+        raise RuntimeError(f"Unexpected error during API call to {url}") from e
 
 async def get_video_details(video_id: str) -> Dict[str, Any]:
     """Get detailed information about a specific YouTube video."""
@@ -338,13 +372,15 @@ def main(
 
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
-        """Context manager for session manager."""
+        """Context manager for session manager and shared HTTP client."""
+        await init_http_clients()
         async with session_manager.run():
             logger.info("Application started with dual transports!")
             try:
                 yield
             finally:
                 logger.info("Application shutting down...")
+                await close_http_clients()
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
@@ -0,0 +1,147 @@
+"""Fake MCP server used as a backend for router load tests.
+
+Serves a configurable number of synthetic tools (see ``search_benchmark``)
+over stdio or HTTP (StreamableHTTP at ``/mcp`` and SSE at ``/sse``). Every
+tool call sleeps for an artificial latency and echoes its arguments back.
+
+Usage:
+    python benchmarks/fake_mcp_server.py --transport stdio --tools 50
+    python benchmarks/fake_mcp_server.py --transport http --port 9001 --latency-ms 20
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import random
+import sys
+from collections.abc import AsyncIterator
+from typing import Any, Dict, List
+
+import mcp.types as types
+from mcp.server.lowlevel import Server
+from mcp.server.sse import SseServerTransport
+from mcp.server.stdio import stdio_server
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from starlette.applications import Starlette
+from starlette.responses import Response
+from starlette.routing import Mount, Route
+from starlette.types import Receive, Scope, Send
+
+from search_benchmark import generate_catalog
+
+logger = logging.getLogger(__name__)
+
+
+def build_tools(num_tools: int, seed: int = 0) -> List[types.Tool]:
+    """Build ``num_tools`` synthetic tool definitions."""
+    catalog = generate_catalog(num_tools, seed=seed)
+    return [
+        types.Tool(
+            name=tool["name"],
+            description=tool["description"],
+            inputSchema=tool["inputSchema"],
+        )
+        for tools in catalog.values()
+        for tool in tools
+    ]
+
+
+def create_server(
+    name: str, num_tools: int, latency_ms: float, jitter_ms: float, seed: int
+) -> Server:
+    """Create a low-level MCP server exposing synthetic tools."""
+    server = Server(name)
+    tools = build_tools(num_tools, seed=seed)
+    tool_names = {tool.name for tool in tools}
+
+    @server.list_tools()
+    async def list_tools() -> list[types.Tool]:
+        return tools
+
+    @server.call_tool(validate_input=False)
+    async def call_tool(tool_name: str, arguments: Dict[str, Any]) -> list[types.ContentBlock]:
+        if tool_name not in tool_names:
+            raise ValueError(f"Unknown tool: {tool_name}")
+
+        delay = latency_ms + random.uniform(-jitter_ms, jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+        return [
+            types.TextContent(
+                type="text",
+                text=json.dumps({"tool": tool_name, "arguments": arguments}),
+            )
+        ]
+
+    return server
+
+
+async def run_stdio(server: Server) -> None:
+    async with stdio_server() as (read_stream, write_stream):
+        await server.run(read_stream, write_stream, server.create_initialization_options())
+
+
+def run_http(server: Server, port: int) -> None:
+    sse = SseServerTransport("/messages/")
+
+    async def handle_sse(request):
+        async with sse.connect_sse(
+            request.scope, request.receive, request._send
+        ) as streams:
+            await server.run(streams[0], streams[1], server.create_initialization_options())
+        return Response()
+
+    session_manager = StreamableHTTPSessionManager(
+        app=server, event_store=None, json_response=False, stateless=True
+    )
+
+    async def handle_streamable_http(scope: Scope, receive: Receive, send: Send) -> None:
+        await session_manager.handle_request(scope, receive, send)
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        async with session_manager.run():
+            yield
+
+    app = Starlette(
+        routes=[
+            Route("/sse", endpoint=handle_sse, methods=["GET"]),
+            Mount("/messages/", app=sse.handle_post_message),
+            Mount("/mcp", app=handle_streamable_http),
+        ],
+        lifespan=lifespan,
+    )
+
+    import uvicorn
+
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Fake MCP server for load tests")
+    parser.add_argument("--name", default="fake", help="Server name")
+    parser.add_argument("--transport", choices=["stdio", "http"], default="stdio")
+    parser.add_argument("--port", type=int, default=9000, help="Port for http transport")
+    parser.add_argument("--tools", type=int, default=50, help="Number of tools")
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="Artificial latency per tool call"
+    )
+    parser.add_argument(
+        "--jitter-ms", type=float, default=0.0, help="Uniform jitter added to latency"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for tool catalog")
+    args = parser.parse_args(argv)
+
+    server = create_server(args.name, args.tools, args.latency_ms, args.jitter_ms, args.seed)
+    if args.transport == "stdio":
+        asyncio.run(run_stdio(server))
+    else:
+        run_http(server, args.port)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,399 @@
+"""End-to-end load test for the Strata router.
+
+Starts N fake MCP backends (see ``fake_mcp_server.py``) over stdio and HTTP,
+starts the router in HTTP mode in front of them and drives
+``discover_server_actions``, ``get_action_details`` and ``execute_action``
+through the router's ``/mcp`` or ``/sse`` endpoint at a target request rate.
+
+Reports per-operation latency percentiles and error rates as JSON.
+
+Usage:
+    python benchmarks/router_load_test.py --stdio-servers 2 --http-servers 2 \\
+        --tools 100 --latency-ms 20 --rps 50 --duration 30
+    python benchmarks/router_load_test.py --endpoint sse --output load.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+from mcp.client.streamable_http import streamablehttp_client
+
+from bench_utils import percentile
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+FAKE_SERVER = BENCHMARKS_DIR / "fake_mcp_server.py"
+
+OPERATIONS = ["discover_server_actions", "get_action_details", "execute_action"]
+
+QUERIES = [
+    "create a new issue",
+    "list all messages",
+    "update contact",
+    "delete archived file",
+    "search invoices",
+    "get event details",
+]
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _wait_for_port(port: int, timeout: float = 30.0) -> None:
+    """Wait until something is listening on ``port``."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            await writer.wait_closed()
+            return
+        except OSError:
+            await asyncio.sleep(0.2)
+    raise TimeoutError(f"Nothing listening on port {port} after {timeout}s")
+
+
+def _fake_server_args(args, name: str, transport: str, port: Optional[int] = None) -> List[str]:
+    cmd = [
+        str(FAKE_SERVER),
+        "--name",
+        name,
+        "--transport",
+        transport,
+        "--tools",
+        str(args.tools),
+        "--latency-ms",
+        str(args.latency_ms),
+        "--jitter-ms",
+        str(args.jitter_ms),
+    ]
+    if port is not None:
+        cmd += ["--port", str(port)]
+    return cmd
+
+
+class RouterCluster:
+    """Fake backends plus a router process, torn down on exit."""
+
+    def __init__(self, args):
+        self.args = args
+        self.processes: List[subprocess.Popen] = []
+        self.tmpdir = tempfile.TemporaryDirectory(prefix="strata-load-")
+        self.router_port = args.router_port or _free_port()
+        self.server_names: List[str] = []
+
+    def _spawn(self, cmd: List[str], env: Optional[Dict[str, str]] = None) -> None:
+        self.processes.append(
+            subprocess.Popen(
+                cmd,
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL if not self.args.verbose else None,
+            )
+        )
+
+    async def start(self) -> None:
+        servers: Dict[str, Dict[str, Any]] = {}
+
+        for i in range(self.args.stdio_servers):
+            name = f"stdio{i}"
+            servers[name] = {
+                "command": sys.executable,
+                "args": _fake_server_args(self.args, name, "stdio"),
+                "enabled": True,
+            }
+
+        http_ports = []
+        for i in range(self.args.http_servers):
+            name = f"http{i}"
+            port = _free_port()
+            self._spawn([sys.executable] + _fake_server_args(self.args, name, "http", port))
+            http_ports.append(port)
+            servers[name] = {
+                "type": "http",
+                "url": f"http://127.0.0.1:{port}/mcp/",
+                "enabled": True,
+            }
+
+        for port in http_ports:
+            await _wait_for_port(port)
+
+        # The router reads the default config location, so point
+        # XDG_CONFIG_HOME at a scratch directory holding our config.
+        config_path = Path(self.tmpdir.name) / "strata" / "servers.json"
+        config_path.parent.mkdir(parents=True)
+        config_path.write_text(json.dumps({"mcp": {"servers": servers}}, indent=2))
+        self.server_names = list(servers)
+
+        env = dict(os.environ, XDG_CONFIG_HOME=self.tmpdir.name)
+        self._spawn(
+            [
+                sys.executable,
+                "-m",
+                "strata",
+                "--config-path",
+                str(config_path),
+                "run",
+                "--port",
+                str(self.router_port),
+                "--no-banner",
+                "--log-level",
+                "WARNING",
+            ],
+            env=env,
+        )
+        await _wait_for_port(self.router_port)
+
+    def stop(self) -> None:
+        for proc in self.processes:
+            proc.terminate()
+        for proc in self.processes:
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        self.tmpdir.cleanup()
+
+
+@contextlib.asynccontextmanager
+async def open_session(url: str, endpoint: str):
+    """Open an initialized client session against the router."""
+    if endpoint == "sse":
+        client = sse_client(url)
+    else:
+        client = streamablehttp_client(url)
+    async with client as streams:
+        async with ClientSession(streams[0], streams[1]) as session:
+            await session.initialize()
+            yield session
+
+
+def _result_text(result) -> str:
+    return "".join(getattr(block, "text", "") for block in result.content)
+
+
+def _is_error(result) -> bool:
+    if result.isError:
+        return True
+    text = _result_text(result)
+    if text.startswith("Error"):
+        return True
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return False
+    return isinstance(data, dict) and "error" in data
+
+
+async def wait_for_backends(
+    session: ClientSession, server_names: List[str], timeout: float = 60.0
+) -> Dict[str, List[str]]:
+    """Wait until the router reports actions for every backend."""
+    deadline = time.monotonic() + timeout
+    while True:
+        result = await session.call_tool(
+            "discover_server_actions", {"user_query": "", "server_names": server_names}
+        )
+        try:
+            servers = json.loads(_result_text(result)).get("servers", {})
+        except ValueError:
+            servers = {}
+        actions = {
+            name: info.get("actions", [])
+            for name, info in servers.items()
+            if info.get("actions")
+        }
+        if len(actions) == len(server_names):
+            return actions
+        if time.monotonic() > deadline:
+            missing = sorted(set(server_names) - set(actions))
+            raise TimeoutError(f"Router never connected to backends: {missing}")
+        await asyncio.sleep(0.5)
+
+
+def _build_call(op: str, rng: random.Random, actions: Dict[str, List[str]]):
+    server_name = rng.choice(list(actions))
+    if op == "discover_server_actions":
+        return op, {"user_query": rng.choice(QUERIES), "server_names": [server_name]}
+    action_name = rng.choice(actions[server_name])
+    if op == "get_action_details":
+        return op, {"server_name": server_name, "action_name": action_name}
+    return op, {
+        "server_name": server_name,
+        "action_name": action_name,
+        "body_schema": json.dumps({"limit": 10}),
+    }
+
+
+async def run_load(
+    url: str,
+    endpoint: str,
+    actions: Dict[str, List[str]],
+    rps: float,
+    duration: float,
+    concurrency: int,
+    mix: List[float],
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Issue calls at ``rps`` (open loop) over a pool of ``concurrency`` sessions."""
+    rng = random.Random(seed)
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    pending: List[asyncio.Task] = []
+
+    async with contextlib.AsyncExitStack() as stack:
+        pool: asyncio.Queue = asyncio.Queue()
+        for _ in range(concurrency):
+            pool.put_nowait(await stack.enter_async_context(open_session(url, endpoint)))
+
+        async def issue(op: str, arguments: Dict[str, Any]) -> None:
+            # Latency includes queueing for a free session, as a real client would see
+            start = time.perf_counter()
+            session = await pool.get()
+            try:
+                result = await session.call_tool(op, arguments)
+                if _is_error(result):
+                    errors[op] += 1
+            except Exception:
+                errors[op] += 1
+            finally:
+                pool.put_nowait(session)
+                latencies[op].append((time.perf_counter() - start) * 1000)
+
+        total = int(rps * duration)
+        started = time.perf_counter()
+        for i in range(total):
+            delay = started + i / rps - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            op = rng.choices(OPERATIONS, weights=mix)[0]
+            pending.append(asyncio.create_task(issue(*_build_call(op, rng, actions))))
+        await asyncio.gather(*pending)
+        elapsed = time.perf_counter() - started
+
+    def summarize(values: List[float], error_count: int) -> Dict[str, Any]:
+        count = len(values)
+        return {
+            "count": count,
+            "errors": error_count,
+            "error_rate": round(error_count / count, 4) if count else 0.0,
+            "latency_ms": {
+                "p50": round(percentile(values, 50), 3),
+                "p90": round(percentile(values, 90), 3),
+                "p99": round(percentile(values, 99), 3),
+                "max": round(max(values), 3) if values else 0.0,
+            },
+        }
+
+    all_latencies = [v for values in latencies.values() for v in values]
+    return {
+        "target_rps": rps,
+        "achieved_rps": round(len(all_latencies) / elapsed, 2) if elapsed else 0.0,
+        "elapsed_seconds": round(elapsed, 3),
+        "overall": summarize(all_latencies, sum(errors.values())),
+        "operations": {op: summarize(latencies[op], errors[op]) for op in OPERATIONS},
+    }
+
+
+async def main_async(args) -> Dict[str, Any]:
+    cluster = RouterCluster(args)
+    try:
+        await cluster.start()
+        path = "/sse" if args.endpoint == "sse" else "/mcp/"
+        url = f"http://127.0.0.1:{cluster.router_port}{path}"
+
+        async with open_session(url, args.endpoint) as session:
+            actions = await wait_for_backends(session, cluster.server_names)
+
+        results = await run_load(
+            url,
+            args.endpoint,
+            actions,
+            rps=args.rps,
+            duration=args.duration,
+            concurrency=args.concurrency,
+            mix=args.mix,
+            seed=args.seed,
+        )
+    finally:
+        cluster.stop()
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "endpoint": args.endpoint,
+            "stdio_servers": args.stdio_servers,
+            "http_servers": args.http_servers,
+            "tools_per_server": args.tools,
+            "backend_latency_ms": args.latency_ms,
+            "backend_jitter_ms": args.jitter_ms,
+            "concurrency": args.concurrency,
+            "duration_seconds": args.duration,
+            "mix": dict(zip(OPERATIONS, args.mix)),
+        },
+        "results": results,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Load test the Strata router")
+    parser.add_argument("--stdio-servers", type=int, default=2)
+    parser.add_argument("--http-servers", type=int, default=2)
+    parser.add_argument("--tools", type=int, default=100, help="Tools per backend")
+    parser.add_argument("--latency-ms", type=float, default=10.0, help="Backend latency")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Backend jitter")
+    parser.add_argument("--endpoint", choices=["mcp", "sse"], default="mcp")
+    parser.add_argument("--router-port", type=int, help="Router port (default: random)")
+    parser.add_argument("--rps", type=float, default=20.0, help="Target requests/sec")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of load")
+    parser.add_argument(
+        "--concurrency", type=int, default=8, help="Number of client sessions"
+    )
+    parser.add_argument(
+        "--mix",
+        type=float,
+        nargs=3,
+        default=[1.0, 1.0, 2.0],
+        metavar=("DISCOVER", "DETAILS", "EXECUTE"),
+        help="Relative weights of the three operations",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--verbose", action="store_true", help="Show backend stderr")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    args = parser.parse_args(argv)
+
+    if args.stdio_servers + args.http_servers < 1:
+        parser.error("At least one backend server is required")
+
+    report = asyncio.run(main_async(args))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,317 @@
+"""Benchmark harness for Strata tool search engines.
+
+Generates synthetic tool catalogs shaped like the MCP server tool definitions
+in ``mcp_servers/*`` and measures, for every search engine and catalog size:
+
+- index build time
+- p50/p99 query latency
+- memory footprint of the built index (tracemalloc)
+- recall@k against a labeled query set
+
+Results are emitted as JSON so CI can track them over time.
+
+Usage:
+    python benchmarks/search_benchmark.py
+    python benchmarks/search_benchmark.py --sizes 100 1000 --engines bm25
+    python benchmarks/search_benchmark.py --output results.json
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple
+
+from strata.utils.shared_search import SEARCH_ENGINES, UniversalToolSearcher
+
+from bench_utils import percentile
+
+ENGINES = SEARCH_ENGINES
+
+DEFAULT_SIZES = [100, 1000, 10000, 50000]
+DEFAULT_RECALL_K = [1, 5, 10]
+
+# Service -> (display name, objects) modelled after mcp_servers/*
+SERVICES: Dict[str, Tuple[str, List[str]]] = {
+    "slack": ("Slack", ["message", "channel", "user", "reaction", "file"]),
+    "hubspot": ("HubSpot", ["contact", "company", "deal", "ticket", "note"]),
+    "google_calendar": ("Google Calendar", ["event", "calendar", "attendee"]),
+    "github": ("GitHub", ["issue", "pull_request", "repository", "branch"]),
+    "jira": ("Jira", ["issue", "sprint", "board", "comment"]),
+    "notion": ("Notion", ["page", "database", "block", "comment"]),
+    "quickbooks": ("QuickBooks", ["invoice", "customer", "payment", "vendor"]),
+    "asana": ("Asana", ["task", "project", "tag", "workspace"]),
+    "google_drive": ("Google Drive", ["file", "folder", "permission"]),
+    "salesforce": ("Salesforce", ["account", "opportunity", "lead", "case"]),
+    "linear": ("Linear", ["issue", "project", "team", "cycle"]),
+    "airtable": ("Airtable", ["record", "table", "base", "field"]),
+}
+
+# verb -> (description prefix, query synonyms)
+VERBS: Dict[str, Tuple[str, List[str]]] = {
+    "create": ("Create a new", ["add", "make", "new"]),
+    "get": ("Retrieve a single", ["fetch", "show", "read"]),
+    "list": ("List all", ["show all", "enumerate", "browse"]),
+    "update": ("Update an existing", ["edit", "modify", "change"]),
+    "delete": ("Delete a", ["remove", "erase", "drop"]),
+    "search": ("Search for", ["find", "look up", "query"]),
+}
+
+QUALIFIERS = ["", "archived", "shared", "scheduled", "draft", "recent", "starred"]
+
+PARAM_TEMPLATES = [
+    ("limit", "integer", "Maximum number of results to return (1-100)."),
+    ("cursor", "string", "Pagination cursor returned by a previous call."),
+    ("fields", "array", "List of fields to include in the response."),
+    ("include_archived", "boolean", "Whether to include archived items."),
+    ("sort_by", "string", "Field used to sort the results."),
+    ("query", "string", "Free-text query used to filter results."),
+]
+
+
+def _make_tool(
+    rng: random.Random,
+    service: str,
+    display: str,
+    verb: str,
+    qualifier: str,
+    obj: str,
+) -> Dict[str, Any]:
+    """Build a single tool definition with a realistic input schema."""
+    obj_words = obj.replace("_", " ")
+    name_parts = [service, verb] + ([qualifier] if qualifier else []) + [obj]
+    name = "_".join(name_parts)
+    subject = f"{qualifier} {obj_words}".strip()
+    description = (
+        f"{VERBS[verb][0]} {subject} in {display}. "
+        f"Use this tool to {verb} {subject} records via the {display} API."
+    )
+
+    properties: Dict[str, Any] = {}
+    required: List[str] = []
+    if verb in ("get", "update", "delete"):
+        properties[f"{obj}_id"] = {
+            "type": "string",
+            "description": f"The unique identifier of the {obj_words}.",
+        }
+        required.append(f"{obj}_id")
+    if verb in ("create", "update"):
+        properties["name"] = {
+            "type": "string",
+            "description": f"The name of the {obj_words}.",
+        }
+        properties["properties"] = {
+            "type": "object",
+            "description": f"Additional {obj_words} properties as key/value pairs.",
+            "additionalProperties": {"type": "string"},
+        }
+        if verb == "create":
+            required.append("name")
+    for param_name, param_type, param_desc in rng.sample(
+        PARAM_TEMPLATES, rng.randint(1, 3)
+    ):
+        schema: Dict[str, Any] = {"type": param_type, "description": param_desc}
+        if param_type == "array":
+            schema["items"] = {"type": "string"}
+        properties[param_name] = schema
+
+    return {
+        "name": name,
+        "description": description,
+        "inputSchema": {
+            "type": "object",
+            "properties": properties,
+            "required": required,
+        },
+    }
+
+
+def generate_catalog(size: int, seed: int = 0) -> Dict[str, List[Dict[str, Any]]]:
+    """Generate a synthetic catalog of ``size`` tools grouped by server.
+
+    Once every (service, verb, qualifier, object) combination is used, further
+    tools are placed on numbered replica servers (e.g. ``slack_2``), mimicking
+    several instances of the same MCP server behind one router.
+    """
+    rng = random.Random(seed)
+    combos = [
+        (service, verb, qualifier, obj)
+        for service, (_, objects) in SERVICES.items()
+        for obj in objects
+        for verb in VERBS
+        for qualifier in QUALIFIERS
+    ]
+    rng.shuffle(combos)
+
+    catalog: Dict[str, List[Dict[str, Any]]] = {}
+    for i in range(size):
+        service, verb, qualifier, obj = combos[i % len(combos)]
+        replica = i // len(combos)
+        server_name = service if replica == 0 else f"{service}_{replica + 1}"
+        display = SERVICES[service][0]
+        tool = _make_tool(rng, server_name, display, verb, qualifier, obj)
+        catalog.setdefault(server_name, []).append(tool)
+    return catalog
+
+
+def generate_queries(
+    catalog: Dict[str, List[Dict[str, Any]]], count: int, seed: int = 0
+) -> List[Dict[str, str]]:
+    """Generate labeled queries, each targeting exactly one tool.
+
+    Half of the queries use the literal verb, the other half a synonym, so the
+    set exercises both exact lexical matches and looser phrasing.
+    """
+    rng = random.Random(seed + 1)
+    all_tools = [
+        (server_name, tool["name"])
+        for server_name, tools in catalog.items()
+        for tool in tools
+    ]
+    targets = rng.sample(all_tools, min(count, len(all_tools)))
+
+    queries = []
+    for i, (server_name, tool_name) in enumerate(targets):
+        words = tool_name[len(server_name) + 1 :].split("_")
+        verb, subject = words[0], " ".join(words[1:])
+        if i % 2:
+            verb = rng.choice(VERBS[verb][1])
+        queries.append(
+            {
+                "query": f"{verb} {subject} {server_name.replace('_', ' ')}",
+                "expected": f"{server_name}::{tool_name}",
+            }
+        )
+    return queries
+
+
+def benchmark_engine(
+    engine_name: str,
+    catalog: Dict[str, List[Dict[str, Any]]],
+    queries: List[Dict[str, str]],
+    recall_k: List[int],
+) -> Dict[str, Any]:
+    """Benchmark a single engine against a catalog and labeled queries."""
+    engine_cls = ENGINES[engine_name]
+
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    searcher = UniversalToolSearcher(catalog, search_engine_cls=engine_cls)
+    build_seconds = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    max_k = max(recall_k)
+    latencies_ms = []
+    hits = {k: 0 for k in recall_k}
+    for labeled in queries:
+        start = time.perf_counter()
+        results = searcher.search(labeled["query"], max_results=max_k)
+        latencies_ms.append((time.perf_counter() - start) * 1000)
+
+        ranked = [f"{r['category_name']}::{r['name']}" for r in results]
+        for k in recall_k:
+            if labeled["expected"] in ranked[:k]:
+                hits[k] += 1
+
+    num_queries = len(queries) or 1
+    return {
+        "engine": engine_name,
+        "num_tools": sum(len(tools) for tools in catalog.values()),
+        "num_servers": len(catalog),
+        "build_seconds": round(build_seconds, 6),
+        "index_memory_bytes": current - baseline,
+        "index_peak_memory_bytes": peak - baseline,
+        "query_count": len(queries),
+        "latency_ms": {
+            "p50": round(percentile(latencies_ms, 50), 4),
+            "p99": round(percentile(latencies_ms, 99), 4),
+            "mean": round(sum(latencies_ms) / num_queries, 4),
+        },
+        "recall": {f"@{k}": round(hits[k] / num_queries, 4) for k in recall_k},
+    }
+
+
+def run_benchmark(
+    sizes: List[int],
+    engines: List[str],
+    num_queries: int = 100,
+    recall_k: List[int] = DEFAULT_RECALL_K,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Run all engine/size combinations and return a JSON-serializable report."""
+    results = []
+    for size in sizes:
+        catalog = generate_catalog(size, seed=seed)
+        queries = generate_queries(catalog, num_queries, seed=seed)
+        for engine_name in engines:
+            print(f"Benchmarking {engine_name} with {size} tools...", file=sys.stderr)
+            results.append(benchmark_engine(engine_name, catalog, queries, recall_k))
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "results": results,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Strata search engines")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="Catalog sizes (number of tools) to benchmark",
+    )
+    parser.add_argument(
+        "--engines",
+        nargs="+",
+        choices=sorted(ENGINES),
+        default=sorted(ENGINES),
+        help="Search engines to benchmark",
+    )
+    parser.add_argument(
+        "--queries", type=int, default=100, help="Number of labeled queries per size"
+    )
+    parser.add_argument(
+        "--recall-k",
+        type=int,
+        nargs="+",
+        default=DEFAULT_RECALL_K,
+        help="Cut-offs used for recall@k",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument(
+        "--output", help="Write JSON results to this file instead of stdout"
+    )
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        sizes=args.sizes,
+        engines=args.engines,
+        num_queries=args.queries,
+        recall_k=args.recall_k,
+        seed=args.seed,
+    )
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,20 @@
 """MCP Client for connecting to and interacting with MCP servers."""
 
 import logging
+import os
 from typing import Any, Dict, List, Optional
 
 from mcp import types
 
+from strata.utils.schema_compaction import compact_schema
 from .transport import Transport
 
 logger = logging.getLogger(__name__)
 
+# Schema compaction for get_action_details, precomputed when tools are fetched
+COMPACT_SCHEMAS = os.getenv("STRATA_COMPACT_SCHEMAS", "true").lower() != "false"
+SCHEMA_DESCRIPTION_BUDGET = int(os.getenv("STRATA_SCHEMA_DESCRIPTION_BUDGET", "0")) or None
+
 
 class MCPClient:
     """Client for connecting to MCP servers using various transports.
@@ -33,6 +39,8 @@ class MCPClient:
         """
         self.transport = transport
         self._tools_cache: Optional[List[Dict[str, Any]]] = None
+        # Tool name -> compacted inputSchema, filled together with _tools_cache
+        self._compact_schemas: Dict[str, Any] = {}
 
     async def initialize(self) -> None:
         """Initialize the MCP client by connecting the transport."""
@@ -49,6 +57,7 @@ class MCPClient:
         """Disconnect from the MCP server."""
         await self.transport.disconnect()
         self._tools_cache = None
+        self._compact_schemas = {}
         logger.info("Disconnected from MCP server")
 
     def is_connected(self) -> bool:
@@ -90,6 +99,13 @@ class MCPClient:
             tools.append(tool_dict)
 
         self._tools_cache = tools
+        self._compact_schemas = {}
+        if COMPACT_SCHEMAS:
+            for tool in tools:
+                self._compact_schemas[tool["name"]] = compact_schema(
+                    tool["inputSchema"],
+                    max_description_length=SCHEMA_DESCRIPTION_BUDGET,
+                )
         logger.info(f"Retrieved {len(tools)} tools from MCP server")
 
         return tools
@@ -138,6 +154,18 @@ class MCPClient:
 
         return None
 
+    def get_compact_schema(self, tool_name: str) -> Optional[Any]:
+        """Get the precomputed compacted inputSchema for a tool.
+
+        Args:
+            tool_name: Name of the tool
+
+        Returns:
+            Compacted schema, or None if compaction is disabled or the tool
+            has not been listed yet
+        """
+        return self._compact_schemas.get(tool_name)
+
     async def __aenter__(self):
         """Enter async context manager."""
         await self.connect()
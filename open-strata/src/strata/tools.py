@@ -2,7 +2,9 @@
 
 import json
 import logging
-from typing import List
+import os
+from collections import OrderedDict
+from typing import Any, Dict, List
 
 import mcp.types as types
 
@@ -18,6 +20,26 @@ TOOL_EXECUTE_ACTION = "execute_action"
 TOOL_SEARCH_DOCUMENTATION = "search_documentation"
 TOOL_HANDLE_AUTH_FAILURE = "handle_auth_failure"
 
+# Per-server searchers, kept across calls so their query caches stay warm.
+# The least recently used searcher is dropped beyond this many servers.
+SEARCHER_CACHE_SIZE = int(os.getenv("STRATA_SEARCHER_CACHE_SIZE", "64"))
+_searchers: "OrderedDict[str, UniversalToolSearcher]" = OrderedDict()
+
+
+def get_searcher(server_name: str, tools: List[Dict[str, Any]]) -> UniversalToolSearcher:
+    """Get the searcher for a server, rebuilding its index if the tool list changed."""
+    searcher = _searchers.get(server_name)
+    if searcher is None:
+        searcher = UniversalToolSearcher({server_name: tools})
+        _searchers[server_name] = searcher
+        while len(_searchers) > max(SEARCHER_CACHE_SIZE, 1):
+            _searchers.popitem(last=False)
+    else:
+        _searchers.move_to_end(server_name)
+        if searcher.tools_map.get(server_name) is not tools:
+            searcher.update_tools({server_name: tools})
+    return searcher
+
 
 def get_tool_definitions(user_available_servers: List[str]) -> List[types.Tool]:
     """Get tool definitions for the available servers."""
@@ -169,8 +191,7 @@ async def execute_tool(
 
                     # Filter tools based on user query if provided
                     if user_query and tools:
-                        tools_map = {server_name: tools}
-                        searcher = UniversalToolSearcher(tools_map)
+                        searcher = get_searcher(server_name, tools)
                         search_results = searcher.search(user_query, max_results=50)
 
                         filtered_action_names = []
@@ -225,12 +246,15 @@ async def execute_tool(
                         break
 
                 if action_found:
+                    input_schema = client.get_compact_schema(action_name)
+                    if input_schema is None:
+                        input_schema = action_found["inputSchema"]
                     result = {
                         "server": server_name,
                         "action": {
                             "name": action_found["name"],
                             "description": action_found["description"],
-                            "inputSchema": action_found["inputSchema"],
+                            "inputSchema": input_schema,
                         },
                     }
                 else:
@@ -308,9 +332,11 @@ async def execute_tool(
                 client = client_manager.get_client(server_name)
                 tools = await client.list_tools()
 
-                tools_map = {server_name: tools if tools else []}
-                searcher = UniversalToolSearcher(tools_map)
-                result = searcher.search(query, max_results=max_results)
+                if tools:
+                    searcher = get_searcher(server_name, tools)
+                    result = searcher.search(query, max_results=max_results)
+                else:
+                    result = []
             except KeyError:
                 result = [
                     {"error": f"Server '{server_name}' not found or not connected"}
@@ -90,6 +90,7 @@ class BM25SearchEngine:
         corpus_tokens = bm25s.tokenize(
             corpus,
             stopwords=[],  # Disable stopwords for better field matching
+            stemmer=self.stemmer,
             show_progress=False,
         )
 
@@ -121,6 +122,7 @@ class BM25SearchEngine:
         query_tokens = bm25s.tokenize(
             query,
             stopwords=[],  # Disable stopwords to match build_index
+            stemmer=self.stemmer,
             show_progress=False,
         )
 
@@ -0,0 +1,197 @@
+"""
+JSON Schema compaction for action details
+
+Backend tool schemas are returned to the model verbatim by get_action_details.
+Many servers generate large schemas with auto-generated titles, default
+keywords and the same nested object repeated for several properties.
+compact_schema() produces an equivalent, smaller schema:
+
+1. Redundant keys are stripped: "$schema", "$id", auto-generated titles
+   (e.g. "title": "Start Time" on property "start_time"),
+   "additionalProperties": true, "default": null and empty "description",
+   "required" or "examples" values
+2. Non-trivial subschemas that occur more than once are moved into "$defs"
+   and replaced with {"$ref": "#/$defs/<Name>"}
+3. Optionally, descriptions longer than a character budget are truncated
+
+Only schema positions (properties, items, anyOf, ...) are rewritten; values of
+data keywords such as "enum", "const", "default" and "examples" are left as is.
+"""
+
+import json
+import re
+from collections import Counter
+from typing import Any, Dict, Optional
+
+# Keywords whose value is a subschema
+_SCHEMA_KEYWORDS = ("items", "additionalProperties", "not", "if", "then", "else", "contains")
+# Keywords whose value is a list of subschemas
+_SCHEMA_LIST_KEYWORDS = ("anyOf", "oneOf", "allOf", "prefixItems")
+# Keywords whose value maps names to subschemas
+_SCHEMA_MAP_KEYWORDS = ("properties", "patternProperties", "$defs", "definitions")
+
+# Subschemas smaller than this (serialized) are never moved to $defs
+MIN_DEDUPE_SIZE = 80
+
+
+def _canonical(schema: Any) -> str:
+    return json.dumps(schema, sort_keys=True, separators=(",", ":"))
+
+
+def _is_auto_title(title: Any, name: Optional[str]) -> bool:
+    """Whether a title is just the prettified property name."""
+    if not isinstance(title, str) or not name:
+        return False
+    normalize = lambda s: re.sub(r"[^a-z0-9]", "", s.lower())  # noqa: E731
+    return normalize(title) == normalize(name)
+
+
+def _strip(
+    schema: Any, name: Optional[str], max_description_length: Optional[int]
+) -> Any:
+    """Recursively remove redundant keys from a schema."""
+    if not isinstance(schema, dict):
+        return schema
+
+    result = {}
+    for key, value in schema.items():
+        if key in ("$schema", "$id"):
+            continue
+        if key == "title" and _is_auto_title(value, name):
+            continue
+        if key == "additionalProperties" and value is True:
+            continue
+        if key == "default" and value is None:
+            continue
+        if key in ("description", "required", "examples") and not value:
+            continue
+
+        if key == "description" and isinstance(value, str):
+            if max_description_length and len(value) > max_description_length:
+                value = value[: max(0, max_description_length - 3)].rstrip() + "..."
+        elif key in _SCHEMA_KEYWORDS:
+            value = _strip(value, None, max_description_length)
+        elif key in _SCHEMA_LIST_KEYWORDS and isinstance(value, list):
+            value = [_strip(item, None, max_description_length) for item in value]
+        elif key in _SCHEMA_MAP_KEYWORDS and isinstance(value, dict):
+            value = {
+                sub_name: _strip(sub_schema, sub_name, max_description_length)
+                for sub_name, sub_schema in value.items()
+            }
+
+        result[key] = value
+    return result
+
+
+def _iter_subschemas(schema: Any):
+    """Yield (name_hint, subschema) for every nested subschema position."""
+    if not isinstance(schema, dict):
+        return
+    for key, value in schema.items():
+        if key in ("$defs", "definitions"):
+            continue
+        if key in _SCHEMA_KEYWORDS and isinstance(value, dict):
+            yield key, value
+            yield from _iter_subschemas(value)
+        elif key in _SCHEMA_LIST_KEYWORDS and isinstance(value, list):
+            for item in value:
+                if isinstance(item, dict):
+                    yield key, item
+                    yield from _iter_subschemas(item)
+        elif key in _SCHEMA_MAP_KEYWORDS and isinstance(value, dict):
+            for sub_name, sub_schema in value.items():
+                if isinstance(sub_schema, dict):
+                    yield sub_name, sub_schema
+                    yield from _iter_subschemas(sub_schema)
+
+
+def _def_name(hint: str, schema: Dict[str, Any], taken: set) -> str:
+    """Derive a unique $defs name from a title or property name."""
+    base = schema.get("title") if isinstance(schema.get("title"), str) else hint
+    base = "".join(part.capitalize() for part in re.split(r"[^A-Za-z0-9]+", base) if part)
+    base = base or "Schema"
+    name, i = base, 2
+    while name in taken:
+        name, i = f"{base}{i}", i + 1
+    taken.add(name)
+    return name
+
+
+def _dedupe(schema: Dict[str, Any], min_size: int) -> Dict[str, Any]:
+    """Move repeated subschemas into $defs."""
+    counts = Counter()
+    hints: Dict[str, str] = {}
+    for hint, subschema in _iter_subschemas(schema):
+        if "$ref" in subschema:
+            continue
+        canonical = _canonical(subschema)
+        if len(canonical) >= min_size:
+            counts[canonical] += 1
+            hints.setdefault(canonical, hint)
+
+    repeated = {canonical for canonical, count in counts.items() if count > 1}
+    if not repeated:
+        return schema
+
+    defs = dict(schema.get("$defs", {}))
+    taken = set(defs)
+    refs: Dict[str, str] = {}
+
+    def replace(node: Any) -> Any:
+        if not isinstance(node, dict):
+            return node
+        canonical = _canonical(node)
+        if canonical in repeated:
+            if canonical not in refs:
+                name = _def_name(hints[canonical], node, taken)
+                refs[canonical] = name
+                defs[name] = node
+            return {"$ref": f"#/$defs/{refs[canonical]}"}
+        return rewrite(node)
+
+    def rewrite(node: Dict[str, Any]) -> Dict[str, Any]:
+        result = {}
+        for key, value in node.items():
+            if key in ("$defs", "definitions"):
+                result[key] = value
+            elif key in _SCHEMA_KEYWORDS and isinstance(value, dict):
+                result[key] = replace(value)
+            elif key in _SCHEMA_LIST_KEYWORDS and isinstance(value, list):
+                result[key] = [replace(item) for item in value]
+            elif key in _SCHEMA_MAP_KEYWORDS and isinstance(value, dict):
+                result[key] = {k: replace(v) for k, v in value.items()}
+            else:
+                result[key] = value
+        return result
+
+    compacted = rewrite(schema)
+    compacted["$defs"] = defs
+    return compacted
+
+
+def compact_schema(
+    schema: Any,
+    max_description_length: Optional[int] = None,
+    dedupe: bool = True,
+    min_dedupe_size: int = MIN_DEDUPE_SIZE,
+) -> Any:
+    """
+    Return a compacted copy of a JSON schema.
+
+    Args:
+        schema: JSON schema (typically a tool's inputSchema)
+        max_description_length: Truncate longer descriptions to this many
+                                characters (None keeps them intact)
+        dedupe: Whether to move repeated subschemas into $defs
+        min_dedupe_size: Minimum serialized size of a subschema to dedupe
+
+    Returns:
+        Compacted schema; non-dict input is returned unchanged
+    """
+    if not isinstance(schema, dict):
+        return schema
+
+    compacted = _strip(schema, None, max_description_length)
+    if dedupe:
+        compacted = _dedupe(compacted, min_dedupe_size)
+    return compacted
@@ -4,11 +4,107 @@ Provides type-safe interfaces for searching through MCP tools
 Uses a unified generic approach to reduce code duplication.
 """
 
-from typing import Any, Dict, List, Optional
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Type
 
+import Stemmer
 from mcp import types
 
 from strata.utils.bm25_search import BM25SearchEngine
+from strata.utils.field_search import FieldSearchEngine
+from strata.utils.vector_search import HybridSearchEngine, VectorSearchEngine
+
+# Available search engines, selectable with the STRATA_SEARCH_ENGINE env var
+SEARCH_ENGINES: Dict[str, Type] = {
+    "bm25": BM25SearchEngine,
+    "field": FieldSearchEngine,
+    "vector": VectorSearchEngine,
+    "hybrid": HybridSearchEngine,
+}
+
+
+def get_search_engine_cls(name: Optional[str] = None) -> Type:
+    """Resolve a search engine class by name (default: $STRATA_SEARCH_ENGINE or bm25)."""
+    name = (name or os.getenv("STRATA_SEARCH_ENGINE") or "bm25").lower()
+    if name not in SEARCH_ENGINES:
+        raise ValueError(
+            f"Unknown search engine: {name}. Use one of {sorted(SEARCH_ENGINES)}"
+        )
+    return SEARCH_ENGINES[name]
+
+
+# Accepted names of the hybrid fusion modes; "weighted" is linear score fusion
+HYBRID_FUSION_MODES = {"rrf": "rrf", "linear": "linear", "weighted": "linear"}
+
+
+def get_search_engine_options(search_engine_cls: Type) -> Dict[str, Any]:
+    """
+    Constructor options for a search engine, read from the environment.
+
+    For HybridSearchEngine: STRATA_HYBRID_FUSION ("rrf", or "linear"/"weighted"),
+    STRATA_HYBRID_ALPHA (lexical weight of linear fusion, 0 to 1) and
+    STRATA_HYBRID_RRF_K (positive rank offset of RRF). Unset variables keep
+    the engine defaults; invalid values raise ValueError.
+    """
+    options: Dict[str, Any] = {}
+    if search_engine_cls is not HybridSearchEngine:
+        return options
+
+    fusion = os.getenv("STRATA_HYBRID_FUSION")
+    if fusion:
+        if fusion.lower() not in HYBRID_FUSION_MODES:
+            raise ValueError(
+                f"Invalid STRATA_HYBRID_FUSION: {fusion}. Use one of {sorted(HYBRID_FUSION_MODES)}"
+            )
+        options["fusion"] = HYBRID_FUSION_MODES[fusion.lower()]
+
+    alpha = os.getenv("STRATA_HYBRID_ALPHA")
+    if alpha:
+        try:
+            options["alpha"] = float(alpha)
+        except ValueError:
+            raise ValueError(f"Invalid STRATA_HYBRID_ALPHA: {alpha}. Use a number from 0 to 1")
+        if not 0.0 <= options["alpha"] <= 1.0:
+            raise ValueError(f"Invalid STRATA_HYBRID_ALPHA: {alpha}. Use a number from 0 to 1")
+
+    rrf_k = os.getenv("STRATA_HYBRID_RRF_K")
+    if rrf_k:
+        try:
+            options["rrf_k"] = int(rrf_k)
+        except ValueError:
+            raise ValueError(f"Invalid STRATA_HYBRID_RRF_K: {rrf_k}. Use a positive integer")
+        if options["rrf_k"] <= 0:
+            raise ValueError(f"Invalid STRATA_HYBRID_RRF_K: {rrf_k}. Use a positive integer")
+
+    return options
+
+
+# Default number of normalized queries cached per searcher
+DEFAULT_QUERY_CACHE_SIZE = int(os.getenv("STRATA_SEARCH_CACHE_SIZE", "256"))
+
+
+# PyStemmer objects are not thread-safe
+_stemmer = Stemmer.Stemmer("english")
+_stemmer_lock = threading.Lock()
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a query for cache lookup and search.
+
+    Splits identifiers into lowercase words, stems them, then sorts and dedupes
+    them, so "List Messages", "messages-list" and "list message" share a cache
+    entry. The search engine runs on the normalized query, so cached results
+    always match what an uncached search for the same key returns.
+    """
+    query = re.sub(r"([a-z])([A-Z])", r"\1 \2", query)
+    tokens = re.findall(r"[^\W_]+", query.lower())
+    with _stemmer_lock:
+        tokens = _stemmer.stemWords(tokens)
+    return " ".join(sorted(set(tokens)))
 
 
 class UniversalToolSearcher:
@@ -17,16 +113,62 @@ class UniversalToolSearcher:
     using a single unified approach based on function names.
     """
 
-    def __init__(self, mixed_tools_map: Dict[str, List[Any]]):
+    def __init__(
+        self,
+        mixed_tools_map: Dict[str, List[Any]],
+        search_engine_cls: Optional[Type] = None,
+        cache_size: int = DEFAULT_QUERY_CACHE_SIZE,
+        search_engine_options: Optional[Dict[str, Any]] = None,
+    ):
         """
         Initialize universal searcher with mixed tool types.
 
         Args:
             mixed_tools_map: Dictionary mapping categories to tools.
                            Tools can be either types.Tool objects or dict objects.
+            search_engine_cls: Search engine class exposing build_index/search.
+                           Defaults to the engine selected by get_search_engine_cls().
+            cache_size: Maximum number of normalized queries kept in the
+                           result LRU cache (0 disables caching)
+            search_engine_options: Keyword arguments for the search engine class.
+                           Defaults to get_search_engine_options() (environment).
         """
         self.tools_map = mixed_tools_map
+        self.search_engine_cls = search_engine_cls or get_search_engine_cls()
+        if search_engine_options is None:
+            search_engine_options = get_search_engine_options(self.search_engine_cls)
+        self.search_engine_options = search_engine_options
+        self.search_engine = self._build_index()
+
+        # Incremented whenever the index is rebuilt; part of every cache key
+        self.catalog_version = 0
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, int, int], List[Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def update_tools(self, mixed_tools_map: Dict[str, List[Any]]) -> None:
+        """Rebuild the index for a new tool catalog and invalidate the cache."""
+        self.tools_map = mixed_tools_map
         self.search_engine = self._build_index()
+        self.catalog_version += 1
+        self.invalidate_cache()
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached query results."""
+        self._cache.clear()
+
+    def cache_info(self) -> Dict[str, int]:
+        """Return cache statistics (hits, misses, size, maxsize, catalog_version)."""
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "size": len(self._cache),
+            "maxsize": self.cache_size,
+            "catalog_version": self.catalog_version,
+        }
 
     def _get_tool_name(self, tool: Any) -> Optional[str]:
         """Extract name from any tool type."""
@@ -44,8 +186,8 @@ class UniversalToolSearcher:
             return tool.get(field_name, default)
         return default
 
-    def _build_index(self) -> BM25SearchEngine:
-        """Build unified search index from all tools."""
+    def _build_documents(self) -> List[Any]:
+        """Build weighted field documents for all tools."""
         documents = []
 
         for category_name, tools in self.tools_map.items():
@@ -145,9 +287,19 @@ class UniversalToolSearcher:
                 if fields:
                     documents.append((fields, doc_id))
 
-        # Build search index
-        search_engine = BM25SearchEngine()
-        search_engine.build_index(documents)
+        return documents
+
+    def _build_index(self):
+        """Build unified search index from all tools."""
+        # doc_id -> tool, used to resolve search hits without scanning tool lists
+        self._tool_lookup = {}
+        for category_name, tools in self.tools_map.items():
+            for tool in tools:
+                tool_name = self._get_tool_name(tool)
+                if tool_name:
+                    self._tool_lookup.setdefault(f"{category_name}::{tool_name}", tool)
+        search_engine = self.search_engine_cls(**self.search_engine_options)
+        search_engine.build_index(self._build_documents())
         return search_engine
 
     def search(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
@@ -164,6 +316,27 @@ class UniversalToolSearcher:
         if self.search_engine is None:
             return []
 
+        query = normalize_query(query)
+        cache_key = (query, max_results, self.catalog_version)
+        if self.cache_size > 0:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                self.cache_hits += 1
+                return [dict(result) for result in cached]
+            self.cache_misses += 1
+
+        results = self._search_uncached(query, max_results)
+
+        if self.cache_size > 0:
+            self._cache[cache_key] = results
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return [dict(result) for result in results]
+        return results
+
+    def _search_uncached(self, query: str, max_results: int) -> List[Dict[str, Any]]:
+        """Run the search engine and resolve hits to result dicts."""
         # Perform search
         search_results = self.search_engine.search(query.lower(), top_k=max_results)
 
@@ -178,25 +351,23 @@ class UniversalToolSearcher:
             category_name, tool_name = doc_id.split("::", 1)
 
             # Find the tool
-            if category_name in self.tools_map:
-                for tool in self.tools_map[category_name]:
-                    if self._get_tool_name(tool) == tool_name:
-                        result = {
-                            "name": tool_name,
-                            "description": self._get_tool_field(
-                                tool, "description", ""
-                            ),
-                            "category_name": category_name,
-                            # "relevance_score": score,
-                        }
-
-                        # Add optional fields if they exist
-                        for field in ["title", "summary"]:
-                            value = self._get_tool_field(tool, field)
-                            if value:
-                                result[field] = value
-
-                        results.append(result)
-                        break
+            tool = self._tool_lookup.get(doc_id)
+            if tool is None:
+                continue
+
+            result = {
+                "name": tool_name,
+                "description": self._get_tool_field(tool, "description", ""),
+                "category_name": category_name,
+                # "relevance_score": score,
+            }
+
+            # Add optional fields if they exist
+            for field in ["title", "summary"]:
+                value = self._get_tool_field(tool, field)
+                if value:
+                    result[field] = value
+
+            results.append(result)
 
         return results
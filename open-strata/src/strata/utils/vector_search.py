@@ -0,0 +1,375 @@
+"""
+Dense vector search engines for tool discovery
+
+Provides a CPU-only, offline dense retriever and a hybrid engine that fuses
+its scores with the lexical BM25SearchEngine. Both expose the same
+build_index/search interface as BM25SearchEngine and FieldSearchEngine.
+
+## Embedding
+
+No model download is required. Text is embedded by feature hashing:
+1. Split identifiers (snake_case, camelCase) and lowercase
+2. Each stemmed word contributes a word feature
+3. Words found in a small concept lexicon also contribute a concept feature,
+   so "send a note to my teammate" and "post message to user" share features
+4. Character trigrams of each word contribute sub-word features, which makes
+   the embedding tolerant to typos and morphological variants
+5. Features are hashed (signed) into a fixed number of dimensions and the
+   vector is L2-normalized
+
+Each document is the weighted sum of its field embeddings (using the same
+field weights passed to build_index), then normalized again.
+
+## Index
+
+Vectors are stored as a single contiguous float32 matrix. Small corpora are
+searched exactly with one matrix-vector product. Larger corpora use an IVF
+index: vectors are clustered with spherical k-means and only the `nprobe` clusters
+closest to the query are scored.
+
+## Hybrid Fusion
+
+HybridSearchEngine runs BM25 and vector retrieval and fuses the rankings:
+- "rrf": reciprocal rank fusion, score = sum(1 / (rrf_k + rank))
+- "linear": alpha * norm(bm25) + (1 - alpha) * norm(vector), where norm is
+  min-max normalization over each engine's candidate list
+
+Dependencies:
+    numpy (installed with bm25s)
+    PyStemmer
+"""
+
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import Stemmer
+
+from strata.utils.bm25_search import BM25SearchEngine
+
+# Word -> concept. Words sharing a concept share an embedding feature.
+CONCEPT_LEXICON: Dict[str, str] = {}
+for _concept, _words in {
+    "create": ["create", "add", "new", "make", "insert", "open", "start", "schedule"],
+    "read": ["get", "read", "fetch", "retrieve", "show", "view", "describe", "detail"],
+    "list": ["list", "all", "browse", "enumerate", "index"],
+    "update": ["update", "edit", "modify", "change", "patch", "set", "rename"],
+    "delete": ["delete", "remove", "erase", "drop", "archive", "trash", "cancel"],
+    "search": ["search", "find", "lookup", "query", "filter", "locate"],
+    "send": ["send", "post", "write", "reply", "notify", "share", "publish", "dm"],
+    "message": ["message", "note", "chat", "text", "mail", "email", "dm", "reply"],
+    "person": [
+        "user", "teammate", "colleague", "member", "person", "people",
+        "contact", "attendee", "coworker", "assignee", "owner",
+    ],
+    "group": ["channel", "team", "group", "room", "space", "workspace"],
+    "document": ["document", "doc", "file", "page", "sheet", "note", "attachment"],
+    "event": ["event", "meeting", "calendar", "appointment", "invite", "slot"],
+    "task": ["task", "issue", "ticket", "todo", "card", "story", "bug"],
+    "money": ["invoice", "payment", "bill", "charge", "price", "cost", "expense"],
+    "deal": ["deal", "opportunity", "lead", "pipeline", "sale"],
+    "company": ["company", "account", "organization", "org", "customer", "vendor"],
+    "folder": ["folder", "directory", "drive", "collection"],
+    "comment": ["comment", "reaction", "feedback", "annotation"],
+}.items():
+    for _word in _words:
+        CONCEPT_LEXICON.setdefault(_word, _concept)
+
+
+class HashedNgramEmbedder:
+    """Offline text embedder based on signed feature hashing."""
+
+    def __init__(self, dim: int = 256, ngram: int = 3, use_stemmer: bool = True):
+        """
+        Initialize the embedder
+
+        Args:
+            dim: Embedding dimensionality
+            ngram: Character n-gram length for sub-word features
+            use_stemmer: Whether to stem words before hashing
+        """
+        self.dim = dim
+        self.ngram = ngram
+        self.stemmer = Stemmer.Stemmer("english") if use_stemmer else None
+        # Word -> hashed features; vocabularies of tool catalogs are small
+        self._word_cache: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self.concepts = {}
+        for word, concept in CONCEPT_LEXICON.items():
+            self.concepts[word] = concept
+            if self.stemmer:
+                self.concepts.setdefault(self.stemmer.stemWord(word), concept)
+
+    def _tokenize(self, text: str) -> List[str]:
+        """Split identifiers and text into lowercase words."""
+        text = re.sub(r"([a-z])([A-Z])", r"\1 \2", text)
+        return re.findall(r"[a-z0-9]+", text.lower())
+
+    def _word_features(self, word: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Hashed (indices, signed weights) for a single word, memoized."""
+        cached = self._word_cache.get(word)
+        if cached is not None:
+            return cached
+
+        stem = self.stemmer.stemWord(word) if self.stemmer else word
+        features = [(f"w:{stem}", 1.0)]
+
+        concept = self.concepts.get(word) or self.concepts.get(stem)
+        if concept:
+            features.append((f"c:{concept}", 1.0))
+
+        padded = f"#{word}#"
+        if len(padded) > self.ngram:
+            grams = [
+                padded[i : i + self.ngram] for i in range(len(padded) - self.ngram + 1)
+            ]
+            gram_weight = 0.5 / len(grams)
+            for gram in grams:
+                features.append((f"g:{gram}", gram_weight))
+
+        indices = np.empty(len(features), dtype=np.int64)
+        weights = np.empty(len(features), dtype=np.float32)
+        for i, (feature, weight) in enumerate(features):
+            h = zlib.crc32(feature.encode("utf-8"))
+            indices[i] = h % self.dim
+            weights[i] = weight if h & 0x80000000 else -weight
+
+        self._word_cache[word] = (indices, weights)
+        return indices, weights
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed text into an L2-normalized float32 vector."""
+        words = self._tokenize(text)
+        if not words:
+            return np.zeros(self.dim, dtype=np.float32)
+
+        features = [self._word_features(word) for word in words]
+        vector = np.bincount(
+            np.concatenate([indices for indices, _ in features]),
+            weights=np.concatenate([weights for _, weights in features]),
+            minlength=self.dim,
+        ).astype(np.float32)
+
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+
+
+class VectorSearchEngine:
+    """
+    Dense retrieval engine with a compact in-memory ANN index
+    Compatible with BM25SearchEngine interface
+    """
+
+    def __init__(
+        self,
+        embedder: Optional[HashedNgramEmbedder] = None,
+        ivf_threshold: int = 4096,
+        nprobe: int = 8,
+        **kwargs,
+    ):
+        """
+        Initialize the vector search engine
+
+        Args:
+            embedder: Text embedder (defaults to HashedNgramEmbedder)
+            ivf_threshold: Minimum corpus size that uses the IVF index
+                           instead of exact search
+            nprobe: Number of IVF clusters scored per query
+            kwargs: Ignored (for compatibility with BM25SearchEngine)
+        """
+        self.embedder = embedder or HashedNgramEmbedder()
+        self.ivf_threshold = ivf_threshold
+        self.nprobe = nprobe
+        self.doc_ids: List[str] = []
+        self.vectors: Optional[np.ndarray] = None
+        # IVF index: centroid matrix and per-cluster document indices
+        self.centroids: Optional[np.ndarray] = None
+        self.inverted_lists: List[np.ndarray] = []
+
+    def build_index(self, documents: List[Tuple[List[Tuple[str, str, int]], str]]):
+        """
+        Build vector index from documents
+
+        Args:
+            documents: List of (fields, doc_id) tuples
+                      fields: List of (field_key, field_value, weight) tuples
+                      doc_id: Document identifier string
+        """
+        vectors = []
+        self.doc_ids = []
+
+        for fields, doc_id in documents:
+            doc_vector = np.zeros(self.embedder.dim, dtype=np.float32)
+            for _, field_value, weight in fields:
+                if field_value and weight > 0:
+                    doc_vector += weight * self.embedder.embed(field_value)
+
+            norm = np.linalg.norm(doc_vector)
+            if norm == 0:
+                continue
+            vectors.append(doc_vector / norm)
+            self.doc_ids.append(doc_id)
+
+        if not vectors:
+            raise ValueError("No documents to index")
+
+        matrix = np.vstack(vectors)
+        self.vectors = np.ascontiguousarray(matrix, dtype=np.float32)
+
+        self.centroids = None
+        self.inverted_lists = []
+        if len(self.doc_ids) >= self.ivf_threshold:
+            self._build_ivf(self.vectors)
+
+    def _build_ivf(self, matrix: np.ndarray, iterations: int = 10):
+        """Cluster vectors with spherical k-means for IVF search."""
+        n = matrix.shape[0]
+        nlist = max(1, int(np.sqrt(n)))
+        rng = np.random.default_rng(0)
+        centroids = matrix[rng.choice(n, nlist, replace=False)].copy()
+
+        assignments = np.zeros(n, dtype=np.int64)
+        for _ in range(iterations):
+            assignments = np.argmax(matrix @ centroids.T, axis=1)
+            for c in range(nlist):
+                members = matrix[assignments == c]
+                if len(members):
+                    centroid = members.sum(axis=0)
+                    norm = np.linalg.norm(centroid)
+                    if norm > 0:
+                        centroids[c] = centroid / norm
+
+        self.centroids = centroids
+        self.inverted_lists = [
+            np.flatnonzero(assignments == c) for c in range(nlist)
+        ]
+
+    def search(self, query: str, top_k: int = 10) -> List[Tuple[float, str]]:
+        """
+        Search indexed documents by cosine similarity
+
+        Args:
+            query: Search query string
+            top_k: Number of top results to return
+
+        Returns:
+            List of (score, doc_id) tuples sorted by score descending
+        """
+        if self.vectors is None:
+            raise ValueError("No documents indexed. Call build_index() first.")
+
+        query_vector = self.embedder.embed(query)
+        if not query_vector.any():
+            return []
+
+        if self.centroids is not None:
+            probe = np.argsort(-(self.centroids @ query_vector))
+            candidates = np.concatenate(
+                [self.inverted_lists[c] for c in probe[: self.nprobe]]
+            )
+        else:
+            candidates = np.arange(len(self.doc_ids))
+
+        if len(candidates) == 0:
+            return []
+
+        scores = self.vectors[candidates] @ query_vector
+        k = min(top_k, len(candidates))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        return [
+            (float(scores[i]), self.doc_ids[candidates[i]])
+            for i in top
+            if scores[i] > 0
+        ]
+
+
+class HybridSearchEngine:
+    """
+    Hybrid engine fusing BM25 lexical and dense vector rankings
+    Compatible with BM25SearchEngine interface
+    """
+
+    def __init__(
+        self,
+        fusion: str = "rrf",
+        alpha: float = 0.5,
+        rrf_k: int = 60,
+        candidate_multiplier: int = 4,
+        **kwargs,
+    ):
+        """
+        Initialize the hybrid search engine
+
+        Args:
+            fusion: Score fusion method, "rrf" or "linear"
+            alpha: Lexical weight for linear fusion (vector weight is 1 - alpha)
+            rrf_k: Rank offset for reciprocal rank fusion
+            candidate_multiplier: Each engine retrieves top_k * multiplier candidates
+            kwargs: Passed to VectorSearchEngine
+        """
+        if fusion not in ("rrf", "linear"):
+            raise ValueError(f"Invalid fusion method: {fusion}. Use 'rrf' or 'linear'.")
+
+        self.fusion = fusion
+        self.alpha = alpha
+        self.rrf_k = rrf_k
+        self.candidate_multiplier = candidate_multiplier
+        self.lexical = BM25SearchEngine()
+        self.dense = VectorSearchEngine(**kwargs)
+
+    def build_index(self, documents: List[Tuple[List[Tuple[str, str, int]], str]]):
+        """
+        Build both lexical and dense indexes
+
+        Args:
+            documents: List of (fields, doc_id) tuples (see BM25SearchEngine)
+        """
+        self.lexical.build_index(documents)
+        self.dense.build_index(documents)
+
+    def search(self, query: str, top_k: int = 10) -> List[Tuple[float, str]]:
+        """
+        Search both engines and fuse their rankings
+
+        Args:
+            query: Search query string
+            top_k: Number of top results to return
+
+        Returns:
+            List of (score, doc_id) tuples sorted by fused score descending
+        """
+        candidates = top_k * self.candidate_multiplier
+        lexical_results = self.lexical.search(query, top_k=candidates)
+        dense_results = self.dense.search(query, top_k=candidates)
+
+        fused = defaultdict(float)
+        if self.fusion == "rrf":
+            for results in (lexical_results, dense_results):
+                for rank, (_, doc_id) in enumerate(results):
+                    fused[doc_id] += 1.0 / (self.rrf_k + rank + 1)
+        else:
+            for results, weight in (
+                (lexical_results, self.alpha),
+                (dense_results, 1.0 - self.alpha),
+            ):
+                for score, doc_id in self._normalize(results):
+                    fused[doc_id] += weight * score
+
+        sorted_results = sorted(fused.items(), key=lambda x: x[1], reverse=True)
+        return [(score, doc_id) for doc_id, score in sorted_results[:top_k]]
+
+    @staticmethod
+    def _normalize(results: List[Tuple[float, str]]) -> List[Tuple[float, str]]:
+        """Min-max normalize scores into [0, 1]."""
+        if not results:
+            return []
+        scores = [score for score, _ in results]
+        low, high = min(scores), max(scores)
+        if high == low:
+            return [(1.0, doc_id) for _, doc_id in results]
+        return [((score - low) / (high - low), doc_id) for score, doc_id in results]
@@ -0,0 +1,140 @@
+"""Tests for JSON schema compaction."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from strata.mcp_proxy.client import MCPClient
+from strata.utils.schema_compaction import compact_schema
+
+ADDRESS = {
+    "type": "object",
+    "title": "Address",
+    "properties": {
+        "street": {"type": "string", "description": "Street name and number"},
+        "city": {"type": "string", "description": "City name"},
+    },
+}
+
+
+class TestCompactSchema:
+    """Test compact_schema."""
+
+    def test_strips_redundant_keys(self):
+        schema = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "type": "object",
+            "properties": {
+                "start_time": {
+                    "type": "string",
+                    "title": "Start Time",
+                    "default": None,
+                    "description": "",
+                },
+                "mode": {"type": "string", "title": "Scheduling mode"},
+            },
+            "required": [],
+            "additionalProperties": True,
+        }
+        assert compact_schema(schema) == {
+            "type": "object",
+            "properties": {
+                "start_time": {"type": "string"},
+                "mode": {"type": "string", "title": "Scheduling mode"},
+            },
+        }
+
+    def test_keeps_data_keywords(self):
+        schema = {
+            "type": "object",
+            "properties": {
+                "status": {"type": "string", "enum": ["open", "closed"], "default": "open"},
+                "required": {"type": "boolean", "description": "A property named required"},
+            },
+            "additionalProperties": False,
+        }
+        assert compact_schema(schema) == schema
+
+    def test_dedupes_repeated_subschemas(self):
+        schema = {
+            "type": "object",
+            "properties": {
+                "billing": ADDRESS,
+                "shipping": ADDRESS,
+                "others": {"type": "array", "items": ADDRESS},
+            },
+        }
+        compacted = compact_schema(schema)
+
+        assert compacted["$defs"] == {"Address": ADDRESS}
+        assert compacted["properties"]["billing"] == {"$ref": "#/$defs/Address"}
+        assert compacted["properties"]["shipping"] == {"$ref": "#/$defs/Address"}
+        assert compacted["properties"]["others"]["items"] == {"$ref": "#/$defs/Address"}
+
+    def test_def_names_do_not_collide(self):
+        schema = {
+            "type": "object",
+            "properties": {"a": ADDRESS, "b": ADDRESS},
+            "$defs": {"Address": {"type": "string"}},
+        }
+        compacted = compact_schema(schema)
+        assert compacted["$defs"]["Address"] == {"type": "string"}
+        assert compacted["$defs"]["Address2"] == ADDRESS
+
+    def test_small_subschemas_not_deduped(self):
+        schema = {
+            "type": "object",
+            "properties": {"a": {"type": "string"}, "b": {"type": "string"}},
+        }
+        assert "$defs" not in compact_schema(schema)
+
+    def test_description_budget(self):
+        schema = {"type": "string", "description": "x" * 100}
+        assert compact_schema(schema, max_description_length=20)["description"] == (
+            "x" * 17 + "..."
+        )
+        assert compact_schema(schema)["description"] == "x" * 100
+
+    def test_does_not_mutate_input(self):
+        schema = {"type": "object", "properties": {"a": ADDRESS, "b": ADDRESS}}
+        compact_schema(schema)
+        assert schema["properties"]["a"] is ADDRESS
+        assert ADDRESS["title"] == "Address"
+
+    @pytest.mark.parametrize("schema", [None, [], "string"])
+    def test_non_dict_passthrough(self, schema):
+        assert compact_schema(schema) == schema
+
+
+class TestClientCompactSchemas:
+    """Test that MCPClient precomputes compacted schemas."""
+
+    @pytest.mark.asyncio
+    async def test_precomputed_on_list_tools(self):
+        tool = MagicMock()
+        tool.name = "update_customer"
+        tool.description = "Update a customer"
+        tool.inputSchema = {
+            "type": "object",
+            "properties": {"billing": ADDRESS, "shipping": ADDRESS},
+        }
+        tool.title = None
+        tool.outputSchema = None
+
+        session = MagicMock()
+
+        async def list_tools():
+            return MagicMock(tools=[tool])
+
+        session.list_tools = list_tools
+        transport = MagicMock()
+        transport.is_connected.return_value = True
+        transport.get_session.return_value = session
+
+        client = MCPClient(transport)
+        assert client.get_compact_schema("update_customer") is None
+
+        tools = await client.list_tools()
+        assert tools[0]["inputSchema"] == tool.inputSchema
+        compacted = client.get_compact_schema("update_customer")
+        assert compacted["properties"]["billing"] == {"$ref": "#/$defs/Address"}
@@ -0,0 +1,164 @@
+"""Tests for UniversalToolSearcher query caching."""
+
+from collections import OrderedDict
+
+import pytest
+
+from strata import tools
+from strata.tools import get_searcher
+from strata.utils.shared_search import (
+    SEARCH_ENGINES,
+    UniversalToolSearcher,
+    normalize_query,
+)
+
+TOOLS = [
+    {"name": "list_messages", "description": "List messages in a channel"},
+    {"name": "send_message", "description": "Send a message to a channel"},
+    {"name": "create_issue", "description": "Create a new issue"},
+]
+
+
+class TestNormalizeQuery:
+    """Test query normalization."""
+
+    def test_case_and_order(self):
+        assert normalize_query("List Messages") == normalize_query("messages list")
+
+    def test_punctuation(self):
+        assert normalize_query("create_issue!") == normalize_query("issue create")
+
+    def test_identifiers(self):
+        assert normalize_query("listProjects") == "list project"
+        assert normalize_query("list-projects") == "list project"
+
+    def test_stemming(self):
+        assert normalize_query("projects") == normalize_query("project")
+        assert normalize_query("create issues") == normalize_query("Creating issue")
+
+
+class TestQueryCache:
+    """Test the normalized-query LRU cache."""
+
+    def test_hit_on_equivalent_query(self):
+        searcher = UniversalToolSearcher({"slack": TOOLS})
+        first = searcher.search("list messages", max_results=5)
+        second = searcher.search("Messages LIST", max_results=5)
+
+        assert first == second
+        assert searcher.cache_info()["hits"] == 1
+        assert searcher.cache_info()["misses"] == 1
+
+    def test_hit_on_inflected_query(self):
+        searcher = UniversalToolSearcher({"github": TOOLS})
+        first = searcher.search("create issues", max_results=5)
+        second = searcher.search("create issue", max_results=5)
+
+        assert first == second
+        assert first[0]["name"] == "create_issue"
+        assert searcher.cache_info()["hits"] == 1
+        assert searcher.cache_info()["size"] == 1
+
+    def test_max_results_is_part_of_key(self):
+        searcher = UniversalToolSearcher({"slack": TOOLS})
+        searcher.search("message", max_results=1)
+        searcher.search("message", max_results=5)
+        assert searcher.cache_info()["misses"] == 2
+
+    def test_results_are_copies(self):
+        searcher = UniversalToolSearcher({"slack": TOOLS})
+        searcher.search("message", max_results=5)[0]["name"] = "mutated"
+        assert searcher.search("message", max_results=5)[0]["name"] != "mutated"
+
+    def test_lru_eviction(self):
+        searcher = UniversalToolSearcher({"slack": TOOLS}, cache_size=2)
+        searcher.search("list")
+        searcher.search("send")
+        searcher.search("create")
+        assert searcher.cache_info()["size"] == 2
+
+        searcher.search("list")
+        assert searcher.cache_info()["hits"] == 0
+
+    def test_cache_disabled(self):
+        searcher = UniversalToolSearcher({"slack": TOOLS}, cache_size=0)
+        searcher.search("list")
+        searcher.search("list")
+        assert searcher.cache_info()["hits"] == 0
+        assert searcher.cache_info()["size"] == 0
+
+    def test_update_tools_invalidates(self):
+        searcher = UniversalToolSearcher({"slack": TOOLS})
+        searcher.search("issue")
+        searcher.update_tools(
+            {"slack": TOOLS + [{"name": "close_issue", "description": "Close an issue"}]}
+        )
+
+        info = searcher.cache_info()
+        assert info["size"] == 0
+        assert info["catalog_version"] == 1
+        names = [r["name"] for r in searcher.search("issue")]
+        assert "close_issue" in names
+
+
+PROJECT_TOOLS = [
+    {"name": "list_projects", "description": "List all projects"},
+    {"name": "projects_archive", "description": "Archive of old projects"},
+    {"name": "project_settings", "description": "Update a project's settings"},
+]
+
+
+@pytest.mark.parametrize("engine", sorted(SEARCH_ENGINES))
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ("list-projects", "list projects"),
+        ("projects list", "List Projects"),
+        ("project", "Project!"),
+        ("projects", "project"),
+    ],
+)
+def test_cached_results_match_uncached(engine, first, second):
+    """A cache hit must return exactly what an uncached search would."""
+    cached = UniversalToolSearcher(
+        {"demo": PROJECT_TOOLS}, search_engine_cls=SEARCH_ENGINES[engine]
+    )
+    cached.search(first, max_results=5)
+    uncached = UniversalToolSearcher(
+        {"demo": PROJECT_TOOLS},
+        search_engine_cls=SEARCH_ENGINES[engine],
+        cache_size=0,
+    )
+
+    assert cached.search(second, max_results=5) == uncached.search(
+        second, max_results=5
+    )
+
+
+class TestGetSearcher:
+    """Test per-server searcher reuse in tools."""
+
+    def test_reuses_searcher_for_same_tools(self):
+        tools = list(TOOLS)
+        assert get_searcher("cache-test", tools) is get_searcher("cache-test", tools)
+
+    def test_rebuilds_when_tools_change(self):
+        searcher = get_searcher("cache-test-2", list(TOOLS))
+        searcher.search("issue")
+
+        new_tools = list(TOOLS)
+        assert get_searcher("cache-test-2", new_tools) is searcher
+        assert searcher.catalog_version == 1
+        assert searcher.cache_info()["size"] == 0
+
+    def test_searchers_are_bounded(self, monkeypatch):
+        monkeypatch.setattr(tools, "SEARCHER_CACHE_SIZE", 2)
+        monkeypatch.setattr(tools, "_searchers", OrderedDict())
+        first = get_searcher("bounded-1", list(TOOLS))
+        get_searcher("bounded-2", list(TOOLS))
+        # Using bounded-1 again makes bounded-2 the least recently used
+        tools_1 = first.tools_map["bounded-1"]
+        assert get_searcher("bounded-1", tools_1) is first
+        get_searcher("bounded-3", list(TOOLS))
+
+        assert list(tools._searchers) == ["bounded-1", "bounded-3"]
@@ -0,0 +1,185 @@
+"""Tests for dense and hybrid search engines."""
+
+import numpy as np
+import pytest
+
+from strata.utils.shared_search import (
+    UniversalToolSearcher,
+    get_search_engine_cls,
+    get_search_engine_options,
+)
+from strata.utils.vector_search import (
+    HashedNgramEmbedder,
+    HybridSearchEngine,
+    VectorSearchEngine,
+)
+
+TOOLS_MAP = {
+    "slack": [
+        {
+            "name": "slack_post_message",
+            "description": "Post a message to a Slack channel or user",
+        },
+        {
+            "name": "slack_list_channels",
+            "description": "List public channels in the workspace",
+        },
+        {"name": "slack_add_reaction", "description": "Add an emoji reaction"},
+    ],
+    "google_calendar": [
+        {
+            "name": "google_calendar_create_event",
+            "description": "Create a new calendar event",
+        },
+        {
+            "name": "google_calendar_delete_event",
+            "description": "Delete an event from a calendar",
+        },
+    ],
+}
+
+
+def _documents():
+    return [
+        (
+            [
+                ("category", category, 30),
+                ("operation", tool["name"], 30),
+                ("description", tool["description"].lower(), 30),
+            ],
+            f"{category}::{tool['name']}",
+        )
+        for category, tools in TOOLS_MAP.items()
+        for tool in tools
+    ]
+
+
+class TestHashedNgramEmbedder:
+    """Test the offline embedder."""
+
+    def test_embedding_is_normalized(self):
+        embedder = HashedNgramEmbedder()
+        vector = embedder.embed("send a message")
+        assert vector.shape == (embedder.dim,)
+        assert np.isclose(np.linalg.norm(vector), 1.0)
+
+    def test_empty_text(self):
+        embedder = HashedNgramEmbedder()
+        assert not embedder.embed("").any()
+
+    def test_concepts_bring_synonyms_closer(self):
+        embedder = HashedNgramEmbedder()
+        query = embedder.embed("send a note to my teammate")
+        related = embedder.embed("post message to user")
+        unrelated = embedder.embed("delete calendar event")
+        assert query @ related > query @ unrelated
+
+
+class TestVectorSearchEngine:
+    """Test dense retrieval."""
+
+    def test_semantic_query(self):
+        engine = VectorSearchEngine()
+        engine.build_index(_documents())
+        results = engine.search("send a note to my teammate", top_k=3)
+        assert results[0][1] == "slack::slack_post_message"
+
+    def test_search_before_index(self):
+        with pytest.raises(ValueError):
+            VectorSearchEngine().search("anything")
+
+    def test_empty_documents(self):
+        with pytest.raises(ValueError):
+            VectorSearchEngine().build_index([])
+
+    def test_ivf_index(self):
+        documents = [
+            ([("operation", f"tool_{i} action {i % 7}", 30)], f"doc{i}")
+            for i in range(200)
+        ]
+        engine = VectorSearchEngine(ivf_threshold=100, nprobe=4)
+        engine.build_index(documents)
+        assert engine.centroids is not None
+        assert sum(len(ids) for ids in engine.inverted_lists) == 200
+
+        results = engine.search("tool_42 action 0", top_k=5)
+        assert 0 < len(results) <= 5
+        assert [score for score, _ in results] == sorted(
+            (score for score, _ in results), reverse=True
+        )
+
+
+class TestHybridSearchEngine:
+    """Test lexical + dense fusion."""
+
+    @pytest.mark.parametrize("fusion", ["rrf", "linear"])
+    def test_fusion_methods(self, fusion):
+        engine = HybridSearchEngine(fusion=fusion)
+        engine.build_index(_documents())
+
+        results = engine.search("create calendar event", top_k=2)
+        assert results[0][1] == "google_calendar::google_calendar_create_event"
+
+        results = engine.search("send a note to my teammate", top_k=3)
+        assert "slack::slack_post_message" in [doc_id for _, doc_id in results]
+
+    def test_invalid_fusion(self):
+        with pytest.raises(ValueError):
+            HybridSearchEngine(fusion="max")
+
+
+class TestSearchEngineSelection:
+    """Test engine selection for UniversalToolSearcher."""
+
+    def test_default_engine(self, monkeypatch):
+        monkeypatch.delenv("STRATA_SEARCH_ENGINE", raising=False)
+        assert get_search_engine_cls().__name__ == "BM25SearchEngine"
+
+    def test_engine_from_env(self, monkeypatch):
+        monkeypatch.setenv("STRATA_SEARCH_ENGINE", "hybrid")
+        searcher = UniversalToolSearcher(TOOLS_MAP)
+        assert isinstance(searcher.search_engine, HybridSearchEngine)
+        results = searcher.search("send a note to my teammate", max_results=3)
+        assert "slack_post_message" in [r["name"] for r in results]
+
+    def test_unknown_engine(self):
+        with pytest.raises(ValueError):
+            get_search_engine_cls("nope")
+
+    def test_hybrid_options_from_env(self, monkeypatch):
+        monkeypatch.setenv("STRATA_SEARCH_ENGINE", "hybrid")
+        monkeypatch.setenv("STRATA_HYBRID_FUSION", "weighted")
+        monkeypatch.setenv("STRATA_HYBRID_ALPHA", "0.8")
+        monkeypatch.setenv("STRATA_HYBRID_RRF_K", "10")
+        searcher = UniversalToolSearcher(TOOLS_MAP)
+        engine = searcher.search_engine
+        assert isinstance(engine, HybridSearchEngine)
+        assert (engine.fusion, engine.alpha, engine.rrf_k) == ("linear", 0.8, 10)
+        # Options survive index rebuilds
+        searcher.update_tools(TOOLS_MAP)
+        assert searcher.search_engine.alpha == 0.8
+
+    def test_hybrid_defaults_without_env(self, monkeypatch):
+        for name in ("STRATA_HYBRID_FUSION", "STRATA_HYBRID_ALPHA", "STRATA_HYBRID_RRF_K"):
+            monkeypatch.delenv(name, raising=False)
+        engine = UniversalToolSearcher(TOOLS_MAP, HybridSearchEngine).search_engine
+        assert (engine.fusion, engine.alpha, engine.rrf_k) == ("rrf", 0.5, 60)
+
+    @pytest.mark.parametrize(
+        "name,value",
+        [
+            ("STRATA_HYBRID_FUSION", "max"),
+            ("STRATA_HYBRID_ALPHA", "1.5"),
+            ("STRATA_HYBRID_ALPHA", "high"),
+            ("STRATA_HYBRID_RRF_K", "0"),
+            ("STRATA_HYBRID_RRF_K", "ten"),
+        ],
+    )
+    def test_invalid_hybrid_options(self, monkeypatch, name, value):
+        monkeypatch.setenv(name, value)
+        with pytest.raises(ValueError):
+            get_search_engine_options(HybridSearchEngine)
+
+    def test_options_only_apply_to_hybrid(self, monkeypatch):
+        monkeypatch.setenv("STRATA_HYBRID_ALPHA", "0.8")
+        assert get_search_engine_options(get_search_engine_cls("bm25")) == {}